@@ -2,6 +2,10 @@
 """Entry point script for the application."""
 
 if __name__ == "__main__":
+    import multiprocessing
     import runpy
 
+    # Executável congelado: processos filhos (pool de extração de PDF) saem aqui
+    multiprocessing.freeze_support()
+
     runpy.run_module("src.core.app", run_name="__main__")
@@ -0,0 +1,69 @@
+-- =============================================================================
+-- Migration: 20260410_clients_search_norm
+-- Descrição: Busca de clientes server-side insensível a acento/pontuação.
+--
+-- COMO APLICAR:
+--   1. Abra o Supabase Dashboard → SQL Editor
+--   2. Cole o conteúdo deste arquivo e clique em "Run"
+--   3. Verifique que a coluna public.clients.search_norm está preenchida
+--
+-- O QUE FAZ:
+--   Mantém em public.clients.search_norm o mesmo texto que o app gera com
+--   src.core.textnorm.join_and_normalize(id, razao_social, cnpj, nome,
+--   numero, obs): sem acentos (unaccent), minúsculo e só letras/dígitos.
+--   O app normaliza o termo do mesmo jeito e filtra com
+--   search_norm ILIKE '%termo%' numa única requisição paginada; o índice
+--   GIN de trigramas (pg_trgm) atende esse ILIKE sem varrer a tabela.
+--
+--   Um trigger BEFORE INSERT/UPDATE mantém a coluna atualizada (coluna
+--   gerada não serve: unaccent não é IMMUTABLE e o texto inclui o id).
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS unaccent WITH SCHEMA extensions;
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+-- Wrapper IMMUTABLE (dicionário explícito) para poder ser usado em índice/trigger
+CREATE OR REPLACE FUNCTION public.rc_search_norm(p_text text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+  SELECT regexp_replace(
+    lower(extensions.unaccent('extensions.unaccent'::regdictionary, coalesce(p_text, ''))),
+    '[^[:alnum:]]+', '', 'g'
+  );
+$$;
+
+ALTER TABLE public.clients
+  ADD COLUMN IF NOT EXISTS search_norm text;
+
+CREATE OR REPLACE FUNCTION public.rc_clients_set_search_norm()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.search_norm := public.rc_search_norm(
+    concat_ws(' ', NEW.id::text, NEW.razao_social, NEW.cnpj, NEW.nome, NEW.numero, NEW.obs)
+  );
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_clients_search_norm ON public.clients;
+CREATE TRIGGER trg_clients_search_norm
+  BEFORE INSERT OR UPDATE OF razao_social, cnpj, nome, numero, obs
+  ON public.clients
+  FOR EACH ROW
+  EXECUTE FUNCTION public.rc_clients_set_search_norm();
+
+-- Backfill das linhas existentes
+UPDATE public.clients
+   SET search_norm = public.rc_search_norm(
+         concat_ws(' ', id::text, razao_social, cnpj, nome, numero, obs)
+       )
+ WHERE search_norm IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_clients_search_norm_trgm
+  ON public.clients
+  USING gin (search_norm extensions.gin_trgm_ops);
@@ -0,0 +1,145 @@
+-- =============================================================================
+-- Migration: 20260420_rpc_dashboard_snapshot
+-- Descrição: Agregados do dashboard do Hub numa única chamada RPC.
+--
+-- COMO APLICAR:
+--   1. Abra o Supabase Dashboard → SQL Editor
+--   2. Cole o conteúdo deste arquivo e clique em "Run"
+--   3. Teste: SELECT public.dashboard_snapshot('<org_id>'::uuid, current_date);
+--
+-- O QUE FAZ:
+--   Antes o app baixava todas as linhas de reg_obligations, rc_tasks e
+--   cashflow_entries (mês inteiro) e agregava em Python. A função devolve
+--   um jsonb com tudo já agregado:
+--     - active_clients, pending_obligations, tasks_today (contagens)
+--     - cash_in_month (soma das entradas 'IN' do mês de p_today)
+--     - upcoming_deadlines (até p_limit obrigações pending/overdue mais
+--       próximas, com o nome do cliente)
+--     - hot_items (por tipo SNGPC/FARMACIA_POPULAR: quantidade e menor
+--       número de dias até o vencimento, para vencimentos até p_today + 2)
+--     - risk_radar (SNGPC/SIFAP: pending e overdue; pending com vencimento
+--       passado conta como overdue)
+--     - clients_of_the_day (clientes com obrigação pending/overdue vencendo
+--       em p_today, com os tipos)
+--   Os textos (alertas, badges, datas dd/mm) continuam sendo montados no app.
+--   Se a função não existir, o app volta para a agregação em Python.
+--
+-- SEGURANÇA:
+--   SECURITY INVOKER: as policies RLS das tabelas continuam valendo para o
+--   usuário autenticado; p_org_id só restringe a consulta.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.dashboard_snapshot(
+  p_org_id uuid,
+  p_today date DEFAULT current_date,
+  p_limit integer DEFAULT 5
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+  v_month_start date := date_trunc('month', p_today)::date;
+  v_month_end date := (date_trunc('month', p_today) + interval '1 month - 1 day')::date;
+  v_result jsonb;
+BEGIN
+  WITH open_obl AS (
+    SELECT o.client_id, o.kind, o.title, o.status, o.due_date
+      FROM public.reg_obligations o
+     WHERE o.org_id = p_org_id
+       AND o.status IN ('pending', 'overdue')
+  ),
+  client_names AS (
+    SELECT c.id,
+           coalesce(nullif(btrim(c.razao_social), ''), nullif(btrim(c.nome), ''), 'Cliente #' || c.id) AS name
+      FROM public.clients c
+     WHERE c.id IN (SELECT DISTINCT client_id FROM open_obl WHERE client_id IS NOT NULL)
+  )
+  SELECT jsonb_build_object(
+    'active_clients', (
+      SELECT count(*) FROM public.clients c
+       WHERE c.org_id = p_org_id AND c.deleted_at IS NULL
+    ),
+    'pending_obligations', (SELECT count(*) FROM open_obl),
+    'tasks_today', (
+      SELECT count(*) FROM public.rc_tasks t
+       WHERE t.org_id = p_org_id AND t.status = 'pending' AND t.due_date <= p_today
+    ),
+    'cash_in_month', (
+      SELECT coalesce(sum(e.amount), 0) FROM public.cashflow_entries e
+       WHERE e.org_id = p_org_id
+         AND upper(e.type) = 'IN'
+         AND e.date BETWEEN v_month_start AND v_month_end
+    ),
+    'upcoming_deadlines', coalesce((
+      SELECT jsonb_agg(d ORDER BY d.due_date, d.ord)
+        FROM (
+          SELECT o.due_date,
+                 o.client_id,
+                 cn.name AS client_name,
+                 o.kind,
+                 coalesce(o.title, o.kind) AS title,
+                 row_number() OVER (ORDER BY o.due_date) AS ord
+            FROM open_obl o
+            LEFT JOIN client_names cn ON cn.id = o.client_id
+           WHERE o.due_date IS NOT NULL
+           ORDER BY o.due_date
+           LIMIT greatest(p_limit, 0)
+        ) d
+    ), '[]'::jsonb),
+    'hot_items', coalesce((
+      SELECT jsonb_agg(jsonb_build_object('kind', h.kind, 'count', h.n, 'min_days', h.min_days) ORDER BY h.kind DESC)
+        FROM (
+          SELECT o.kind, count(*) AS n, min(o.due_date - p_today) AS min_days
+            FROM open_obl o
+           WHERE o.kind IN ('SNGPC', 'FARMACIA_POPULAR')
+             AND o.due_date <= p_today + 2
+           GROUP BY o.kind
+        ) h
+    ), '[]'::jsonb),
+    'risk_radar', (
+      SELECT jsonb_object_agg(q.kind, jsonb_build_object('pending', q.pending, 'overdue', q.overdue))
+        FROM (
+          SELECT k.kind,
+                 count(o.*) FILTER (
+                   WHERE o.status = 'pending' AND (o.due_date IS NULL OR o.due_date >= p_today)
+                 ) AS pending,
+                 count(o.*) FILTER (
+                   WHERE o.status = 'overdue' OR (o.status = 'pending' AND o.due_date < p_today)
+                 ) AS overdue
+            FROM (VALUES ('SNGPC'), ('SIFAP')) AS k(kind)
+            LEFT JOIN open_obl o ON o.kind = k.kind
+           GROUP BY k.kind
+        ) q
+    ),
+    'clients_of_the_day', coalesce((
+      SELECT jsonb_agg(jsonb_build_object('client_id', t.client_id, 'client_name', t.client_name,
+                                          'obligation_kinds', t.kinds) ORDER BY t.client_name)
+        FROM (
+          SELECT o.client_id,
+                 coalesce(cn.name, 'Cliente #' || o.client_id) AS client_name,
+                 coalesce(array_agg(DISTINCT o.kind ORDER BY o.kind) FILTER (WHERE o.kind <> ''), '{}') AS kinds
+            FROM open_obl o
+            LEFT JOIN client_names cn ON cn.id = o.client_id
+           WHERE o.due_date = p_today AND o.client_id IS NOT NULL
+           GROUP BY o.client_id, cn.name
+        ) t
+    ), '[]'::jsonb)
+  )
+  INTO v_result;
+
+  RETURN v_result;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.dashboard_snapshot(uuid, date, integer) TO authenticated;
+
+-- Índices usados pelos filtros acima (idempotentes)
+CREATE INDEX IF NOT EXISTS idx_reg_obligations_org_status_due
+  ON public.reg_obligations (org_id, status, due_date);
+CREATE INDEX IF NOT EXISTS idx_rc_tasks_org_status_due
+  ON public.rc_tasks (org_id, status, due_date);
+CREATE INDEX IF NOT EXISTS idx_cashflow_entries_org_date
+  ON public.cashflow_entries (org_id, date);
@@ -0,0 +1,83 @@
+-- =============================================================================
+-- Migration: 20260421_rpc_cashflow_summary
+-- Descrição: Totais do Fluxo de Caixa agregados no banco (entradas/saídas/saldo).
+--
+-- COMO APLICAR:
+--   1. Abra o Supabase Dashboard → SQL Editor
+--   2. Cole o conteúdo deste arquivo e clique em "Run"
+--   3. Teste: SELECT * FROM public.cashflow_summary('<org_id>'::uuid, '2026-01-01', '2026-12-31', 'month');
+--
+-- O QUE FAZ:
+--   O app baixava todos os lançamentos do período (select *) só para somar
+--   amount. cashflow_summary devolve as somas já agregadas:
+--     - p_group NULL        → uma linha com o total do período (bucket NULL)
+--     - p_group 'day'       → uma linha por dia  (bucket 'YYYY-MM-DD')
+--     - p_group 'month'     → uma linha por mês  (bucket 'YYYY-MM')
+--     - p_group 'category'  → uma linha por categoria (bucket = category)
+--   Mesma regra do app: type 'IN' é entrada; qualquer outro valor é saída.
+--   p_type ('IN'/'OUT') e p_text (ILIKE na descrição) espelham os filtros
+--   da listagem. O custo não depende mais do número de lançamentos
+--   transferidos: um relatório de vários anos devolve poucas linhas.
+--   Se a função não existir, o app volta a somar os lançamentos localmente.
+--
+-- SEGURANÇA:
+--   SECURITY INVOKER: as policies RLS de cashflow_entries continuam valendo.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.cashflow_summary(
+  p_org_id uuid,
+  p_from date DEFAULT NULL,
+  p_to date DEFAULT NULL,
+  p_group text DEFAULT NULL,
+  p_type text DEFAULT NULL,
+  p_text text DEFAULT NULL
+)
+RETURNS TABLE (
+  bucket text,
+  total_in numeric,
+  total_out numeric,
+  balance numeric,
+  entries bigint
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+BEGIN
+  IF p_group IS NOT NULL AND p_group NOT IN ('day', 'month', 'category') THEN
+    RAISE EXCEPTION 'cashflow_summary: agrupamento inválido: %', p_group
+      USING ERRCODE = '22023';
+  END IF;
+
+  RETURN QUERY
+  SELECT g.bucket,
+         coalesce(sum(g.amount) FILTER (WHERE g.is_in), 0) AS total_in,
+         coalesce(sum(g.amount) FILTER (WHERE NOT g.is_in), 0) AS total_out,
+         coalesce(sum(CASE WHEN g.is_in THEN g.amount ELSE -g.amount END), 0) AS balance,
+         count(*) AS entries
+    FROM (
+      SELECT CASE p_group
+               WHEN 'day' THEN to_char(e.date, 'YYYY-MM-DD')
+               WHEN 'month' THEN to_char(e.date, 'YYYY-MM')
+               WHEN 'category' THEN coalesce(e.category, '')
+             END AS bucket,
+             coalesce(e.amount, 0) AS amount,
+             upper(coalesce(e.type, '')) = 'IN' AS is_in
+        FROM public.cashflow_entries e
+       WHERE (p_org_id IS NULL OR e.org_id = p_org_id)
+         AND (p_from IS NULL OR e.date >= p_from)
+         AND (p_to IS NULL OR e.date <= p_to)
+         AND (p_type IS NULL OR e.type = p_type)
+         AND (p_text IS NULL OR p_text = '' OR e.description ILIKE '%' || p_text || '%')
+    ) g
+   GROUP BY g.bucket
+   ORDER BY g.bucket NULLS FIRST;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.cashflow_summary(uuid, date, date, text, text, text) TO authenticated;
+
+-- Filtro por organização + período (idempotente; também criado em 20260420)
+CREATE INDEX IF NOT EXISTS idx_cashflow_entries_org_date
+  ON public.cashflow_entries (org_id, date);
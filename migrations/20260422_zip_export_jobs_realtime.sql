@@ -0,0 +1,35 @@
+-- =============================================================================
+-- Migration: 20260422_zip_export_jobs_realtime
+-- Descrição: Publica zip_export_jobs no Supabase Realtime (progresso por push).
+--
+-- COMO APLICAR:
+--   1. Abra o Supabase Dashboard → SQL Editor
+--   2. Cole o conteúdo deste arquivo e clique em "Run"
+--   3. Teste: SELECT * FROM pg_publication_tables
+--             WHERE pubname = 'supabase_realtime' AND tablename = 'zip_export_jobs';
+--
+-- O QUE FAZ:
+--   O app acompanha o job de exportação ZIP inscrevendo-se nos UPDATEs da
+--   linha (postgres_changes, filtro id=eq.<job>). Sem a tabela na publicação
+--   supabase_realtime o canal chega a SUBSCRIBED mas nunca entrega eventos,
+--   e o progresso fica só no poll de segurança.
+--   Idempotente: não falha se a tabela já estiver publicada.
+--
+-- SEGURANÇA:
+--   O Realtime respeita as policies RLS de zip_export_jobs: cada usuário só
+--   recebe eventos das linhas que já pode ler.
+-- =============================================================================
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1
+      FROM pg_publication_tables
+     WHERE pubname = 'supabase_realtime'
+       AND schemaname = 'public'
+       AND tablename = 'zip_export_jobs'
+  ) THEN
+    ALTER PUBLICATION supabase_realtime ADD TABLE public.zip_export_jobs;
+  END IF;
+END;
+$$;
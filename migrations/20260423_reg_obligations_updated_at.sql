@@ -0,0 +1,34 @@
+-- =============================================================================
+-- Migration: 20260423_reg_obligations_updated_at
+-- Descrição: reg_obligations.updated_at gerado pelo relógio do servidor.
+--
+-- COMO APLICAR:
+--   1. Abra o Supabase Dashboard → SQL Editor
+--   2. Cole o conteúdo deste arquivo e clique em "Run"
+--   3. Teste: UPDATE public.reg_obligations SET notes = notes WHERE id = '<id>'
+--             RETURNING updated_at;  -- deve ser o now() do servidor
+--
+-- O QUE FAZ:
+--   O cache de obrigações do app (src/features/regulations/cache.py) busca
+--   só as linhas com updated_at a partir da última alteração vista. O app
+--   grava updated_at com o relógio da máquina; uma máquina atrasada mais que
+--   a margem da busca gerava alterações que as outras nunca sincronizavam.
+--   O trigger BEFORE INSERT/UPDATE sobrescreve o valor enviado com now().
+--
+-- SEGURANÇA:
+--   Só altera a coluna updated_at da própria linha; RLS e policies de
+--   reg_obligations não mudam.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.trg_reg_obligations_updated_at()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS reg_obligations_updated_at ON public.reg_obligations;
+CREATE TRIGGER reg_obligations_updated_at
+    BEFORE INSERT OR UPDATE ON public.reg_obligations
+    FOR EACH ROW EXECUTE FUNCTION public.trg_reg_obligations_updated_at();
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Micro-benchmark do JsonCacheStore (get/set por tamanho do cache).
+
+OBJETIVO: Mostrar que a latência de ``get``/``set`` não depende do número de
+entradas. O store é pré-populado com N entradas e, em seguida, mede-se a
+mediana de ``get`` (acerto) e de ``set`` (sobrescrita), com gravação em lote
+(padrão) ou write-through (``--flush-delay 0``, grava o arquivo a cada set).
+
+Uso:
+    python scripts/bench_cache_store.py
+    python scripts/bench_cache_store.py --sizes 100 1000 10000 --flush-delay 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+try:
+    from src.infra.cache_store import JsonCacheStore
+except ImportError as e:
+    print(f"❌ Erro ao importar dependências: {e}", file=sys.stderr)
+    sys.exit(1)
+
+PAYLOAD = {"cnpj": "12345678000190", "razao_social": "Farmácia Exemplo LTDA", "itens": list(range(20))}
+
+
+def _median_us(fn, keys: list[str]) -> float:
+    samples = []
+    for key in keys:
+        t0 = time.perf_counter()
+        fn(key)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def _bench(size: int, samples: int, flush_delay: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JsonCacheStore(
+            os.path.join(tmp, "cache.json"), max_entries=size + samples, flush_delay=max(flush_delay, 3600)
+        )
+        for i in range(size):
+            store.set(f"k{i}", PAYLOAD)
+        store.flush()
+        store.flush_delay = flush_delay
+
+        rng = random.Random(size)
+        keys = [f"k{rng.randrange(size)}" for _ in range(samples)]
+        get_us = _median_us(store.get, keys)
+        set_us = _median_us(lambda k: store.set(k, PAYLOAD), keys)
+        store.close()
+        stats = store.stats()
+    print(f"{size:>7} entradas  get={get_us:8.1f} µs  set={set_us:9.1f} µs  hits={stats.hits} flushes={stats.flushes}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 50_000])
+    parser.add_argument("--samples", type=int, default=200, help="Operações medidas por cenário")
+    parser.add_argument("--flush-delay", type=float, default=2.0, help="Segundos de debounce (0 = write-through)")
+    args = parser.parse_args()
+
+    print(f"JsonCacheStore — flush_delay={args.flush_delay}s, {args.samples} amostras")
+    for size in args.sizes:
+        _bench(size, args.samples, args.flush_delay)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
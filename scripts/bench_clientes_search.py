@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark da busca local da lista de Clientes (tecla → rows filtradas).
+
+OBJETIVO: Medir a latência de ``ClientesViewModel.set_search_text`` por tecla
+com 1k/10k/50k clientes sintéticos, comparando:
+- legado: reconstrói todas as ClienteRow e varre ``search_norm`` a cada tecla
+- índice: rows construídas uma vez + índice de trigramas incremental
+
+Cada cenário digita termos letra a letra ("f", "fa", "far", ...) e reporta a
+mediana e o p95 por tecla, além do custo de carga inicial.
+
+Uso:
+    python scripts/bench_clientes_search.py
+    python scripts/bench_clientes_search.py --sizes 1000 10000 50000 --legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+try:
+    from src.core.textnorm import normalize_search
+    from src.modules.clientes.core.viewmodel import ClientesViewModel
+except ImportError as e:
+    print(f"❌ Erro ao importar dependências: {e}", file=sys.stderr)
+    sys.exit(1)
+
+ORDER_CHOICES = {"Razão Social (A→Z)": ("razao_social", False)}
+QUERIES = ("farmacia sao", "12345", "drogaria bom jesus", "maria")
+_NOMES = ("Farmácia", "Drogaria", "Drogasil", "Farma", "Botica")
+_SUFIXOS = ("São João", "Bom Jesus", "Central", "Popular", "Vida", "Saúde", "Maria", "do Povo")
+
+
+def _make_clientes(n: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    clientes = []
+    for i in range(1, n + 1):
+        clientes.append(
+            {
+                "id": i,
+                "razao_social": f"{rng.choice(_NOMES)} {rng.choice(_SUFIXOS)} {i} LTDA",
+                "cnpj": f"{rng.randrange(10**13, 10**14)}",
+                "nome": f"{rng.choice(_SUFIXOS)} {rng.randrange(1000)}",
+                "whatsapp": f"+55 31 9{rng.randrange(10**7, 10**8)}",
+                "observacoes": f"[{rng.choice(('Ativo', 'Pendente', 'Novo'))}] obs {i}",
+                "ultima_alteracao": "2026-03-01T10:00:00",
+            }
+        )
+    return clientes
+
+
+def _legacy_rebuild(vm: ClientesViewModel, text: str) -> list:
+    """Comportamento anterior: reconstrói todas as rows e varre linearmente."""
+    rows = [vm._build_row_from_cliente(c) for c in vm._clientes_raw]
+    norm = normalize_search(text)
+    if norm:
+        rows = [r for r in rows if norm in r.search_norm]
+    return vm._sort_rows(rows)
+
+
+def _keystrokes() -> list[str]:
+    return [q[:k] for q in QUERIES for k in range(1, len(q) + 1)]
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return f"mediana={statistics.median(ordered):7.2f}ms  p95={p95:7.2f}ms"
+
+
+def run(size: int, legacy: bool) -> None:
+    clientes = _make_clientes(size)
+    vm = ClientesViewModel(order_choices=ORDER_CHOICES)
+
+    t0 = time.perf_counter()
+    vm.load_from_iterable(clientes)
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    samples = []
+    for text in _keystrokes():
+        t0 = time.perf_counter()
+        vm.set_search_text(text)
+        vm.get_rows()
+        samples.append((time.perf_counter() - t0) * 1000)
+    print(f"{size:>6} clientes | índice  | carga={load_ms:8.1f}ms | {_summary(samples)}")
+
+    if legacy:
+        samples = []
+        for text in _keystrokes():
+            t0 = time.perf_counter()
+            _legacy_rebuild(vm, text)
+            samples.append((time.perf_counter() - t0) * 1000)
+        print(f"{size:>6} clientes | legado  | {'':>16} | {_summary(samples)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--legacy", action="store_true", help="mede também o rebuild completo por tecla")
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.legacy)
+
+
+if __name__ == "__main__":
+    main()
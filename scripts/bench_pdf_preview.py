@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark do preview de PDF - renderização síncrona x worker em background.
+
+OBJETIVO: Medir, num PDF sintético de várias centenas de páginas "escaneadas"
+(uma imagem por página), o custo que fica na thread principal do Tk:
+- time-to-first-visible-page: tempo até a primeira página visível estar pronta
+- scroll jank: tempo bloqueado na thread principal a cada passo de rolagem
+
+A thread principal é simulada (sem display): um loop que executa os callbacks
+agendados via after(). A criação do PhotoImage não entra na medição em
+nenhum dos dois modos.
+
+Com --tile-zoom, compara também página inteira x tiles em zoom alto: tempo
+e bytes rasterizados para cobrir um viewport.
+
+Uso:
+    python scripts/bench_pdf_preview.py --pages 300 --zoom 1.5
+    python scripts/bench_pdf_preview.py --pages 20 --tile-zoom 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+try:
+    import fitz  # type: ignore
+
+    from src.modules.pdf_preview.controller import PdfPreviewController
+    from src.modules.pdf_preview.controllers.pdf_render_controller import PdfRenderController
+    from src.modules.pdf_preview.render_service import PdfRenderService
+    from src.modules.pdf_preview.render_worker import PdfRenderWorker
+except ImportError as e:
+    print(f"❌ Erro ao importar dependências: {e}", file=sys.stderr)
+    sys.exit(1)
+
+VIEWPORT_H = 900
+VIEWPORT_W = 1200
+SCROLL_STEP = 240
+
+
+class _MainLoop:
+    """after() de mentira: callbacks rodam quando o benchmark chama pump()."""
+
+    def __init__(self) -> None:
+        self._calls: "queue.Queue" = queue.Queue()
+
+    def after(self, _ms, fn):
+        self._calls.put(fn)
+        return "after#bench"
+
+    def pump(self, *, block: float = 0.0) -> float:
+        """Executa callbacks pendentes e devolve o tempo gasto neles."""
+        spent = 0.0
+        while True:
+            try:
+                fn = self._calls.get(timeout=block) if block else self._calls.get_nowait()
+            except queue.Empty:
+                return spent
+            t0 = time.perf_counter()
+            fn()
+            spent += time.perf_counter() - t0
+            block = 0.0
+
+
+def build_synthetic_pdf(path: str, pages: int) -> None:
+    """Cria um PDF A4 com uma imagem ruidosa por página (simula scan)."""
+    doc = fitz.open()
+    noise = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 1240, 1754), False)
+    noise.set_rect(noise.irect, (235, 235, 230))
+    for y in range(0, 1754, 24):
+        noise.set_rect(fitz.IRect(80, y, 1160, y + 10), (40 + y % 60, 40, 40))
+    png = noise.tobytes("png")
+    for i in range(pages):
+        page = doc.new_page(width=595, height=842)
+        page.insert_image(page.rect, stream=png)
+        page.insert_text((60, 60), f"SIFAP - página {i + 1}", fontsize=14)
+    doc.save(path)
+    doc.close()
+
+
+def _visible(ctrl: PdfRenderController, layout, sizes, zoom: float, y0: int):
+    return ctrl.find_visible_page_indices(layout.page_tops, sizes, zoom, y0, VIEWPORT_H, margin=32)
+
+
+def run_sync(path: str, zoom: float, steps: int) -> dict:
+    pdf = PdfPreviewController(pdf_path=path)
+    svc = PdfRenderService()
+    ctrl = PdfRenderController()
+    sizes = pdf.page_sizes
+    layout = ctrl.calculate_page_layout(sizes, zoom)
+    done: set = set()
+
+    def _render_visible(y0: int) -> float:
+        t0 = time.perf_counter()
+        for i in _visible(ctrl, layout, sizes, zoom, y0):
+            if i not in done:
+                svc.prepare_page_image(page_index=i, zoom=zoom, pdf_controller=pdf)
+                done.add(i)
+        return time.perf_counter() - t0
+
+    ttfp = _render_visible(0)
+    jank = [_render_visible(step * SCROLL_STEP) for step in range(1, steps + 1)]
+    pdf.close()
+    return {"ttfp": ttfp, "jank": jank}
+
+
+def run_async(path: str, zoom: float, steps: int, workers: int, lookahead: int) -> dict:
+    pdf = PdfPreviewController(pdf_path=path)
+    svc = PdfRenderService()
+    ctrl = PdfRenderController()
+    loop = _MainLoop()
+    sizes = pdf.page_sizes
+    layout = ctrl.calculate_page_layout(sizes, zoom)
+    ready: set = set()
+    worker = PdfRenderWorker(
+        loop,
+        lambda i, z: svc.prepare_page_image(page_index=i, zoom=z, pdf_controller=pdf),
+        max_workers=workers,
+        lookahead=lookahead,
+    )
+
+    def _request(y0: int) -> tuple[float, list]:
+        t0 = time.perf_counter()
+        vis = _visible(ctrl, layout, sizes, zoom, y0)
+        wanted = ctrl.expand_with_lookahead(vis, len(sizes), worker.lookahead)
+        worker.request([i for i in wanted if i not in ready], zoom, lambda i, z, p: ready.add(i))
+        return time.perf_counter() - t0, vis
+
+    t_open = time.perf_counter()
+    first_cost, first_visible = _request(0)
+    while not ready.issuperset(first_visible[:1]):
+        loop.pump(block=0.01)
+    ttfp = time.perf_counter() - t_open
+
+    jank = []
+    for step in range(1, steps + 1):
+        cost, _vis = _request(step * SCROLL_STEP)
+        cost += loop.pump()
+        jank.append(cost)
+        time.sleep(0.016)  # ~1 frame entre eventos de rolagem
+    worker.shutdown()
+    pdf.close()
+    return {"ttfp": ttfp, "ttfp_main_thread": first_cost, "jank": jank}
+
+
+def run_tiles(path: str, zoom: float) -> None:
+    """Página inteira x tiles visíveis num zoom alto (primeira página, viewport no topo)."""
+    pdf = PdfPreviewController(pdf_path=path)
+    svc = PdfRenderService()
+    ctrl = PdfRenderController()
+    sizes = pdf.page_sizes
+    layout = ctrl.calculate_page_layout(sizes, zoom)
+
+    t0 = time.perf_counter()
+    full = svc.prepare_page_image(page_index=0, zoom=zoom, pdf_controller=pdf)
+    t_full = time.perf_counter() - t0
+    full_bytes = full.width * full.height * 3 if full is not None else 0
+    svc.clear_cache()
+    pdf.close()
+
+    pdf = PdfPreviewController(pdf_path=path)
+    viewport = (0, 0, VIEWPORT_W, VIEWPORT_H)
+    t0 = time.perf_counter()
+    tiles = ctrl.find_visible_tiles(layout.page_tops, sizes, zoom, viewport)
+    tile_bytes = 0
+    for tile in tiles:
+        img = svc.prepare_tile_image(tile=tile, zoom=zoom, pdf_controller=pdf)
+        if img is not None:
+            tile_bytes += img.width * img.height * 3
+    t_tiles = time.perf_counter() - t0
+    pdf.close()
+
+    print(f"   Zoom {zoom:.0%}, viewport {VIEWPORT_W}x{VIEWPORT_H}")
+    print(f"      página inteira: {t_full * 1000:8.1f} ms | {full_bytes / 1e6:7.1f} MB")
+    print(f"      {len(tiles):3d} tiles de {ctrl.tile_size}px: {t_tiles * 1000:8.1f} ms | {tile_bytes / 1e6:7.1f} MB")
+
+
+def _report(name: str, result: dict) -> None:
+    jank_ms = sorted(v * 1000 for v in result["jank"])
+    p95 = jank_ms[int(len(jank_ms) * 0.95) - 1] if jank_ms else 0.0
+    print(f"   {name}")
+    print(f"      time-to-first-visible-page: {result['ttfp'] * 1000:8.1f} ms")
+    if "ttfp_main_thread" in result:
+        print(f"      (bloqueio da thread principal na abertura: {result['ttfp_main_thread'] * 1000:.1f} ms)")
+    print(
+        f"      scroll jank por passo: mediana {statistics.median(jank_ms):7.1f} ms | "
+        f"p95 {p95:7.1f} ms | máx {max(jank_ms):7.1f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--zoom", type=float, default=1.5)
+    parser.add_argument("--steps", type=int, default=60, help="passos de rolagem simulados")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--lookahead", type=int, default=2)
+    parser.add_argument("--tile-zoom", type=float, default=0.0, help="compara tiles x página inteira neste zoom")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.pdf")
+        print(f"📄 Gerando PDF sintético com {args.pages} páginas...")
+        build_synthetic_pdf(path, args.pages)
+        print(f"⏱️  Zoom {args.zoom:.0%}, viewport {VIEWPORT_H}px, {args.steps} passos de {SCROLL_STEP}px")
+        _report("Síncrono (thread principal)", run_sync(path, args.zoom, args.steps))
+        _report(
+            f"Worker em background ({args.workers} threads, look-ahead {args.lookahead})",
+            run_async(path, args.zoom, args.steps, args.workers, args.lookahead),
+        )
+        if args.tile_zoom > 0:
+            run_tiles(path, args.tile_zoom)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark dos backends de persistência da SyncQueue.
+
+OBJETIVO: Comparar, com N operações enfileiradas (padrão 10k):
+- json: ``SyncQueue`` — reescreve o arquivo JSON inteiro a cada enqueue/process
+- journal: ``JournalSyncQueue`` — anexa uma linha por operação (append-only)
+
+Mede o tempo total de enfileirar N itens, de processar todos (ack de cada
+sucesso) e de reabrir a fila (replay do arquivo), além do tamanho final.
+
+Uso:
+    python scripts/bench_sync_queue.py
+    python scripts/bench_sync_queue.py --ops 10000 --no-fsync
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+try:
+    from src.infra.sync_queue import JournalSyncQueue, SyncQueue
+except ImportError as e:
+    print(f"❌ Erro ao importar dependências: {e}", file=sys.stderr)
+    sys.exit(1)
+
+PAYLOAD = {"client_id": 123, "path": "org/123/GERAL/documento.pdf", "size": 1048576}
+
+
+def _bench(name: str, factory, path: str, ops: int) -> None:
+    queue = factory(path)
+    t0 = time.perf_counter()
+    for i in range(ops):
+        queue.enqueue("upload", dict(PAYLOAD, seq=i))
+    t_enqueue = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    reopened = factory(path)
+    t_reopen = time.perf_counter() - t0
+    pending = len(reopened.list())
+    if hasattr(queue, "close"):
+        queue.close()
+
+    t0 = time.perf_counter()
+    processed, remaining = reopened.process(lambda _item: True)
+    t_process = time.perf_counter() - t0
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    if hasattr(reopened, "close"):
+        reopened.close()
+
+    print(
+        f"{name:<8} enqueue={t_enqueue * 1000:9.1f} ms ({t_enqueue / ops * 1e6:7.1f} µs/op)  "
+        f"reopen={t_reopen * 1000:7.1f} ms  process={t_process * 1000:9.1f} ms  "
+        f"pendentes={pending} processados={processed} restantes={remaining} arquivo={size} B"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=10_000, help="Operações enfileiradas (padrão: 10000)")
+    parser.add_argument("--no-fsync", action="store_true", help="Journal sem fsync por registro")
+    parser.add_argument("--skip-json", action="store_true", help="Não roda o backend JSON (lento para N grande)")
+    args = parser.parse_args()
+
+    print(f"SyncQueue — {args.ops} operações")
+    with tempfile.TemporaryDirectory() as tmp:
+        if not args.skip_json:
+            _bench("json", SyncQueue, os.path.join(tmp, "q.json"), args.ops)
+        _bench(
+            "journal",
+            lambda p: JournalSyncQueue(p, fsync=not args.no_fsync),
+            os.path.join(tmp, "q.jsonl"),
+            args.ops,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# adapters/storage/bulk_delete.py
+"""Exclusão recursiva em lote de um prefixo (pasta) do Storage.
+
+Pipeline único usado pelo navegador de arquivos e pela exclusão definitiva
+de clientes:
+
+1. Listagem concorrente: a árvore é percorrida com ``walk_prefix``, que
+   lista até ``max_workers`` pastas em paralelo, em vez de uma chamada
+   ``list`` por vez.
+2. Remoção em lotes: as chaves encontradas são enviadas em chamadas
+   ``remove`` de até ``chunk_size`` chaves (limite da API: 1000), também em
+   paralelo, cada uma com retry para falhas transitórias.
+3. Relatório por lote: ``BulkDeleteReport`` informa exatamente quais chaves
+   continuam no storage (lotes que falharam e chaves que ``remove`` não
+   devolveu como apagadas) e quais prefixos não puderam ser listados.
+
+As chaves vêm da própria listagem e são removidas como estão (sem a
+normalização de nomes usada no upload), para que objetos antigos com
+acentos no nome também sejam apagados.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence
+
+from src.adapters.storage.listing import walk_prefix
+from src.config.environment import env_int
+from src.infra.retry_policy import retry_call
+
+logger = logging.getLogger("infra.supabase.storage")
+
+__all__ = [
+    "BulkDeleteReport",
+    "ChunkFailure",
+    "DELETE_CHUNK_SIZE",
+    "DELETE_MAX_WORKERS",
+    "collect_storage_keys",
+    "delete_prefix",
+]
+
+# Máximo de chaves por chamada ``remove`` aceito pela API do Storage
+DELETE_CHUNK_SIZE: int = 1000
+# Chamadas simultâneas de list/remove durante uma exclusão recursiva
+DELETE_MAX_WORKERS: int = max(1, env_int("RC_STORAGE_DELETE_WORKERS", 4))
+
+ListFn = Callable[[str], Iterable[Any]]
+RemoveFn = Callable[[list[str]], Any]
+
+
+@dataclass(frozen=True)
+class ChunkFailure:
+    """Chaves de um lote cuja remoção falhou ou não foi confirmada (continuam no storage)."""
+
+    keys: tuple[str, ...]
+    error: str
+
+
+@dataclass
+class BulkDeleteReport:
+    """Resultado de ``delete_prefix``."""
+
+    prefix: str
+    found: int = 0
+    deleted: int = 0
+    failed_chunks: list[ChunkFailure] = field(default_factory=list)
+    list_errors: list[str] = field(default_factory=list)
+    duration_s: float = 0.0
+
+    @property
+    def remaining(self) -> list[str]:
+        """Chaves que não foram removidas (lotes com falha ou não confirmadas)."""
+        return [key for failure in self.failed_chunks for key in failure.keys]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed_chunks and not self.list_errors
+
+    def error_messages(self) -> list[str]:
+        """Uma mensagem por falha de listagem e por lote não removido."""
+        messages = [f"Falha ao listar {err}" for err in self.list_errors]
+        for failure in self.failed_chunks:
+            preview = ", ".join(failure.keys[:5])
+            extra = f" (+{len(failure.keys) - 5})" if len(failure.keys) > 5 else ""
+            messages.append(f"{len(failure.keys)} arquivo(s) não removidos: {failure.error} [{preview}{extra}]")
+        return messages
+
+
+def _removed_names(response: Any) -> set[str] | None:
+    """Chaves confirmadas na resposta de ``remove`` (lista de objetos apagados).
+
+    Retorna None quando a resposta não traz essa lista (nada a conferir).
+    """
+    if not isinstance(response, list):
+        return None
+    return {
+        str(item["name"]).strip("/") for item in response if isinstance(item, dict) and item.get("name") is not None
+    }
+
+
+def collect_storage_keys(
+    list_fn: ListFn,
+    root_prefix: str,
+    *,
+    max_workers: int = DELETE_MAX_WORKERS,
+) -> tuple[list[str], list[str]]:
+    """Coleta todas as chaves de arquivo sob ``root_prefix``.
+
+    As pastas são listadas em paralelo (``walk_prefix``). Um prefixo que
+    falha na listagem não interrompe os demais.
+
+    Returns:
+        ``(chaves, erros_de_listagem)``; cada erro é ``"<prefixo>: <mensagem>"``.
+    """
+    errors: list[str] = []
+    keys = [
+        entry["full_path"]
+        for entry in walk_prefix(
+            list_fn,
+            root_prefix,
+            max_workers=max_workers,
+            on_error=lambda prefix, exc: errors.append(f"{prefix}: {exc}"),
+        )
+    ]
+    return keys, errors
+
+
+def delete_prefix(
+    list_fn: ListFn,
+    remove_fn: RemoveFn,
+    prefix: str,
+    *,
+    chunk_size: int = DELETE_CHUNK_SIZE,
+    max_workers: int = DELETE_MAX_WORKERS,
+    keys: Sequence[str] | None = None,
+) -> BulkDeleteReport:
+    """Remove recursivamente todos os arquivos sob ``prefix``.
+
+    Args:
+        list_fn: Lista um nível do prefixo (ex.: ``adapter.list_files``).
+        remove_fn: Remove uma lista de chaves numa única chamada.
+        prefix: Pasta a esvaziar.
+        chunk_size: Chaves por chamada ``remove`` (máx. 1000).
+        max_workers: Chamadas simultâneas de list/remove.
+        keys: Chaves já conhecidas (pula a listagem).
+
+    Returns:
+        ``BulkDeleteReport``; falhas não levantam exceção, ficam no relatório.
+    """
+    start = time.perf_counter()
+    report = BulkDeleteReport(prefix=prefix.strip("/"))
+    if keys is None:
+        found, report.list_errors = collect_storage_keys(list_fn, report.prefix, max_workers=max_workers)
+    else:
+        found = [k.strip("/") for k in keys if k and k.strip("/")]
+    report.found = len(found)
+
+    size = max(1, min(int(chunk_size), DELETE_CHUNK_SIZE))
+    chunks = [found[i : i + size] for i in range(0, len(found), size)]
+
+    def _remove(chunk: list[str]) -> ChunkFailure | None:
+        try:
+            response = retry_call(remove_fn, chunk)
+        except Exception as exc:  # noqa: BLE001 - registrada no relatório
+            return ChunkFailure(tuple(chunk), f"{type(exc).__name__}: {exc}")
+        removed = _removed_names(response)
+        if removed is None:
+            return None
+        # Chaves sem permissão (RLS) ou já inexistentes não voltam na resposta
+        missing = tuple(key for key in chunk if key not in removed)
+        return ChunkFailure(missing, "não confirmadas pelo storage") if missing else None
+
+    workers = max(1, min(int(max_workers), len(chunks)))
+    if workers == 1:
+        outcomes = [_remove(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="StorageRemove") as executor:
+            outcomes = list(executor.map(_remove, chunks))
+
+    for chunk, failure in zip(chunks, outcomes):
+        report.deleted += len(chunk) - (len(failure.keys) if failure else 0)
+        if failure is not None:
+            report.failed_chunks.append(failure)
+
+    report.duration_s = time.perf_counter() - start
+    log_fn = logger.info if report.ok else logger.warning
+    log_fn(
+        "storage.bulk_delete: prefix=%s, found=%d, deleted=%d, remaining=%d, list_errors=%d, chunks=%d, duration_ms=%.2f",
+        report.prefix,
+        report.found,
+        report.deleted,
+        len(report.remaining),
+        len(report.list_errors),
+        len(chunks),
+        report.duration_s * 1000,
+    )
+    return report
@@ -0,0 +1,139 @@
+# adapters/storage/listing.py
+"""Listagem paginada e percurso recursivo concorrente do Storage.
+
+O endpoint ``list`` do Storage devolve no máximo ``limit`` entradas por
+chamada (teto de 1000). ``iter_pages`` percorre o prefixo com
+``offset`` crescente até receber uma página incompleta, entregando cada
+página assim que chega, sem truncar pastas grandes.
+
+``walk_prefix`` percorre a árvore inteira listando até ``max_workers``
+pastas ao mesmo tempo e devolve os arquivos conforme cada pasta termina
+de ser listada (sem esperar a árvore toda).
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from src.config.environment import env_int
+
+logger = logging.getLogger("infra.supabase.storage")
+
+__all__ = [
+    "LIST_MAX_WORKERS",
+    "LIST_PAGE_SIZE",
+    "MAX_LIST_PAGE_SIZE",
+    "entry_path",
+    "entry_size",
+    "is_folder_entry",
+    "iter_pages",
+    "walk_prefix",
+]
+
+# Teto de ``limit`` aceito pelo endpoint de listagem
+MAX_LIST_PAGE_SIZE: int = 1000
+LIST_PAGE_SIZE: int = min(MAX_LIST_PAGE_SIZE, max(1, env_int("RC_STORAGE_LIST_PAGE_SIZE", MAX_LIST_PAGE_SIZE)))
+# Pastas listadas simultaneamente no percurso recursivo
+LIST_MAX_WORKERS: int = max(1, env_int("RC_STORAGE_LIST_WORKERS", 4))
+
+FetchPage = Callable[[int, int], Optional[Iterable[Any]]]
+ListFn = Callable[[str], Iterable[Any]]
+
+
+def iter_pages(fetch_page: FetchPage, page_size: int = LIST_PAGE_SIZE) -> Iterator[list[Any]]:
+    """Gera páginas de ``fetch_page(limit, offset)`` até uma página vir incompleta."""
+    size = min(MAX_LIST_PAGE_SIZE, max(1, int(page_size)))
+    offset = 0
+    while True:
+        page = list(fetch_page(size, offset) or [])
+        if page:
+            yield page
+        if len(page) < size:
+            return
+        offset += len(page)
+
+
+def is_folder_entry(entry: dict[str, Any]) -> bool:
+    """Pastas são chaves virtuais: a API devolve ``metadata`` None para elas."""
+    if "is_folder" in entry:
+        return bool(entry["is_folder"])
+    return entry.get("metadata") is None
+
+
+def entry_path(prefix: str, entry: dict[str, Any]) -> str:
+    full_path = (entry.get("full_path") or "").strip("/")
+    if full_path:
+        return full_path
+    name = (entry.get("name") or "").strip("/")
+    return f"{prefix}/{name}" if prefix and name else name
+
+
+def entry_size(entry: dict[str, Any]) -> int:
+    """Tamanho em bytes de uma entrada de arquivo (0 se desconhecido)."""
+    meta = entry.get("metadata")
+    raw = entry.get("size_bytes")
+    if raw is None and isinstance(meta, dict):
+        raw = meta.get("size") or meta.get("contentLength")
+    try:
+        return max(0, int(raw or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def walk_prefix(
+    list_fn: ListFn,
+    root_prefix: str,
+    *,
+    max_workers: int = LIST_MAX_WORKERS,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+) -> Iterator[dict[str, Any]]:
+    """Percorre ``root_prefix`` recursivamente, gerando as entradas de arquivo.
+
+    Cada entrada gerada é uma cópia com ``full_path`` preenchido. Até
+    ``max_workers`` pastas são listadas em paralelo; a ordem de saída segue
+    a ordem em que as pastas terminam.
+
+    Args:
+        list_fn: Lista um nível do prefixo (todas as páginas).
+        root_prefix: Pasta inicial.
+        max_workers: Pastas listadas simultaneamente.
+        on_error: Recebe ``(prefixo, exceção)`` de pastas que falharam e o
+            percurso continua; sem ele, a primeira falha é propagada.
+    """
+    root = root_prefix.strip("/")
+
+    def _list_one(prefix: str) -> list[dict[str, Any]]:
+        return [entry for entry in list_fn(prefix) or [] if isinstance(entry, dict)]
+
+    workers = max(1, int(max_workers))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="StorageList")
+    pending: dict[Future[list[dict[str, Any]]], str] = {}
+    try:
+        pending[executor.submit(_list_one, root)] = root
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                prefix = pending.pop(future)
+                try:
+                    entries = future.result()
+                except Exception as exc:
+                    if on_error is None:
+                        raise
+                    logger.warning("storage.walk.list_error: prefix=%s, error=%s", prefix, exc)
+                    on_error(prefix, exc)
+                    continue
+                for entry in entries:
+                    path = entry_path(prefix, entry)
+                    if not path:
+                        continue
+                    if is_folder_entry(entry):
+                        pending[executor.submit(_list_one, path)] = path
+                    else:
+                        yield {**entry, "full_path": path}
+    finally:
+        # Gerador abandonado (ex.: cancelamento): não espera as listagens restantes
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,215 @@
+# adapters/storage/resumable_upload.py
+"""Upload resumível (protocolo TUS) para o Supabase Storage.
+
+Arquivos grandes são enviados em blocos de ``TUS_CHUNK_SIZE`` lidos do disco
+sob demanda: a memória usada por upload fica limitada a um bloco, seja qual
+for o tamanho do arquivo.
+
+O Supabase expõe o endpoint TUS em ``<storage>/upload/resumable``:
+
+1. ``POST`` cria o upload (``Upload-Length`` + ``Upload-Metadata`` com
+   bucket/objeto/content-type) e devolve a URL do upload em ``Location``;
+2. ``PATCH`` envia cada bloco a partir de ``Upload-Offset``; a resposta traz
+   o novo offset confirmado pelo servidor;
+3. ``HEAD`` consulta o offset já confirmado — usado para retomar.
+
+A URL de cada upload em andamento fica registrada em memória (chave: bucket,
+objeto, tamanho e mtime do arquivo). Quando uma tentativa cai no meio, a
+próxima (retry do adapter ou de ``upload_with_retry``) consulta o offset e
+continua do último bloco confirmado, em vez de reenviar o arquivo inteiro.
+O Supabase descarta uploads incompletos após 24 h; uma URL expirada
+(404/410) faz o upload recomeçar do zero.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Mapping, Optional
+from urllib.parse import urljoin
+
+from storage3.exceptions import StorageApiError
+
+from src.config.environment import env_int
+
+logger = logging.getLogger("infra.supabase.storage")
+
+__all__ = [
+    "RESUMABLE_THRESHOLD_BYTES",
+    "TUS_CHUNK_SIZE",
+    "ResumableUploadRegistry",
+    "resumable_endpoint",
+    "tus_upload",
+]
+
+TUS_VERSION = "1.0.0"
+# O Supabase exige blocos de exatamente 6 MB (exceto o último)
+TUS_CHUNK_SIZE: int = 6 * 1024 * 1024
+# Acima deste tamanho o upload usa TUS; abaixo, um único POST em streaming
+RESUMABLE_THRESHOLD_BYTES: int = max(1, env_int("RC_UPLOAD_RESUMABLE_MB", 6)) * 1024 * 1024
+
+
+class ResumableUploadRegistry:
+    """URLs de uploads TUS em andamento, por impressão digital do arquivo."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._urls: dict[tuple, str] = {}
+
+    def get(self, fingerprint: tuple) -> Optional[str]:
+        with self._lock:
+            return self._urls.get(fingerprint)
+
+    def put(self, fingerprint: tuple, url: str) -> None:
+        with self._lock:
+            self._urls[fingerprint] = url
+
+    def discard(self, fingerprint: tuple) -> None:
+        with self._lock:
+            self._urls.pop(fingerprint, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._urls)
+
+
+_registry = ResumableUploadRegistry()
+
+
+def resumable_endpoint(storage: Any) -> Optional[tuple[Any, str, dict[str, str]]]:
+    """Extrai (sessão httpx, URL do endpoint TUS, headers de auth) do cliente storage3.
+
+    Retorna None se o cliente não expõe o necessário (ex.: mocks, versões antigas).
+    """
+    session = getattr(storage, "session", None)
+    base_url = getattr(storage, "_base_url", None)
+    headers = getattr(storage, "_headers", None)
+    if session is None or base_url is None or not isinstance(headers, Mapping):
+        return None
+    endpoint = str(base_url).rstrip("/") + "/upload/resumable"
+    if not endpoint.startswith(("http://", "https://")):
+        return None
+    return session, endpoint, dict(headers)
+
+
+def _b64(value: str) -> str:
+    return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def _raise_for_status(response: Any, expected: tuple[int, ...]) -> None:
+    status = int(getattr(response, "status_code", 0))
+    if status in expected:
+        return
+    text = str(getattr(response, "text", "") or "").strip()
+    error = "Duplicate" if status == 409 else "TusError"
+    raise StorageApiError(text or f"HTTP {status}", error, status)
+
+
+def _server_offset(session: Any, url: str, headers: dict[str, str]) -> Optional[int]:
+    """Offset confirmado pelo servidor, ou None se o upload não existe mais."""
+    response = session.request("HEAD", url, headers=headers)
+    if int(response.status_code) in (404, 410):
+        return None
+    _raise_for_status(response, (200, 204))
+    return int(response.headers.get("Upload-Offset", 0))
+
+
+def tus_upload(
+    session: Any,
+    endpoint: str,
+    auth_headers: Mapping[str, str],
+    bucket: str,
+    key: str,
+    path: str | os.PathLike[str],
+    content_type: str,
+    *,
+    upsert: bool = False,
+    chunk_size: int = TUS_CHUNK_SIZE,
+    registry: ResumableUploadRegistry = _registry,
+) -> str:
+    """Envia ``path`` para ``bucket/key`` via TUS, retomando se já houver upload parcial.
+
+    Raises:
+        StorageApiError: Resposta de erro do servidor (409 = objeto já existe).
+        OSError/httpx.HTTPError: Falhas de leitura/rede (transitórias para o retry).
+    """
+    file_path = Path(path)
+    stat = file_path.stat()
+    total = stat.st_size
+    fingerprint = (endpoint, bucket, key, total, stat.st_mtime_ns)
+    headers = {**auth_headers, "Tus-Resumable": TUS_VERSION}
+
+    url = registry.get(fingerprint)
+    offset: Optional[int] = None
+    if url:
+        offset = _server_offset(session, url, headers)
+        if offset is None:
+            registry.discard(fingerprint)
+            url = None
+        else:
+            logger.info("storage.tus.resume: bucket=%s, key=%s, offset=%d/%d", bucket, key, offset, total)
+
+    if url is None:
+        metadata = ",".join(
+            f"{name} {_b64(value)}"
+            for name, value in (
+                ("bucketName", bucket),
+                ("objectName", key),
+                ("contentType", content_type),
+                ("cacheControl", "3600"),
+            )
+        )
+        response = session.request(
+            "POST",
+            endpoint,
+            headers={
+                **headers,
+                "Upload-Length": str(total),
+                "Upload-Metadata": metadata,
+                "x-upsert": "true" if upsert else "false",
+            },
+        )
+        _raise_for_status(response, (200, 201))
+        location = response.headers.get("Location")
+        if not location:
+            raise StorageApiError("Resposta TUS sem Location", "TusError", int(response.status_code))
+        url = urljoin(endpoint, str(location))
+        registry.put(fingerprint, url)
+        offset = 0
+
+    assert offset is not None
+    with file_path.open("rb") as handle:
+        while offset < total:
+            handle.seek(offset)
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                raise OSError(f"Arquivo encolheu durante o upload: {file_path}")
+            response = session.request(
+                "PATCH",
+                url,
+                headers={
+                    **headers,
+                    "Upload-Offset": str(offset),
+                    "Content-Type": "application/offset+octet-stream",
+                },
+                content=chunk,
+            )
+            if int(response.status_code) == 409:
+                # Offset divergente (bloco confirmado sem resposta chegar): ressincroniza
+                synced = _server_offset(session, url, headers)
+                if synced is None:
+                    registry.discard(fingerprint)
+                    raise ConnectionError(f"Upload TUS expirou no servidor: {key}")
+                if synced == offset:
+                    raise ConnectionError(f"Upload TUS sem progresso no offset {offset}: {key}")
+                offset = synced
+                continue
+            _raise_for_status(response, (200, 204))
+            offset = int(response.headers.get("Upload-Offset", offset + len(chunk)))
+            logger.debug("storage.tus.chunk: key=%s, offset=%d/%d", key, offset, total)
+
+    registry.discard(fingerprint)
+    return key
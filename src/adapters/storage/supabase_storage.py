@@ -7,7 +7,7 @@ import os
 import re
 import time
 from pathlib import Path
-from typing import Iterable, Optional, Any
+from typing import Callable, Iterable, Iterator, Optional, Any, cast
 
 # PERF-006: Import em nível de módulo
 from src.core.text_normalization import normalize_ascii  # noqa: E402
@@ -15,6 +15,22 @@ from src.config.paths import CLOUD_ONLY  # noqa: E402
 from src.infra.supabase_client import supabase, baixar_pasta_zip, DownloadCancelledError  # noqa: E402
 from src.infra.retry_policy import retry_call as _core_retry  # noqa: E402
 from src.adapters.storage.port import StoragePort  # noqa: E402
+from src.adapters.storage.listing import (  # noqa: E402
+    LIST_MAX_WORKERS,
+    LIST_PAGE_SIZE,
+    iter_pages,
+    walk_prefix,
+)
+from src.adapters.storage.bulk_delete import (  # noqa: E402
+    DELETE_MAX_WORKERS,
+    BulkDeleteReport,
+    delete_prefix as _bulk_delete_prefix,
+)
+from src.adapters.storage.resumable_upload import (  # noqa: E402
+    RESUMABLE_THRESHOLD_BYTES,
+    resumable_endpoint,
+    tus_upload,
+)
 
 # Alias patchável em testes (sem afetar time.sleep do restante do processo)
 _sleep = time.sleep
@@ -154,12 +170,18 @@ def _is_transient_exc(exc: Exception) -> bool:
     return False
 
 
-def _read_data(source: Any) -> bytes:
+def _upload_source(source: Any) -> tuple[bytes | None, Path | None, int]:
+    """Resolve a origem do upload sem carregar arquivos do disco na memória.
+
+    Returns:
+        (bytes, None, tamanho) para dados em memória ou (None, caminho, tamanho)
+        para arquivos, que são enviados em streaming a cada tentativa.
+    """
     if isinstance(source, (bytes, bytearray)):
-        return bytes(source)
+        data = bytes(source)
+        return data, None, len(data)
     path = Path(source)
-    with path.open("rb") as handle:
-        return handle.read()
+    return None, path, path.stat().st_size
 
 
 def _upload(
@@ -177,19 +199,40 @@ def _upload(
         # storage3 espera string, não bool (evita erro 'bool'.encode)
         "upsert": "true" if upsert else "false",
     }
-    data = _read_data(source)
-    data_size = len(data)
+    data, path, data_size = _upload_source(source)
+    # Arquivos grandes: TUS em blocos (memória limitada a um bloco, retoma do último confirmado)
+    tus = None
+    if path is not None and data_size > RESUMABLE_THRESHOLD_BYTES:
+        tus = resumable_endpoint(client.storage)
 
     start = time.perf_counter()
     logger.info(
-        "storage.op.start: op=upload, bucket=%s, key=%s, size=%d",
+        "storage.op.start: op=upload, bucket=%s, key=%s, size=%d, mode=%s",
         bucket,
         key,
         data_size,
+        "tus" if tus else "stream" if path is not None else "bytes",
     )
 
     def _do_upload() -> str:
-        response = client.storage.from_(bucket).upload(key, data, file_options=file_options)
+        if tus is not None:
+            session, endpoint, auth_headers = tus
+            return tus_upload(
+                session,
+                endpoint,
+                auth_headers,
+                bucket,
+                key,
+                cast(Path, path),
+                file_options["content-type"],
+                upsert=upsert,
+            )
+        if path is not None:
+            # Handle novo por tentativa: httpx lê o arquivo em blocos durante o envio
+            with path.open("rb") as handle:
+                response = client.storage.from_(bucket).upload(key, handle, file_options=file_options)
+        else:
+            response = client.storage.from_(bucket).upload(key, data, file_options=file_options)
         if isinstance(response, dict):
             data_obj = response.get("data")
             if isinstance(data_obj, dict):
@@ -406,9 +449,27 @@ def _remove_batch(
         raise
 
 
-def _list(client: Any, bucket: str, prefix: str = "") -> list[dict[str, Any]]:
+def _iter_list_pages(
+    client: Any,
+    bucket: str,
+    prefix: str = "",
+    *,
+    page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Gera as páginas de um nível do prefixo (``limit``/``offset``), com ``full_path``."""
     base = prefix.strip("/")
     path = f"{base}/" if base else ""
+    bucket_api = client.storage.from_(bucket)
+
+    def _fetch(limit: int, offset: int) -> list[Any]:
+        return bucket_api.list(
+            path=path,
+            options={
+                "limit": limit,
+                "offset": offset,
+                "sortBy": {"column": "name", "order": "asc"},
+            },
+        )
 
     start = time.perf_counter()
     logger.info(
@@ -417,48 +478,48 @@ def _list(client: Any, bucket: str, prefix: str = "") -> list[dict[str, Any]]:
         base,
     )
 
+    count = 0
+    pages = 0
     try:
-        response = client.storage.from_(bucket).list(
-            path=path,
-            options={
-                "limit": 1000,
-                "offset": 0,
-                "sortBy": {"column": "name", "order": "asc"},
-            },
-        )
-
-        results: list[dict[str, Any]] = []
-        for obj in response or []:
-            if not isinstance(obj, dict):
-                continue
-            entry = dict(obj)
-            name = entry.get("name") or ""
-            entry["full_path"] = f"{base}/{name}".strip("/") if base else name
-            results.append(entry)
-
-        duration_ms = (time.perf_counter() - start) * 1000
-        logger.info(
-            "storage.op.success: op=list, bucket=%s, prefix=%s, count=%d, duration_ms=%.2f",
-            bucket,
-            base,
-            len(results),
-            duration_ms,
-        )
-
-        return results
-
+        for raw_page in iter_pages(_fetch, page_size):
+            page: list[dict[str, Any]] = []
+            for obj in raw_page:
+                if not isinstance(obj, dict):
+                    continue
+                entry = dict(obj)
+                name = entry.get("name") or ""
+                entry["full_path"] = f"{base}/{name}".strip("/") if base else name
+                page.append(entry)
+            pages += 1
+            count += len(page)
+            yield page
     except Exception as exc:
         duration_ms = (time.perf_counter() - start) * 1000
         logger.error(
-            "storage.op.error: op=list, bucket=%s, prefix=%s, duration_ms=%.2f, error=%s",
+            "storage.op.error: op=list, bucket=%s, prefix=%s, pages=%d, duration_ms=%.2f, error=%s",
             bucket,
             base,
+            pages,
             duration_ms,
             type(exc).__name__,
             exc_info=True,
         )
         raise
 
+    duration_ms = (time.perf_counter() - start) * 1000
+    logger.info(
+        "storage.op.success: op=list, bucket=%s, prefix=%s, count=%d, pages=%d, duration_ms=%.2f",
+        bucket,
+        base,
+        count,
+        pages,
+        duration_ms,
+    )
+
+
+def _list(client: Any, bucket: str, prefix: str = "") -> list[dict[str, Any]]:
+    return [entry for page in _iter_list_pages(client, bucket, prefix) for entry in page]
+
 
 class SupabaseStorageAdapter(StoragePort):
     """Concrete implementation of StoragePort backed by the shared supabase client."""
@@ -497,6 +558,41 @@ class SupabaseStorageAdapter(StoragePort):
     def list_files(self, prefix: str = "") -> list[dict[str, Any]]:
         return _list(self._client, self._bucket, prefix)
 
+    def iter_file_pages(self, prefix: str = "", *, page_size: int = LIST_PAGE_SIZE) -> Iterator[list[dict[str, Any]]]:
+        """Gera as páginas de um nível de *prefix* conforme chegam do servidor."""
+        return _iter_list_pages(self._client, self._bucket, prefix, page_size=page_size)
+
+    def iter_files(self, prefix: str = "", *, page_size: int = LIST_PAGE_SIZE) -> Iterator[dict[str, Any]]:
+        """Gera as entradas de um nível de *prefix*, página a página."""
+        for page in self.iter_file_pages(prefix, page_size=page_size):
+            yield from page
+
+    def walk_files(
+        self,
+        prefix: str = "",
+        *,
+        max_workers: int = LIST_MAX_WORKERS,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Gera todos os arquivos sob *prefix* (pastas listadas em paralelo)."""
+        return walk_prefix(self.list_files, prefix, max_workers=max_workers, on_error=on_error)
+
+    def delete_prefix(
+        self,
+        prefix: str,
+        *,
+        chunk_size: int = 1000,
+        max_workers: int = DELETE_MAX_WORKERS,
+    ) -> BulkDeleteReport:
+        """Remove recursivamente todos os arquivos sob *prefix* (listagem paralela + lotes)."""
+        return _bulk_delete_prefix(
+            self.list_files,
+            lambda keys: self._client.storage.from_(self._bucket).remove(keys),
+            prefix,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
     def download_folder_zip(
         self,
         prefix: str,
@@ -543,6 +639,10 @@ def list_files(prefix: str = "") -> Iterable[dict[str, Any]]:
     return _default_adapter.list_files(prefix)
 
 
+def iter_files(prefix: str = "", *, page_size: int = LIST_PAGE_SIZE) -> Iterator[dict[str, Any]]:
+    return _default_adapter.iter_files(prefix, page_size=page_size)
+
+
 def download_folder_zip(
     prefix: str,
     *,
@@ -576,6 +676,7 @@ __all__ = [
     "delete_file",
     "remove_files",
     "list_files",
+    "iter_files",
     "download_folder_zip",
     "DownloadCancelledError",
     "get_default_adapter",
@@ -467,6 +467,18 @@ def _update_footer_email(app: AppProtocol) -> None:
         log.debug("Falha ao atualizar email no rodapé", exc_info=exc)
 
 
+def _start_clients_replica(logger: Optional[logging.Logger]) -> None:
+    """Abre a réplica local de clientes da organização logada (sincroniza em segundo plano)."""
+    try:
+        from src.core.db_manager.replica import start_clients_replica
+        from src.core.session.session import get_current_user
+
+        user = get_current_user()
+        start_clients_replica(getattr(user, "org_id", None) if user else None)
+    except Exception as exc:
+        (logger or log).debug("Réplica local de clientes não iniciada", exc_info=exc)
+
+
 def _mark_app_online(app: AppProtocol, logger: Optional[logging.Logger]) -> None:
     """Atualiza indicadores visuais sem exibir a janela (deiconify é responsabilidade do app_gui)."""
     # REMOVIDO: app.deiconify() - isso agora é feito em app_gui.py APÓS ensure_logged retornar True
@@ -484,6 +496,7 @@ def _mark_app_online(app: AppProtocol, logger: Optional[logging.Logger]) -> None
         (logger or log).warning("Falha ao atualizar status do usuário: %s", exc, exc_info=True)
 
     _update_footer_email(app)
+    _start_clients_replica(logger)
 
 
 def ensure_logged(
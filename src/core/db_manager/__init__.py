@@ -27,10 +27,13 @@ from .db_manager import (
     update_cliente,
     update_status_only,
 )
+from .keyset import ClientesPage, InvalidCursorError
 
 __all__ = [
     "BatchInsertPartialError",
+    "ClientesPage",
     "DEFAULT_PAGE_LIMIT",
+    "InvalidCursorError",
     "db_manager",
     "init_db",
     "init_or_upgrade",
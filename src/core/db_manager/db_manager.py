@@ -8,6 +8,8 @@ from typing import Any, Callable, Iterable
 
 from src.infra.supabase_client import exec_postgrest, supabase
 from src.core.cnpj_norm import normalize_cnpj as normalize_cnpj_norm
+from src.core.db_manager.keyset import ClientesPage, apply_keyset, page_from_rows
+from src.core.db_manager.replica import notify_clients_changed
 from src.core.models import Cliente
 from src.core.session.session import get_current_user
 
@@ -199,6 +201,24 @@ def _resolve_order(order_by: str | None, descending: bool | None) -> tuple[str,
     return col, desc
 
 
+def _fetch_page(
+    query: Any, col: str, desc: bool, *, limit: int | None, offset: int, cursor: str | None
+) -> ClientesPage:
+    """Executa a listagem já ordenada por ``(col, id DESC)`` e embala a página.
+
+    Com ``cursor`` a página começa depois da última linha vista (keyset);
+    sem ele, usa ``range(offset, ...)`` como antes.
+    """
+    if limit is not None:
+        if cursor:
+            query = apply_keyset(query, col, desc, cursor, id_desc=True).limit(limit)
+        else:
+            query = query.range(offset, offset + limit - 1)
+    resp: Any = exec_postgrest(query)
+    rows: list[dict[str, Any]] = resp.data or []
+    return page_from_rows([_to_cliente(r) for r in rows], rows, col, desc, limit)
+
+
 # -------------------- CRUD / LISTAGEM --------------------
 
 
@@ -209,9 +229,13 @@ def list_clientes_by_org(
     *,
     limit: int | None = DEFAULT_PAGE_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[Cliente]:
     """
     Lista clientes filtrando por org_id (obrigatório) com paginação.
+
+    O retorno é uma ``ClientesPage`` (lista) com ``next_cursor``: passá-lo em
+    ``cursor`` busca a página seguinte por keyset em vez de ``offset``.
     """
     if org_id is None:
         raise ValueError("org_id obrigatório")
@@ -226,10 +250,7 @@ def list_clientes_by_org(
         .order(col, desc=desc)
         .order("id", desc=True)  # tiebreaker estável
     )
-    if limit is not None:
-        query = query.range(offset, offset + limit - 1)
-    resp: Any = exec_postgrest(query)
-    return [_to_cliente(r) for r in (resp.data or [])]
+    return _fetch_page(query, col, desc, limit=limit, offset=offset, cursor=cursor)
 
 
 def list_clientes(
@@ -238,6 +259,7 @@ def list_clientes(
     *,
     limit: int | None = DEFAULT_PAGE_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[Cliente]:
     """Lista clientes ativos com filtro explícito por org_id e paginação.
 
@@ -255,12 +277,9 @@ def list_clientes(
     else:
         log.warning("list_clientes: org_id indisponível; confiando apenas no RLS.")
     query = query.order(col, desc=desc).order("id", desc=True)
-    if limit is not None:
-        query = query.range(offset, offset + limit - 1)
-    else:
+    if limit is None:
         log.warning("list_clientes: chamado sem limite de paginação (fetch_all).")
-    resp: Any = exec_postgrest(query)
-    return [_to_cliente(r) for r in (resp.data or [])]
+    return _fetch_page(query, col, desc, limit=limit, offset=offset, cursor=cursor)
 
 
 def list_clientes_deletados(
@@ -269,8 +288,9 @@ def list_clientes_deletados(
     *,
     limit: int | None = DEFAULT_PAGE_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[Cliente]:
-    """Lista clientes na lixeira com filtro explícito por org_id e paginação."""
+    """Lista clientes na lixeira com filtro explícito por org_id e paginação (offset ou ``cursor``)."""
     col: str
     desc: bool
     col, desc = _resolve_order(order_by, descending)
@@ -281,10 +301,7 @@ def list_clientes_deletados(
     else:
         log.warning("list_clientes_deletados: org_id indisponível; confiando apenas no RLS.")
     query = query.order(col, desc=desc).order("id", desc=True)
-    if limit is not None:
-        query = query.range(offset, offset + limit - 1)
-    resp: Any = exec_postgrest(query)
-    return [_to_cliente(r) for r in (resp.data or [])]
+    return _fetch_page(query, col, desc, limit=limit, offset=offset, cursor=cursor)
 
 
 def get_cliente(cliente_id: int) -> Cliente | None:
@@ -378,10 +395,12 @@ def insert_cliente(
         raise RuntimeError("Falha ao obter ID do cliente inserido.")
 
     try:
-        return _do()
+        result = _do()
     except Exception as e:
         log.warning(f"Falha ao inserir cliente após retries: {e}")
         raise
+    notify_clients_changed()
+    return result
 
 
 def insert_clientes_batch(
@@ -489,6 +508,7 @@ def insert_clientes_batch(
                     len(inserted_ids),
                     len(clientes),
                 )
+                notify_clients_changed()
                 raise BatchInsertPartialError(
                     f"Falha no lote {batch_idx + 1}/{total_batches}: {exc}",
                     inserted_ids=inserted_ids,
@@ -497,6 +517,8 @@ def insert_clientes_batch(
                     original_error=exc,
                 ) from exc
 
+    if inserted_ids:
+        notify_clients_changed()
     if skipped_cnpjs:
         log.info("insert_clientes_batch: %d CNPJ(s) duplicados ignorados.", len(skipped_cnpjs))
     log.info("insert_clientes_batch: %d/%d inseridos com sucesso.", len(inserted_ids), len(clientes))
@@ -547,10 +569,12 @@ def update_cliente(
         return len(resp.data or [])
 
     try:
-        return _do()
+        result = _do()
     except Exception as e:
         log.warning(f"Falha ao atualizar cliente {cliente_id} após retries: {e}")
         raise
+    notify_clients_changed()
+    return result
 
 
 def update_status_only(cliente_id: int, obs: str) -> int:
@@ -574,15 +598,18 @@ def update_status_only(cliente_id: int, obs: str) -> int:
         return len(resp.data or [])
 
     try:
-        return _do()
+        result = _do()
     except Exception as e:
         log.warning(f"Falha ao atualizar status do cliente {cliente_id}: {e}")
         raise
+    notify_clients_changed()
+    return result
 
 
 def delete_cliente(cliente_id: int) -> int:
     """Exclusão física de um único cliente (use soft_delete_clientes para lixeira)."""
     resp: Any = exec_postgrest(supabase.table("clients").delete().eq("id", cliente_id))
+    notify_clients_changed([cliente_id])
     if getattr(resp, "count", None) is not None:
         return int(resp.count or 0)
     return len(resp.data or [])
@@ -602,6 +629,7 @@ def soft_delete_clientes(ids: Iterable[int]) -> int:
         ),
         context="soft_delete_clientes",
     )
+    notify_clients_changed()
 
     # PostgREST pode não trazer count; fallback no len(data) retornado
     if getattr(resp, "count", None) is not None:
@@ -623,6 +651,7 @@ def restore_clientes(ids: Iterable[int]) -> int:
         ),
         context="restore_clientes",
     )
+    notify_clients_changed()
     if getattr(resp, "count", None) is not None:
         return int(resp.count or 0)
     return len(resp.data or id_list)
@@ -634,6 +663,7 @@ def purge_clientes(ids: Iterable[int]) -> int:
     if not id_list:
         return 0
     resp: Any = exec_postgrest(supabase.table("clients").delete().in_("id", id_list))
+    notify_clients_changed(id_list)
     if getattr(resp, "count", None) is not None:
         return int(resp.count or 0)
     return len(resp.data or [])
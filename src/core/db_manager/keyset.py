@@ -0,0 +1,125 @@
+# core/db_manager/keyset.py
+"""Paginação por cursor (keyset) para listagens de clientes.
+
+``range(offset, offset+limit-1)`` obriga o Postgres a percorrer e descartar
+``offset`` linhas a cada página, e pula/duplica clientes quando alguém edita
+um registro entre uma página e outra (ex.: ordenação por
+``ultima_alteracao``). Aqui a página seguinte começa logo depois da última
+linha vista, comparando ``(coluna de ordenação, id)``:
+
+    ORDER BY col DESC, id DESC  →  col < v OR (col = v AND id < i)
+
+O filtro é montado com ``or_`` do PostgREST e respeita a posição dos NULLs
+no ``order`` padrão (ASC → NULLS LAST, DESC → NULLS FIRST). O cursor é
+opaco para quem chama (base64 de JSON) e carrega a ordenação com que foi
+gerado: usar um cursor com outra ordenação levanta ``InvalidCursorError``.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any, Generic, TypeVar
+
+__all__ = [
+    "ClientesPage",
+    "InvalidCursorError",
+    "apply_keyset",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_filter",
+    "page_from_rows",
+]
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Cursor malformado ou gerado com outra ordenação."""
+
+
+class ClientesPage(list, Generic[T]):  # type: ignore[type-arg]
+    """Lista de uma página com o cursor da próxima (None = última página).
+
+    Continua sendo uma ``list``: quem só itera os clientes não muda.
+    """
+
+    next_cursor: str | None
+
+    def __init__(self, items: Sequence[T] = (), next_cursor: str | None = None) -> None:
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(order_col: str | None, desc: bool, row: Mapping[str, Any]) -> str:
+    """Cursor que aponta para logo depois de ``row`` na ordenação dada."""
+    payload = {"c": order_col or "id", "d": bool(desc), "v": row.get(order_col or "id"), "i": row.get("id")}
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order_col: str | None, desc: bool) -> tuple[Any, Any]:
+    """Devolve ``(valor da coluna, id)`` da última linha vista.
+
+    Raises:
+        InvalidCursorError: Se o cursor for inválido ou de outra ordenação.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        col, cur_desc, value, last_id = payload["c"], payload["d"], payload["v"], payload["i"]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise InvalidCursorError("cursor de paginação inválido") from exc
+    if col != (order_col or "id") or bool(cur_desc) != bool(desc) or last_id is None:
+        raise InvalidCursorError("cursor gerado com outra ordenação")
+    return value, last_id
+
+
+def _quote(value: Any) -> str:
+    """Valor entre aspas para filtros ``or_`` (vírgulas, parênteses, '+' etc.)."""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_filter(order_col: str | None, desc: bool, value: Any, last_id: Any, *, id_desc: bool) -> str:
+    """Expressão ``or_`` do PostgREST para as linhas depois de ``(value, last_id)``."""
+    if not order_col or order_col == "id":
+        # id é a própria ordenação: a direção dela prevalece sobre a do desempate
+        return f"id.{'lt' if desc else 'gt'}.{_quote(last_id)}"
+    after_id = f"id.{'lt' if id_desc else 'gt'}.{_quote(last_id)}"
+    op = "lt" if desc else "gt"
+    if value is None:
+        if desc:
+            # NULLS FIRST: depois do bloco de NULLs vêm todos os não nulos
+            return f"{order_col}.not.is.null,and({order_col}.is.null,{after_id})"
+        # NULLS LAST: só resta o bloco de NULLs
+        return f"and({order_col}.is.null,{after_id})"
+    v = _quote(value)
+    expr = f"{order_col}.{op}.{v},and({order_col}.eq.{v},{after_id})"
+    if not desc:
+        expr += f",{order_col}.is.null"
+    return expr
+
+
+def apply_keyset(query: Any, order_col: str | None, desc: bool, cursor: str, *, id_desc: bool) -> Any:
+    """Restringe ``query`` às linhas depois do cursor (a ordem já deve estar aplicada)."""
+    value, last_id = decode_cursor(cursor, order_col, desc)
+    if not order_col or order_col == "id":
+        return query.lt("id", last_id) if desc else query.gt("id", last_id)
+    return query.or_(keyset_filter(order_col, desc, value, last_id, id_desc=id_desc))
+
+
+def page_from_rows(
+    items: Sequence[T],
+    rows: Sequence[Mapping[str, Any]],
+    order_col: str | None,
+    desc: bool,
+    limit: int | None,
+) -> ClientesPage[T]:
+    """Embala ``items`` (convertidos de ``rows``) com o cursor da próxima página."""
+    next_cursor = None
+    if limit is not None and rows and len(rows) >= limit:
+        next_cursor = encode_cursor(order_col, desc, rows[-1])
+    return ClientesPage(items, next_cursor)
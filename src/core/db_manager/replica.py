@@ -0,0 +1,513 @@
+# core/db_manager/replica.py
+"""Réplica local (SQLite) dos clientes da organização, com sincronização incremental.
+
+Abrir a tela de Clientes, pesquisar e ver a Lixeira ia sempre ao Supabase,
+e o modo offline de ``search_clientes`` também acabava no Supabase. Aqui a
+organização logada tem uma cópia em disco de ``clients``:
+
+- Um arquivo por organização (``clients_<org_id>.sqlite3``) em
+  ``RC_CLIENTS_REPLICA_DIR`` (padrão: ``%LOCALAPPDATA%/RCGestor/cache``).
+  Como sobrevive ao reinício do app, a lista já abre do disco.
+- A primeira sincronização baixa tudo (páginas por ``id``). As seguintes
+  buscam só as linhas com ``ultima_alteracao`` a partir da última vista
+  (com margem para relógios adiantados). Exclusão lógica e restauração
+  também atualizam ``ultima_alteracao``. Depois vem uma contagem
+  ``exact``: se não bater, houve exclusão definitiva em outra máquina e a
+  cópia é recarregada. Uma recarga completa também ocorre a cada
+  ``_FULL_RELOAD_S``.
+- A busca usa o mesmo texto normalizado de ``search_norm`` (migration
+  20260410), indexado por FTS5 com tokenizer ``trigram`` (``LIKE`` quando o
+  SQLite não o suporta). Listagem, ordenação e paginação são feitas no
+  SQLite.
+- As leituras nunca esperam a rede: passado ``CLIENTS_REPLICA_SYNC_S``, a
+  sincronização roda em segundo plano. Exceção: depois de uma gravação do
+  próprio app (``notify_clients_changed``), a leitura seguinte sincroniza
+  antes, para mostrar a alteração. Se a sincronização falhar, a cópia local
+  continua sendo usada.
+
+A réplica é um cache: se o esquema mudar (``_SCHEMA_VERSION``), o arquivo é
+recriado.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.config.environment import env_bool, env_int
+from src.core.textnorm import client_search_norm, normalize_search
+from src.infra.supabase_client import exec_postgrest, is_supabase_online, supabase
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "CLIENTS_REPLICA_ENABLED",
+    "CLIENTS_REPLICA_SYNC_S",
+    "ClientsReplica",
+    "ClientsReplicaStats",
+    "get_clients_replica",
+    "notify_clients_changed",
+    "start_clients_replica",
+    "stop_clients_replica",
+]
+
+# Liga/desliga a réplica local (desligada: tudo volta a ir ao Supabase)
+CLIENTS_REPLICA_ENABLED: bool = env_bool("RC_CLIENTS_REPLICA", True)
+# Intervalo (s) em que a cópia local é usada sem sincronizar em segundo plano
+CLIENTS_REPLICA_SYNC_S: int = max(0, env_int("RC_CLIENTS_REPLICA_SYNC_S", 60))
+# Recarga completa periódica: ultima_alteracao vem do relógio de cada máquina
+_FULL_RELOAD_S = 6 * 3600
+# Margem na busca incremental (mesma ideia do cache de obrigações)
+_DELTA_OVERLAP = timedelta(minutes=5)
+_FETCH_PAGE = 1000
+_SCHEMA_VERSION = 1
+
+# Colunas de clients copiadas (mesmas de CLIENT_COLUMNS) + texto normalizado de busca
+_COLUMNS: tuple[str, ...] = (
+    "id",
+    "numero",
+    "nome",
+    "razao_social",
+    "cnpj",
+    "cnpj_norm",
+    "ultima_alteracao",
+    "ultima_por",
+    "obs",
+    "org_id",
+    "deleted_at",
+    "status_anvisa",
+    "status_farmacia_popular",
+)
+# Ordenações atendidas localmente (outras colunas vão ao Supabase)
+# Nome/razão ordenam pela forma normalizada (sem acento/caixa/pontuação), como a
+# collation do Postgres faz no primeiro nível
+_ORDERABLE: dict[str, str] = {
+    "id": "id",
+    "numero": "numero",
+    "nome": "nome_key",
+    "razao_social": "razao_key",
+    "cnpj": "cnpj",
+    "ultima_alteracao": "ultima_alteracao",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    id INTEGER PRIMARY KEY,
+    numero TEXT,
+    nome TEXT,
+    razao_social TEXT,
+    cnpj TEXT,
+    cnpj_norm TEXT,
+    ultima_alteracao TEXT,
+    ultima_por TEXT,
+    obs TEXT,
+    org_id TEXT,
+    deleted_at TEXT,
+    status_anvisa TEXT,
+    status_farmacia_popular TEXT,
+    search_blob TEXT NOT NULL DEFAULT '',
+    nome_key TEXT,
+    razao_key TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_clients_razao ON clients (razao_key);
+CREATE INDEX IF NOT EXISTS idx_clients_nome ON clients (nome_key);
+CREATE INDEX IF NOT EXISTS idx_clients_ultima ON clients (ultima_alteracao);
+CREATE INDEX IF NOT EXISTS idx_clients_deleted ON clients (deleted_at);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+@dataclass(frozen=True)
+class ClientsReplicaStats:
+    """Contadores da réplica local de clientes (snapshot)."""
+
+    local_reads: int
+    full_loads: int
+    delta_syncs: int
+    sync_failures: int
+    rows: int
+
+
+def _default_dir() -> Path:
+    env_dir = os.getenv("RC_CLIENTS_REPLICA_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return Path(os.environ.get("LOCALAPPDATA", tempfile.gettempdir())) / "RCGestor" / "cache"
+
+
+def _delta_since(watermark: str) -> str:
+    try:
+        return (datetime.fromisoformat(watermark) - _DELTA_OVERLAP).isoformat()
+    except ValueError:
+        return watermark
+
+
+def _search_blob(row: Mapping[str, Any]) -> str:
+    return client_search_norm(row)
+
+
+def _sort_key(value: Any) -> Optional[str]:
+    return None if value is None else normalize_search(value)
+
+
+def _fetch_rows(org_id: str, *, since: Optional[str], after_id: Optional[int], limit: int) -> list[dict[str, Any]]:
+    """Uma página de clients da organização, em ordem de id (keyset)."""
+    qb = supabase.table("clients").select(",".join(_COLUMNS)).eq("org_id", org_id)
+    if since is not None:
+        qb = qb.gte("ultima_alteracao", since)
+    if after_id is not None:
+        qb = qb.gt("id", after_id)
+    resp: Any = exec_postgrest(qb.order("id").limit(limit))
+    return list(resp.data or [])
+
+
+def _count_rows(org_id: str) -> int:
+    """Total de clients da organização (ativos + lixeira)."""
+    qb = supabase.table("clients").select("id", count="exact").eq("org_id", org_id).limit(1)
+    resp: Any = exec_postgrest(qb)
+    return int(getattr(resp, "count", None) or 0)
+
+
+def _fetch_all_since(org_id: str, since: Optional[str]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    after_id: Optional[int] = None
+    while True:
+        page = _fetch_rows(org_id, since=since, after_id=after_id, limit=_FETCH_PAGE)
+        rows.extend(page)
+        if len(page) < _FETCH_PAGE:
+            return rows
+        after_id = int(page[-1]["id"])
+
+
+class ClientsReplica:
+    """Cópia em SQLite dos clientes de uma organização."""
+
+    def __init__(
+        self,
+        org_id: str,
+        path: Path | str,
+        *,
+        sync_interval_s: float = CLIENTS_REPLICA_SYNC_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.org_id = org_id
+        self.path = Path(path)
+        self.sync_interval_s = max(0.0, float(sync_interval_s))
+        self._clock = clock
+        self._db_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._bg_thread: Optional[threading.Thread] = None
+        self._dirty = False
+        self._local_reads = 0
+        self._full_loads = 0
+        self._delta_syncs = 0
+        self._sync_failures = 0
+        self._conn = self._open()
+        self._fts = self._init_fts()
+
+    # ------------------------------------------------------------------
+    # Armazenamento
+    # ------------------------------------------------------------------
+
+    def _open(self) -> sqlite3.Connection:
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS clients; DROP TABLE IF EXISTS clients_fts; DROP TABLE IF EXISTS meta;"
+            )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.DatabaseError:
+            pass
+        conn.commit()
+        return conn
+
+    def _init_fts(self) -> bool:
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS clients_fts USING fts5(search_blob, tokenize='trigram')"
+            )
+            self._conn.commit()
+            return True
+        except sqlite3.OperationalError as exc:
+            # SQLite < 3.34 (sem trigram) ou compilado sem FTS5
+            log.info("Réplica de clientes: FTS5 trigram indisponível (%s); busca por LIKE", exc)
+            return False
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._conn.close()
+
+    def _meta_get(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _meta_set(self, key: str, value: Optional[str]) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _upsert_locked(self, rows: Iterable[Mapping[str, Any]]) -> Optional[str]:
+        """Grava as linhas (e o índice de busca); devolve o maior ultima_alteracao."""
+        newest: Optional[str] = None
+        placeholders = ",".join("?" * (len(_COLUMNS) + 3))
+        sql = (
+            f"INSERT OR REPLACE INTO clients ({','.join(_COLUMNS)}, search_blob, nome_key, razao_key)"
+            f" VALUES ({placeholders})"
+        )
+        for row in rows:
+            blob = _search_blob(row)
+            keys = (_sort_key(row.get("nome")), _sort_key(row.get("razao_social")))
+            self._conn.execute(sql, (*(row.get(col) for col in _COLUMNS), blob, *keys))
+            if self._fts:
+                self._conn.execute("DELETE FROM clients_fts WHERE rowid = ?", (row.get("id"),))
+                self._conn.execute("INSERT INTO clients_fts (rowid, search_blob) VALUES (?, ?)", (row.get("id"), blob))
+            updated = row.get("ultima_alteracao")
+            if updated is not None and (newest is None or str(updated) > newest):
+                newest = str(updated)
+        return newest
+
+    def _delete_locked(self, ids: Iterable[int]) -> None:
+        for cid in ids:
+            self._conn.execute("DELETE FROM clients WHERE id = ?", (cid,))
+            if self._fts:
+                self._conn.execute("DELETE FROM clients_fts WHERE rowid = ?", (cid,))
+
+    # ------------------------------------------------------------------
+    # Estado
+    # ------------------------------------------------------------------
+
+    def ready(self) -> bool:
+        """True se já houve ao menos uma carga completa (nesta ou em outra sessão)."""
+        with self._db_lock:
+            return self._meta_get("loaded_at") is not None
+
+    def row_count(self) -> int:
+        with self._db_lock:
+            return int(self._conn.execute("SELECT count(*) FROM clients").fetchone()[0])
+
+    def stats(self) -> ClientsReplicaStats:
+        rows = self.row_count()
+        return ClientsReplicaStats(self._local_reads, self._full_loads, self._delta_syncs, self._sync_failures, rows)
+
+    def invalidate(self) -> None:
+        """A próxima leitura sincroniza antes de responder (gravação feita pelo app)."""
+        self._dirty = True
+
+    def discard(self, ids: Iterable[int]) -> None:
+        """Remove clientes excluídos definitivamente pelo app e força sincronização."""
+        with self._db_lock, self._conn:
+            self._delete_locked(int(i) for i in ids)
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Sincronização
+    # ------------------------------------------------------------------
+
+    def sync(self, *, full: bool = False) -> str:
+        """Sincroniza com o Supabase; devolve ``"full"`` ou ``"delta"``.
+
+        Erros de rede são propagados (quem chama decide se usa a cópia local).
+        """
+        with self._sync_lock:
+            was_dirty, self._dirty = self._dirty, False
+            try:
+                kind = self._sync_locked(full)
+            except Exception:
+                self._dirty = was_dirty
+                self._sync_failures += 1
+                raise
+            finally:
+                # Também em falha: a próxima tentativa em segundo plano espera o intervalo
+                with self._db_lock, self._conn:
+                    self._meta_set("synced_at", str(self._clock()))
+            return kind
+
+    def _sync_locked(self, full: bool) -> str:
+        with self._db_lock:
+            watermark = self._meta_get("watermark")
+            loaded_at = self._meta_get("loaded_at")
+        if not full and watermark is not None and loaded_at is not None:
+            if self._clock() - float(loaded_at) < _FULL_RELOAD_S and self._sync_delta(watermark):
+                self._delta_syncs += 1
+                return "delta"
+        self._load_full()
+        self._full_loads += 1
+        return "full"
+
+    def _load_full(self) -> None:
+        # Rede fora do lock: leituras continuam sendo atendidas pela cópia anterior
+        rows = _fetch_all_since(self.org_id, None)
+        with self._db_lock, self._conn:
+            self._conn.execute("DELETE FROM clients")
+            if self._fts:
+                self._conn.execute("DELETE FROM clients_fts")
+            newest = self._upsert_locked(rows)
+            self._meta_set("watermark", newest)
+            self._meta_set("loaded_at", str(self._clock()))
+        log.debug("Réplica de clientes: carga completa org=%s (%d linhas)", self.org_id, len(rows))
+
+    def _sync_delta(self, watermark: str) -> bool:
+        """Aplica as linhas alteradas; False se a contagem exige recarga completa."""
+        changed = _fetch_all_since(self.org_id, _delta_since(watermark))
+        total = _count_rows(self.org_id)
+        with self._db_lock, self._conn:
+            newest = self._upsert_locked(changed)
+            if newest is not None and newest > watermark:
+                self._meta_set("watermark", newest)
+            local = int(self._conn.execute("SELECT count(*) FROM clients").fetchone()[0])
+        if total != local:
+            log.debug(
+                "Réplica de clientes: contagem divergente org=%s (%d local, %d servidor)", self.org_id, local, total
+            )
+            return False
+        log.debug("Réplica de clientes: delta org=%s (%d alterado(s))", self.org_id, len(changed))
+        return True
+
+    def _stale(self) -> bool:
+        with self._db_lock:
+            synced_at = self._meta_get("synced_at")
+        return synced_at is None or self._clock() - float(synced_at) >= self.sync_interval_s
+
+    def refresh_async(self) -> None:
+        """Sincroniza em segundo plano (uma execução por vez)."""
+        if self._bg_thread is not None and self._bg_thread.is_alive():
+            return
+        self._bg_thread = threading.Thread(target=self._sync_quietly, name="clients-replica-sync", daemon=True)
+        self._bg_thread.start()
+
+    def _sync_quietly(self) -> None:
+        try:
+            self.sync()
+        except Exception as exc:  # noqa: BLE001
+            log.warning("Réplica de clientes: falha ao sincronizar org %s; usando cópia local (%s)", self.org_id, exc)
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        term: str,
+        order_col: Optional[str],
+        desc: bool,
+        *,
+        trash: bool,
+        limit: Optional[int],
+        offset: int = 0,
+    ) -> Optional[list[dict[str, Any]]]:
+        """Mesma semântica de ``search_clientes``/``search_clientes_lixeira``, no SQLite.
+
+        Returns:
+            Linhas de clients, ou None se a réplica ainda não foi carregada ou
+            a ordenação não é atendida localmente (quem chama vai ao Supabase).
+        """
+        order_sql = _ORDERABLE.get(order_col or "id")
+        if order_sql is None or not self.ready():
+            return None
+        online = is_supabase_online()
+        if self._dirty and online:
+            self._sync_quietly()
+        elif online and self._stale():
+            self.refresh_async()
+
+        where = ["deleted_at IS NOT NULL" if trash else "deleted_at IS NULL"]
+        params: list[Any] = []
+        query_norm = normalize_search(term)
+        if query_norm:
+            if self._fts and len(query_norm) >= 3:
+                # Frase entre aspas: o trigram casa substrings, como o ILIKE '%termo%'
+                where.append("id IN (SELECT rowid FROM clients_fts WHERE clients_fts MATCH ?)")
+                params.append(f'"{query_norm}"')
+            else:
+                where.append("search_blob LIKE ? ESCAPE '\\'")
+                escaped = query_norm.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+        direction = "DESC" if desc else "ASC"
+        # Mesma posição de NULLs do Postgres; desempate por id na direção da ordenação
+        nulls = "NULLS FIRST" if desc else "NULLS LAST"
+        sql = (
+            f"SELECT {','.join(_COLUMNS)} FROM clients WHERE {' AND '.join(where)}"  # nosec B608 - colunas/direção vindas de _ORDERABLE; valores via parâmetros
+            f" ORDER BY {order_sql} {direction} {nulls}, id {direction}"
+        )
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((int(limit), max(0, int(offset))))
+        with self._db_lock:
+            rows = [dict(r) for r in self._conn.execute(sql, params)]
+        self._local_reads += 1
+        return rows
+
+
+_shared: Optional[ClientsReplica] = None
+_shared_lock = threading.Lock()
+
+
+def get_clients_replica(org_id: Optional[str] = None) -> Optional[ClientsReplica]:
+    """Réplica ativa (da organização ``org_id``, se informada) ou None."""
+    with _shared_lock:
+        replica = _shared
+    if replica is None or (org_id is not None and replica.org_id != org_id):
+        return None
+    return replica
+
+
+def start_clients_replica(org_id: Optional[str], *, directory: Path | str | None = None) -> Optional[ClientsReplica]:
+    """Abre a réplica da organização logada e agenda uma sincronização.
+
+    Chamada depois do login. No-op se desligada por ``RC_CLIENTS_REPLICA=0``.
+    """
+    global _shared
+    if not CLIENTS_REPLICA_ENABLED or not org_id:
+        return None
+    with _shared_lock:
+        if _shared is not None and _shared.org_id != org_id:
+            _shared.close()
+            _shared = None
+        if _shared is None:
+            path = Path(directory) if directory is not None else _default_dir()
+            try:
+                _shared = ClientsReplica(org_id, path / f"clients_{org_id}.sqlite3")
+            except (OSError, sqlite3.Error) as exc:
+                log.warning("Réplica de clientes indisponível: %s", exc)
+                return None
+        replica = _shared
+    replica.refresh_async()
+    return replica
+
+
+def stop_clients_replica() -> None:
+    """Fecha a réplica ativa (logout/encerramento)."""
+    global _shared
+    with _shared_lock:
+        replica, _shared = _shared, None
+    if replica is not None:
+        replica.close()
+
+
+def notify_clients_changed(removed_ids: Iterable[int] = ()) -> None:
+    """Avisa a réplica ativa de uma gravação feita pelo app."""
+    replica = get_clients_replica()
+    if replica is None:
+        return
+    removed = list(removed_ids)
+    try:
+        if removed:
+            replica.discard(removed)
+        else:
+            replica.invalidate()
+    except sqlite3.Error as exc:
+        log.debug("Réplica de clientes: falha ao aplicar alteração local: %s", exc)
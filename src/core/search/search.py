@@ -7,12 +7,21 @@ from typing import Any, Mapping, Sequence
 
 from src.infra.supabase_client import exec_postgrest, is_supabase_online, supabase
 from src.core.db_manager.db_manager import CLIENT_COLUMNS
+from src.core.db_manager.keyset import ClientesPage, apply_keyset, page_from_rows
+from src.core.db_manager.replica import get_clients_replica
 from src.core.models import Cliente
 from src.core.session.session import get_current_user  # << pegar org_id da sessao
-from src.core.textnorm import join_and_normalize, normalize_search
+from src.core.textnorm import client_search_norm, normalize_search
+from src.infra.db_schemas import is_schema_drift_error
 
 log = logging.getLogger(__name__)
 
+#: Coluna mantida pela migration 20260410_clients_search_norm (mesma regra de normalize_search).
+SEARCH_NORM_COLUMN = "search_norm"
+
+# None = ainda não verificado; False = migration não aplicada (ilike legado)
+_server_norm_available: bool | None = None
+
 
 def _normalize_order(order_by: str | None) -> tuple[str | None, bool]:
     """Normaliza apelidos de ordenação para colunas canônicas e flag de descending.
@@ -80,45 +89,8 @@ def _row_to_cliente(row: Mapping[str, Any]) -> Cliente:
 
 
 def _cliente_search_blob(cliente: Cliente) -> str:
-    """Concatena campos relevantes de Cliente em blob normalizado para busca textual."""
-    return join_and_normalize(
-        getattr(cliente, "id", None),
-        getattr(cliente, "nome", None),
-        getattr(cliente, "razao_social", None),
-        getattr(cliente, "cnpj", None),
-        getattr(cliente, "numero", None),
-        getattr(cliente, "obs", None),
-    )
-
-
-def _filter_rows_with_norm(rows: Sequence[Mapping[str, Any]], term: str) -> list[dict[str, Any]]:
-    """
-    Filtra rows já carregadas usando termo normalizado, cacheando _search_norm por row.
-
-    Termo vazio retorna todas as rows.
-    """
-    query_norm = normalize_search(term)
-    if not query_norm:
-        return list(rows)  # type: ignore[arg-type]
-
-    filtered: list[dict[str, Any]] = []
-    for row in rows:
-        # Convert to dict if needed for mutation
-        row_dict = dict(row) if not isinstance(row, dict) else row
-        norm = row_dict.get("_search_norm")
-        if not norm:
-            norm = join_and_normalize(
-                row_dict.get("id"),
-                row_dict.get("razao_social"),
-                row_dict.get("cnpj"),
-                row_dict.get("nome"),
-                row_dict.get("numero"),
-                row_dict.get("obs"),
-            )
-            row_dict["_search_norm"] = norm
-        if query_norm in norm:
-            filtered.append(row_dict)
-    return filtered
+    """Blob normalizado de Cliente para busca textual (mesmo texto da coluna search_norm)."""
+    return client_search_norm(cliente)
 
 
 def _filter_clientes(clientes: Sequence[Cliente], term: str) -> list[Cliente]:
@@ -129,6 +101,122 @@ def _filter_clientes(clientes: Sequence[Cliente], term: str) -> list[Cliente]:
     return [cli for cli in clientes if query_norm in _cliente_search_blob(cli)]
 
 
+def _apply_term_filter(qb: Any, term: str) -> Any:
+    """Aplica o filtro textual server-side ao query builder.
+
+    Com a migration ``20260410_clients_search_norm`` aplicada, compara o termo
+    normalizado (mesma regra de :func:`normalize_search`) com a coluna
+    ``search_norm`` — acentos, caixa e pontuação são ignorados e um índice de
+    trigramas atende o ``ILIKE``. Sem a coluna, usa o ``ilike`` legado nas
+    quatro colunas de texto.
+    """
+    if _server_norm_available is not False:
+        query_norm = normalize_search(term)
+        if not query_norm:
+            return qb
+        return qb.ilike(SEARCH_NORM_COLUMN, f"%{query_norm}%")
+    pat = f"%{term}%"
+    return qb.or_("nome.ilike.{pat},razao_social.ilike.{pat},cnpj.ilike.{pat},numero.ilike.{pat}".format(pat=pat))
+
+
+def _fetch_clients_page(
+    org_id: str,
+    term: str,
+    col: str | None,
+    desc: bool,
+    *,
+    trash: bool,
+    limit: int | None,
+    offset: int,
+    cursor: str | None = None,
+) -> list[dict[str, Any]]:
+    """Busca uma página de clientes (ativos ou lixeira) numa única requisição.
+
+    Com ``cursor`` (keyset) a página começa depois da última linha vista, em
+    vez de pular ``offset`` linhas.
+    """
+    global _server_norm_available
+
+    def _run() -> list[dict[str, Any]]:
+        qb = supabase.table("clients").select(CLIENT_COLUMNS)
+        qb = qb.not_.is_("deleted_at", "null") if trash else qb.is_("deleted_at", "null")
+        qb = qb.eq("org_id", org_id)
+        if term:
+            qb = _apply_term_filter(qb, term)
+        if col:
+            qb = qb.order(col, desc=desc)
+        # Ordem estável por id para paginação determinística.
+        # A direção do desempate acompanha a do campo principal para
+        # que registros com mesmo valor de *col* apareçam na ordem
+        # natural esperada pelo usuário (ex: DESC → id DESC).
+        qb = qb.order("id", desc=desc)
+        if limit is not None:
+            if cursor:
+                qb = apply_keyset(qb, col, desc, cursor, id_desc=desc).limit(limit)
+            else:
+                qb = qb.range(offset, offset + limit - 1)
+        resp = exec_postgrest(qb)
+        return list(resp.data or [])
+
+    try:
+        rows = _run()
+    except Exception as exc:
+        if not (term and _server_norm_available is None and is_schema_drift_error(exc)):
+            raise
+        log.warning("clients.search_norm ausente (migration 20260410 não aplicada); usando ilike legado")
+        _server_norm_available = False
+        return _run()
+    if term and _server_norm_available is None:
+        _server_norm_available = True
+    return rows
+
+
+def _search_online_or_local(
+    label: str,
+    term: str | None,
+    order_by: str | None,
+    org_id: str | None,
+    *,
+    trash: bool,
+    limit: int | None,
+    offset: int,
+    cursor: str | None = None,
+) -> ClientesPage[Cliente]:
+    if org_id is None:
+        current_user = get_current_user()
+        org_id = getattr(current_user, "org_id", None) if current_user else None
+
+    term = (term or "").strip()
+    col, desc = _normalize_order(order_by)
+
+    # Réplica local carregada: lista/busca/ordena no SQLite, online ou offline.
+    # Páginas pedidas por cursor continuam no Supabase (a listagem começou lá).
+    replica = get_clients_replica(org_id) if org_id is not None and not cursor else None
+    if replica is not None:
+        local_rows = replica.search(term, col, desc, trash=trash, limit=limit, offset=offset)
+        if local_rows is not None:
+            return ClientesPage([_row_to_cliente(r) for r in local_rows])
+
+    if is_supabase_online():
+        if org_id is None:
+            raise ValueError("org_id obrigatorio")
+        rows = _fetch_clients_page(org_id, term, col, desc, trash=trash, limit=limit, offset=offset, cursor=cursor)
+        return page_from_rows([_row_to_cliente(r) for r in rows], rows, col, desc, limit)
+
+    # Offline: filtro local sobre o que a camada de dados conseguir listar
+    log.info("%s: Supabase offline, usando filtro local", label)
+    if org_id is None:
+        raise ValueError("org_id obrigatorio")
+    from src.core.db_manager.db_manager import list_clientes_by_org, list_clientes_deletados  # evita ciclo
+
+    if trash:
+        clientes = list_clientes_deletados(order_by=col or None, descending=desc if col else None)
+    else:
+        clientes = list_clientes_by_org(org_id, order_by=col or None, descending=desc if col else None)
+    # Sem cursor: o filtro local já devolve tudo de uma vez
+    return ClientesPage(_filter_clientes(clientes, term) if term else clientes)
+
+
 def search_clientes(
     term: str | None,
     order_by: str | None = None,
@@ -136,66 +224,27 @@ def search_clientes(
     *,
     limit: int | None = None,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[Cliente]:
     """
-    Busca clientes por *term* (nome/razao/CNPJ/numero) priorizando Supabase.
-    Fallback para filtro local quando offline ou em falha.
+    Busca clientes por *term* (id/nome/razao/CNPJ/numero/obs) no Supabase.
+
+    O termo é comparado sem acentos/pontuação no servidor (coluna
+    ``search_norm``), numa única requisição já paginada. Erros do Supabase
+    são propagados; o filtro local só é usado quando offline.
 
     Args:
         limit: Se fornecido, aplica paginação server-side (range + order estável por id).
         offset: Posição inicial da página (ignorado se *limit* for None).
-    """
-    if org_id is None:
-        current_user = get_current_user()
-        org_id = getattr(current_user, "org_id", None) if current_user else None
-
-    term = (term or "").strip()
-    col, desc = _normalize_order(order_by)
-
-    try:
-        if is_supabase_online():
-            if org_id is None:
-                raise ValueError("org_id obrigatorio")
-
-            def _fetch_rows(search_term: str | None) -> list[dict[str, Any]]:
-                qb = supabase.table("clients").select(CLIENT_COLUMNS).is_("deleted_at", "null").eq("org_id", org_id)
-                if search_term:
-                    pat = f"%{search_term}%"
-                    qb = qb.or_(
-                        "nome.ilike.{pat},razao_social.ilike.{pat},cnpj.ilike.{pat},numero.ilike.{pat}".format(pat=pat)
-                    )
-                if col:
-                    qb = qb.order(col, desc=desc)
-                # Ordem estável por id para paginação determinística.
-                # A direção do desempate acompanha a do campo principal para
-                # que registros com mesmo valor de *col* apareçam na ordem
-                # natural esperada pelo usuário (ex: DESC → id DESC).
-                qb = qb.order("id", desc=desc)
-                if limit is not None:
-                    qb = qb.range(offset, offset + limit - 1)
-                resp_inner = exec_postgrest(qb)
-                return list(resp_inner.data or [])
-
-            rows = _fetch_rows(term)
-            if term:
-                rows = _filter_rows_with_norm(rows, term)
-                if not rows:
-                    rows = _filter_rows_with_norm(_fetch_rows(None), term)
-            clientes = [_row_to_cliente(r) for r in rows]
-            if term:
-                return _filter_clientes(clientes, term)
-            return clientes
-    except Exception as exc:
-        log.warning("search_clientes: falha no Supabase, usando fallback local", exc_info=exc)
+        cursor: ``next_cursor`` da página anterior; substitui *offset* (keyset).
 
-    if org_id is None:
-        raise ValueError("org_id obrigatorio")
-    from src.core.db_manager.db_manager import list_clientes_by_org  # evita ciclo
-
-    clientes = list_clientes_by_org(org_id, order_by=col or None, descending=desc if col else None)
-    if not term:
-        return clientes
-    return _filter_clientes(clientes, term)
+    Returns:
+        ``ClientesPage`` (lista) cujo ``next_cursor`` pede a próxima página;
+        None quando a página veio incompleta (fim da listagem) ou offline.
+    """
+    return _search_online_or_local(
+        "search_clientes", term, order_by, org_id, trash=False, limit=limit, offset=offset, cursor=cursor
+    )
 
 
 def search_clientes_lixeira(
@@ -205,66 +254,22 @@ def search_clientes_lixeira(
     *,
     limit: int | None = None,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[Cliente]:
     """Busca clientes na lixeira (``deleted_at IS NOT NULL``).
 
     Interface idêntica a :func:`search_clientes` — mesma normalização de
-    ``order_by``, tiebreaker por ``id``, paginação via ``range`` e filtro
-    ``ilike`` server-side + normalização local.
+    ``order_by``, tiebreaker por ``id``, paginação via ``range`` ou cursor e busca
+    normalizada server-side.
 
     Args:
-        term: Texto de busca (nome/razao/CNPJ/numero).
+        term: Texto de busca (id/nome/razao/CNPJ/numero/obs).
         order_by: Ordenação no formato ``+col``/``-col`` ou canônico.
         org_id: Organização; se ``None``, resolve via sessão.
         limit: Limite de registros (paginação).
         offset: Deslocamento da página.
+        cursor: ``next_cursor`` da página anterior (keyset).
     """
-    if org_id is None:
-        current_user = get_current_user()
-        org_id = getattr(current_user, "org_id", None) if current_user else None
-
-    term = (term or "").strip()
-    col, desc = _normalize_order(order_by)
-
-    try:
-        if is_supabase_online():
-            if org_id is None:
-                raise ValueError("org_id obrigatorio")
-
-            def _fetch_rows_trash(search_term: str | None) -> list[dict[str, Any]]:
-                qb = (
-                    supabase.table("clients").select(CLIENT_COLUMNS).not_.is_("deleted_at", "null").eq("org_id", org_id)
-                )
-                if search_term:
-                    pat = f"%{search_term}%"
-                    qb = qb.or_(
-                        "nome.ilike.{pat},razao_social.ilike.{pat},cnpj.ilike.{pat},numero.ilike.{pat}".format(pat=pat)
-                    )
-                if col:
-                    qb = qb.order(col, desc=desc)
-                qb = qb.order("id", desc=desc)
-                if limit is not None:
-                    qb = qb.range(offset, offset + limit - 1)
-                resp_inner = exec_postgrest(qb)
-                return list(resp_inner.data or [])
-
-            rows = _fetch_rows_trash(term)
-            if term:
-                rows = _filter_rows_with_norm(rows, term)
-                if not rows:
-                    rows = _filter_rows_with_norm(_fetch_rows_trash(None), term)
-            clientes = [_row_to_cliente(r) for r in rows]
-            if term:
-                return _filter_clientes(clientes, term)
-            return clientes
-    except Exception as exc:
-        log.warning("search_clientes_lixeira: falha no Supabase, usando fallback local", exc_info=exc)
-
-    if org_id is None:
-        raise ValueError("org_id obrigatorio")
-    from src.core.db_manager.db_manager import list_clientes_deletados  # evita ciclo
-
-    clientes = list_clientes_deletados(order_by=col or None, descending=desc if col else None)
-    if not term:
-        return clientes
-    return _filter_clientes(clientes, term)
+    return _search_online_or_local(
+        "search_clientes_lixeira", term, order_by, org_id, trash=True, limit=limit, offset=offset, cursor=cursor
+    )
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Tuple
 
 from src.infra.supabase_client import exec_postgrest, supabase
+from src.config.environment import env_int
 from src.config.paths import CLOUD_ONLY
 from src.core.db_manager import (
     find_cliente_by_cnpj_norm,
@@ -71,6 +74,158 @@ def count_clients() -> int:
             return _clients_cache.count
 
 
+# ---------------------------------------------------------------------------
+# Resolução em lote de nomes de clientes (Hub, atividade recente)
+# ---------------------------------------------------------------------------
+
+# Validade das entradas do cache de clientes; ids não encontrados expiram antes
+CLIENT_INFO_TTL_SECONDS: int = max(1, env_int("RC_CLIENT_INFO_TTL_S", 300))
+CLIENT_INFO_MISS_TTL_SECONDS: int = 30
+# Ids por query .in_("id", ...): mantém a URL do PostgREST bem abaixo dos limites de proxy
+CLIENT_IDS_CHUNK: int = 150
+
+
+@dataclass(frozen=True)
+class ClientInfo:
+    """Dados mínimos de um cliente para exibição (nome, CNPJ)."""
+
+    id: int
+    razao_social: str = ""
+    nome: str = ""
+    cnpj: str = ""
+
+    @property
+    def display_name(self) -> str:
+        return self.razao_social or self.nome or f"Cliente #{self.id}"
+
+
+@dataclass
+class ClientInfoCache:
+    """Cache TTL thread-safe de ClientInfo por (org_id, id), compartilhado no processo.
+
+    Guarda também ids inexistentes (valor None) por um período curto, para
+    não reconsultar a cada refresh. Consultas sem org_id (só RLS) ficam na
+    chave ``""``; o cache é limpo no logout.
+    """
+
+    ttl: float = CLIENT_INFO_TTL_SECONDS
+    miss_ttl: float = CLIENT_INFO_MISS_TTL_SECONDS
+    _entries: dict[tuple[str, int], tuple[ClientInfo | None, float]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def lookup(
+        self, client_ids: Iterable[int], org_id: str | None = None
+    ) -> tuple[dict[int, ClientInfo | None], list[int]]:
+        """Separa ids em (encontrados no cache, ausentes/expirados)."""
+        org = org_id or ""
+        now = time.monotonic()
+        found: dict[int, ClientInfo | None] = {}
+        missing: list[int] = []
+        with self._lock:
+            for cid in client_ids:
+                entry = self._entries.get((org, cid))
+                if entry is not None and entry[1] > now:
+                    found[cid] = entry[0]
+                else:
+                    missing.append(cid)
+        return found, missing
+
+    def store(self, infos: dict[int, ClientInfo | None], org_id: str | None = None) -> None:
+        org = org_id or ""
+        now = time.monotonic()
+        with self._lock:
+            for cid, info in infos.items():
+                self._entries[(org, cid)] = (info, now + (self.ttl if info is not None else self.miss_ttl))
+
+    def invalidate(self, client_ids: Iterable[int] | None = None) -> None:
+        """Descarta os ids dados (em todas as organizações), ou tudo se None."""
+        with self._lock:
+            if client_ids is None:
+                self._entries.clear()
+                return
+            drop = set(client_ids)
+            for key in [key for key in self._entries if key[1] in drop]:
+                del self._entries[key]
+
+
+_client_info_cache = ClientInfoCache()
+
+
+def _coerce_client_ids(client_ids: Iterable[Any]) -> list[int]:
+    """Ids distintos, como int, preservando a ordem; ignora valores inválidos."""
+    out: dict[int, None] = {}
+    for raw in client_ids:
+        if raw is None or isinstance(raw, bool):
+            continue
+        try:
+            out[int(raw)] = None
+        except (TypeError, ValueError):
+            continue
+    return list(out)
+
+
+def _fetch_clients_info_raw(client_ids: list[int], org_id: str | None = None) -> dict[int, ClientInfo]:
+    """Uma query .in_() por bloco de CLIENT_IDS_CHUNK ids (filtrada por org_id, se dado)."""
+    infos: dict[int, ClientInfo] = {}
+    for start in range(0, len(client_ids), CLIENT_IDS_CHUNK):
+        chunk = client_ids[start : start + CLIENT_IDS_CHUNK]
+        query = supabase.table("clients").select("id,razao_social,nome,cnpj")
+        if org_id:
+            query = query.eq("org_id", org_id)
+        resp = exec_postgrest(query.in_("id", chunk))
+        for row in resp.data or []:
+            try:
+                cid = int(row.get("id"))
+            except (TypeError, ValueError):
+                continue
+            infos[cid] = ClientInfo(
+                id=cid,
+                razao_social=(row.get("razao_social") or "").strip(),
+                nome=(row.get("nome") or "").strip(),
+                cnpj=(row.get("cnpj") or "").strip(),
+            )
+    return infos
+
+
+def resolve_clients_info(client_ids: Iterable[Any], *, org_id: str | None = None) -> dict[int, ClientInfo]:
+    """Resolve vários clientes de uma vez, via cache TTL + queries em lote.
+
+    Custa no máximo ceil(ids_fora_do_cache / CLIENT_IDS_CHUNK) round-trips.
+    Nunca levanta: em falha de rede devolve só o que estava em cache.
+    Com ``org_id``, só clientes dessa organização são resolvidos (além da RLS).
+
+    Returns:
+        {client_id: ClientInfo} apenas para ids existentes
+    """
+    ids = _coerce_client_ids(client_ids)
+    if not ids:
+        return {}
+
+    found, missing = _client_info_cache.lookup(ids, org_id)
+    if missing:
+        try:
+            fetched = _fetch_clients_info_raw(missing, org_id)
+        except Exception as e:  # noqa: BLE001
+            log.warning("Clientes: falha ao resolver %d cliente(s) em lote: %r", len(missing), e)
+        else:
+            resolved: dict[int, ClientInfo | None] = {cid: fetched.get(cid) for cid in missing}
+            _client_info_cache.store(resolved, org_id)
+            found.update(resolved)
+    return {cid: info for cid, info in found.items() if info is not None}
+
+
+def resolve_client_names(client_ids: Iterable[Any], *, org_id: str | None = None) -> dict[int, str]:
+    """{client_id: razão social (ou nome, ou "Cliente #id")} para todos os ids pedidos."""
+    ids = _coerce_client_ids(client_ids)
+    infos = resolve_clients_info(ids, org_id=org_id)
+    return {cid: infos[cid].display_name if cid in infos else f"Cliente #{cid}" for cid in ids}
+
+
+def invalidate_client_info_cache(client_ids: Iterable[Any] | None = None) -> None:
+    """Descarta entradas do cache de clientes (todas, se client_ids for None)."""
+    _client_info_cache.invalidate(None if client_ids is None else _coerce_client_ids(client_ids))
+
+
 def _normalize_payload(valores: dict[str, Any]) -> Tuple[str, str, str, str, str, str]:
     """
     Normaliza campos vindos da UI/tabela para uso interno no serviço.
@@ -279,6 +434,7 @@ def salvar_cliente(row: tuple[Any, ...] | None, valores: dict[str, Any]) -> tupl
             status_farmacia_popular=status_farmacia_popular,
         )
         real_pk = pk
+        invalidate_client_info_cache([pk])
     else:
         real_pk = insert_cliente(
             numero=numero,
@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import logging
 import tkinter as tk
+from datetime import datetime, timezone
 from typing import Iterable
 
 from src.ui.dialogs.rc_dialogs import show_error
 
-from src.adapters.storage.api import delete_file as storage_delete_file
-from src.adapters.storage.api import list_files as storage_list_files
-from src.adapters.storage.api import using_storage_backend
 from src.adapters.storage.supabase_storage import SupabaseStorageAdapter
+from src.core.db_manager.replica import notify_clients_changed
 from src.infra.db_schemas import MEMBERSHIPS_SELECT_ORG_ID
 from src.infra.supabase_client import exec_postgrest
+from src.modules.uploads.listing_cache import get_listing_cache
 
 logger = logging.getLogger(__name__)
 log = logger
@@ -44,57 +44,19 @@ def _get_supabase_and_org() -> tuple[object, str]:
         raise RuntimeError(f"Falha ao obter usuário/organização: {e}")
 
 
-# ---- Listagem recursiva no Storage (usando list + chamada recursiva) ----
-def _list_storage_children(bucket: str, prefix: str) -> list[dict]:
-    """Lista UM nível de filhos em `prefix`. Retorna dicts com pelo menos {name, is_folder?}."""
-    adapter = SupabaseStorageAdapter(bucket=bucket)
-    with using_storage_backend(adapter):
-        items = storage_list_files(prefix)
-    out = []
-    for it in items or []:
-        if not isinstance(it, dict):
-            continue
-        # Heurística: objetos com metadata None são "pastas" (chaves virtuais)
-        name = it.get("name")
-        meta = it.get("metadata")
-        is_folder = meta is None
-        out.append({"name": name, "is_folder": is_folder})
-    return out
-
-
-def _gather_all_paths(bucket: str, root_prefix: str) -> list[str]:
-    """Collect every file path under root_prefix recursively."""
-    paths: list[str] = []
-
-    def walk(prefix: str) -> None:
-        for obj in _list_storage_children(bucket, prefix):
-            name = obj.get("name")
-            if not name:
-                continue
-            if obj.get("is_folder"):
-                walk(f"{prefix}/{name}")
-            else:
-                paths.append(f"{prefix}/{name}")
-
-    walk(root_prefix)
-    return paths
-
-
 def _remove_storage_prefix(org_id: str, client_id: int) -> int:
-    """Delete all objects for <org_id>/<client_id>, returning how many were removed."""
-    root = f"{org_id}/{client_id}"
-    paths = _gather_all_paths(BUCKET_DOCS, root)
+    """Delete all objects for <org_id>/<client_id>, returning how many were removed.
 
-    if not paths:
-        return 0
-
-    removed = 0
-    adapter = SupabaseStorageAdapter(bucket=BUCKET_DOCS)
-    with using_storage_backend(adapter):
-        for key in paths:
-            if storage_delete_file(key):
-                removed += 1
-    return removed
+    Raises RuntimeError listing the keys that remain if any listing/chunk fails.
+    """
+    prefix = f"{org_id}/{client_id}"
+    try:
+        report = SupabaseStorageAdapter(bucket=BUCKET_DOCS).delete_prefix(prefix)
+    finally:
+        get_listing_cache().invalidate(BUCKET_DOCS, prefix, recursive=True)
+    if not report.ok:
+        raise RuntimeError("; ".join(report.error_messages()))
+    return report.deleted
 
 
 # ----------------- Ações públicas -----------------
@@ -109,13 +71,17 @@ def restore_clients(client_ids: Iterable[int], parent: tk.Misc | None = None) ->
         show_error(parent_widget, "Erro", str(e))
         return 0, [(0, str(e))]
 
+    # ultima_alteracao: a sincronização incremental da réplica local enxerga a restauração
+    payload = {"deleted_at": None, "ultima_alteracao": datetime.now(timezone.utc).isoformat()}
     for cid in client_ids:
         try:
-            exec_postgrest(supabase.table("clients").update({"deleted_at": None}).eq("id", int(cid)))  # pyright: ignore[reportAttributeAccessIssue]
+            exec_postgrest(supabase.table("clients").update(payload).eq("id", int(cid)))  # pyright: ignore[reportAttributeAccessIssue]
             ok += 1
         except Exception as e:
             errs.append((int(cid), str(e)))
 
+    if ok:
+        notify_clients_changed()
     return ok, errs
 
 
@@ -123,6 +89,7 @@ def hard_delete_clients(client_ids: Iterable[int], parent: tk.Misc | None = None
     """Hard-delete clients across storage and DB, returning (successes, error list)."""
     ok = 0
     errs: list[tuple[int, str]] = []
+    removed_ids: list[int] = []
 
     parent_widget: tk.Misc | None = parent if isinstance(parent, tk.Misc) else None
     try:
@@ -153,7 +120,10 @@ def hard_delete_clients(client_ids: Iterable[int], parent: tk.Misc | None = None
             exec_postgrest(supabase.table("clients").delete().eq("id", cid))  # pyright: ignore[reportAttributeAccessIssue]
 
             ok += 1
+            removed_ids.append(cid)
         except Exception as e:
             errs.append((cid, str(e)))
 
+    if removed_ids:
+        notify_clients_changed(removed_ids)
     return ok, errs
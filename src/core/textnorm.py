@@ -6,6 +6,7 @@ Search text normalization helpers (accent/punctuation insensitive).
 from __future__ import annotations
 
 import unicodedata as ud
+from typing import Any, Mapping
 
 from src.core.text_normalization import strip_diacritics as _strip_diacritics
 
@@ -13,8 +14,13 @@ __all__ = [
     "_strip_diacritics",
     "normalize_search",
     "join_and_normalize",
+    "CLIENT_SEARCH_FIELDS",
+    "client_search_norm",
 ]
 
+# Em ASCII só letras e dígitos sobrevivem (o resto é P/Z/C/S); atalho via translate.
+_ASCII_DROP: dict[int, None] = {code: None for code in range(128) if not chr(code).isalnum()}
+
 
 def normalize_search(value: object) -> str:
     """
@@ -22,8 +28,14 @@ def normalize_search(value: object) -> str:
     - remove diacritics with Unicode NFD decomposition
     - apply casefold (stronger than lower)
     - drop punctuation / separators / control characters
+
+    ASCII input (the common case for CNPJs, phones and most names) skips the
+    per-character ``unicodedata`` walk; the result is identical.
     """
-    stripped: str = _strip_diacritics("" if value is None else str(value))
+    text: str = "" if value is None else str(value)
+    if text.isascii():
+        return text.lower().translate(_ASCII_DROP)
+    stripped: str = _strip_diacritics(text)
     folded: str = stripped.casefold()
     out_chars: list[str] = []
     for ch in folded:
@@ -40,3 +52,17 @@ def join_and_normalize(*parts: object) -> str:
     """
     combined: str = " ".join("" if part is None else str(part) for part in parts)
     return normalize_search(combined)
+
+
+# Mesma ordem de concat_ws em public.rc_clients_set_search_norm (migration 20260410)
+CLIENT_SEARCH_FIELDS: tuple[str, ...] = ("id", "razao_social", "cnpj", "nome", "numero", "obs")
+
+
+def client_search_norm(client: Any) -> str:
+    """
+    Build the normalized search text of a client (row mapping or object),
+    matching the server-side ``clients.search_norm`` column.
+    """
+    if isinstance(client, Mapping):
+        return join_and_normalize(*(client.get(name) for name in CLIENT_SEARCH_FIELDS))
+    return join_and_normalize(*(getattr(client, name, None) for name in CLIENT_SEARCH_FIELDS))
@@ -22,6 +22,17 @@ logger = logging.getLogger(__name__)
 
 TABLE = "cashflow_entries"
 
+# Função SQL da migration 20260421_rpc_cashflow_summary
+SUMMARY_RPC = "cashflow_summary"
+SUMMARY_GROUPS = ("day", "month", "category")
+
+# Colunas exibidas na grade do Fluxo de Caixa (projeção da listagem)
+LIST_COLUMNS = "id,date,type,category,description,amount,account"
+
+# Códigos PostgREST/Postgres de "função não existe": migration não aplicada
+_RPC_MISSING_CODES = frozenset({"PGRST202", "42883"})
+_summary_rpc_missing = False
+
 
 # ---------------------------------------------------------------------------
 # Utilitários Locais
@@ -44,9 +55,11 @@ def _build_list_query(
     type_filter: str | None,
     text: str | None,
     org_id: str | None,
+    columns: str = "*",
 ) -> Any:
     """Constrói query de listagem com filtros."""
-    q = client.table(TABLE).select("*").order("date", desc=False)
+    # id desempata lançamentos do mesmo dia: páginas estáveis com range()
+    q = client.table(TABLE).select(columns).order("date", desc=False).order("id", desc=False)
 
     if org_id:
         q = q.eq("org_id", org_id)
@@ -88,6 +101,77 @@ def _accumulate_totals(rows: list[dict[str, Any]]) -> dict[str, float]:
     return {"in": t_in, "out": t_out, "balance": t_in - t_out}
 
 
+def _summary_bucket(row: dict[str, Any], group_by: str | None) -> str | None:
+    if group_by is None:
+        return None
+    if group_by == "category":
+        return str(row.get("category") or "")
+    raw = str(row.get("date") or "")[:10]
+    return raw[:7] if group_by == "month" else raw
+
+
+def _summarize_rows(rows: list[dict[str, Any]], group_by: str | None) -> list[dict[str, Any]]:
+    """Agregação local equivalente à RPC (fallback sem a migration)."""
+    buckets: dict[str | None, list[dict[str, Any]]] = {}
+    for r in rows:
+        buckets.setdefault(_summary_bucket(r, group_by), []).append(r)
+    summary: list[dict[str, Any]] = []
+    for bucket in sorted(buckets, key=lambda b: (b is not None, b or "")):
+        items = buckets[bucket]
+        summary.append({"bucket": bucket, **_accumulate_totals(items), "count": len(items)})
+    return summary
+
+
+def _summary_from_rpc(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _num(value: Any) -> float:
+        try:
+            return float(value or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    return [
+        {
+            "bucket": r.get("bucket"),
+            "in": _num(r.get("total_in")),
+            "out": _num(r.get("total_out")),
+            "balance": _num(r.get("balance")),
+            "count": int(r.get("entries") or 0),
+        }
+        for r in rows
+    ]
+
+
+def _rpc_summary(
+    client: Any,
+    dfrom: date_cls | str | None,
+    dto: date_cls | str | None,
+    group_by: str | None,
+    type_filter: str | None,
+    text: str | None,
+    org_id: str | None,
+) -> list[dict[str, Any]] | None:
+    """Chama cashflow_summary; None se a função não existe no banco."""
+    global _summary_rpc_missing
+    params = {
+        "p_org_id": org_id or None,
+        "p_from": to_iso_date(dfrom) if dfrom else None,
+        "p_to": to_iso_date(dto) if dto else None,
+        "p_group": group_by,
+        "p_type": type_filter if type_filter in ("IN", "OUT") else None,
+        "p_text": text or None,
+    }
+    try:
+        res = client.rpc(SUMMARY_RPC, params).execute()
+    except PostgrestAPIError as e:
+        if getattr(e, "code", None) in _RPC_MISSING_CODES:
+            _summary_rpc_missing = True
+            logger.info("Cashflow: RPC %s indisponível; somando lançamentos localmente", SUMMARY_RPC)
+            return None
+        raise format_api_error(e, "RPC")
+    data: list[dict[str, Any]] = getattr(res, "data", None) or []
+    return _summary_from_rpc(list(data))
+
+
 # ---------------------------------------------------------------------------
 # Repositório do Fluxo de Caixa
 # ---------------------------------------------------------------------------
@@ -98,13 +182,60 @@ def list_entries(
     text: str | None = None,
     *,
     org_id: str | None = None,
+    columns: str = "*",
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
-    """Lista lançamentos por período, com filtros opcionais."""
+    """Lista lançamentos por período, com filtros opcionais.
+
+    Args:
+        columns: Projeção do select (ex.: ``LIST_COLUMNS``); padrão todas.
+        limit: Tamanho da página; None devolve o período inteiro.
+        offset: Posição inicial da página (ordem: date, id).
+    """
     c = get_supabase_client()
-    q = _build_list_query(c, dfrom, dto, type_filter, text, org_id)
+    q = _build_list_query(c, dfrom, dto, type_filter, text, org_id, columns)
+    if limit is not None:
+        start = max(0, int(offset))
+        q = q.range(start, start + max(1, int(limit)) - 1)
     return _execute_list_query(q)
 
 
+def summarize(
+    dfrom: date_cls | str | None,
+    dto: date_cls | str | None,
+    *,
+    group_by: str | None = None,
+    type_filter: str | None = None,
+    text: str | None = None,
+    org_id: str | None = None,
+) -> list[dict[str, Any]]:
+    """Entradas/saídas/saldo do período, agregados no banco.
+
+    Args:
+        group_by: None (total do período), "day", "month" ou "category".
+
+    Returns:
+        Uma linha por grupo, em ordem de ``bucket``:
+        ``{"bucket", "in", "out", "balance", "count"}``. Sem ``group_by`` o
+        bucket é None e a lista fica vazia quando não há lançamentos.
+
+    Raises:
+        ValueError: Se ``group_by`` não for suportado.
+    """
+    if group_by is not None and group_by not in SUMMARY_GROUPS:
+        raise ValueError(f"Agrupamento inválido: {group_by!r}")
+    c = get_supabase_client()
+    if not _summary_rpc_missing:
+        summary = _rpc_summary(c, dfrom, dto, group_by, type_filter, text, org_id)
+        if summary is not None:
+            return summary
+
+    columns = "type,amount" if group_by is None else f"type,amount,{'category' if group_by == 'category' else 'date'}"
+    rows = list_entries(dfrom, dto, type_filter, text, org_id=org_id, columns=columns)
+    return _summarize_rows(rows, group_by)
+
+
 def totals(
     dfrom: date_cls | str | None,
     dto: date_cls | str | None,
@@ -112,8 +243,11 @@ def totals(
     org_id: str | None = None,
 ) -> dict[str, float]:
     """Totaliza entradas/saídas/saldo no período."""
-    rows: list[dict[str, Any]] = list_entries(dfrom, dto, org_id=org_id)
-    return _accumulate_totals(rows)
+    summary = summarize(dfrom, dto, org_id=org_id)
+    if not summary:
+        return {"in": 0.0, "out": 0.0, "balance": 0.0}
+    row = summary[0]
+    return {"in": row["in"], "out": row["out"], "balance": row["balance"]}
 
 
 def create_entry(data: dict[str, Any], org_id: str | None = None) -> dict[str, Any]:
@@ -159,7 +159,14 @@ class CashflowWindow(ctk.CTkToplevel):
 
     def _fetch_rows(self, dfrom: date, dto: date, tfilter: Optional[str]) -> list[dict]:
         try:
-            return repo.list_entries(dfrom, dto, tfilter, self.var_text.get().strip(), org_id=self._org_id)
+            return repo.list_entries(
+                dfrom,
+                dto,
+                tfilter,
+                self.var_text.get().strip(),
+                org_id=self._org_id,
+                columns=repo.LIST_COLUMNS,
+            )
         except Exception as e:
             show_warning(
                 self,
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""Cache de obrigações regulatórias por organização, com sincronização incremental.
+
+O dashboard do Hub (prazos, alertas, radar, clientes do dia, atividade
+recente) baixava a tabela ``reg_obligations`` inteira várias vezes por
+atualização. Aqui cada organização tem uma cópia em memória:
+
+- A primeira leitura carrega tudo; as seguintes, passado
+  ``OBLIGATIONS_SYNC_S``, buscam só as linhas com ``updated_at`` a partir da
+  última alteração vista (com uma margem para relógios adiantados) e uma
+  contagem ``exact``. Se a contagem não bate com a cópia local (exclusão
+  feita em outra máquina), a cópia é recarregada por inteiro.
+- A cada ``OBLIGATIONS_FULL_RELOAD_S`` a sincronização é uma carga completa,
+  mesmo com a contagem certa: alterações gravadas com ``updated_at`` anterior
+  à margem (relógio atrasado, base sem o trigger da migration
+  20260423_reg_obligations_updated_at) não se perdem para sempre.
+- ``create_obligation``/``update_obligation``/``delete_obligation`` chamam
+  ``invalidate``/``discard``: a próxima leitura sincroniza o delta.
+- Um índice ordenado por ``due_date`` atende consultas por intervalo
+  (``scan``) com busca binária, sem ordenar a lista a cada chamada.
+- Se a sincronização falhar, a última cópia é usada (e a sincronização é
+  tentada de novo na próxima leitura).
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Optional
+
+from src.config.environment import env_int
+from src.db.domain_types import RegObligationRow
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "OBLIGATIONS_FULL_RELOAD_S",
+    "OBLIGATIONS_SYNC_S",
+    "ObligationsCache",
+    "ObligationsCacheStats",
+    "get_obligations_cache",
+]
+
+# Intervalo (s) em que a cópia local é usada sem consultar o servidor
+OBLIGATIONS_SYNC_S: int = max(0, env_int("RC_OBLIGATIONS_SYNC_S", 30))
+# Intervalo (s) máximo entre cargas completas (0 = só quando a contagem diverge)
+OBLIGATIONS_FULL_RELOAD_S: int = max(0, env_int("RC_OBLIGATIONS_FULL_RELOAD_S", 600))
+# Margem (s) na busca incremental: updated_at é gerado pelo relógio de cada máquina
+_DELTA_OVERLAP = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class ObligationsCacheStats:
+    """Contadores do cache de obrigações (snapshot)."""
+
+    hits: int
+    full_loads: int
+    delta_syncs: int
+    rows: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.full_loads + self.delta_syncs
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _OrgState:
+    rows: dict[str, RegObligationRow] = field(default_factory=dict)
+    # (due_date ISO, id) em ordem; só linhas com due_date válida
+    due_index: list[tuple[str, str]] = field(default_factory=list)
+    watermark: Optional[str] = None  # maior updated_at visto
+    loaded: bool = False
+    synced_at: float = float("-inf")
+    full_at: float = float("-inf")  # última carga completa
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _due_key(row: RegObligationRow) -> Optional[str]:
+    raw: Any = row.get("due_date")
+    if isinstance(raw, date):
+        return raw.isoformat()[:10]
+    if isinstance(raw, str):
+        try:
+            return date.fromisoformat(raw[:10]).isoformat()
+        except ValueError:
+            return None
+    return None
+
+
+def _as_key(value: date | str | None) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+def _delta_since(watermark: str) -> str:
+    try:
+        return (datetime.fromisoformat(watermark) - _DELTA_OVERLAP).isoformat()
+    except ValueError:
+        return watermark
+
+
+class ObligationsCache:
+    """Obrigações por organização com delta por ``updated_at`` e índice por vencimento."""
+
+    def __init__(
+        self,
+        sync_interval_s: float = OBLIGATIONS_SYNC_S,
+        *,
+        full_reload_s: float = OBLIGATIONS_FULL_RELOAD_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sync_interval_s = max(0.0, float(sync_interval_s))
+        self.full_reload_s = max(0.0, float(full_reload_s))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: dict[str, _OrgState] = {}
+        self._hits = 0
+        self._full_loads = 0
+        self._delta_syncs = 0
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def rows(self, org_id: str) -> list[RegObligationRow]:
+        """Todas as obrigações da organização (as linhas não devem ser alteradas)."""
+        state = self._ensure(org_id)
+        with state.lock:
+            return list(state.rows.values())
+
+    def scan(
+        self,
+        org_id: str,
+        *,
+        start: date | str | None = None,
+        end: date | str | None = None,
+        statuses: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> list[RegObligationRow]:
+        """Obrigações com ``start <= due_date <= end``, em ordem de vencimento.
+
+        Linhas sem due_date válida ficam de fora. ``limit`` conta só as
+        linhas que passam no filtro de status.
+        """
+        state = self._ensure(org_id)
+        wanted = frozenset(statuses) if statuses is not None else None
+        lo_key, hi_key = _as_key(start), _as_key(end)
+        with state.lock:
+            index = state.due_index
+            lo = bisect.bisect_left(index, (lo_key, "")) if lo_key else 0
+            # "\uffff" fica depois de qualquer id: inclui todo o dia ``end``
+            hi = bisect.bisect_right(index, (hi_key, "\uffff")) if hi_key else len(index)
+            found: list[RegObligationRow] = []
+            for _due, obligation_id in index[lo:hi]:
+                row = state.rows[obligation_id]
+                if wanted is not None and row.get("status") not in wanted:
+                    continue
+                found.append(row)
+                if limit is not None and len(found) >= limit:
+                    break
+            return found
+
+    # ------------------------------------------------------------------
+    # Invalidação
+    # ------------------------------------------------------------------
+
+    def invalidate(self, org_id: Optional[str] = None) -> None:
+        """Força sincronização na próxima leitura (de uma organização ou de todas)."""
+        with self._lock:
+            states = list(self._states.values()) if org_id is None else [self._states.get(org_id)]
+        for state in states:
+            if state is not None:
+                with state.lock:
+                    state.synced_at = float("-inf")
+
+    def discard(self, org_id: str, obligation_id: str) -> None:
+        """Remove uma obrigação excluída pelo app e força sincronização."""
+        with self._lock:
+            state = self._states.get(org_id)
+        if state is None:
+            return
+        with state.lock:
+            self._remove_locked(state, str(obligation_id))
+            state.synced_at = float("-inf")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def stats(self) -> ObligationsCacheStats:
+        with self._lock:
+            rows = sum(len(s.rows) for s in self._states.values())
+            return ObligationsCacheStats(self._hits, self._full_loads, self._delta_syncs, rows)
+
+    # ------------------------------------------------------------------
+    # Sincronização
+    # ------------------------------------------------------------------
+
+    def _ensure(self, org_id: str) -> _OrgState:
+        with self._lock:
+            state = self._states.setdefault(org_id, _OrgState())
+        # Lock por organização: leituras concorrentes esperam uma única sincronização
+        with state.lock:
+            now = self._clock()
+            if now - state.synced_at < self.sync_interval_s:
+                with self._lock:
+                    self._hits += 1
+                return state
+            loaded = state.loaded
+            delta_ok = loaded and state.watermark is not None
+            if delta_ok and self.full_reload_s and now - state.full_at >= self.full_reload_s:
+                delta_ok = False
+            try:
+                if delta_ok and self._sync_delta_locked(org_id, state):
+                    kind = "delta"
+                else:
+                    self._load_full_locked(org_id, state)
+                    state.full_at = now
+                    kind = "full"
+            except Exception as exc:  # noqa: BLE001
+                if not loaded:
+                    raise
+                logger.warning("Obrigações: falha ao sincronizar org %s; usando cópia local (%s)", org_id, exc)
+                return state
+            state.synced_at = now
+            with self._lock:
+                if kind == "delta":
+                    self._delta_syncs += 1
+                else:
+                    self._full_loads += 1
+            return state
+
+    def _load_full_locked(self, org_id: str, state: _OrgState) -> None:
+        from src.features.regulations import repository
+
+        rows = repository.list_obligations_for_org(org_id)
+        state.rows = {}
+        state.due_index = []
+        state.watermark = None
+        for row in rows:
+            self._put_locked(state, row)
+        state.due_index.sort()
+        state.loaded = True
+        logger.debug("Obrigações: carga completa org=%s (%d linhas)", org_id, len(state.rows))
+
+    def _sync_delta_locked(self, org_id: str, state: _OrgState) -> bool:
+        """Aplica as linhas alteradas; False se a contagem exige recarga completa."""
+        from src.features.regulations import repository
+
+        assert state.watermark is not None
+        changed = repository.list_obligations_updated_since(org_id, _delta_since(state.watermark))
+        for row in changed:
+            self._remove_locked(state, str(row.get("id")))
+            self._insert_locked(state, row)
+        total = repository.count_obligations(org_id)
+        if total != len(state.rows):
+            logger.debug(
+                "Obrigações: contagem divergente org=%s (%d local, %d servidor)", org_id, len(state.rows), total
+            )
+            return False
+        logger.debug("Obrigações: delta org=%s (%d alterada(s))", org_id, len(changed))
+        return True
+
+    def _put_locked(self, state: _OrgState, row: RegObligationRow) -> None:
+        """Grava a linha sem manter a ordem do índice (carga completa ordena no fim)."""
+        obligation_id = str(row.get("id"))
+        state.rows[obligation_id] = row
+        due = _due_key(row)
+        if due is not None:
+            state.due_index.append((due, obligation_id))
+        updated: Any = row.get("updated_at")
+        if updated is not None:
+            updated = updated.isoformat() if isinstance(updated, datetime) else str(updated)
+            if state.watermark is None or updated > state.watermark:
+                state.watermark = updated
+
+    def _insert_locked(self, state: _OrgState, row: RegObligationRow) -> None:
+        index_len = len(state.due_index)
+        self._put_locked(state, row)
+        if len(state.due_index) > index_len:
+            entry = state.due_index.pop()
+            bisect.insort(state.due_index, entry)
+
+    def _remove_locked(self, state: _OrgState, obligation_id: str) -> None:
+        old = state.rows.pop(obligation_id, None)
+        if old is None:
+            return
+        due = _due_key(old)
+        if due is None:
+            return
+        i = bisect.bisect_left(state.due_index, (due, obligation_id))
+        if i < len(state.due_index) and state.due_index[i] == (due, obligation_id):
+            del state.due_index[i]
+
+
+_shared: Optional[ObligationsCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_obligations_cache() -> ObligationsCache:
+    """Cache compartilhado do processo (criado no primeiro uso)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ObligationsCache()
+        return _shared
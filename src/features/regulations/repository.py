@@ -35,6 +35,7 @@ def list_obligations_for_org(
     status: str | None = None,
     kind: str | None = None,
     limit: int | None = None,
+    client_id: int | None = None,
 ) -> list[RegObligationRow]:
     """Lista obrigações regulatórias de uma organização, com filtros opcionais.
 
@@ -45,6 +46,7 @@ def list_obligations_for_org(
         status: Filtra por status ('pending', 'done', 'overdue', 'canceled').
         kind: Filtra por tipo ('SNGPC', 'FARMACIA_POPULAR', 'SIFAP', etc.).
         limit: Limita o número de resultados retornados.
+        client_id: Filtra pelas obrigações de um cliente (no servidor).
 
     Returns:
         Lista de obrigações no formato RegObligationRow.
@@ -67,6 +69,9 @@ def list_obligations_for_org(
     if kind is not None:
         query = query.eq("kind", kind)
 
+    if client_id is not None:
+        query = query.eq("client_id", client_id)
+
     # Ordenar por data de vencimento
     query = query.order("due_date", desc=False)
 
@@ -81,6 +86,56 @@ def list_obligations_for_org(
         raise format_api_error(e, "SELECT")
 
 
+def list_obligations_for_client(
+    org_id: str,
+    client_id: int,
+    *,
+    status: str | None = None,
+) -> list[RegObligationRow]:
+    """Lista as obrigações de um cliente, filtradas no servidor e ordenadas por due_date.
+
+    Raises:
+        RuntimeError: Se houver erro na API do Supabase.
+    """
+    return list_obligations_for_org(org_id, status=status, client_id=client_id)
+
+
+def list_obligations_updated_since(org_id: str, since: str) -> list[RegObligationRow]:
+    """Lista obrigações com updated_at >= ``since`` (ISO 8601), em ordem de updated_at.
+
+    Usado pela sincronização incremental do cache de obrigações.
+
+    Raises:
+        RuntimeError: Se houver erro na API do Supabase.
+    """
+    client = get_supabase_client()
+    query = client.table(TABLE).select("*").eq("org_id", org_id).gte("updated_at", since).order("updated_at")
+    try:
+        res = query.execute()
+        data: list[RegObligationRow] = getattr(res, "data", None) or []
+        return list(data)
+    except PostgrestAPIError as e:
+        raise format_api_error(e, "SELECT")
+
+
+def count_obligations(org_id: str) -> int:
+    """Conta todas as obrigações de uma organização (qualquer status).
+
+    Raises:
+        RuntimeError: Se houver erro na API do Supabase.
+    """
+    client = get_supabase_client()
+    query = client.table(TABLE).select("id", count="exact").eq("org_id", org_id).limit(1)
+    try:
+        res = query.execute()
+        count_val = getattr(res, "count", None)
+        if count_val is not None:
+            return int(count_val)
+        raise RuntimeError("[COUNT] Resposta sem contagem")
+    except PostgrestAPIError as e:
+        raise format_api_error(e, "COUNT")
+
+
 def count_pending_obligations(org_id: str) -> int:
     """Conta obrigações pendentes ou atrasadas de uma organização.
 
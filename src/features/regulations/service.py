@@ -13,7 +13,8 @@ from typing import Final, Literal
 from uuid import uuid4
 
 from src.db.domain_types import RegObligationRow
-from src.features.regulations.repository import list_obligations_for_org
+from src.features.regulations import repository
+from src.features.regulations.cache import get_obligations_cache
 
 logger = logging.getLogger(__name__)
 
@@ -153,10 +154,9 @@ def list_obligations_for_client(org_id: str, client_id: int) -> list[RegObligati
         client_id: Client ID to filter obligations.
 
     Returns:
-        List of obligation records for the client.
+        List of obligation records for the client, ordered by due_date.
     """
-    all_obligations = list_obligations_for_org(org_id)
-    return [obl for obl in all_obligations if obl.get("client_id") == client_id]
+    return repository.list_obligations_for_client(org_id, client_id)
 
 
 def create_obligation(
@@ -228,6 +228,7 @@ def create_obligation(
         if not response.data:
             raise RuntimeError("Failed to create obligation: no data returned")
 
+        get_obligations_cache().invalidate(org_id)
         return response.data[0]
 
     except Exception as exc:
@@ -303,6 +304,7 @@ def update_obligation(
         if not response.data:
             raise RuntimeError("Failed to update obligation: no data returned")
 
+        get_obligations_cache().invalidate(org_id)
         return response.data[0]
 
     except Exception as exc:
@@ -325,6 +327,7 @@ def delete_obligation(org_id: str, obligation_id: str) -> None:
     try:
         client.table("reg_obligations").delete().eq("id", obligation_id).eq("org_id", org_id).execute()
         logger.info("Deleted obligation %s", obligation_id)
+        get_obligations_cache().discard(org_id, obligation_id)
 
     except Exception as exc:
         logger.error("Failed to delete obligation: %s", exc)
@@ -1,21 +1,98 @@
-import time
+"""Cache JSON com TTL, em memória primeiro e persistência em lote.
+
+O arquivo (``runtime/cache.json``) é lido uma única vez, na criação do
+store; depois disso ``get``/``set`` operam só no dicionário em memória:
+
+- expiração preguiçosa: um min-heap de ``expire`` descarta as entradas
+  vencidas à medida que o relógio passa por elas (sem varrer tudo a cada
+  leitura);
+- LRU com limite de entradas e de bytes (tamanho do payload em JSON);
+- gravação write-behind: alterações marcam o store como sujo e um timer
+  grava o arquivo inteiro uma vez após ``flush_delay`` segundos, juntando
+  todas as alterações do intervalo (``flush_delay=0`` grava na hora).
+  A gravação é atômica (arquivo temporário + ``os.replace``) e também
+  acontece em ``flush()``/``close()`` e na saída do processo.
+
+Formato do arquivo (inalterado):
+``{ cache_key: { "timestamp": "...", "expire": <epoch>, "payload": ... } }``
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import heapq
+import itertools
 import json
+import logging
 import os
+import tempfile
 import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+from src.config.environment import env_int
+
+log = logging.getLogger(__name__)
+
+# Limites padrão do cache (sobrescrevíveis por ambiente)
+CACHE_MAX_ENTRIES: int = max(1, env_int("RC_CACHE_MAX_ENTRIES", 5000))
+CACHE_MAX_MB: int = max(1, env_int("RC_CACHE_MAX_MB", 32))
+# Atraso (ms) para juntar alterações numa única gravação do arquivo
+CACHE_FLUSH_DELAY_MS: int = max(0, env_int("RC_CACHE_FLUSH_DELAY_MS", 2000))
+
+
+@dataclass(frozen=True)
+class CacheStoreStats:
+    """Contadores do cache (snapshot)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    flushes: int
+    entries: int
+    bytes_used: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _flush_at_exit(ref: weakref.ReferenceType[JsonCacheStore]) -> None:
+    store = ref()
+    # diretório removido (ex.: pasta temporária): não há onde gravar
+    if store is not None and os.path.isdir(os.path.dirname(store.file_path) or "."):
+        store.close()
+
 
 class JsonCacheStore:
     """
-    Cache simples baseado em JSON com TTL.
+    Cache baseado em JSON com TTL, mantido em memória e gravado em lote.
     Salva um dicionário: { cache_key: { "timestamp": "...", "expire": <epoch>, "payload": ... } }
     """
 
-    def __init__(self, file_path: str = "runtime/cache.json", ttl_hours: int = 24) -> None:
+    def __init__(
+        self,
+        file_path: str = "runtime/cache.json",
+        ttl_hours: int = 24,
+        *,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_MB * 1024 * 1024,
+        flush_delay: float = CACHE_FLUSH_DELAY_MS / 1000,
+    ) -> None:
         self.file_path = file_path
         self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.flush_delay = max(0.0, float(flush_delay))
         self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
         dir_name = os.path.dirname(self.file_path)
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
@@ -23,6 +100,22 @@ class JsonCacheStore:
             with open(self.file_path, "w", encoding="utf-8") as f:
                 json.dump({}, f)
 
+        # chave -> (entrada, bytes); ordem = LRU (mais recente no fim)
+        self._entries: OrderedDict[str, tuple[dict, int]] = OrderedDict()
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._bytes = 0
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._flushes = 0
+
+        self._populate(self._load_unlocked())
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
     # ------------------------------------------------------------------
     # I/O interno — sem lock, para ser chamado dentro de seções críticas
     # ------------------------------------------------------------------
@@ -35,8 +128,18 @@ class JsonCacheStore:
             return {}
 
     def _save_unlocked(self, data: dict) -> None:
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        dir_name = os.path.dirname(self.file_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".cache_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     # Wrappers públicos preservados para retrocompatibilidade interna
     def _load(self) -> dict:
@@ -69,73 +172,208 @@ class JsonCacheStore:
                 pass
         return None
 
-    # ------------------------------------------------------------------
-    # API pública
-    # ------------------------------------------------------------------
+    @staticmethod
+    def _payload_size(payload: Any) -> int:
+        return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
 
-    def get(self, key: str) -> Any:
-        """Retorna o payload cacheado ou None se expirado/inexistente."""
+    def _populate(self, data: dict) -> None:
+        """Carrega o arquivo em memória, descartando vencidas e migrando legadas."""
         now = time.time()
+        if not isinstance(data, dict):
+            data = {}
         with self._lock:
-            data = self._load_unlocked()
-            dirty = False
-
-            # Remove entradas expiradas ou malformadas (limpeza geral)
-            to_remove = []
-            for k, v in data.items():
-                if not isinstance(v, dict):
-                    to_remove.append(k)
+            for key, item in data.items():
+                if not isinstance(item, dict):
+                    self._dirty = True
                     continue
-                expire = self._resolve_expire(v)
+                try:
+                    expire = self._resolve_expire(item)
+                except (TypeError, ValueError):
+                    expire = None
                 if expire is None or expire < now:
-                    to_remove.append(k)
+                    self._dirty = True
+                    continue
+                if "expire" not in item:
+                    # Migra entradas legadas: 'expire' é gravado no próximo flush
+                    item = {**item, "expire": expire}
+                    self._dirty = True
+                try:
+                    size = self._payload_size(item.get("payload"))
+                except (TypeError, ValueError):
+                    size = 0
+                self._insert_locked(str(key), item, expire, size)
+            self._enforce_limits_locked()
+        if self._dirty:
+            self._schedule_flush()
 
-            for k in to_remove:
-                data.pop(k, None)
-                dirty = True
+    def _insert_locked(self, key: str, item: dict, expire: float, size: int) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (item, size)
+        self._bytes += size
+        heapq.heappush(self._heap, (expire, next(self._seq), key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            # reaproveita o heap quando sobrescritas deixaram muitos itens obsoletos
+            self._heap = [(float(e["expire"]), next(self._seq), k) for k, (e, _s) in self._entries.items()]
+            heapq.heapify(self._heap)
 
-            item = data.get(key)
-            if item is None:
-                if dirty:
-                    self._save_unlocked(data)
-                return None
+    def _remove_locked(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+            self._dirty = True
 
-            # Migra entradas legadas: adiciona 'expire' ao arquivo
-            if "expire" not in item:
-                expire = self._resolve_expire(item)
-                if expire is not None:
-                    item["expire"] = expire
-                    dirty = True
+    def _expire_locked(self, now: float) -> None:
+        """Remove as entradas vencidas do topo do heap (amortizado O(log n))."""
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            expire, _seq, key = heapq.heappop(heap)
+            current = self._entries.get(key)
+            # item do heap obsoleto se a chave foi sobrescrita/removida depois
+            if current is not None and float(current[0]["expire"]) == expire:
+                self._remove_locked(key)
+                self._expirations += 1
 
-            if dirty:
-                self._save_unlocked(data)
+    def _enforce_limits_locked(self) -> None:
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _key, (_item, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            self._dirty = True
 
-            return item.get("payload")
+    # ------------------------------------------------------------------
+    # Persistência em lote
+    # ------------------------------------------------------------------
+
+    def _schedule_flush(self) -> None:
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+        with self._lock:
+            if self._timer is not None or not self._dirty:
+                return
+            timer = threading.Timer(self.flush_delay, self.flush)
+            timer.daemon = True
+            self._timer = timer
+        timer.start()
+
+    def flush(self) -> bool:
+        """Grava o estado atual no arquivo se houver alterações pendentes.
+
+        Returns:
+            True se o arquivo foi gravado.
+        """
+        with self._flush_lock:
+            with self._lock:
+                timer, self._timer = self._timer, None
+                if not self._dirty:
+                    return False
+                snapshot = {k: item for k, (item, _size) in self._entries.items()}
+                self._dirty = False
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            try:
+                self._save_unlocked(snapshot)
+            except (OSError, TypeError, ValueError) as exc:
+                log.warning("Falha ao gravar cache em %s: %s", self.file_path, exc)
+                with self._lock:
+                    self._dirty = True
+                return False
+            with self._lock:
+                self._flushes += 1
+            return True
+
+    def close(self) -> None:
+        """Cancela o timer pendente e grava as alterações."""
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Any:
+        """Retorna uma cópia do payload cacheado ou None se expirado/inexistente."""
+        # Cópia: alterar o retorno não pode mudar o cache (nem o que o flush grava)
+        return copy.deepcopy(self._lookup(key))
+
+    def _lookup(self, key: str) -> Any:
+        """Payload guardado (sem cópia), contando hit/miss e aplicando a expiração."""
+        now = time.time()
+        with self._lock:
+            dirty_before = self._dirty
+            self._expire_locked(now)
+            entry = self._entries.get(key)
+            if entry is not None and float(entry[0]["expire"]) < now:
+                self._remove_locked(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                payload = None
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                payload = entry[0].get("payload")
+            changed = self._dirty and not dirty_before
+        if changed:
+            self._schedule_flush()
+        return payload
 
     def get_entry(self, key: str) -> dict | None:
         """Retorna a entrada completa {timestamp, expire, payload} para debug/uso interno."""
         now = time.time()
         with self._lock:
-            data = self._load_unlocked()
-        item = data.get(key)
-        if not isinstance(item, dict):
+            entry = self._entries.get(key)
+        if entry is None:
             return None
-        expire = self._resolve_expire(item)
-        if expire is None or expire < now:
+        item = entry[0]
+        if float(item["expire"]) < now:
             return None
-        return item
+        return copy.deepcopy(item)
 
     def set(self, key: str, payload: Any) -> None:
-        """Grava o payload com TTL. Operação atômica (read-modify-write sob lock)."""
+        """Grava o payload com TTL em memória; o arquivo é atualizado no próximo flush."""
+        size = self._payload_size(payload)  # falha aqui (e não no flush) se não for serializável
+        payload = copy.deepcopy(payload)  # o chamador pode continuar alterando o original
         now = time.time()
+        expire = now + self.ttl.total_seconds()
+        item = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "expire": expire,
+            "payload": payload,
+        }
         with self._lock:
-            data = self._load_unlocked()
-            data[key] = {
-                "timestamp": datetime.now().isoformat(timespec="seconds"),
-                "expire": now + self.ttl.total_seconds(),
-                "payload": payload,
-            }
-            self._save_unlocked(data)
+            self._expire_locked(now)
+            self._insert_locked(key, item, expire, size)
+            self._dirty = True
+            self._enforce_limits_locked()
+        self._schedule_flush()
+
+    def delete(self, key: str) -> bool:
+        """Remove a chave; retorna True se ela existia."""
+        with self._lock:
+            existed = key in self._entries
+            self._remove_locked(key)
+        if existed:
+            self._schedule_flush()
+        return existed
 
     def has_valid(self, key: str) -> bool:
-        return self.get(key) is not None
+        return self._lookup(key) is not None
+
+    def stats(self) -> CacheStoreStats:
+        with self._lock:
+            return CacheStoreStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                flushes=self._flushes,
+                entries=len(self._entries),
+                bytes_used=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
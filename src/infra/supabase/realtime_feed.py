@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Feed de alterações de linhas via Supabase Realtime (postgres_changes).
+
+O cliente sync do supabase-py não implementa Realtime; aqui o
+``AsyncRealtimeClient`` roda num event loop próprio, numa thread daemon, e
+entrega cada linha alterada numa ``queue.Queue`` que o código sync consome
+com ``get(timeout=...)``.
+
+``open_row_feed`` devolve None quando o Realtime não está disponível
+(sem URL/credenciais, sem rede, timeout na inscrição). Quem usa o feed deve
+manter um polling de segurança: ``connected`` vira False se o canal cair
+depois de inscrito (CHANNEL_ERROR/TIMED_OUT/CLOSED ou erro de sistema, como
+tabela fora da publicação ``supabase_realtime``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger("infra.supabase.realtime")
+
+__all__ = ["RowChangeFeed", "open_row_feed"]
+
+_SUBSCRIBE_TIMEOUT_S = 5.0
+# Intervalo (s) de conferência do estado do canal depois de inscrito
+_STATE_CHECK_S = 1.0
+
+
+class RowChangeFeed:
+    """Inscrição em UPDATEs de uma tabela filtrada (ex.: ``id=eq.<id>``)."""
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        access_token: Optional[str],
+        *,
+        table: str,
+        row_filter: str,
+        event: str = "UPDATE",
+        schema: str = "public",
+    ) -> None:
+        self.url = url
+        self.api_key = api_key
+        self.access_token = access_token
+        self.table = table
+        self.row_filter = row_filter
+        self.event = event
+        self.schema = schema
+        self.rows: queue.Queue[dict[str, Any]] = queue.Queue()
+        self.connected = False
+        self._ready = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, timeout_s: float = _SUBSCRIBE_TIMEOUT_S) -> bool:
+        """Conecta e inscreve o canal; True se inscrito dentro do timeout."""
+        self._thread = threading.Thread(target=self._run, name=f"Realtime-{self.table}", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout_s)
+        if not self.connected:
+            self.close()
+        return self.connected
+
+    def get(self, timeout: float) -> Optional[dict[str, Any]]:
+        """Próxima linha alterada ou None após ``timeout`` segundos."""
+        try:
+            return self.rows.get(timeout=max(0.0, timeout))
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self.connected = False
+        loop, stop = self._loop, self._stop
+        if loop is not None and stop is not None:
+            try:
+                loop.call_soon_threadsafe(stop.set)
+            except RuntimeError:
+                pass  # loop já encerrado
+
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._main())
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("realtime.feed: encerrado com erro (%s): %s", self.table, exc)
+        finally:
+            self.connected = False
+            self._ready.set()
+
+    async def _main(self) -> None:
+        from realtime import AsyncRealtimeClient, RealtimeSubscribeStates
+
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        client = AsyncRealtimeClient(f"{self.url}/realtime/v1", self.api_key, max_retries=2)
+        if self.access_token:
+            client.access_token = self.access_token
+
+        def _on_change(payload: dict[str, Any]) -> None:
+            record = (payload.get("data") or {}).get("record")
+            if isinstance(record, dict):
+                self.rows.put(record)
+
+        def _on_state(state: Any, error: Optional[Exception]) -> None:
+            if state == RealtimeSubscribeStates.SUBSCRIBED:
+                self.connected = True
+            else:
+                # CHANNEL_ERROR, TIMED_OUT, CLOSED
+                self.connected = False
+                logger.debug("realtime.feed: %s %s: %s", self.table, state, error)
+            self._ready.set()
+
+        def _on_system(payload: Any) -> None:
+            if getattr(payload, "status", "ok") != "ok":
+                self.connected = False
+                logger.debug("realtime.feed: erro de sistema em %s: %s", self.table, payload)
+
+        channel = client.channel(f"rc_{self.table}_{self.row_filter}")
+        channel.on_postgres_changes(
+            self.event, _on_change, table=self.table, schema=self.schema, filter=self.row_filter
+        )
+        channel.on_system(_on_system)
+        try:
+            await channel.subscribe(_on_state)
+            while not self._stop.is_set():
+                try:
+                    await asyncio.wait_for(self._stop.wait(), _STATE_CHECK_S)
+                except asyncio.TimeoutError:
+                    pass
+                # Erros de sistema (status "error") não passam pelos callbacks:
+                # o canal só muda de estado
+                if self.connected and not channel.is_joined:
+                    self.connected = False
+                    logger.debug("realtime.feed: canal %s saiu do estado joined", self.table)
+        finally:
+            try:
+                await client.close()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("realtime.feed: falha ao fechar conexão: %s", exc)
+
+
+def open_row_feed(table: str, row_filter: str, *, timeout_s: float = _SUBSCRIBE_TIMEOUT_S) -> Optional[RowChangeFeed]:
+    """Abre um feed de UPDATEs de ``table`` filtrado por ``row_filter``.
+
+    Usa o JWT da sessão atual (RLS) e a anon key. Devolve None se o Realtime
+    não estiver disponível; nunca levanta exceção.
+    """
+    from src.infra.supabase import types as supa_types
+
+    url = os.getenv("SUPABASE_URL") or supa_types.SUPABASE_URL
+    api_key = os.getenv("SUPABASE_ANON_KEY") or supa_types.SUPABASE_ANON_KEY
+    if not url or not api_key:
+        return None
+
+    access_token: Optional[str] = None
+    try:
+        from src.infra.supabase.db_client import get_supabase
+
+        session = get_supabase().auth.get_session()
+        access_token = getattr(session, "access_token", None) or None
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("realtime.feed: sessão indisponível: %s", exc)
+
+    feed = RowChangeFeed(url, api_key, access_token, table=table, row_filter=row_filter)
+    try:
+        if feed.start(timeout_s):
+            logger.debug("realtime.feed: inscrito em %s (%s)", table, row_filter)
+            return feed
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("realtime.feed: indisponível para %s: %s", table, exc)
+    feed.close()
+    return None
@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""Download resumível (HTTP Range) para arquivos ZIP grandes.
+
+O arquivo é escrito em ``<destino>.part``. Quando o servidor aceita Range
+(``Accept-Ranges: bytes`` e tamanho conhecido), o progresso de cada
+segmento fica em ``<destino>.part.json``:
+
+- uma queda de rede no meio do download não apaga o ``.part``: a próxima
+  tentativa (na mesma chamada, com backoff, ou numa chamada futura com a
+  mesma ``resume_key``) continua com ``Range: bytes=<offset>-``;
+- artefatos grandes (``RC_DOWNLOAD_PARALLEL_MIN_MB``) são divididos em até
+  ``RC_DOWNLOAD_SEGMENTS`` segmentos baixados em paralelo, cada um gravando
+  na sua faixa do ``.part`` pré-alocado;
+- ``If-Range`` com o ETag garante que, se o arquivo mudou no servidor, a
+  resposta volta inteira (200) e o download recomeça do zero;
+- antes de promover o ``.part`` (``os.replace``) o tamanho é conferido e,
+  quando conhecido, o hash (SHA-256 informado ou MD5 do ETag simples do
+  Storage).
+
+Sem suporte a Range (ex.: ZIP gerado em streaming), o comportamento é o
+de sempre: qualquer falha remove o ``.part``. Cancelamento pelo usuário
+também remove o ``.part`` e os metadados.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from http.client import RemoteDisconnected
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+from requests import exceptions as req_exc
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from src.config.environment import env_int
+
+logger = logging.getLogger("infra.supabase.storage_client")
+
+__all__ = [
+    "DOWNLOAD_SEGMENTS",
+    "DownloadHTTPError",
+    "DownloadIntegrityError",
+    "PARALLEL_MIN_BYTES",
+    "ResumableDownload",
+]
+
+_CHUNK_SIZE = 256 * 1024
+# Intervalo (bytes) entre gravações do arquivo de metadados
+_META_SAVE_EVERY = 8 * 1024 * 1024
+
+DOWNLOAD_SEGMENTS: int = max(1, env_int("RC_DOWNLOAD_SEGMENTS", 4))
+PARALLEL_MIN_BYTES: int = max(1, env_int("RC_DOWNLOAD_PARALLEL_MIN_MB", 64)) * 1024 * 1024
+RESUME_ATTEMPTS: int = max(1, env_int("RC_DOWNLOAD_RESUME_ATTEMPTS", 5))
+
+# Alias patchável em testes
+_sleep = time.sleep
+
+_MD5_ETAG_RE = re.compile(r'^"?([0-9a-fA-F]{32})"?$')
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+_NETWORK_ERRORS: tuple[type[BaseException], ...] = (
+    req_exc.ConnectionError,
+    req_exc.Timeout,
+    req_exc.ChunkedEncodingError,
+    ProtocolError,
+    ReadTimeoutError,
+    RemoteDisconnected,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+class DownloadIntegrityError(IOError):
+    """Arquivo baixado não confere com o tamanho/hash esperado."""
+
+
+class _TruncatedError(IOError):
+    """Resposta terminou antes do fim do segmento (retentável)."""
+
+
+class _RestartError(Exception):
+    """Servidor ignorou o Range ou o arquivo mudou: recomeçar do zero."""
+
+
+class DownloadHTTPError(IOError):
+    """Resposta HTTP de erro durante o download."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"Falha ao baixar (HTTP {status})")
+        self.status = status
+
+
+class _RetryableHTTPError(DownloadHTTPError):
+    """Status HTTP transitório (5xx/408/429)."""
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int  # inclusivo; -1 = tamanho desconhecido
+    done: int = 0
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1 if self.end >= 0 else -1
+
+    @property
+    def next_offset(self) -> int:
+        return self.start + self.done
+
+    @property
+    def complete(self) -> bool:
+        return self.end >= 0 and self.done >= self.length
+
+
+@dataclass
+class _PartState:
+    key: str
+    total: int
+    etag: str
+    segments: list[_Segment]
+
+    @property
+    def written(self) -> int:
+        return sum(seg.done for seg in self.segments)
+
+
+def _header(headers: Any, name: str) -> str:
+    try:
+        return str(headers.get(name) or "")
+    except Exception:  # noqa: BLE001
+        return ""
+
+
+def _content_length(headers: Any) -> int:
+    try:
+        return int(_header(headers, "Content-Length") or "0")
+    except ValueError:
+        return 0
+
+
+class ResumableDownload:
+    """Baixa ``url`` para ``dest`` com retomada por Range e segmentos paralelos.
+
+    Args:
+        session: Sessão ``requests`` (``get`` com ``stream=True``).
+        url: URL do arquivo.
+        dest: Caminho final; o parcial fica em ``<dest>.part``.
+        resume_key: Identidade estável do arquivo (ex.: id do job). URLs
+            assinadas mudam a cada pedido, então a retomada entre chamadas
+            só acontece com a mesma chave.
+        headers: Headers extras de cada requisição.
+        params: Query string de cada requisição.
+        cancel_event: Cancela entre blocos (remove o parcial).
+        progress_cb: ``(bytes_escritos, bytes_esperados)``; esperado 0 se desconhecido.
+        expected_sha256: Hash esperado do arquivo final (opcional).
+        verify_etag_md5: Confere o MD5 quando o ETag é um MD5 simples (Storage).
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        url: str,
+        dest: Path,
+        *,
+        resume_key: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, str]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        timeout: tuple[int, int] = (15, 300),
+        segments: int = DOWNLOAD_SEGMENTS,
+        parallel_min_bytes: int = PARALLEL_MIN_BYTES,
+        max_attempts: int = RESUME_ATTEMPTS,
+        expected_sha256: Optional[str] = None,
+        verify_etag_md5: bool = False,
+    ) -> None:
+        self.session = session
+        self.url = url
+        self.dest = Path(dest)
+        self.part_path = self.dest.with_suffix(self.dest.suffix + ".part")
+        self.meta_path = self.dest.with_suffix(self.dest.suffix + ".part.json")
+        self.resume_key = resume_key
+        self.headers = dict(headers or {})
+        self.params = dict(params or {})
+        self.cancel_event = cancel_event
+        self.progress_cb = progress_cb
+        self.timeout = timeout
+        self.segments = max(1, int(segments))
+        self.parallel_min_bytes = max(1, int(parallel_min_bytes))
+        self.max_attempts = max(1, int(max_attempts))
+        self.expected_sha256 = (expected_sha256 or "").lower() or None
+        self.verify_etag_md5 = verify_etag_md5
+        self._lock = threading.Lock()
+        self._state: Optional[_PartState] = None
+        self._resumable = False
+        self._unsaved = 0
+
+    # ------------------------------------------------------------------
+    # Estado persistido (.part.json)
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Optional[_PartState]:
+        try:
+            raw = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            state = _PartState(
+                key=str(raw["key"]),
+                total=int(raw["total"]),
+                etag=str(raw.get("etag") or ""),
+                segments=[_Segment(int(s["start"]), int(s["end"]), int(s["done"])) for s in raw["segments"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if state.key != self.resume_key or state.total <= 0 or not self.part_path.exists():
+            return None
+        if self.part_path.stat().st_size != state.total:
+            return None
+        return state
+
+    def _save_state_locked(self) -> None:
+        state = self._state
+        if state is None or not self._resumable:
+            return
+        payload = {
+            "key": state.key,
+            "total": state.total,
+            "etag": state.etag,
+            "segments": [asdict(s) for s in state.segments],
+        }
+        tmp = self.meta_path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.meta_path)
+        except OSError as exc:
+            logger.debug("Falha ao gravar metadados do download parcial: %s", exc)
+        self._unsaved = 0
+
+    def _discard_partial(self) -> None:
+        for path in (self.part_path, self.meta_path):
+            try:
+                path.unlink(missing_ok=True)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Erro ao remover arquivo temporário: %s", exc)
+        self._state = None
+        self._resumable = False
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def _check_cancel(self) -> None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            from src.infra.supabase.storage_client import DownloadCancelledError
+
+            raise DownloadCancelledError("Operação cancelada pelo usuário.")
+
+    def _advance(self, seg: _Segment, n: int) -> None:
+        with self._lock:
+            seg.done += n
+            self._unsaved += n
+            if self._unsaved >= _META_SAVE_EVERY:
+                self._save_state_locked()
+            written = self._state.written if self._state else seg.done
+            total = self._state.total if self._state else 0
+        if self.progress_cb is not None:
+            try:
+                self.progress_cb(written, total)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Callback de progresso falhou", exc_info=exc)
+
+    def run(self, first_response: Any = None) -> Path:
+        """Executa o download e devolve ``dest``.
+
+        Args:
+            first_response: Resposta já aberta (status/headers validados pelo
+                chamador) para o primeiro trecho; o chamador é dono dela.
+        """
+        self.dest.parent.mkdir(parents=True, exist_ok=True)
+        self._state = self._load_state()
+        if self._state is not None:
+            self._resumable = True
+            logger.info("Download: retomando %s em %d/%d bytes", self.dest.name, self._state.written, self._state.total)
+        else:
+            self._discard_partial()
+
+        attempt = 0
+        promoted = False
+        try:
+            while True:
+                attempt += 1
+                try:
+                    self._check_cancel()
+                    if self._state is None:
+                        response, first_response = first_response, None
+                        self._start(response)
+                    else:
+                        self._fetch_remaining()
+                    self._check_cancel()
+                    self._verify_and_promote()
+                    promoted = True
+                    return self.dest
+                except _RestartError as exc:
+                    logger.info("Download: reiniciando %s do zero (%s)", self.dest.name, exc)
+                    self._discard_partial()
+                    if attempt >= self.max_attempts:
+                        raise IOError(f"Servidor não permitiu retomar o download: {exc}") from exc
+                except (_TruncatedError, _RetryableHTTPError, *_NETWORK_ERRORS) as exc:
+                    if not self._resumable or attempt >= self.max_attempts:
+                        raise
+                    with self._lock:
+                        self._save_state_locked()
+                    delay = min(8.0, 0.5 * (2 ** (attempt - 1)))
+                    logger.warning(
+                        "Download: falha de rede em %s (%s); retomando de %d bytes em %.1fs (tentativa %d/%d)",
+                        self.dest.name,
+                        type(exc).__name__,
+                        self._state.written if self._state else 0,
+                        delay,
+                        attempt + 1,
+                        self.max_attempts,
+                    )
+                    self._wait(delay)
+        except BaseException as exc:
+            if not promoted:
+                from src.infra.supabase.storage_client import DownloadCancelledError
+
+                keep = self._resumable and not isinstance(exc, (DownloadCancelledError, DownloadIntegrityError))
+                if keep:
+                    with self._lock:
+                        self._save_state_locked()
+                    logger.info("Download: parcial mantido para retomada: %s", self.part_path.name)
+                else:
+                    self._discard_partial()
+            raise
+
+    def _wait(self, delay: float) -> None:
+        remaining = delay
+        while remaining > 0:
+            self._check_cancel()
+            step = min(0.25, remaining)
+            _sleep(step)
+            remaining -= step
+        self._check_cancel()
+
+    def _get(self, headers: Mapping[str, str]) -> Any:
+        return self.session.get(
+            self.url,
+            headers={**self.headers, **headers},
+            params=self.params or None,
+            stream=True,
+            timeout=self.timeout,
+        )
+
+    def _start(self, response: Any) -> None:
+        """Primeira requisição: decide entre fluxo único e segmentos paralelos."""
+        if response is None:
+            with self._get({}) as resp:
+                self._start(_OwnedResponse(resp))
+            return
+
+        status = int(getattr(response, "status_code", 0))
+        if status != 200:
+            self._raise_for_status(status)
+        total = _content_length(response.headers)
+        etag = _header(response.headers, "ETag")
+        ranges = _header(response.headers, "Accept-Ranges").lower() == "bytes"
+        self._resumable = ranges and total > 0
+        end = total - 1 if total > 0 else -1
+
+        if self._resumable and self.segments > 1 and total >= self.parallel_min_bytes:
+            # Fecha o fluxo inicial e baixa por faixas em paralelo
+            size = -(-total // self.segments)
+            segments = [_Segment(s, min(total, s + size) - 1) for s in range(0, total, size)]
+            self._state = _PartState(self.resume_key, total, etag, segments)
+            with open(self.part_path, "wb") as f:
+                f.truncate(total)
+            with self._lock:
+                self._save_state_locked()
+            if isinstance(response, _OwnedResponse):
+                response.close()
+            logger.info("Download: %s em %d segmentos paralelos (%d bytes)", self.dest.name, len(segments), total)
+            self._fetch_remaining()
+            return
+
+        seg = _Segment(0, end)
+        self._state = _PartState(self.resume_key, total, etag, [seg])
+        with open(self.part_path, "wb") as f:
+            if total > 0:
+                f.truncate(total)
+            with self._lock:
+                self._save_state_locked()
+            self._write_stream(response, f, seg)
+        self._check_segment(seg)
+
+    def _write_stream(self, response: Any, f: Any, seg: _Segment) -> None:
+        try:
+            response.raw.decode_content = True
+        except Exception:  # noqa: BLE001
+            pass
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            self._check_cancel()
+            if not chunk:
+                continue
+            if seg.end >= 0 and seg.done + len(chunk) > seg.length:
+                if not self._resumable:
+                    raise IOError(f"Download maior que o esperado: >{seg.length}B")
+                raise _RestartError("resposta maior que o esperado")
+            f.write(chunk)
+            self._advance(seg, len(chunk))
+
+    def _check_segment(self, seg: _Segment) -> None:
+        if seg.end >= 0 and seg.done != seg.length:
+            raise _TruncatedError(f"Download truncado: {seg.done}B != {seg.length}B")
+
+    def _fetch_remaining(self) -> None:
+        state = self._state
+        assert state is not None
+        pending = [seg for seg in state.segments if not seg.complete]
+        if len(pending) <= 1:
+            for seg in pending:
+                self._fetch_segment(seg)
+            return
+        with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="ZipRange") as executor:
+            futures = [executor.submit(self._fetch_segment, seg) for seg in pending]
+            errors = []
+            for future in futures:
+                try:
+                    future.result()
+                except BaseException as exc:  # noqa: BLE001 - relançada abaixo
+                    errors.append(exc)
+        if errors:
+            # prioriza cancelamento/reinício sobre falhas de rede dos outros segmentos
+            from src.infra.supabase.storage_client import DownloadCancelledError
+
+            for kind in (DownloadCancelledError, _RestartError):
+                for exc in errors:
+                    if isinstance(exc, kind):
+                        raise exc
+            raise errors[0]
+
+    def _fetch_segment(self, seg: _Segment) -> None:
+        state = self._state
+        assert state is not None
+        self._check_cancel()
+        headers = {"Range": f"bytes={seg.next_offset}-{seg.end}"}
+        if state.etag:
+            headers["If-Range"] = state.etag
+        with self._get(headers) as resp:
+            status = int(resp.status_code)
+            if status in (200, 416):
+                raise _RestartError(f"HTTP {status} para Range")
+            if status != 206:
+                self._raise_for_status(status)
+            match = _CONTENT_RANGE_RE.match(_header(resp.headers, "Content-Range"))
+            if not match or int(match.group(1)) != seg.next_offset:
+                raise _RestartError("Content-Range inesperado")
+            if match.group(3) != "*" and int(match.group(3)) != state.total:
+                raise _RestartError("tamanho do arquivo mudou no servidor")
+            with open(self.part_path, "r+b") as f:
+                f.seek(seg.next_offset)
+                self._write_stream(resp, f, seg)
+        self._check_segment(seg)
+
+    @staticmethod
+    def _raise_for_status(status: int) -> None:
+        if status >= 500 or status in (408, 429):
+            raise _RetryableHTTPError(status)
+        raise DownloadHTTPError(status)
+
+    def _verify_and_promote(self) -> None:
+        state = self._state
+        assert state is not None
+        size = self.part_path.stat().st_size
+        if state.total > 0 and (size != state.total or state.written != state.total):
+            raise _TruncatedError(f"Download truncado: {state.written}B != {state.total}B")
+
+        md5_match = _MD5_ETAG_RE.match(state.etag) if self.verify_etag_md5 else None
+        if self.expected_sha256 or md5_match:
+            sha = hashlib.sha256() if self.expected_sha256 else None
+            md5 = hashlib.md5(usedforsecurity=False) if md5_match else None  # nosec B324 - confere o ETag do Storage
+            with open(self.part_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    self._check_cancel()
+                    if sha is not None:
+                        sha.update(block)
+                    if md5 is not None:
+                        md5.update(block)
+            if sha is not None and sha.hexdigest() != self.expected_sha256:
+                raise DownloadIntegrityError(f"SHA-256 não confere para {self.dest.name}")
+            if md5 is not None and md5_match and md5.hexdigest() != md5_match.group(1).lower():
+                raise DownloadIntegrityError(f"MD5 (ETag) não confere para {self.dest.name}")
+
+        os.replace(self.part_path, self.dest)
+        try:
+            self.meta_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        logger.info("Download concluído: %s (%d bytes)", self.dest.name, size)
+
+
+class _OwnedResponse:
+    """Marca uma resposta aberta pelo próprio ResumableDownload (pode ser fechada)."""
+
+    def __init__(self, resp: Any) -> None:
+        self._resp = resp
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resp, name)
+
+    def close(self) -> None:
+        close = getattr(self._resp, "close", None)
+        if callable(close):
+            close()
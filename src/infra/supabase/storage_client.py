@@ -18,6 +18,7 @@ from urllib3.exceptions import ReadTimeoutError, ProtocolError
 
 from src.infra.net_session import make_session
 from src.infra.supabase import types as supa_types
+from src.infra.supabase.resumable_download import DownloadHTTPError, ResumableDownload
 
 logger = logging.getLogger("infra.supabase.storage_client")
 
@@ -185,53 +186,20 @@ def baixar_pasta_zip(
                 out_path = base.with_name(f"{base.stem} ({i}){base.suffix}")
                 i += 1
 
-            expected: int
-            try:
-                expected = int(resp.headers.get("Content-Length") or "0")
-            except Exception:
-                expected = 0
-
-            tmp_path: Path = out_path.with_suffix(out_path.suffix + ".part")
-            written: int = 0
-            resp.raw.decode_content = True
-            _promoted = False  # True apenas após os.replace bem-sucedido
-
-            try:
-                with open(tmp_path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=1024 * 256):
-                        if cancel_event is not None and cancel_event.is_set():
-                            raise DownloadCancelledError("Operação cancelada pelo usuário.")
-
-                        if not chunk:
-                            continue
-
-                        f.write(chunk)
-                        written += len(chunk)
-
-                        if progress_cb is not None:
-                            try:
-                                progress_cb(written, expected)
-                            except Exception as exc:
-                                logger.debug("Callback de progresso falhou", exc_info=exc)
-
-                if cancel_event is not None and cancel_event.is_set():
-                    raise DownloadCancelledError("Operação cancelada no final do download.")
-
-                if expected and written != expected:
-                    raise IOError(f"Download truncado: {written}B != {expected}B")
-
-                os.replace(tmp_path, out_path)
-                _promoted = True
-                return out_path
-
-            finally:
-                # Cobre todos os caminhos de falha: erro de escrita, cancelamento,
-                # truncamento e qualquer exceção inesperada.
-                if not _promoted:
-                    try:
-                        tmp_path.unlink(missing_ok=True)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.debug("Erro ao remover arquivo temporário: %s", exc)
+            # ZIP gerado em streaming não anuncia Range: nesse caso o download
+            # é único e qualquer falha remove o .part (como antes); com Range,
+            # quedas de rede retomam do ponto em que pararam.
+            return ResumableDownload(
+                sess,
+                zipper_url,
+                out_path,
+                resume_key=f"zipper:{bucket}/{prefix}/{desired_name}",
+                headers=headers,
+                params=params,
+                cancel_event=cancel_event,
+                progress_cb=progress_cb,
+                timeout=timeouts,
+            ).run(first_response=resp)
 
     except (req_exc.ConnectTimeout, req_exc.ReadTimeout, req_exc.Timeout, ReadTimeoutError) as e:
         logger.warning(
@@ -246,6 +214,8 @@ def baixar_pasta_zip(
         ) from e
     except DownloadCancelledError:
         raise
+    except DownloadHTTPError as e:
+        raise RuntimeError(f"Erro do servidor (HTTP {e.status}) durante o download.") from e
     except req_exc.MissingSchema as e:
         # URL inválida (ex.: SUPABASE_URL=None → "None/functions/v1/zipper")
         logger.error(
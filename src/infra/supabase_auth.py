@@ -60,7 +60,8 @@ def logout(client: Client | None = None) -> None:
 
     Note:
         Sempre limpa a sessão local, mesmo se o logout remoto falhar.
-        Também tenta limpar a sessão persistida em disco.
+        Também tenta limpar a sessão persistida em disco, fecha a réplica
+        local de clientes da organização e limpa o cache de nomes de clientes.
     """
     try:
         sb: Client = client or get_supabase()
@@ -74,3 +75,16 @@ def logout(client: Client | None = None) -> None:
             prefs_utils.clear_auth_session()
         except Exception:
             logger.warning("Falha ao limpar sessão persistida no logout", exc_info=True)
+        try:
+            from src.core.db_manager.replica import stop_clients_replica
+
+            # A réplica é da organização desta sessão; a próxima abre a sua
+            stop_clients_replica()
+        except Exception:
+            logger.warning("Falha ao fechar réplica local de clientes no logout", exc_info=True)
+        try:
+            from src.core.services.clientes_service import invalidate_client_info_cache
+
+            invalidate_client_info_cache()
+        except Exception:
+            logger.warning("Falha ao limpar cache de nomes de clientes no logout", exc_info=True)
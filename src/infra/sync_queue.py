@@ -136,3 +136,206 @@ class SyncQueue:
                     remaining.append(item)
             self._save_unlocked(remaining)
             return processed, len(remaining)
+
+
+class JournalSyncQueue:
+    """
+    Variante de :class:`SyncQueue` com persistência *append-only* (JSON Lines).
+
+    Cada operação vira uma linha no journal, sem reescrever o arquivo:
+      {"op": "add", "item": {...}}      — enqueue (O(1))
+      {"op": "ack", "ids": ["..."]}     — item(s) concluído(s)
+
+    O estado vivo fica em memória (dict ordenado por inserção). Quando as
+    linhas obsoletas (adds já confirmados + acks) passam de
+    ``compact_min_garbage`` e superam o número de itens vivos, o journal é
+    compactado: reescrito atomicamente (temp → fsync → os.replace) só com os
+    itens pendentes.
+
+    Recuperação após crash: uma última linha incompleta (escrita
+    interrompida) é descartada e o arquivo truncado no último ``\\n``
+    válido; linhas inválidas no meio são ignoradas com aviso.
+    """
+
+    def __init__(
+        self,
+        file_path="runtime/sync_queue.jsonl",
+        *,
+        fsync: bool = True,
+        compact_min_garbage: int = 1000,
+    ):
+        self.file_path = file_path
+        self._fsync = fsync
+        self._compact_min_garbage = compact_min_garbage
+        self._lock = threading.Lock()
+        self._items: dict[str, dict] = {}
+        self._garbage = 0
+        dir_name = os.path.dirname(self.file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        with self._lock:
+            self._replay_unlocked()
+            self._fh = open(self.file_path, "a", encoding="utf-8")
+            self._maybe_compact_unlocked()
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    def _replay_unlocked(self):
+        """Reconstrói o estado em memória a partir do journal."""
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+        valid_end = 0
+        pos = 0
+        skipped = 0
+        while pos < len(data):
+            nl = data.find(b"\n", pos)
+            if nl < 0:
+                # Última linha sem "\n": escrita interrompida no meio
+                break
+            line = data[pos:nl]
+            pos = nl + 1
+            valid_end = pos
+            if not line.strip():
+                continue
+            try:
+                self._apply_record(json.loads(line))
+            except (ValueError, TypeError, KeyError, AttributeError):
+                skipped += 1
+        if skipped:
+            log.warning("sync_queue: %d linha(s) inválida(s) ignorada(s) no journal", skipped)
+            self._garbage += skipped
+        if valid_end < len(data):
+            log.warning(
+                "sync_queue: descartando %d byte(s) de registro incompleto no fim do journal",
+                len(data) - valid_end,
+            )
+            with open(self.file_path, "r+b") as f:
+                f.truncate(valid_end)
+
+    def _apply_record(self, record):
+        op = record["op"]
+        if op == "add":
+            item = record["item"]
+            self._items[str(item["id"])] = item
+        elif op == "ack":
+            for item_id in record["ids"]:
+                if self._items.pop(str(item_id), None) is not None:
+                    self._garbage += 1
+            self._garbage += 1
+        else:
+            raise ValueError(op)
+
+    def _append_unlocked(self, record):
+        self._fh.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._fh.flush()
+        if self._fsync:
+            os.fsync(self._fh.fileno())
+
+    def _maybe_compact_unlocked(self):
+        if self._garbage >= self._compact_min_garbage and self._garbage > len(self._items):
+            self._compact_unlocked()
+
+    def _compact_unlocked(self):
+        dir_name = os.path.dirname(self.file_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".syncq_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for item in self._items.values():
+                    f.write(json.dumps({"op": "add", "item": item}, ensure_ascii=False, separators=(",", ":")))
+                    f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._fh.close()
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            if self._fh.closed:
+                self._fh = open(self.file_path, "a", encoding="utf-8")
+            raise
+        self._fh = open(self.file_path, "a", encoding="utf-8")
+        log.debug(
+            "sync_queue: journal compactado (%d itens, %d registros descartados)", len(self._items), self._garbage
+        )
+        self._garbage = 0
+
+    # ------------------------------------------------------------------
+    # API (mesma de SyncQueue + ack/compact/close)
+    # ------------------------------------------------------------------
+
+    def enqueue(self, action_type: str, payload: dict):
+        """Enfileira operação acrescentando uma linha ao journal (O(1))."""
+        item = {
+            "id": str(uuid.uuid4()),
+            "type": action_type,
+            "payload": payload,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        }
+        with self._lock:
+            self._append_unlocked({"op": "add", "item": item})
+            self._items[item["id"]] = item
+            return item["id"]
+
+    def ack(self, item_ids):
+        """Marca itens como concluídos sem reescrever o arquivo.
+
+        Returns:
+            Quantos dos ids estavam pendentes.
+        """
+        with self._lock:
+            ids = [str(i) for i in item_ids if str(i) in self._items]
+            if not ids:
+                return 0
+            self._append_unlocked({"op": "ack", "ids": ids})
+            for item_id in ids:
+                del self._items[item_id]
+            self._garbage += len(ids) + 1
+            self._maybe_compact_unlocked()
+            return len(ids)
+
+    def list(self):
+        with self._lock:
+            return list(self._items.values())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def process(self, processor_fn, max_items=None):
+        """
+        processor_fn: função que recebe (item) e retorna True (sucesso) ou False (falha).
+        Cada sucesso é confirmado (ack) imediatamente no journal, então um
+        crash no meio do lote não reprocessa o que já foi concluído.
+        """
+        with self._lock:
+            processed = 0
+            for item in list(self._items.values()):
+                if max_items is not None and processed >= max_items:
+                    break
+                try:
+                    ok = bool(processor_fn(item))
+                except Exception:
+                    ok = False
+                if ok:
+                    self._append_unlocked({"op": "ack", "ids": [item["id"]]})
+                    del self._items[item["id"]]
+                    self._garbage += 2
+                    processed += 1
+            self._maybe_compact_unlocked()
+            return processed, len(self._items)
+
+    def compact(self):
+        """Força a compactação do journal."""
+        with self._lock:
+            self._compact_unlocked()
+
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
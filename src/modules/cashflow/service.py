@@ -11,6 +11,7 @@ from src.features.cashflow import repository
 # Reexports finos – mantêm a assinatura original do repositório legado
 list_entries = repository.list_entries
 totals = repository.totals
+summarize = repository.summarize
 create_entry = repository.create_entry
 update_entry = repository.update_entry
 delete_entry = repository.delete_entry
@@ -18,6 +19,7 @@ delete_entry = repository.delete_entry
 __all__ = [
     "list_entries",
     "totals",
+    "summarize",
     "create_entry",
     "update_entry",
     "delete_entry",
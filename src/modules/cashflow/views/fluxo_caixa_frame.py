@@ -196,7 +196,14 @@ class CashflowFrame(ctk.CTkFrame):
             tfilter = self.TYPE_LABEL_TO_CODE[tfilter]
 
         try:
-            rows = repo.list_entries(dfrom, dto, tfilter, self.var_text.get().strip(), org_id=self._org_id)
+            rows = repo.list_entries(
+                dfrom,
+                dto,
+                tfilter,
+                self.var_text.get().strip(),
+                org_id=self._org_id,
+                columns=repo.LIST_COLUMNS,
+            )
         except Exception as e:
             show_warning(
                 self,
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""Índice de busca incremental da lista de Clientes.
+
+Mantém o texto normalizado (``normalize_search``) de cada linha calculado uma
+única vez e um índice de trigramas para responder buscas por substring sem
+varrer todas as linhas a cada tecla:
+
+- consultas com 3+ caracteres usam a lista de postings do trigrama mais raro
+  e só confirmam (``termo in texto``) os candidatos dela;
+- consultas mais curtas caem na varredura linear sobre os textos já
+  normalizados (barata, e o resultado tende a ser grande de qualquer forma);
+- digitar mais uma letra reaproveita o resultado anterior (refinamento).
+
+Inserção, atualização e remoção são incrementais. Remoções deixam lápides
+(slots mortos) que são compactadas quando passam de metade do índice.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Generic, TypeVar
+
+__all__ = ["ClientesSearchIndex", "NGRAM"]
+
+T = TypeVar("T")
+
+#: Tamanho dos n-gramas indexados.
+NGRAM: int = 3
+
+# Compactar só vale a pena a partir de algumas centenas de lápides.
+_COMPACT_MIN_DEAD = 256
+
+
+def _ngrams(text: str) -> set[str]:
+    """Conjunto de n-gramas distintos de ``text`` (vazio se curto demais)."""
+    return {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class ClientesSearchIndex(Generic[T]):
+    """Índice de substring sobre textos já normalizados, na ordem de inserção.
+
+    Cada item ocupa um slot; ``search`` devolve os itens cujo texto contém o
+    termo, preservando a ordem dos slots. Itens podem ter uma chave (ex.: id
+    do cliente) para ``replace``/``remove``; chaves repetidas são permitidas e
+    tratadas em conjunto.
+
+    Os postings são construídos sob demanda na primeira consulta longa, de
+    modo que carregar uma página e buscar só por prefixos curtos não paga o
+    custo de indexação.
+
+    Example:
+        >>> idx = ClientesSearchIndex()
+        >>> idx.add("farmaciacentral", "A", key="1")
+        >>> idx.add("drogariasul", "B", key="2")
+        >>> idx.search("central")
+        ['A']
+        >>> idx.replace("1", "farmacianorte", "A2")
+        True
+        >>> idx.search("central"), idx.search("norte")
+        ([], ['A2'])
+    """
+
+    def __init__(self) -> None:
+        self._texts: list[str | None] = []
+        self._items: list[T | None] = []
+        self._keys: list[Hashable | None] = []
+        self._slots_by_key: dict[Hashable, list[int]] = {}
+        self._postings: dict[str, array] | None = None
+        # Postings fora de ordem (após replace) exigem ordenar os candidatos
+        self._postings_sorted = True
+        self._dead = 0
+        self._version = 0
+        self._last_query = ""
+        self._last_slots: list[int] | None = None
+        self._last_version = -1
+
+    # ------------------------------------------------------------------ #
+    # Mutação
+    # ------------------------------------------------------------------ #
+
+    def clear(self) -> None:
+        """Remove todos os itens."""
+        version = self._version
+        self.__init__()  # type: ignore[misc]
+        self._version = version + 1
+
+    def add(self, text: str, item: T, *, key: Hashable | None = None) -> None:
+        """Acrescenta ``item`` ao final com o texto normalizado ``text``."""
+        slot = len(self._texts)
+        self._texts.append(text)
+        self._items.append(item)
+        self._keys.append(key)
+        if key is not None:
+            self._slots_by_key.setdefault(key, []).append(slot)
+        if self._postings is not None:
+            self._index_slot(slot, _ngrams(text))
+        self._version += 1
+
+    def extend(self, entries: Iterable[tuple[str, T, Hashable | None]]) -> None:
+        """Acrescenta vários ``(texto, item, chave)`` de uma vez."""
+        for text, item, key in entries:
+            self.add(text, item, key=key)
+
+    def replace(self, key: Hashable, text: str, item: T) -> bool:
+        """Atualiza o item de ``key`` mantendo sua posição.
+
+        Se houver mais de um slot com a mesma chave, o primeiro é atualizado e
+        os demais removidos. Retorna False se a chave não existe.
+        """
+        slots = self._slots_by_key.get(key)
+        if not slots:
+            return False
+        slot = slots[0]
+        for extra in slots[1:]:
+            self._kill(extra)
+        del slots[1:]
+        old_text = self._texts[slot] or ""
+        self._texts[slot] = text
+        self._items[slot] = item
+        if self._postings is not None:
+            # Postings antigos ficam como falso-positivo (filtrados na confirmação)
+            added = _ngrams(text) - _ngrams(old_text)
+            if added:
+                self._index_slot(slot, added)
+                self._postings_sorted = False
+        self._version += 1
+        self._maybe_compact()
+        return True
+
+    def remove(self, key: Hashable) -> int:
+        """Remove todos os itens com ``key``; retorna quantos foram removidos."""
+        slots = self._slots_by_key.pop(key, None) or []
+        for slot in slots:
+            self._kill(slot)
+        if slots:
+            self._version += 1
+            self._maybe_compact()
+        return len(slots)
+
+    def _kill(self, slot: int) -> None:
+        self._texts[slot] = None
+        self._items[slot] = None
+        self._keys[slot] = None
+        self._dead += 1
+
+    def _maybe_compact(self) -> None:
+        if self._dead < _COMPACT_MIN_DEAD or self._dead * 2 < len(self._texts):
+            return
+        live = [(text, item, key) for text, item, key in zip(self._texts, self._items, self._keys) if text is not None]
+        had_postings = self._postings is not None
+        version = self._version
+        self.__init__()  # type: ignore[misc]
+        self._version = version + 1
+        self.extend(live)
+        if had_postings:
+            self._build_postings()
+
+    # ------------------------------------------------------------------ #
+    # Postings
+    # ------------------------------------------------------------------ #
+
+    def _index_slot(self, slot: int, grams: Iterable[str]) -> None:
+        postings = self._postings
+        assert postings is not None
+        for gram in grams:
+            bucket = postings.get(gram)
+            if bucket is None:
+                postings[gram] = array("I", (slot,))
+            else:
+                bucket.append(slot)
+
+    def _build_postings(self) -> None:
+        self._postings = {}
+        self._postings_sorted = True
+        for slot, text in enumerate(self._texts):
+            if text is not None:
+                self._index_slot(slot, _ngrams(text))
+
+    # ------------------------------------------------------------------ #
+    # Consulta
+    # ------------------------------------------------------------------ #
+
+    def _candidates(self, query: str) -> Iterable[int] | None:
+        """Slots que podem conter ``query`` (None = todos)."""
+        if (
+            self._last_slots is not None
+            and self._last_version == self._version
+            and self._last_query
+            and self._last_query in query
+        ):
+            return self._last_slots
+        if len(query) < NGRAM:
+            return None
+        if self._postings is None:
+            self._build_postings()
+        postings = self._postings
+        assert postings is not None
+        best: array | None = None
+        for i in range(len(query) - NGRAM + 1):
+            bucket = postings.get(query[i : i + NGRAM])
+            if bucket is None:
+                return ()
+            if best is None or len(bucket) < len(best):
+                best = bucket
+        if best is None:
+            return None
+        if self._postings_sorted:
+            return best
+        return sorted(set(best))
+
+    def search_slots(self, query: str) -> list[int]:
+        """Slots (em ordem) cujo texto contém ``query`` já normalizada."""
+        texts = self._texts
+        if not query:
+            return [slot for slot, text in enumerate(texts) if text is not None]
+        candidates = self._candidates(query)
+        if candidates is None:
+            slots = [slot for slot, text in enumerate(texts) if text is not None and query in text]
+        else:
+            slots = [slot for slot in candidates if (text := texts[slot]) is not None and query in text]
+        self._last_query = query
+        self._last_slots = slots
+        self._last_version = self._version
+        return slots
+
+    def search(self, query: str) -> list[T]:
+        """Itens (em ordem de inserção) cujo texto contém ``query`` já normalizada."""
+        items = self._items
+        return [items[slot] for slot in self.search_slots(query)]  # type: ignore[misc]
+
+    # ------------------------------------------------------------------ #
+    # Inspeção
+    # ------------------------------------------------------------------ #
+
+    def items(self) -> Iterator[T]:
+        """Itera os itens vivos em ordem de inserção."""
+        return (item for item, text in zip(self._items, self._texts) if text is not None)  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        return len(self._texts) - self._dead
+
+    def __contains__(self, key: object) -> bool:
+        return bool(self._slots_by_key.get(key))  # type: ignore[arg-type]
+
+    @property
+    def version(self) -> int:
+        """Contador incrementado a cada mutação (para caches derivados)."""
+        return self._version
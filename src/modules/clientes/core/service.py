@@ -10,11 +10,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Callable, Iterable, Mapping, Tuple, cast
 
-from src.adapters.storage.api import (
-    delete_file as storage_delete_file,
-    list_files as storage_list_files,
-    using_storage_backend,
-)
+from src.adapters.storage.api import using_storage_backend
 from src.adapters.storage.supabase_storage import SupabaseStorageAdapter
 from src.infra.db_schemas import MEMBERSHIPS_SELECT_ORG_ID
 from src.infra.supabase_client import exec_postgrest, supabase
@@ -25,8 +21,10 @@ from src.core.db_manager import (
     list_clientes_deletados as _list_clientes_deletados_core,
     update_status_only as _update_status_only,
 )
+from src.core.db_manager.replica import notify_clients_changed
 from src.core.services import clientes_service as _legacy_clientes_service
 from src.core.session.session import get_current_user as _get_current_user
+from src.modules.uploads.listing_cache import get_listing_cache
 from ..core.constants import STATUS_PREFIX_RE
 
 RowData = Tuple[Any, ...]
@@ -91,7 +89,7 @@ def _current_user_label() -> str:
         return (getattr(cu, "email", "") or "").strip()
     except Exception as exc:
         log.debug(
-            "_current_user_label: falha ao obter usuário autenticado; " "campo 'ultima_por' ficará vazio. Detalhe: %s",
+            "_current_user_label: falha ao obter usuário autenticado; campo 'ultima_por' ficará vazio. Detalhe: %s",
             exc,
         )
         return ""
@@ -159,7 +157,7 @@ def extrair_dados_cartao_cnpj_em_pasta(base_dir: str) -> dict[str, str | None]:
     Este service implementa a lógica de negócio (sem UI) para:
     1. Listar e classificar PDFs na pasta
     2. Localizar Cartão CNPJ via tipo "cnpj_card"
-    3. Fallback: localizar PDF de cartão manualmente e extrair texto
+    3. Fallback: varrer os PDFs da pasta (``find_cartao_cnpj``) e usar o texto extraído
     4. Extrair campos CNPJ e Razão Social
 
     Parâmetros:
@@ -175,7 +173,7 @@ def extrair_dados_cartao_cnpj_em_pasta(base_dir: str) -> dict[str, str | None]:
     BUG-008: Valida se base_dir existe e é um diretório válido.
     """
     from pathlib import Path
-    from src.utils.file_utils import find_cartao_cnpj_pdf, list_and_classify_pdfs
+    from src.utils.file_utils import find_cartao_cnpj, list_and_classify_pdfs
     from src.utils.paths import ensure_str_path
     from src.utils.pdf_reader import read_pdf_text
     from src.utils.text_utils import extract_company_fields
@@ -223,10 +221,10 @@ def extrair_dados_cartao_cnpj_em_pasta(base_dir: str) -> dict[str, str | None]:
 
     # 3) Fallback: se ainda não achou, varre a pasta inteira
     if not (cnpj or razao):
-        pdf = find_cartao_cnpj_pdf(base_dir)
-        if pdf:
-            # Normalize Path to str for read_pdf_text (PEP 519)
-            text = read_pdf_text(ensure_str_path(pdf)) or ""
+        # Texto já vem da varredura (cache por hash + OCR só se necessário)
+        found = find_cartao_cnpj(base_dir)
+        if found:
+            _pdf, text = found
             if text:
                 fields = extract_company_fields(text)
                 cnpj = fields.get("cnpj")
@@ -514,6 +512,7 @@ def mover_cliente_para_lixeira(cliente_id: int) -> None:
         # Compatibilidade: ambientes antigos sem a coluna ultima_por
         payload.pop("ultima_por", None)
         exec_postgrest(supabase.table("clients").update(payload).eq("id", cliente_id))
+    notify_clients_changed()
 
 
 def restaurar_clientes_da_lixeira(ids: Iterable[int]) -> None:
@@ -541,6 +540,7 @@ def restaurar_clientes_da_lixeira(ids: Iterable[int]) -> None:
         # Compatibilidade: ambientes antigos sem a coluna ultima_por
         payload.pop("ultima_por", None)
         exec_postgrest(supabase.table("clients").update(payload).in_("id", ids_list))
+    notify_clients_changed()
 
 
 def _resolve_current_org_id() -> str:
@@ -570,34 +570,12 @@ def _resolve_current_org_id() -> str:
         raise RuntimeError(f"Falha ao resolver organização atual: {e}")
 
 
-def _gather_paths(bucket: str, root_prefix: str) -> list[str]:
-    paths: list[str] = []
-    adapter = SupabaseStorageAdapter(bucket=bucket)
-    with using_storage_backend(adapter):
-        stack = [root_prefix]
-        while stack:
-            prefix = stack.pop()
-            try:
-                items = storage_list_files(prefix) or []
-            except Exception:
-                items = []
-            for it in items:
-                if not isinstance(it, dict):
-                    continue
-                name = it.get("name")
-                if not name:
-                    continue
-                meta = it.get("metadata")
-                if meta is None:
-                    stack.append(f"{prefix}/{name}")
-                else:
-                    paths.append(f"{prefix}/{name}")
-    return paths
-
-
 def _remove_cliente_storage(bucket: str, org_id: str, cid_int: int) -> None:
     """Remove todos os arquivos do cliente no storage.
 
+    Usa a exclusão em lote do adapter (listagem paralela + ``remove`` com até
+    1000 chaves por chamada).
+
     Raises:
         ClienteStorageRemovalError: se qualquer arquivo nao puder ser removido
             ou se ocorrer erro ao listar/acessar o storage.  Nao silencia falhas;
@@ -605,27 +583,21 @@ def _remove_cliente_storage(bucket: str, org_id: str, cid_int: int) -> None:
     """
     prefix = f"{org_id}/{cid_int}"
     try:
-        paths = _gather_paths(bucket, prefix)
-        failed: list[str] = []
-        removed = 0
-        for key in paths:
-            try:
-                if storage_delete_file(key):
-                    removed += 1
-                else:
-                    failed.append(key)
-            except Exception as e:
-                failed.append(f"{key}: {e}")
-        if removed:
-            log.info("Storage: removidos %s objeto(s) de %s", removed, prefix)
-        if failed:
-            raise ClienteStorageRemovalError(
-                f"Falha ao remover {len(failed)} arquivo(s) do storage para cliente {cid_int}: {failed}"
-            )
-    except ClienteStorageRemovalError:
-        raise
+        report = SupabaseStorageAdapter(bucket=bucket).delete_prefix(prefix)
     except Exception as e:
         raise ClienteStorageRemovalError(f"Erro ao acessar storage para cliente {cid_int}: {e}") from e
+    finally:
+        # Exclusão parcial também muda a listagem vista pelo navegador de arquivos
+        get_listing_cache().invalidate(bucket, prefix, recursive=True)
+    if report.deleted:
+        log.info("Storage: removidos %s objeto(s) de %s", report.deleted, prefix)
+    if report.list_errors:
+        raise ClienteStorageRemovalError(f"Erro ao listar storage para cliente {cid_int}: {report.list_errors}")
+    if report.remaining:
+        raise ClienteStorageRemovalError(
+            f"Falha ao remover {len(report.remaining)} arquivo(s) do storage para cliente {cid_int}: "
+            f"{report.remaining} ({'; '.join(f.error for f in report.failed_chunks)})"
+        )
 
 
 def excluir_clientes_definitivamente(
@@ -649,6 +621,7 @@ def excluir_clientes_definitivamente(
 
     ok = 0
     errs: list[tuple[int, str]] = []
+    removed_ids: list[int] = []
     bucket = "rc-docs"
 
     adapter = SupabaseStorageAdapter(bucket=bucket)
@@ -675,6 +648,7 @@ def excluir_clientes_definitivamente(
             try:
                 exec_postgrest(supabase.table("clients").delete().eq("id", cid_int))
                 ok += 1
+                removed_ids.append(cid_int)
             except Exception as e:
                 errs.append((cid_int, str(e)))
 
@@ -684,6 +658,8 @@ def excluir_clientes_definitivamente(
                 except Exception:
                     log.exception("Erro no callback de progresso em excluir_clientes_definitivamente")
 
+    if removed_ids:
+        notify_clients_changed(removed_ids)
     return ok, errs
 
 
@@ -694,6 +670,7 @@ def excluir_cliente_simples(cliente_id: int) -> None:
     """
 
     exec_postgrest(supabase.table("clients").delete().eq("id", int(cliente_id)))
+    notify_clients_changed([int(cliente_id)])
 
 
 def listar_clientes_na_lixeira(
@@ -828,6 +805,7 @@ def touch_ultima_alteracao(cliente_id: int) -> None:
             )
         else:
             log.info("[touch_ultima_alteracao] %d linha(s) atualizadas para cliente %s ts=%s", n, cliente_id, ts)
+            notify_clients_changed()
         return
     except Exception as exc:  # noqa: BLE001
         # Fallback: coluna ultima_por pode não existir em schemas legados
@@ -853,5 +831,6 @@ def touch_ultima_alteracao(cliente_id: int) -> None:
                 cliente_id,
                 ts,
             )
+            notify_clients_changed()
     except Exception as exc2:
         log.warning("[touch_ultima_alteracao] fallback também falhou para cliente %s: %s", cliente_id, exc2)
@@ -9,10 +9,11 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, List
 
 from src.core.search import search_clientes, search_clientes_lixeira
 from src.core.string_utils import only_digits
-from src.core.textnorm import join_and_normalize
+from src.core.textnorm import join_and_normalize, normalize_search
 from src.utils.phone_utils import normalize_br_whatsapp, resolve_client_phone
 
 from . import constants as status_helpers
+from .search_index import ClientesSearchIndex
 
 if TYPE_CHECKING:
     pass  # Imports apenas para type checking, se necessário
@@ -124,10 +125,18 @@ class ClientesViewModel:
         # Cache de rows processadas (após filtros e ordenação)
         self._rows: List[ClienteRow] = []
 
+        # Rows construídas uma vez por cliente carregado + índice de busca.
+        # Filtro/ordenação só consultam o índice; fetch e upsert/remove o atualizam.
+        self._index: ClientesSearchIndex[ClienteRow] = ClientesSearchIndex()
+        # Ordenação completa memoizada por (label, versão do índice)
+        self._sorted_cache: tuple[str, int, List[ClienteRow]] | None = None
+
         # Estado de paginação (PR5)
         self._page_size: int = PAGE_SIZE
         self._current_offset: int = 0
         self._has_more: bool = False
+        # Cursor keyset da próxima página (None → paginação por offset)
+        self._next_cursor: str | None = None
 
         # Estado server-side (query propagada ao Supabase)
         self._server_term: str = ""
@@ -227,6 +236,7 @@ class ClientesViewModel:
             )
         except Exception as exc:  # pragma: no cover - erros propagados
             raise ClientesViewModelError(str(exc)) from exc
+        self._next_cursor = getattr(clientes, "next_cursor", None)
 
         if fetch_all:
             self._cap_hit = len(clientes) >= fetch_all_limit
@@ -244,6 +254,7 @@ class ClientesViewModel:
             self._current_offset = len(clientes)
 
         self._clientes_raw = list(clientes)
+        self._reindex()
         self._update_status_choices()
         self._rebuild_rows()
 
@@ -252,6 +263,8 @@ class ClientesViewModel:
 
         Reutiliza ``_server_term`` e ``_server_order_by`` salvos por
         ``refresh_from_service`` para manter ordenação/filtro consistentes.
+        Se a página anterior trouxe ``next_cursor``, a busca é por cursor
+        (keyset); senão, por ``offset``.
 
         Returns:
             True se novos registros foram carregados, False se não há mais.
@@ -261,14 +274,25 @@ class ClientesViewModel:
 
         _search_fn = search_clientes_lixeira if self._trash_mode else search_clientes
         try:
-            clientes = _search_fn(
-                self._server_term,
-                self._server_order_by,
-                limit=self._page_size,
-                offset=self._current_offset,
-            )
+            if self._next_cursor:
+                # Keyset: continua depois da última linha vista, imune a
+                # inserções/edições feitas entre uma página e outra
+                clientes = _search_fn(
+                    self._server_term,
+                    self._server_order_by,
+                    limit=self._page_size,
+                    cursor=self._next_cursor,
+                )
+            else:
+                clientes = _search_fn(
+                    self._server_term,
+                    self._server_order_by,
+                    limit=self._page_size,
+                    offset=self._current_offset,
+                )
         except Exception as exc:  # pragma: no cover
             raise ClientesViewModelError(str(exc)) from exc
+        self._next_cursor = getattr(clientes, "next_cursor", None)
 
         if not clientes:
             self._has_more = False
@@ -280,6 +304,7 @@ class ClientesViewModel:
             self._cap_hit = False
         self._current_offset += len(clientes)
         self._clientes_raw.extend(clientes)
+        self._index_clientes(clientes)
         self._update_status_choices()
         self._rebuild_rows()
         return True
@@ -320,61 +345,133 @@ class ClientesViewModel:
     def load_from_iterable(self, clientes: Iterable[Any]) -> None:
         """Utilitário para testes: injeta dados fake."""
         self._clientes_raw = list(clientes)
+        self._reindex()
         self._update_status_choices()
         self._rebuild_rows()
 
-    def _rebuild_rows(self) -> None:
-        """Reconstrói lista de rows aplicando filtros e ordenação.
+    def upsert_cliente(self, cliente: Any) -> None:
+        """Insere ou atualiza um cliente já carregado sem novo fetch.
 
-        Round 15: Método interno que aplica filtros de busca e status,
-        depois ordena conforme label de ordenação atual.
+        Atualiza ``_clientes_raw`` e o índice de busca no lugar (a posição do
+        cliente na lista é mantida) e reaplica filtros/ordenação.
         """
-        from src.core.textnorm import normalize_search
+        row = self._row_for_index(cliente)
+        key = row.id or None
+        if key is not None and self._index.replace(key, row.search_norm, row):
+            for pos, existing in enumerate(self._clientes_raw):
+                if str(self._value_from_cliente(existing, "id", "pk", "client_id") or "") == key:
+                    self._clientes_raw[pos] = cliente
+                    break
+        else:
+            self._clientes_raw.append(cliente)
+            self._index.add(row.search_norm, row, key=key)
+        self._update_status_choices()
+        self._rebuild_rows()
 
-        # 1. Construir rows brutas de todos os clientes
-        all_rows = [self._build_row_from_cliente(c) for c in self._clientes_raw]
+    def remove_clientes(self, client_ids: Iterable[Any]) -> int:
+        """Remove clientes carregados (ex.: após excluir/restaurar) sem novo fetch.
 
-        # 1b. No modo lixeira, marcar clientes sem status como "[LIXEIRA]"
-        if self._trash_mode:
-            for row in all_rows:
-                if not row.status:
-                    row.status = "[LIXEIRA]"
+        Returns:
+            Quantidade de linhas removidas.
+        """
+        ids = {str(cid) for cid in client_ids if cid not in (None, "")}
+        removed = sum(self._index.remove(cid) for cid in ids)
+        if removed:
+            self._clientes_raw = [
+                c
+                for c in self._clientes_raw
+                if str(self._value_from_cliente(c, "id", "pk", "client_id") or "") not in ids
+            ]
+            self._update_status_choices()
+            self._rebuild_rows()
+        return removed
+
+    def _row_for_index(self, cliente: Any) -> ClienteRow:
+        row = self._build_row_from_cliente(cliente)
+        # No modo lixeira, marcar clientes sem status como "[LIXEIRA]"
+        if self._trash_mode and not row.status:
+            row.status = "[LIXEIRA]"
+        return row
+
+    def _index_clientes(self, clientes: Iterable[Any]) -> None:
+        for cliente in clientes:
+            row = self._row_for_index(cliente)
+            self._index.add(row.search_norm, row, key=row.id or None)
 
-        # 2. Aplicar filtro de busca
-        if self._search_text_raw:
-            search_norm = normalize_search(self._search_text_raw.strip())
-            if search_norm:
-                all_rows = [r for r in all_rows if search_norm in r.search_norm]
+    def _reindex(self) -> None:
+        """Reconstrói o índice a partir de ``_clientes_raw`` (novo fetch)."""
+        self._index.clear()
+        self._sorted_cache = None
+        self._index_clientes(self._clientes_raw)
 
-        # 3. Aplicar filtro de status
+    def _rebuild_rows(self) -> None:
+        """Reconstrói lista de rows aplicando filtros e ordenação.
+
+        Round 15: Método interno que aplica filtros de busca e status,
+        depois ordena conforme label de ordenação atual. As rows vêm do
+        índice (construídas uma vez por cliente), então cada tecla custa só
+        a consulta ao índice + filtro de status + ordenação.
+        """
+        # 1. Aplicar filtro de busca (índice; sem termo = todas as rows)
+        search_norm = normalize_search(self._search_text_raw.strip()) if self._search_text_raw else ""
+        all_rows = self._index.search(search_norm)
+        filtered = bool(search_norm)
+
+        # 2. Aplicar filtro de status
         if self._status_filter:
             sf = self._status_filter.strip()
             sf_lower = sf.lower()
             if sf_lower == "farmácia popular":
                 # Clientes com status_farmacia_popular ativo
                 all_rows = [r for r in all_rows if _field_is_active(r.status_farmacia_popular)]
+                filtered = True
             elif sf_lower == "anvisa":
                 # Clientes com status_anvisa ativo
                 all_rows = [r for r in all_rows if _field_is_active(r.status_anvisa)]
+                filtered = True
             elif sf_lower:
                 # Filtro principal por igualdade exata
                 all_rows = [r for r in all_rows if r.status.strip().lower() == sf_lower]
+                filtered = True
 
-        # 4. Aplicar ordenação
-        all_rows = self._sort_rows(all_rows)
+        # 3. Aplicar ordenação e atualizar cache
+        self._rows = self._sort_filtered(all_rows, filtered)
 
-        # 5. Atualizar cache
-        self._rows = all_rows
+    def _sort_filtered(self, rows: List[ClienteRow], filtered: bool) -> List[ClienteRow]:
+        """Ordena ``rows`` reaproveitando a ordenação completa memoizada.
+
+        ``sorted`` é estável e ``rows`` está na ordem do índice, então filtrar a
+        lista completa já ordenada dá o mesmo resultado que ordenar o subconjunto.
+        Subconjuntos pequenos são ordenados diretamente.
+        """
+        label = self._current_order_label
+        cache = self._sorted_cache
+        if cache is not None and cache[0] == label and cache[1] == self._index.version:
+            full = cache[2]
+        elif not filtered or len(rows) * 8 >= len(self._index):
+            full = self._sort_rows(list(self._index.items()))
+            self._sorted_cache = (label, self._index.version, full)
+        else:
+            return self._sort_rows(rows)
+        if not filtered:
+            return list(full)
+        if len(rows) * 8 < len(full):
+            return self._sort_rows(rows)
+        keep = {id(r) for r in rows}
+        return [r for r in full if id(r) in keep]
 
     def _update_status_choices(self) -> None:
         """Extrai opções únicas de status dos clientes carregados."""
         statuses: Dict[str, str] = {}
 
-        for cliente in self._clientes_raw:
-            row = self._build_row_from_cliente(cliente)
-            status_key = row.status.strip().lower()
-            if row.status and status_key not in statuses:
-                statuses[status_key] = row.status
+        for row in self._index.items():
+            status = row.status
+            if self._trash_mode and status == "[LIXEIRA]":
+                # Marcação de exibição, não um status real do cliente
+                continue
+            status_key = status.strip().lower()
+            if status and status_key not in statuses:
+                statuses[status_key] = status
 
         self._status_choices = sorted(statuses.values(), key=lambda s: s.lower())
 
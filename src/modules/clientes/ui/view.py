@@ -54,6 +54,7 @@ from src.modules.clientes.ui.column_layout import (
     first_line_preview as _first_line_preview,
     one_line as _one_line,
 )
+from src.modules.clientes.ui.virtual_rows import VirtualRowWindow
 
 log = logging.getLogger(__name__)
 
@@ -61,6 +62,27 @@ log = logging.getLogger(__name__)
 CELL_PAD_PX = 12  # Padding interno nas bordas das colunas (como ID)
 
 
+def _row_cell_values(row: ClienteRow) -> tuple[str, ...]:
+    """Formata a tupla de células da Treeview para um ClienteRow.
+
+    FASE C: Incluindo observacoes e ultima_alteracao.
+    """
+    # Compor texto da coluna Status: principal + marcadores AN/FP
+    status_cell = _compute_status_cell(row.status, row.status_anvisa, row.status_farmacia_popular)
+    return (
+        row.id,
+        # Sanitizar textos para evitar quebras de linha
+        _one_line(row.razao_social),
+        _fmt_cnpj(row.cnpj) or row.cnpj,
+        _one_line(row.nome),
+        _fmt_whatsapp(row.whatsapp) or row.whatsapp,
+        status_cell,
+        # AJUSTE 2: Mostrar apenas primeira linha das observações
+        _first_line_preview(row.observacoes) or "",
+        row.ultima_alteracao,  # já formatado pelo ViewModel
+    )
+
+
 class ClientesV2Frame(ctk.CTkFrame):
     """Frame principal do módulo ClientesV2.
 
@@ -111,6 +133,8 @@ class ClientesV2Frame(ctk.CTkFrame):
         self._load_job: Optional[str] = None
         self._load_gen: int = 0  # Geração de load p/ descartar resultados obsoletos
         self._row_data_map: dict[str, ClienteRow] = {}  # iid -> ClienteRow
+        self._row_window: Optional[VirtualRowWindow[ClienteRow]] = None  # janela materializada
+        self._rendering_rows: bool = False
 
         self._build_ui()
         self._setup_theme_integration()
@@ -230,6 +254,16 @@ class ClientesV2Frame(ctk.CTkFrame):
         # Guardar referência ao widget Treeview interno
         self.tree_widget = self.tree
 
+        # Lista virtualizada: só a área visível (+ buffer) vira item da Treeview;
+        # a scrollbar passa a representar a lista completa do ViewModel.
+        self._row_window = VirtualRowWindow(
+            self.tree,
+            _row_cell_values,
+            lambda row: row.id,
+            on_window_changed=self._on_row_window_changed,
+        )
+        self._row_window.attach_scrollbar(self._tree_container.get_vscrollbar())
+
         self._setup_treeview_bindings()
 
         log.info("✅ [Clientes] Treeview criada com style RC.ClientesV2.Treeview")
@@ -820,63 +854,48 @@ class ClientesV2Frame(ctk.CTkFrame):
         """Callback na main thread após carregar mais registros."""
         if gen != self._load_gen:
             return
-        self._render_rows()
+        self._render_rows(keep_position=True)
         self._load_more_btn.configure(state="normal", text="Carregar mais…")
         self._sync_load_more_btn()
         if had_new:
             log.info("[Clientes] Página adicional carregada — total: %d", len(self._vm.get_rows()))
 
-    def _render_rows(self) -> None:
+    def _render_rows(self, *, keep_position: bool = False) -> None:
         """Renderiza rows do ViewModel na Treeview com zebra tags.
 
-        FASE C: Incluindo observacoes e ultima_alteracao.
+        A Treeview recebe só a janela visível (+ buffer) das rows, e apenas o
+        diff em relação ao que já está na tela (ver ``VirtualRowWindow``).
+        ``_row_data_map`` continua cobrindo a lista completa.
+
+        Args:
+            keep_position: Mantém a rolagem atual (ex.: após "Carregar mais").
         """
-        if not self.tree_widget:
+        if not self.tree_widget or self._row_window is None:
             return
 
-        # Limpar tree
-        for item in self.tree_widget.get_children():
-            self.tree_widget.delete(item)
-
-        # Limpar mapa
-        self._row_data_map.clear()
-
-        # Inserir rows
         rows = self._vm.get_rows()
 
-        for row in rows:
-            ultima_alt_str = row.ultima_alteracao  # já formatado pelo ViewModel
-
-            # Sanitizar textos para evitar quebras de linha
-            razao_social = _one_line(row.razao_social)
-            nome = _one_line(row.nome)
-            # AJUSTE 2: Mostrar apenas primeira linha das observações
-            observacoes = _first_line_preview(row.observacoes)
-
-            # Compor texto da coluna Status: principal + marcadores AN/FP
-            status_cell = _compute_status_cell(row.status, row.status_anvisa, row.status_farmacia_popular)
-
-            iid = self.tree_widget.insert(
-                "",
-                "end",
-                values=(
-                    row.id,
-                    razao_social,
-                    _fmt_cnpj(row.cnpj) or row.cnpj,
-                    nome,
-                    _fmt_whatsapp(row.whatsapp) or row.whatsapp,
-                    status_cell,
-                    observacoes or "",  # FASE C: Observações (primeira linha)
-                    ultima_alt_str,  # FASE C: Última alteração formatada
-                ),
-            )
-            self._row_data_map[iid] = row
+        self._rendering_rows = True
+        try:
+            self._row_window.set_rows(rows, keep_position=keep_position)
+        finally:
+            self._rendering_rows = False
+
+        self._row_data_map.clear()
+        self._row_data_map.update(self._row_window.row_map)
 
         # ANTI-FLASH: Reaplicar style + zebra com cores do modo ATUAL
         # (evita ficar branco se self._tree_colors foi cached do Light)
         self._sync_tree_theme_and_zebra()
 
-        log.debug(f"[Clientes] Renderizados {len(rows)} clientes")
+        start, end = self._row_window.window
+        log.debug(f"[Clientes] Renderizados {len(rows)} clientes (materializados {start}:{end})")
+
+    def _on_row_window_changed(self) -> None:
+        """Reaplica zebra quando a rolagem troca as linhas materializadas."""
+        if self._rendering_rows or not self.tree_widget or self._tree_colors is None:
+            return
+        apply_zebra(self.tree_widget, self._tree_colors)
 
     # Callbacks (implementados com dados reais)
     def _on_search(self, text: str) -> None:
@@ -1143,7 +1162,7 @@ class ClientesV2Frame(ctk.CTkFrame):
                     )
                 else:
                     log.info(f"[Clientes:{session_id}] Cliente {client_id!r} salvo com sucesso")
-                self.load_async()
+                self._refresh_saved_client(data.get("_cliente_id") or client_id)
 
             def on_closed() -> None:
                 """Callback quando diálogo é fechado."""
@@ -1192,6 +1211,8 @@ class ClientesV2Frame(ctk.CTkFrame):
             )
             from src.modules.clientes.ui.views.client_editor_dialog import ClientEditorDialog
 
+            upload_client_id = self._selected_client_id
+
             def on_saved(data: dict) -> None:
                 """Callback após salvar ou após documentos enviados."""
                 if data.get("_source") == "upload":
@@ -1200,7 +1221,7 @@ class ClientesV2Frame(ctk.CTkFrame):
                     )
                 else:
                     log.info(f"[Clientes] Cliente {self._selected_client_id} atualizado após upload")
-                self.load_async()
+                self._refresh_saved_client(data.get("_cliente_id") or upload_client_id)
 
             dialog = ClientEditorDialog(
                 parent=self.winfo_toplevel(),  # type: ignore[attr-defined]
@@ -1213,10 +1234,40 @@ class ClientesV2Frame(ctk.CTkFrame):
         except Exception as e:
             log.error(f"[Clientes] Erro ao abrir diálogo para upload: {e}", exc_info=True)
 
-    def _deselect_and_reload(self) -> None:
-        """Desmarca a seleção atual e recarrega a lista após uma mutação."""
+    def _refresh_saved_client(self, client_id: Any) -> None:
+        """Atualiza só a linha do cliente salvo (uma consulta por id, sem recarregar a lista)."""
+        if not client_id:
+            self.load_async()
+            return
+        gen = self._load_gen
+
+        def _fetch_one() -> None:
+            try:
+                from src.modules.clientes.core import service as clientes_service
+
+                cliente = clientes_service.get_cliente_by_id(int(client_id))
+            except Exception as exc:
+                log.warning("[Clientes] Falha ao buscar cliente %s salvo: %s", client_id, exc)
+                cliente = None
+            self.after(0, lambda: self._finish_refresh_saved_client(gen, cliente))
+
+        threading.Thread(target=_fetch_one, daemon=True, name="clientes-saved-row").start()
+
+    def _finish_refresh_saved_client(self, gen: int, cliente: Any) -> None:
+        """Callback na main thread: aplica o cliente salvo no ViewModel."""
+        if gen != self._load_gen:
+            return  # um load mais novo já trouxe a lista atualizada
+        if cliente is None:
+            self.load_async()
+            return
+        self._vm.upsert_cliente(cliente)
+        self._render_rows(keep_position=True)
+
+    def _remove_and_render(self, client_id: Any) -> None:
+        """Tira da lista o cliente excluído/restaurado (sem recarregar a lista)."""
         self._selected_client_id = None
-        self.carregar()
+        self._vm.remove_clientes([client_id])
+        self._render_rows(keep_position=True)
 
     def _on_delete_client(self, event: Any = None) -> str | None:
         """Handler para botão Excluir Cliente.
@@ -1259,7 +1310,7 @@ class ClientesV2Frame(ctk.CTkFrame):
                 label_cli=label_cli,
                 top=top,
                 service=clientes_service,
-                on_success=self._deselect_and_reload,
+                on_success=lambda: self._remove_and_render(client_id),
                 ask_danger_fn=_ask_yes_no_danger,
                 show_info_fn=_show_info,
                 show_error_fn=_show_error,
@@ -1271,7 +1322,7 @@ class ClientesV2Frame(ctk.CTkFrame):
                 top=top,
                 service=clientes_service,
                 refresh_lixeira=refresh_lixeira_if_open,
-                on_success=self._deselect_and_reload,
+                on_success=lambda: self._remove_and_render(client_id),
                 ask_fn=_ask_yes_no,
                 show_info_fn=_show_info,
                 show_error_fn=_show_error,
@@ -1291,13 +1342,14 @@ class ClientesV2Frame(ctk.CTkFrame):
         )
 
         label_cli = _resolve_client_label(self._selected_client_id, self._row_data_map)
+        client_id = self._selected_client_id
 
         _execute_restore(
-            client_id=self._selected_client_id,
+            client_id=client_id,
             label_cli=label_cli,
             top=self.winfo_toplevel(),  # pyright: ignore[reportAttributeAccessIssue]
             service=clientes_service,
-            on_success=self._deselect_and_reload,
+            on_success=lambda: self._remove_and_render(client_id),
             ask_fn=_ask_yes_no,
             show_info_fn=_show_info,
             show_error_fn=_show_error,
@@ -610,7 +610,8 @@ class EditorDataMixin:
                         show_warning(self, "Salvo com ressalvas", msg)
 
                     if self.on_save:
-                        self.on_save(valores)
+                        # _cliente_id: a lista atualiza só a linha salva (sem recarregar tudo)
+                        self.on_save({**valores, "_cliente_id": cliente_id_salvo})
                     if self.winfo_exists():
                         self.destroy()
 
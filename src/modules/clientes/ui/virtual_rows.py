@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""Renderização virtualizada da Treeview de Clientes.
+
+A ``ttk.Treeview`` fica lenta com milhares de itens: cada filtro apagava e
+reinseria todas as linhas (com formatação) na thread principal. Aqui a
+Treeview guarda só uma *janela* das linhas — as visíveis mais um buffer
+acima/abaixo — e a barra de rolagem é traduzida para a lista completa:
+
+- a rolagem nativa (roda do mouse, setas, ``see``) funciona dentro da janela;
+  quando a vista se aproxima da borda, a janela é recentralizada;
+- a troca de janela/lista aplica só o *diff*: remove itens que saíram, insere
+  os que entraram, move os que mudaram de posição e atualiza valores apenas
+  das linhas cuja versão mudou. Os iids são estáveis por cliente, então
+  seleção e foco sobrevivem a filtros e rolagem;
+- as tuplas de células formatadas ficam em cache por versão da linha (o
+  ViewModel cria um ``ClienteRow`` novo sempre que o cliente muda).
+
+Sem dependência de Tk: a Treeview e a scrollbar são usadas por duck typing,
+o que permite testar com objetos falsos.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any, Generic, TypeVar
+
+log = logging.getLogger(__name__)
+
+__all__ = ["RowValuesCache", "VirtualRowWindow", "WINDOW_BUFFER_ROWS"]
+
+R = TypeVar("R")
+
+#: Linhas materializadas acima e abaixo da área visível.
+WINDOW_BUFFER_ROWS: int = 60
+
+
+class RowValuesCache(Generic[R]):
+    """Cache de tuplas de células por versão (identidade) da linha.
+
+    Guarda a própria linha junto do valor para que ``id(row)`` não seja
+    reaproveitado por outro objeto enquanto a entrada existir.
+    """
+
+    def __init__(self, format_fn: Callable[[R], tuple[Any, ...]]) -> None:
+        self._format_fn = format_fn
+        self._entries: dict[int, tuple[R, tuple[Any, ...]]] = {}
+
+    def get(self, row: R) -> tuple[Any, ...]:
+        entry = self._entries.get(id(row))
+        if entry is not None and entry[0] is row:
+            return entry[1]
+        values = self._format_fn(row)
+        self._entries[id(row)] = (row, values)
+        return values
+
+    def retain(self, rows: Sequence[R]) -> None:
+        """Descarta entradas de linhas que não estão mais na lista."""
+        if len(self._entries) <= 2 * max(len(rows), 1):
+            return
+        live = {id(r) for r in rows}
+        self._entries = {k: v for k, v in self._entries.items() if k in live}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class VirtualRowWindow(Generic[R]):
+    """Mantém na Treeview apenas a janela visível (+ buffer) de ``rows``.
+
+    Args:
+        tree: ``ttk.Treeview`` (ou compatível).
+        format_fn: Converte a linha na tupla de ``values`` da Treeview.
+        key_fn: Chave estável da linha (vira o iid; duplicatas ganham sufixo).
+        buffer_rows: Linhas extras materializadas acima e abaixo da vista.
+        visible_rows: Estimativa inicial de linhas visíveis (ajustada pela
+            própria Treeview ao rolar).
+        on_window_changed: Chamado após cada alteração dos itens materializados
+            (ex.: reaplicar zebra).
+    """
+
+    def __init__(
+        self,
+        tree: Any,
+        format_fn: Callable[[R], tuple[Any, ...]],
+        key_fn: Callable[[R], str],
+        *,
+        buffer_rows: int = WINDOW_BUFFER_ROWS,
+        visible_rows: int = 40,
+        on_window_changed: Callable[[], None] | None = None,
+    ) -> None:
+        self._tree = tree
+        self._key_fn = key_fn
+        self._values = RowValuesCache(format_fn)
+        self._buffer = max(2, buffer_rows)
+        self._visible = max(1, visible_rows)
+        self._on_window_changed = on_window_changed
+        self._scrollbar: Any = None
+
+        self._rows: list[R] = []
+        self._iids: list[str] = []
+        self.row_map: dict[str, R] = {}  # iid -> linha (lista completa)
+        self._start = 0
+        self._end = 0
+        self._top = 0
+        # iid -> linha exibida atualmente (para saber se os values mudaram)
+        self._shown: dict[str, R] = {}
+        self._recenter_pending = False
+
+    # ------------------------------------------------------------------ #
+    # Integração com a scrollbar
+    # ------------------------------------------------------------------ #
+
+    def attach_scrollbar(self, scrollbar: Any) -> None:
+        """Faz ``scrollbar`` refletir/controlar a lista completa, não a janela."""
+        self._scrollbar = scrollbar
+        scrollbar.configure(command=self.yview)
+        self._tree.configure(yscrollcommand=self._on_tree_yscroll)
+
+    def yview(self, *args: Any) -> None:
+        """Comando da scrollbar (``moveto``/``scroll``) em coordenadas globais."""
+        total = len(self._rows)
+        if not total or not args:
+            return
+        if args[0] == "moveto":
+            top = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            amount = int(float(args[1]))
+            step = self._visible if len(args) > 2 and str(args[2]).startswith("page") else 1
+            top = self._top + amount * step
+        else:
+            return
+        self.scroll_to(top)
+
+    def scroll_to(self, top: int) -> None:
+        """Rola para que a linha global ``top`` fique no topo da vista."""
+        total = len(self._rows)
+        top = max(0, min(top, max(0, total - self._visible)))
+        if not (self._start <= top and top + self._visible <= self._end) and total:
+            self._materialize(top)
+        self._top = top
+        size = self._end - self._start
+        if size:
+            self._tree.yview_moveto((top - self._start) / size)
+        self._sync_scrollbar()
+
+    def _on_tree_yscroll(self, first: str | float, last: str | float) -> None:
+        """yscrollcommand da Treeview: converte a vista local em global."""
+        size = self._end - self._start
+        if not size:
+            self._set_scrollbar(0.0, 1.0)
+            return
+        lo, hi = float(first), float(last)
+        local_top = int(round(lo * size))
+        self._visible = max(1, int(round((hi - lo) * size)) or self._visible)
+        self._top = self._start + local_top
+        self._sync_scrollbar()
+        near_top = self._start > 0 and local_top < self._buffer // 2
+        near_bottom = self._end < len(self._rows) and local_top + self._visible > size - self._buffer // 2
+        if (near_top or near_bottom) and not self._recenter_pending:
+            # Fora do callback do Tk: mexer nos itens aqui reentraria o yscrollcommand
+            self._recenter_pending = True
+            self._tree.after_idle(self._recenter)
+
+    def _recenter(self) -> None:
+        self._recenter_pending = False
+        top = self._top
+        self._materialize(top)
+        size = self._end - self._start
+        if size:
+            self._tree.yview_moveto((top - self._start) / size)
+
+    def _sync_scrollbar(self) -> None:
+        total = len(self._rows)
+        if not total:
+            self._set_scrollbar(0.0, 1.0)
+            return
+        self._set_scrollbar(self._top / total, min(1.0, (self._top + self._visible) / total))
+
+    def _set_scrollbar(self, lo: float, hi: float) -> None:
+        if self._scrollbar is not None:
+            self._scrollbar.set(lo, hi)
+
+    # ------------------------------------------------------------------ #
+    # Dados
+    # ------------------------------------------------------------------ #
+
+    def set_rows(self, rows: Sequence[R], *, keep_position: bool = False) -> None:
+        """Troca a lista completa, aplicando só o diff na janela materializada.
+
+        Args:
+            rows: Linhas já filtradas/ordenadas.
+            keep_position: Mantém a linha do topo (ex.: "Carregar mais");
+                caso contrário volta ao início da lista.
+        """
+        self._rows = list(rows)
+        self._iids = self._build_iids(self._rows)
+        self.row_map = dict(zip(self._iids, self._rows))
+        self._values.retain(self._rows)
+        top = self._top if keep_position else 0
+        top = max(0, min(top, max(0, len(self._rows) - self._visible)))
+        self._materialize(top)
+        self._top = top
+        size = self._end - self._start
+        if size:
+            self._tree.yview_moveto((top - self._start) / size)
+        self._sync_scrollbar()
+
+    def _build_iids(self, rows: Sequence[R]) -> list[str]:
+        seen: dict[str, int] = {}
+        iids: list[str] = []
+        for row in rows:
+            key = str(self._key_fn(row))
+            count = seen.get(key, 0)
+            seen[key] = count + 1
+            iids.append(key if count == 0 else f"{key}#{count}")
+        return iids
+
+    def _materialize(self, top: int) -> None:
+        """Ajusta a janela para cobrir ``top`` (+ buffer) e aplica o diff."""
+        total = len(self._rows)
+        start = max(0, top - self._buffer)
+        start -= start % 2  # paridade global estável para a zebra
+        end = min(total, top + self._visible + self._buffer)
+        self._apply_window(start, end)
+
+    def _apply_window(self, start: int, end: int) -> None:
+        tree = self._tree
+        target = self._iids[start:end]
+        target_set = set(target)
+        current = list(tree.get_children(""))
+
+        stale = [iid for iid in current if iid not in target_set]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                self._shown.pop(iid, None)
+        remaining = [iid for iid in current if iid in target_set]
+
+        inserted = moved = updated = 0
+        pos = 0  # índice em `remaining` do próximo item já na ordem certa
+        present = set(remaining)
+        for index, iid in enumerate(target, start=start):
+            row = self._rows[index]
+            local = index - start
+            if iid in present:
+                if pos < len(remaining) and remaining[pos] == iid:
+                    pos += 1
+                else:
+                    tree.move(iid, "", local)
+                    remaining.remove(iid)
+                    moved += 1
+                if self._shown.get(iid) is not row:
+                    tree.item(iid, values=self._values.get(row))
+                    self._shown[iid] = row
+                    updated += 1
+            else:
+                tree.insert("", local, iid=iid, values=self._values.get(row))
+                self._shown[iid] = row
+                inserted += 1
+
+        self._start, self._end = start, end
+        log.debug(
+            "[Clientes] janela %d:%d/%d (ins=%d mov=%d upd=%d del=%d)",
+            start,
+            end,
+            len(self._rows),
+            inserted,
+            moved,
+            updated,
+            len(stale),
+        )
+        if self._on_window_changed is not None and (inserted or moved or updated or stale):
+            self._on_window_changed()
+
+    # ------------------------------------------------------------------ #
+    # Consultas
+    # ------------------------------------------------------------------ #
+
+    @property
+    def rows(self) -> list[R]:
+        return list(self._rows)
+
+    @property
+    def window(self) -> tuple[int, int]:
+        """Intervalo ``[início, fim)`` das linhas materializadas."""
+        return (self._start, self._end)
+
+    def index_of(self, iid: str) -> int:
+        """Posição global do ``iid`` na lista completa (-1 se ausente)."""
+        try:
+            return self._iids.index(iid)
+        except ValueError:
+            return -1
+
+    def see(self, iid: str) -> bool:
+        """Garante que ``iid`` está materializado e visível."""
+        index = self.index_of(iid)
+        if index < 0:
+            return False
+        if not (self._start <= index < self._end):
+            self.scroll_to(index - self._visible // 2)
+        self._tree.see(iid)
+        return True
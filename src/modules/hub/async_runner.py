@@ -87,6 +87,14 @@ class HubAsyncRunner:
 
         self._executor.submit(_worker)
 
+    def post(self, callback: Callable[[], None]) -> None:
+        """Agenda callback no main thread a partir de uma tarefa em andamento.
+
+        Útil para publicar resultados parciais antes do on_success; a ordem
+        de agendamento é preservada (after(0) é FIFO).
+        """
+        self._schedule_callback(callback)
+
     def _schedule_callback(self, callback: Callable[[], None]) -> None:
         """Agenda callback no main thread com verificação de widget válido."""
         if self._shutdown:
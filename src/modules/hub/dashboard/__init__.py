@@ -6,6 +6,7 @@ Re-exports from service module for convenience.
 
 from src.modules.hub.dashboard.service import (
     DashboardSnapshot,
+    SectionTiming,
     due_badge,
     format_due_br,
     get_dashboard_snapshot,
@@ -17,6 +18,7 @@ from src.modules.hub.dashboard.service import (
 
 __all__ = [
     "DashboardSnapshot",
+    "SectionTiming",
     "get_dashboard_snapshot",
     "get_first_day_of_month",
     "get_last_day_of_month",
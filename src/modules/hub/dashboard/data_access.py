@@ -8,13 +8,16 @@ This module should NOT import from service.py to avoid circular imports.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 from datetime import date, timedelta
 from typing import Any
 
 from src.modules.hub.dashboard_formatters import _parse_timestamp
 
 __all__ = [
+    "DASHBOARD_RPC_NAME",
     "fetch_client_names_impl",
+    "fetch_dashboard_snapshot_rpc",
     "load_pending_tasks_impl",
     "load_clients_of_the_day_impl",
     "load_recent_activity_impl",
@@ -22,10 +25,16 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Função SQL da migration 20260420_rpc_dashboard_snapshot
+DASHBOARD_RPC_NAME = "dashboard_snapshot"
+
 
 def fetch_client_names_impl(client_ids: list[int]) -> dict[int, str]:
     """Fetch client names for a list of client IDs.
 
+    Uses the process-wide batched resolver: one ``in_("id", ...)`` query per
+    chunk of ids not yet cached, instead of one query per client.
+
     Args:
         client_ids: List of client IDs to fetch.
 
@@ -36,23 +45,48 @@ def fetch_client_names_impl(client_ids: list[int]) -> dict[int, str]:
         return {}
 
     try:
-        from src.modules.clientes.core.service import fetch_cliente_by_id
-
-        names: dict[int, str] = {}
-        for cid in client_ids:
-            try:
-                cliente = fetch_cliente_by_id(cid)
-                if cliente:
-                    names[cid] = cliente.get("razao_social") or cliente.get("nome_fantasia") or f"Cliente #{cid}"
-                else:
-                    names[cid] = f"Cliente #{cid}"
-            except Exception:  # noqa: BLE001
-                names[cid] = f"Cliente #{cid}"
-        return names
+        from src.core.services.clientes_service import resolve_client_names
     except ImportError:
         logger.warning("Could not import clientes service for client names")
         return {cid: f"Cliente #{cid}" for cid in client_ids}
 
+    resolved = resolve_client_names(client_ids)
+    names: dict[int, str] = {}
+    for cid in client_ids:
+        # ids podem vir como str das linhas do PostgREST; a chave original é preservada
+        try:
+            names[cid] = resolved.get(int(cid), f"Cliente #{cid}")
+        except (TypeError, ValueError):
+            names[cid] = f"Cliente #{cid}"
+    return names
+
+
+def fetch_dashboard_snapshot_rpc(org_id: str, today: date, limit: int = 5) -> dict[str, Any]:
+    """Fetch the dashboard aggregates in a single RPC round-trip.
+
+    Args:
+        org_id: UUID of the organization.
+        today: Reference date (month for cash totals, overdue cut-off).
+        limit: Maximum number of upcoming deadlines.
+
+    Returns:
+        Raw jsonb object returned by ``public.dashboard_snapshot``.
+
+    Raises:
+        Exception: Propagated from PostgREST (function missing, network, RLS).
+        ValueError: If the response is not a JSON object.
+    """
+    from src.infra.supabase.db_client import exec_postgrest, get_supabase
+
+    params = {"p_org_id": org_id, "p_today": today.isoformat(), "p_limit": int(limit)}
+    resp = exec_postgrest(get_supabase().rpc(DASHBOARD_RPC_NAME, params))
+    data = getattr(resp, "data", None)
+    if isinstance(data, list) and len(data) == 1:
+        data = data[0]
+    if not isinstance(data, dict):
+        raise ValueError(f"{DASHBOARD_RPC_NAME}: resposta inesperada ({type(data).__name__})")
+    return data
+
 
 def load_pending_tasks_impl(
     org_id: str,
@@ -60,6 +94,7 @@ def load_pending_tasks_impl(
     limit: int = 5,
     *,
     fetch_client_names_fn: Any = None,
+    tasks: Sequence[Mapping[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     """Load pending tasks for the dashboard.
 
@@ -68,6 +103,7 @@ def load_pending_tasks_impl(
         today: Reference date for ordering (tasks are shown from earliest due_date).
         limit: Maximum number of tasks to return (default: 5).
         fetch_client_names_fn: Optional function to fetch client names (for testing).
+        tasks: Pending tasks already fetched by the caller (skips the query).
 
     Returns:
         List of pending task dictionaries with due_date, client_id, client_name,
@@ -77,13 +113,14 @@ def load_pending_tasks_impl(
     _fetch_names = fetch_client_names_fn or fetch_client_names_impl
 
     try:
-        from src.features.tasks.repository import list_tasks_for_org
+        if tasks is None:
+            from src.features.tasks.repository import list_tasks_for_org
 
-        # Get pending tasks, ordered by due_date and priority (already done in repo)
-        tasks = list_tasks_for_org(org_id, status="pending")
+            # Get pending tasks, ordered by due_date and priority (already done in repo)
+            tasks = list_tasks_for_org(org_id, status="pending")
 
         # Take only the first `limit` tasks
-        tasks = tasks[:limit]
+        tasks = list(tasks)[:limit]
 
         # Fetch client names for tasks that have client_id
         client_ids_raw = [task.get("client_id") for task in tasks if task.get("client_id") is not None]
@@ -133,17 +170,10 @@ def load_clients_of_the_day_impl(
     _fetch_names = fetch_client_names_fn or fetch_client_names_impl
 
     try:
-        from src.features.regulations.repository import list_obligations_for_org
-
-        # Get obligations for today
-        obligations_today = list_obligations_for_org(
-            org_id,
-            start_date=today,
-            end_date=today,
-            status=None,
-            kind=None,
-            limit=None,
-        )
+        from src.features.regulations.cache import get_obligations_cache
+
+        # Get obligations for today (range scan on the cached due_date index)
+        obligations_today = get_obligations_cache().scan(org_id, start=today, end=today)
 
         # Filter: only pending or overdue, and due_date == today
         filtered_obligations = []
@@ -273,16 +303,9 @@ def load_recent_activity_impl(
 
         # Get obligations
         try:
-            from src.features.regulations.repository import list_obligations_for_org
-
-            obligation_rows = list_obligations_for_org(
-                org_id,
-                start_date=None,
-                end_date=None,
-                status=None,
-                kind=None,
-                limit=None,
-            )
+            from src.features.regulations.cache import get_obligations_cache
+
+            obligation_rows = get_obligations_cache().rows(org_id)
 
             for row in obligation_rows:
                 raw_created_at = row.get("created_at")
@@ -11,9 +11,27 @@ from typing import Any
 
 __all__ = [
     "DashboardSnapshot",
+    "SectionTiming",
 ]
 
 
+@dataclass(frozen=True)
+class SectionTiming:
+    """Latency of one dashboard section (one or more backend round-trips).
+
+    Attributes:
+        name: Section name (e.g. "active_clients", "obligations").
+        elapsed_ms: Wall time spent in the section, in milliseconds.
+        status: "ok", "error" or "timeout".
+        error: Short error description when status is "error".
+    """
+
+    name: str
+    elapsed_ms: float
+    status: str = "ok"
+    error: str | None = None
+
+
 @dataclass
 class DashboardSnapshot:
     """Aggregated data for the Hub dashboard.
@@ -34,6 +52,7 @@ class DashboardSnapshot:
             each containing pending, overdue counts and status (green/yellow/red).
         recent_activity: Recent team activity (up to 20 items), each containing
             timestamp, category, text.
+        section_timings: Per-section latency breakdown, in completion order.
     """
 
     active_clients: int = 0
@@ -46,3 +65,4 @@ class DashboardSnapshot:
     clients_of_the_day: list[dict[str, Any]] = field(default_factory=list)
     risk_radar: dict[str, dict[str, Any]] = field(default_factory=dict)
     recent_activity: list[dict[str, Any]] = field(default_factory=list)
+    section_timings: list[SectionTiming] = field(default_factory=list)
@@ -9,12 +9,18 @@ call the Supabase client directly.
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, Sequence
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
 from datetime import date, timedelta
+from functools import partial
 from typing import Any
 
+from src.config.environment import env_bool, env_int
+
 # Import models
-from src.modules.hub.dashboard.models import DashboardSnapshot
+from src.modules.hub.dashboard.models import DashboardSnapshot, SectionTiming
 
 # Re-export formatters for backward compatibility
 from src.modules.hub.dashboard_formatters import (
@@ -34,6 +40,7 @@ from src.modules.hub.dashboard_formatters import (
 
 __all__ = [
     "DashboardSnapshot",
+    "SectionTiming",
     "get_dashboard_snapshot",
     # Re-exported formatters (public API)
     "get_first_day_of_month",
@@ -53,6 +60,17 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Seções buscadas em paralelo e tempo máximo (por seção) antes de desistir dela
+DASHBOARD_MAX_WORKERS: int = max(1, env_int("RC_HUB_DASHBOARD_WORKERS", 4))
+DASHBOARD_SECTION_TIMEOUT: float = max(1, env_int("RC_HUB_DASHBOARD_SECTION_TIMEOUT_MS", 8000)) / 1000.0
+# Agregação server-side (RPC dashboard_snapshot); False força o caminho em Python
+DASHBOARD_USE_RPC: bool = env_bool("RC_HUB_DASHBOARD_RPC", True)
+
+_OPEN_STATUSES = ("pending", "overdue")
+
+# (org_id, today) -> campos do DashboardSnapshot preenchidos pela seção
+SectionFn = Callable[[str, date], dict[str, Any]]
+
 
 def _count_tasks_due_until_today(
     tasks: Sequence[Mapping[str, Any]],
@@ -90,6 +108,25 @@ def _count_tasks_due_until_today(
     return count
 
 
+def _format_hot_item(kind: str, count: int, min_days: int | None) -> str | None:
+    """Alert text for ``count`` urgent obligations of ``kind`` (None if not shown)."""
+    if min_days is None or count <= 0:
+        return None
+    if kind == "SNGPC":
+        if min_days <= 0:
+            return f"{count} envio(s) SNGPC vencido(s) ou para hoje!"
+        if min_days == 1:
+            return f"Falta 1 dia para {count} envio(s) SNGPC"
+        return f"Faltam {min_days} dias para {count} envio(s) SNGPC"
+    if kind == "FARMACIA_POPULAR":
+        if min_days <= 0:
+            return f"{count} obrigação(ões) Farmácia Popular vencida(s) ou para hoje!"
+        if min_days == 1:
+            return f"Falta 1 dia para {count} obrigação(ões) Farmácia Popular"
+        return f"Faltam {min_days} dias para {count} obrigação(ões) Farmácia Popular"
+    return None
+
+
 def _build_hot_items(
     obligations: Sequence[Mapping[str, Any]],
     today: date,
@@ -145,11 +182,12 @@ def _build_hot_items(
             farmacia_popular_urgent.append(obl)
 
     # Generate alert strings
-    if sngpc_urgent:
-        count = len(sngpc_urgent)
+    for kind, urgent in (("SNGPC", sngpc_urgent), ("FARMACIA_POPULAR", farmacia_popular_urgent)):
+        if not urgent:
+            continue
         # Find minimum days remaining
         min_days = None
-        for obl in sngpc_urgent:
+        for obl in urgent:
             due_date_raw = obl.get("due_date")
             if due_date_raw is None:
                 continue
@@ -166,43 +204,19 @@ def _build_hot_items(
             if min_days is None or days_left < min_days:
                 min_days = days_left
 
-        if min_days is not None:
-            if min_days <= 0:
-                hot_items.append(f"{count} envio(s) SNGPC vencido(s) ou para hoje!")
-            elif min_days == 1:
-                hot_items.append(f"Falta 1 dia para {count} envio(s) SNGPC")
-            else:
-                hot_items.append(f"Faltam {min_days} dias para {count} envio(s) SNGPC")
+        text = _format_hot_item(kind, len(urgent), min_days)
+        if text:
+            hot_items.append(text)
 
-    if farmacia_popular_urgent:
-        count = len(farmacia_popular_urgent)
-        min_days = None
-        for obl in farmacia_popular_urgent:
-            due_date_raw = obl.get("due_date")
-            if due_date_raw is None:
-                continue
-            if isinstance(due_date_raw, str):
-                try:
-                    due_date = date.fromisoformat(due_date_raw)
-                except ValueError:
-                    continue
-            elif isinstance(due_date_raw, date):
-                due_date = due_date_raw
-            else:
-                continue
-            days_left = (due_date - today).days
-            if min_days is None or days_left < min_days:
-                min_days = days_left
+    return hot_items
 
-        if min_days is not None:
-            if min_days <= 0:
-                hot_items.append(f"{count} obrigação(ões) Farmácia Popular vencida(s) ou para hoje!")
-            elif min_days == 1:
-                hot_items.append(f"Falta 1 dia para {count} obrigação(ões) Farmácia Popular")
-            else:
-                hot_items.append(f"Faltam {min_days} dias para {count} obrigação(ões) Farmácia Popular")
 
-    return hot_items
+def _quadrant_status(pending: int, overdue: int) -> str:
+    if pending == 0 and overdue == 0:
+        return "green"
+    if overdue > 0:
+        return "red"
+    return "yellow"
 
 
 def _build_risk_radar(
@@ -267,13 +281,6 @@ def _build_risk_radar(
             quadrants[key]["pending"] += 1
 
     # Calculate status for each quadrant
-    def _quadrant_status(pending: int, overdue: int) -> str:
-        if pending == 0 and overdue == 0:
-            return "green"
-        if overdue > 0:
-            return "red"
-        return "yellow"
-
     for key, data in quadrants.items():
         pending = data["pending"]
         overdue = data["overdue"]
@@ -300,6 +307,8 @@ def _load_pending_tasks(
     org_id: str,
     today: date,
     limit: int = 5,
+    *,
+    tasks: Sequence[Mapping[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     """Load pending tasks for the dashboard.
 
@@ -307,6 +316,7 @@ def _load_pending_tasks(
         org_id: UUID of the organization.
         today: Reference date for ordering (tasks are shown from earliest due_date).
         limit: Maximum number of tasks to return (default: 5).
+        tasks: Pending tasks already fetched (reused instead of querying again).
 
     Returns:
         List of pending task dictionaries with due_date, client_id, client_name,
@@ -314,11 +324,17 @@ def _load_pending_tasks(
     """
     from . import data_access
 
-    return data_access.load_pending_tasks_impl(org_id, today, limit, fetch_client_names_fn=_fetch_client_names)
+    return data_access.load_pending_tasks_impl(
+        org_id,
+        today,
+        limit,
+        fetch_client_names_fn=_fetch_client_names,
+        tasks=tasks,
+    )
 
 
 def _load_obligations(org_id: str) -> list[Any]:
-    """Load all obligations for the organization.
+    """Load all obligations for the organization (from the obligations cache).
 
     Args:
         org_id: UUID of the organization.
@@ -327,14 +343,25 @@ def _load_obligations(org_id: str) -> list[Any]:
         List of obligation dictionaries.
     """
     try:
-        from src.features.regulations.repository import list_obligations_for_org
+        from src.features.regulations.cache import get_obligations_cache
 
-        return list(list_obligations_for_org(org_id))
+        return get_obligations_cache().rows(org_id)
     except Exception as e:  # noqa: BLE001
         logger.warning("Failed to load obligations: %s", e)
         return []
 
 
+def _scan_open_obligations(org_id: str, *, end: date | None = None, limit: int | None = None) -> list[Any]:
+    """Pending/overdue obligations in due_date order, up to ``end`` (index range scan)."""
+    try:
+        from src.features.regulations.cache import get_obligations_cache
+
+        return get_obligations_cache().scan(org_id, end=end, statuses=_OPEN_STATUSES, limit=limit)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Failed to scan obligations: %s", e)
+        return []
+
+
 def _load_clients_of_the_day(
     org_id: str,
     today: date,
@@ -460,121 +487,383 @@ def _build_upcoming_deadlines(
     return deadlines[:limit]
 
 
-def get_dashboard_snapshot(
-    org_id: str,
-    today: date | None = None,
-    minimal: bool = False,
-) -> DashboardSnapshot:
-    """Get aggregated dashboard data for an organization.
+# ---------------------------------------------------------------------------
+# Sections: each one does its own round-trips and returns the snapshot fields
+# it fills. They run concurrently; a section that raises keeps the defaults.
+# ---------------------------------------------------------------------------
 
-    This function collects data from multiple repositories and services to
-    build a comprehensive snapshot for the Hub dashboard.
 
-    Args:
-        org_id: UUID of the organization.
-        today: Reference date (defaults to date.today() if None).
-        minimal: Se True, carrega apenas pending_tasks (modo rápido para o Hub).
+def _section_active_clients(org_id: str, today: date) -> dict[str, Any]:
+    from src.core.services.clientes_service import count_clients
 
-    Returns:
-        DashboardSnapshot with aggregated data.
-    """
-    if today is None:
-        today = date.today()
+    return {"active_clients": count_clients()}
 
-    snapshot = DashboardSnapshot()
 
-    # Modo minimal: carrega só tarefas pendentes (mais rápido para o Hub)
-    if minimal:
-        try:
-            snapshot.pending_tasks = _load_pending_tasks(org_id, today, limit=5)
-        except Exception as e:  # noqa: BLE001
-            logger.warning("Failed to load pending tasks (minimal): %s", e)
-            snapshot.pending_tasks = []
-        return snapshot
+def _section_pending_obligations(org_id: str, today: date) -> dict[str, Any]:
+    from src.features.regulations.repository import count_pending_obligations
 
-    # 1) Active clients count
-    try:
-        from src.core.services.clientes_service import count_clients
+    return {"pending_obligations": count_pending_obligations(org_id)}
 
-        snapshot.active_clients = count_clients()
-    except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to count active clients: %s", e)
-        snapshot.active_clients = 0
 
-    # 2) Pending obligations count
-    try:
-        from src.features.regulations.repository import count_pending_obligations
+def _section_tasks(org_id: str, today: date) -> dict[str, Any]:
+    """tasks_today + pending_tasks from a single list_tasks_for_org(status="pending")."""
+    from src.features.tasks.repository import list_tasks_for_org
 
-        snapshot.pending_obligations = count_pending_obligations(org_id)
+    pending_tasks_all = list_tasks_for_org(org_id, status="pending")
+    fields: dict[str, Any] = {"tasks_today": _count_tasks_due_until_today(pending_tasks_all, today)}
+    try:
+        fields["pending_tasks"] = _load_pending_tasks(org_id, today, limit=5, tasks=pending_tasks_all)
     except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to count pending obligations: %s", e)
-        snapshot.pending_obligations = 0
+        logger.warning("Failed to load pending tasks: %s", e)
+    return fields
 
-    # 3) Tasks due today
-    try:
-        from src.features.tasks.repository import list_tasks_for_org
 
-        pending_tasks_all = list_tasks_for_org(org_id, status="pending")
-        snapshot.tasks_today = _count_tasks_due_until_today(pending_tasks_all, today)
-    except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to count tasks due today: %s", e)
-        snapshot.tasks_today = 0
+def _section_cash_in_month(org_id: str, today: date) -> dict[str, Any]:
+    from src.features.cashflow.repository import totals as cashflow_totals
 
-    # 4) Cash inflow for current month
-    try:
-        from src.features.cashflow.repository import totals as cashflow_totals
+    first_day = _get_first_day_of_month(today)
+    last_day = _get_last_day_of_month(today)
+    month_totals = cashflow_totals(first_day, last_day, org_id=org_id)
+    return {"cash_in_month": month_totals.get("in", 0.0)}
 
-        first_day = _get_first_day_of_month(today)
-        last_day = _get_last_day_of_month(today)
-        month_totals = cashflow_totals(first_day, last_day, org_id=org_id)
-        snapshot.cash_in_month = month_totals.get("in", 0.0)
-    except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to get cash inflow: %s", e)
-        snapshot.cash_in_month = 0.0
 
-    # 5) Load obligations (used for deadlines, hot_items, risk_radar)
+def _section_obligations(org_id: str, today: date) -> dict[str, Any]:
+    """Deadlines, hot items and the risk radar from the cached obligations.
+
+    Deadlines and hot items read only a due_date range of the sorted index;
+    the radar counts every row (pending obligations without due_date count).
+    """
     obligations = _load_obligations(org_id)
+    fields: dict[str, Any] = {}
 
-    # 6) Upcoming deadlines from obligations (pending/overdue, sorted by due_date, top 5)
     try:
-        snapshot.upcoming_deadlines = _build_upcoming_deadlines(obligations, today, limit=5)
+        # Os primeiros em ordem de vencimento já são os mais próximos
+        deadlines = _build_upcoming_deadlines(_scan_open_obligations(org_id, limit=5), today, limit=5)
+        _fill_deadline_client_names(deadlines)
+        fields["upcoming_deadlines"] = deadlines
     except Exception as e:  # noqa: BLE001
         logger.warning("Failed to build upcoming deadlines: %s", e)
-        snapshot.upcoming_deadlines = []
 
-    # 7) Pending tasks (top 5)
     try:
-        snapshot.pending_tasks = _load_pending_tasks(org_id, today, limit=5)
+        fields["hot_items"] = _build_hot_items(_scan_open_obligations(org_id, end=today + timedelta(days=2)), today)
     except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to load pending tasks: %s", e)
-        snapshot.pending_tasks = []
+        logger.warning("Failed to build hot items: %s", e)
 
-    # 8) Clients of the day
     try:
-        snapshot.clients_of_the_day = _load_clients_of_the_day(org_id, today)
+        fields["risk_radar"] = _build_risk_radar(obligations, today)
     except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to load clients of the day: %s", e)
-        snapshot.clients_of_the_day = []
+        logger.warning("Failed to build risk radar: %s", e)
+
+    return fields
+
+
+def _section_clients_of_the_day(org_id: str, today: date) -> dict[str, Any]:
+    return {"clients_of_the_day": _load_clients_of_the_day(org_id, today)}
+
+
+def _section_recent_activity(org_id: str, today: date) -> dict[str, Any]:
+    return {"recent_activity": _load_recent_activity(org_id, today)}
+
+
+def _section_pending_tasks_minimal(org_id: str, today: date) -> dict[str, Any]:
+    return {"pending_tasks": _load_pending_tasks(org_id, today, limit=5)}
+
+
+def _fill_deadline_client_names(deadlines: list[dict[str, Any]]) -> None:
+    """Replace the "Cliente #id" placeholders with names from one batched lookup."""
+    ids = [int(d["client_id"]) for d in deadlines if str(d.get("client_id", "")).isdigit()]
+    if not ids:
+        return
+    names = _fetch_client_names(ids)
+    for item in deadlines:
+        cid = str(item.get("client_id", ""))
+        if cid.isdigit() and int(cid) in names:
+            item["client_name"] = names[int(cid)]
+
+
+# Order = submission priority (KPI cards first)
+_SECTIONS: tuple[tuple[str, SectionFn], ...] = (
+    ("active_clients", _section_active_clients),
+    ("pending_obligations", _section_pending_obligations),
+    ("tasks", _section_tasks),
+    ("cash_in_month", _section_cash_in_month),
+    ("obligations", _section_obligations),
+    ("clients_of_the_day", _section_clients_of_the_day),
+    ("recent_activity", _section_recent_activity),
+)
+
+
+# ---------------------------------------------------------------------------
+# Server-side aggregation: public.dashboard_snapshot (one round-trip for the
+# client/obligation counters, cash total, deadlines, hot items, risk radar and
+# clients of the day). Tasks and recent activity still come from their own
+# sections.
+# If the RPC fails, the Python sections above are used for that snapshot.
+# ---------------------------------------------------------------------------
+
+# Códigos PostgREST/Postgres de "função não existe": migration não aplicada
+_RPC_MISSING_CODES = frozenset({"PGRST202", "42883"})
+_rpc_missing = False
+
+
+def _to_date(value: Any) -> date | None:
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _snapshot_fields_from_rpc(data: Mapping[str, Any], today: date) -> dict[str, Any]:
+    """Map the ``dashboard_snapshot`` jsonb to DashboardSnapshot fields."""
+    deadlines: list[dict[str, Any]] = []
+    for row in data.get("upcoming_deadlines") or []:
+        due_date = _to_date(row.get("due_date"))
+        if due_date is None:
+            continue
+        client_id = "" if row.get("client_id") is None else str(row["client_id"])
+        status_badge, _days_delta = _due_badge(due_date, today)
+        deadlines.append(
+            {
+                "due_date": _format_due_br(due_date),
+                "client_id": client_id,
+                "client_name": row.get("client_name") or f"Cliente #{client_id}",
+                "kind": row.get("kind", ""),
+                "title": row.get("title") or row.get("kind", ""),
+                "status": status_badge,
+            }
+        )
+
+    hot_by_kind = {item.get("kind"): item for item in data.get("hot_items") or []}
+    hot_items: list[str] = []
+    for kind in ("SNGPC", "FARMACIA_POPULAR"):
+        item = hot_by_kind.get(kind)
+        if not item:
+            continue
+        min_days = item.get("min_days")
+        text = _format_hot_item(kind, int(item.get("count") or 0), int(min_days) if min_days is not None else None)
+        if text:
+            hot_items.append(text)
+
+    raw_radar = data.get("risk_radar") or {}
+    risk_radar: dict[str, dict[str, Any]] = {}
+    for key in ("SNGPC", "SIFAP"):
+        quadrant = raw_radar.get(key) or {}
+        pending = int(quadrant.get("pending") or 0)
+        overdue = int(quadrant.get("overdue") or 0)
+        risk_radar[key] = {"pending": pending, "overdue": overdue, "status": _quadrant_status(pending, overdue)}
+
+    clients_of_the_day = [
+        {
+            "client_id": row.get("client_id"),
+            "client_name": row.get("client_name") or f"Cliente #{row.get('client_id')}",
+            "obligation_kinds": sorted(row.get("obligation_kinds") or []),
+        }
+        for row in data.get("clients_of_the_day") or []
+    ]
+
+    return {
+        "active_clients": int(data.get("active_clients") or 0),
+        "pending_obligations": int(data.get("pending_obligations") or 0),
+        "cash_in_month": float(data.get("cash_in_month") or 0.0),
+        "upcoming_deadlines": deadlines,
+        "hot_items": hot_items,
+        "risk_radar": risk_radar,
+        "clients_of_the_day": clients_of_the_day,
+    }
+
+
+def _section_snapshot_rpc(org_id: str, today: date) -> dict[str, Any]:
+    global _rpc_missing
+    from . import data_access
 
-    # 9) Hot items (urgent alerts)
     try:
-        snapshot.hot_items = _build_hot_items(obligations, today)
-    except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to build hot items: %s", e)
-        snapshot.hot_items = []
+        data = data_access.fetch_dashboard_snapshot_rpc(org_id, today, limit=5)
+    except Exception as e:
+        if getattr(e, "code", None) in _RPC_MISSING_CODES:
+            # Banco sem a migration: não tenta de novo neste processo
+            _rpc_missing = True
+            logger.info("Dashboard RPC %s indisponível; usando agregação local", data_access.DASHBOARD_RPC_NAME)
+        raise
+    return _snapshot_fields_from_rpc(data, today)
+
+
+# tasks_today vem da seção "tasks" (a mesma consulta das tarefas pendentes),
+# não do RPC, para que o fallback não consulte as tarefas de novo
+_RPC_SECTIONS: tuple[tuple[str, SectionFn], ...] = (
+    ("snapshot_rpc", _section_snapshot_rpc),
+    ("tasks", _section_tasks),
+    ("recent_activity", _section_recent_activity),
+)
 
-    # 10) Risk radar from obligations
+# Seções que cobrem o que o RPC deixou de preencher (tasks e recent_activity já rodaram)
+_RPC_FALLBACK_SECTIONS: tuple[tuple[str, SectionFn], ...] = tuple(
+    (name, fn) for name, fn in _SECTIONS if name not in {rpc_name for rpc_name, _fn in _RPC_SECTIONS}
+)
+
+
+def _run_section(
+    fn: SectionFn,
+    org_id: str,
+    today: date,
+    started: dict[str, float],
+    name: str,
+) -> tuple[dict[str, Any], float, BaseException | None]:
+    """Worker wrapper: never raises, records when the section actually started."""
+    t0 = time.perf_counter()
+    started[name] = t0  # atribuição em dict é atômica; lida pela thread chamadora
     try:
-        snapshot.risk_radar = _build_risk_radar(obligations, today)
+        fields = fn(org_id, today)
+        return fields, time.perf_counter() - t0, None
     except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to build risk radar: %s", e)
-        snapshot.risk_radar = {}
+        logger.warning("Failed to load dashboard section %s: %s", name, e)
+        return {}, time.perf_counter() - t0, e
+
 
-    # 11) Recent activity
+def _load_sections(
+    snapshot: DashboardSnapshot,
+    sections: Sequence[tuple[str, SectionFn]],
+    org_id: str,
+    today: date,
+    *,
+    max_workers: int,
+    section_timeout: float,
+    on_partial: Callable[[DashboardSnapshot], None] | None,
+) -> None:
+    """Run sections on a bounded pool, applying results as they arrive.
+
+    Each section has ``section_timeout`` seconds from the moment it starts
+    running; a section still queued counts against the whole batch budget
+    (timeout times the number of "waves" the pool needs). Timed-out sections
+    keep their default values and their late results are discarded.
+    """
+    workers = max(1, min(int(max_workers), len(sections)))
+    waves = -(-len(sections) // workers)
+    t_start = time.perf_counter()
+    batch_deadline = t_start + section_timeout * waves
+    started: dict[str, float] = {}
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="HubDashboard")
     try:
-        snapshot.recent_activity = _load_recent_activity(org_id, today)
-    except Exception as e:  # noqa: BLE001
-        logger.warning("Failed to load recent activity: %s", e)
-        snapshot.recent_activity = []
+        futures: dict[Future, str] = {
+            executor.submit(_run_section, fn, org_id, today, started, name): name for name, fn in sections
+        }
+        pending = set(futures)
+        while pending:
+            now = time.perf_counter()
+            deadlines = [
+                started[futures[f]] + section_timeout if futures[f] in started else batch_deadline for f in pending
+            ]
+            done, pending = wait(pending, timeout=max(0.0, min(deadlines) - now), return_when=FIRST_COMPLETED)
+
+            for fut in done:
+                name = futures[fut]
+                fields, elapsed, error = fut.result()
+                for field_name, value in fields.items():
+                    setattr(snapshot, field_name, value)
+                if error is None:
+                    timing = SectionTiming(name=name, elapsed_ms=elapsed * 1000)
+                else:
+                    timing = SectionTiming(
+                        name=name,
+                        elapsed_ms=elapsed * 1000,
+                        status="error",
+                        error=f"{type(error).__name__}: {error}",
+                    )
+                snapshot.section_timings.append(timing)
+
+            now = time.perf_counter()
+            for fut in list(pending):
+                name = futures[fut]
+                t0 = started.get(name)
+                expired = now >= (t0 + section_timeout if t0 is not None else batch_deadline)
+                if not expired:
+                    continue
+                pending.discard(fut)
+                fut.cancel()
+                logger.warning("Dashboard section %s timed out after %.1fs", name, section_timeout)
+                snapshot.section_timings.append(
+                    SectionTiming(name=name, elapsed_ms=(now - (t0 or t_start)) * 1000, status="timeout")
+                )
+
+            if done and pending and on_partial is not None:
+                try:
+                    on_partial(replace(snapshot, section_timings=list(snapshot.section_timings)))
+                except Exception as e:  # noqa: BLE001
+                    logger.debug("Dashboard partial snapshot callback failed: %s", e)
+    finally:
+        # Não espera seções que estouraram o timeout: o resultado delas é descartado
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    total_ms = (time.perf_counter() - t_start) * 1000
+    logger.info(
+        "[PERF-HUB] dashboard snapshot: total=%.0fms %s",
+        total_ms,
+        " ".join(f"{t.name}={t.elapsed_ms:.0f}ms/{t.status}" for t in snapshot.section_timings),
+    )
+
+
+def get_dashboard_snapshot(
+    org_id: str,
+    today: date | None = None,
+    minimal: bool = False,
+    *,
+    on_partial: Callable[[DashboardSnapshot], None] | None = None,
+    max_workers: int = DASHBOARD_MAX_WORKERS,
+    section_timeout: float = DASHBOARD_SECTION_TIMEOUT,
+    use_rpc: bool | None = None,
+) -> DashboardSnapshot:
+    """Get aggregated dashboard data for an organization.
+
+    This function collects data from multiple repositories and services to
+    build a comprehensive snapshot for the Hub dashboard. Independent
+    sections are fetched concurrently on a bounded pool, each with its own
+    timeout; ``snapshot.section_timings`` carries the latency breakdown.
+
+    Args:
+        org_id: UUID of the organization.
+        today: Reference date (defaults to date.today() if None).
+        minimal: Se True, carrega apenas pending_tasks (modo rápido para o Hub).
+        on_partial: Called (from the calling thread) with a copy of the
+            snapshot each time a section finishes while others are pending.
+        max_workers: Maximum concurrent sections.
+        section_timeout: Seconds each section may run before being dropped.
+        use_rpc: Aggregate on the server (``dashboard_snapshot`` RPC) and fall
+            back to the Python sections if it fails. None uses
+            ``RC_HUB_DASHBOARD_RPC`` (skipped once the function is known to
+            be missing).
+
+    Returns:
+        DashboardSnapshot with aggregated data.
+    """
+    if today is None:
+        today = date.today()
+
+    snapshot = DashboardSnapshot()
+    if use_rpc is None:
+        use_rpc = DASHBOARD_USE_RPC and not _rpc_missing
+
+    # Modo minimal: carrega só tarefas pendentes (mais rápido para o Hub)
+    if minimal:
+        sections: Sequence[tuple[str, SectionFn]] = (("pending_tasks", _section_pending_tasks_minimal),)
+    else:
+        sections = _RPC_SECTIONS if use_rpc else _SECTIONS
+    load = partial(
+        _load_sections,
+        snapshot,
+        org_id=org_id,
+        today=today,
+        max_workers=max_workers,
+        section_timeout=section_timeout,
+        on_partial=on_partial,
+    )
+    load(sections)
 
+    if sections is _RPC_SECTIONS:
+        rpc_timing = next(t for t in snapshot.section_timings if t.name == "snapshot_rpc")
+        if rpc_timing.status != "ok":
+            logger.info("Dashboard RPC %s; usando agregação local", rpc_timing.status)
+            load(_RPC_FALLBACK_SECTIONS)
     return snapshot
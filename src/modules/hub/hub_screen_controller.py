@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 # MF-40: Import do serviço assíncrono (extraído na MF-31)
@@ -562,9 +563,15 @@ class HubScreenController:
         """No-op: dashboard desativado."""
         return
 
-    def load_dashboard_data(self) -> Any:
+    def load_dashboard_data(self, on_partial: Callable[[Any], None] | None = None) -> Any:
         """Carrega dados do dashboard via ViewModel.
 
+        Args:
+            on_partial: Recebe os estados intermediários (seções que já
+                chegaram). Padrão: publica cada um na view via
+                ``async_runner.post`` (after(0) no main thread), já que o load
+                roda fora do main thread.
+
         Returns:
             DashboardViewState com dados carregados
         """
@@ -572,14 +579,21 @@ class HubScreenController:
         if not org_id:
             return self.dashboard_vm.from_error("Organização não identificada")
 
+        if on_partial is None:
+            on_partial = self._post_partial_dashboard
+
         try:
-            state = self.dashboard_vm.load(org_id=org_id, today=None)
+            state = self.dashboard_vm.load(org_id=org_id, today=None, on_partial=on_partial)
             self.state.is_dashboard_loaded = True
             return state
         except Exception as exc:
             self.logger.exception("Erro ao carregar dashboard")
             return self.dashboard_vm.from_error(str(exc))
 
+    def _post_partial_dashboard(self, state: Any) -> None:
+        """Agenda a renderização de um estado parcial no main thread."""
+        self.async_runner.post(lambda: self.view.update_dashboard(state))
+
     def load_notes_data(self) -> list[NoteItemView]:
         """Carrega notas compartilhadas via ViewModel.
 
@@ -202,35 +202,21 @@ class RecentActivityStore:
 
         log.info(f"[RecentActivityStore] Enriquecendo {len(missing_client_ids)} clientes com razão social")
 
-        # 3) Bulk query na tabela clients
+        # 3) Resolver em lote (cache TTL compartilhado com o dashboard do Hub)
         try:
-            from src.infra.supabase_client import get_supabase
-
-            sb = get_supabase()
-            client_ids_list = list(missing_client_ids)
-
-            # Query: select id, cnpj, razao_social where org_id = X and id in (...)
-            resp = (
-                sb.table("clients")
-                .select("id,cnpj,razao_social")
-                .eq("org_id", org_id)
-                .in_("id", client_ids_list)
-                .execute()
-            )
+            from src.core.services.clientes_service import resolve_clients_info
+
+            resolved = resolve_clients_info(missing_client_ids, org_id=org_id)
 
-            if not resp.data:
+            if not resolved:
                 log.warning("[RecentActivityStore] Bulk query retornou 0 clientes")
                 return events
 
             # 4) Montar map: {client_id: {"cnpj": ..., "razao_social": ...}}
-            client_info_map = {}
-            for row in resp.data:
-                client_id = row.get("id")
-                if client_id:
-                    client_info_map[client_id] = {
-                        "cnpj": row.get("cnpj") or "",
-                        "razao_social": row.get("razao_social") or "",
-                    }
+            client_info_map = {
+                client_id: {"cnpj": info.cnpj, "razao_social": info.razao_social}
+                for client_id, info in resolved.items()
+            }
 
             log.info(f"[RecentActivityStore] Encontrados {len(client_info_map)} clientes no banco")
 
@@ -102,9 +102,13 @@ def _load_dashboard_data_async_disabled(controller: "HubScreenController") -> No
         )
         _update_dashboard_ui_from_state(controller, error_state)
 
+    def on_partial(state: Any) -> None:  # DashboardViewState (thread do runner)
+        """Publica seções que já chegaram enquanto as demais carregam."""
+        controller.async_runner.post(lambda: controller.view.update_dashboard(state))
+
     # Executar carregamento em background via HubAsyncRunner
     controller.async_runner.run(
-        func=lambda: controller.dashboard_vm.load(org_id=org_id, today=None),
+        func=lambda: controller.dashboard_vm.load(org_id=org_id, today=None, on_partial=on_partial),
         on_success=on_success,
         on_error=on_error,
     )
@@ -119,7 +119,13 @@ class DashboardViewModel:
         )
         return self._state
 
-    def load(self, org_id: str, today: date | None = None) -> DashboardViewState:
+    def load(
+        self,
+        org_id: str,
+        today: date | None = None,
+        *,
+        on_partial: Callable[[DashboardViewState], None] | None = None,
+    ) -> DashboardViewState:
         """Carrega snapshot e monta cards de indicadores.
 
         Este método é headless (sem Tkinter) e pode rodar em thread separada.
@@ -127,6 +133,9 @@ class DashboardViewModel:
         Args:
             org_id: ID da organização.
             today: Data de referência (opcional, usa date.today() se None).
+            on_partial: Recebe estados intermediários (is_loading=True) à medida
+                que as seções do snapshot ficam prontas. Chamado na mesma thread
+                do load(); quem atualiza a UI deve reagendar no main thread.
 
         Returns:
             Novo estado do Dashboard (com snapshot e cards ou erro).
@@ -139,23 +148,19 @@ class DashboardViewModel:
         )
 
         try:
-            # Buscar snapshot via service
-            snapshot = self._service(org_id=org_id, today=today)
-
-            # Montar cards de indicadores
-            card_clientes = self._make_card_clientes(snapshot)
-            card_pendencias = self._make_card_pendencias(snapshot)
-            card_tarefas = self._make_card_tarefas(snapshot)
+            # Buscar snapshot via service (parciais só se pedidos: services
+            # injetados em testes não precisam aceitar o parâmetro)
+            if on_partial is not None:
+                snapshot = self._service(
+                    org_id=org_id,
+                    today=today,
+                    on_partial=lambda partial: on_partial(self._state_from_snapshot(partial, is_loading=True)),
+                )
+            else:
+                snapshot = self._service(org_id=org_id, today=today)
 
             # Atualizar estado com sucesso
-            self._state = DashboardViewState(
-                is_loading=False,
-                error_message=None,
-                snapshot=snapshot,
-                card_clientes=card_clientes,
-                card_pendencias=card_pendencias,
-                card_tarefas=card_tarefas,
-            )
+            self._state = self._state_from_snapshot(snapshot, is_loading=False)
 
         except Exception as exc:  # noqa: BLE001
             # Atualizar estado com erro
@@ -175,6 +180,17 @@ class DashboardViewModel:
     # BUILDERS DE CARDS (Lógica de Apresentação)
     # ========================================================================
 
+    def _state_from_snapshot(self, snapshot: DashboardSnapshot, *, is_loading: bool) -> DashboardViewState:
+        """Monta o estado (snapshot + cards) a partir de um snapshot completo ou parcial."""
+        return DashboardViewState(
+            is_loading=is_loading,
+            error_message=None,
+            snapshot=snapshot,
+            card_clientes=self._make_card_clientes(snapshot),
+            card_pendencias=self._make_card_pendencias(snapshot),
+            card_tarefas=self._make_card_tarefas(snapshot),
+        )
+
     def _make_card_clientes(self, snapshot: DashboardSnapshot) -> DashboardCardView:
         """Monta card de Clientes Ativos.
 
@@ -601,6 +601,14 @@ def destroy_window(app: App) -> None:
         except Exception as exc:  # noqa: BLE001
             log.debug("Falha ao parar pollers: %s", exc)
 
+    # Fechar a réplica local de clientes (SQLite) antes de encerrar
+    try:
+        from src.core.db_manager.replica import stop_clients_replica
+
+        stop_clients_replica()
+    except Exception as exc:  # noqa: BLE001
+        log.debug("Falha ao fechar réplica de clientes: %s", exc)
+
     if getattr(app, "_status_monitor", None):
         try:
             status_monitor = getattr(app, "_status_monitor", None)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, List, Optional, Tuple
 
+from .page_cache import PageCache
 from .raster_service import PdfRasterService, RasterResult
 
 
@@ -60,12 +61,14 @@ class PdfPreviewController:
         pdf_bytes: Optional[bytes] = None,
         pdf_path: Optional[str] = None,
         raster_service: Optional[PdfRasterService] = None,
+        page_cache: Optional[PageCache] = None,
     ) -> None:
-        self._raster = raster_service or PdfRasterService(pdf_bytes=pdf_bytes, pdf_path=pdf_path)
+        self._raster = raster_service or PdfRasterService(pdf_bytes=pdf_bytes, pdf_path=pdf_path, cache=page_cache)
         page_count = self._raster.page_count if self._raster is not None else 0
         self.state = PdfPreviewState(page_count=page_count)
         self._page_sizes: List[Tuple[int, int]] = self._compute_page_sizes()
-        self._text_buffer: List[str] = self._compute_text_buffer()
+        # Texto é extraído sob demanda (painel de texto/busca), não na abertura
+        self._text_buffer: Optional[List[str]] = None
 
     def close(self) -> None:
         if self._raster is not None:
@@ -141,7 +144,41 @@ class PdfPreviewController:
             page_index = self.state.current_page
         if zoom is not None:
             self.state.zoom = zoom
-        result: Optional[RasterResult] = self._raster.get_page_pixmap(page_index, self.state.zoom)
+        return self.rasterize_page(page_index, self.state.zoom)
+
+    def rasterize_page(self, page_index: int, zoom: float) -> Optional[PageRenderData]:
+        """
+        Rasteriza uma página sem alterar o estado de navegação/zoom.
+
+        Seguro para chamar a partir do worker de renderização em background.
+        """
+        if self._raster is None:
+            return None
+        result: Optional[RasterResult] = self._raster.get_page_pixmap(page_index, zoom)
+        if result is None:
+            return None
+        return PageRenderData(
+            page_index=page_index,
+            zoom=result.zoom,
+            pixmap=result.pixmap,
+            width=result.width,
+            height=result.height,
+        )
+
+    def rasterize_tile(
+        self,
+        page_index: int,
+        zoom: float,
+        rect: Tuple[int, int, int, int],
+    ) -> Optional[PageRenderData]:
+        """
+        Rasteriza apenas um retângulo (x0, y0, x1, y1, em pixels do zoom) da página.
+
+        Seguro para chamar a partir do worker de renderização em background.
+        """
+        if self._raster is None:
+            return None
+        result: Optional[RasterResult] = self._raster.get_tile_pixmap(page_index, zoom, rect)
         if result is None:
             return None
         return PageRenderData(
@@ -159,8 +196,26 @@ class PdfPreviewController:
 
     @property
     def text_buffer(self) -> List[str]:
+        """Texto de todas as páginas; extraído na primeira leitura (pode ser lento)."""
+        if self._text_buffer is None:
+            self._text_buffer = self._compute_text_buffer()
         return list(self._text_buffer)
 
+    @property
+    def text_loaded(self) -> bool:
+        return self._text_buffer is not None
+
+    def get_page_text(self, page_index: int) -> str:
+        if self._raster is None:
+            return ""
+        return self._raster.get_page_text(page_index)
+
+    def has_text_sample(self) -> bool:
+        """Rótulo "OCR: OK/vazio" a partir de uma amostra de páginas."""
+        if self._raster is None:
+            return False
+        return self._raster.sample_has_text()
+
     def get_page_label(self, prefix: str = "Página") -> str:
         total = max(1, self.state.page_count)
         current = max(0, min(self.state.current_page, total - 1))
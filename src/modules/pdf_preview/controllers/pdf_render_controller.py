@@ -13,16 +13,23 @@ import tkinter as tk
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from src.config.environment import env_int
+
 if TYPE_CHECKING:
     from src.modules.pdf_preview.controller import PdfPreviewController, PageRenderData
     from src.modules.pdf_preview.utils import LRUCache
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["PdfRenderController", "PageLayout"]
+__all__ = ["PdfRenderController", "PageLayout", "TileSpec", "TILE_SIZE", "TILE_MIN_ZOOM"]
 
 GAP = 16
 
+# Acima deste zoom a página é rasterizada em tiles (só a área visível)
+TILE_MIN_ZOOM: float = max(1, env_int("RC_PDF_TILE_MIN_ZOOM_PCT", 200)) / 100.0
+# Lado (em pixels de tela) de cada tile
+TILE_SIZE: int = max(64, env_int("RC_PDF_TILE_PX", 512))
+
 # Type aliases
 ZoomValue = float
 PageIndex = int
@@ -39,6 +46,27 @@ class PageLayout:
     total_height: int
 
 
+@dataclass(frozen=True)
+class TileSpec:
+    """Retângulo de uma página em pixels do zoom atual (origem no canto da página)."""
+
+    page_index: PageIndex
+    col: int
+    row: int
+    x0: PixelCoord
+    y0: PixelCoord
+    x1: PixelCoord
+    y1: PixelCoord
+
+    @property
+    def width(self) -> int:
+        return self.x1 - self.x0
+
+    @property
+    def height(self) -> int:
+        return self.y1 - self.y0
+
+
 class PdfRenderController:
     """Controller para gerenciar renderização de páginas PDF."""
 
@@ -46,13 +74,19 @@ class PdfRenderController:
         self,
         *,
         gap: int = GAP,
+        tile_size: int = TILE_SIZE,
+        tile_min_zoom: float = TILE_MIN_ZOOM,
     ) -> None:
         """Inicializa controller de render.
 
         Args:
             gap: Espaçamento entre páginas
+            tile_size: Lado dos tiles no modo de renderização em tiles
+            tile_min_zoom: Zoom a partir do qual o modo em tiles é usado
         """
         self._gap: int = gap
+        self.tile_size: int = max(1, int(tile_size))
+        self.tile_min_zoom: float = float(tile_min_zoom)
 
     def calculate_page_layout(
         self,
@@ -145,6 +179,134 @@ class PdfRenderController:
 
         return visible
 
+    def expand_with_lookahead(
+        self,
+        visible: List[PageIndex],
+        page_count: int,
+        lookahead: int,
+    ) -> List[PageIndex]:
+        """Acrescenta páginas vizinhas às visíveis, em ordem de prioridade.
+
+        As visíveis vêm primeiro; depois as próximas páginas abaixo e acima,
+        alternando, até ``lookahead`` páginas de cada lado.
+
+        Args:
+            visible: Índices visíveis (saída de find_visible_page_indices)
+            page_count: Total de páginas do documento
+            lookahead: Quantidade de páginas extras de cada lado
+
+        Returns:
+            Lista de índices sem repetição
+
+        Examples:
+            >>> ctrl = PdfRenderController()
+            >>> ctrl.expand_with_lookahead([3, 4], 10, 2)
+            [3, 4, 5, 2, 6, 1]
+            >>> ctrl.expand_with_lookahead([0], 2, 3)
+            [0, 1]
+        """
+        if not visible:
+            return []
+        ordered: List[PageIndex] = list(dict.fromkeys(visible))
+        seen = set(ordered)
+        first, last = min(visible), max(visible)
+        for step in range(1, max(0, lookahead) + 1):
+            for idx in (last + step, first - step):
+                if 0 <= idx < page_count and idx not in seen:
+                    ordered.append(idx)
+                    seen.add(idx)
+        return ordered
+
+    def use_tiles(self, zoom: ZoomValue) -> bool:
+        """Indica se o zoom é alto o bastante para renderizar em tiles.
+
+        Examples:
+            >>> ctrl = PdfRenderController(tile_min_zoom=2.0)
+            >>> ctrl.use_tiles(1.5), ctrl.use_tiles(3.0)
+            (False, True)
+        """
+        return zoom >= self.tile_min_zoom - 1e-9
+
+    def tile_at(
+        self,
+        page_index: PageIndex,
+        page_size: PageSize,
+        zoom: ZoomValue,
+        col: int,
+        row: int,
+    ) -> TileSpec:
+        """Retângulo do tile (col, row) de uma página, cortado na borda da página.
+
+        Examples:
+            >>> ctrl = PdfRenderController(tile_size=512)
+            >>> t = ctrl.tile_at(0, (400, 600), 2.0, 1, 2)
+            >>> (t.x0, t.y0, t.x1, t.y1)
+            (512, 1024, 800, 1200)
+        """
+        w = int(page_size[0] * zoom)
+        h = int(page_size[1] * zoom)
+        x0 = col * self.tile_size
+        y0 = row * self.tile_size
+        return TileSpec(
+            page_index=page_index,
+            col=col,
+            row=row,
+            x0=x0,
+            y0=y0,
+            x1=min(w, x0 + self.tile_size),
+            y1=min(h, y0 + self.tile_size),
+        )
+
+    def find_visible_tiles(
+        self,
+        page_tops: List[PixelCoord],
+        page_sizes: List[PageSize],
+        zoom: ZoomValue,
+        viewport: Tuple[int, int, int, int],
+        *,
+        margin: int = 0,
+    ) -> List[TileSpec]:
+        """Tiles que cruzam a área visível do canvas (mais uma margem).
+
+        Páginas ficam em x = gap (ver calculate_page_layout). A ordem segue a
+        leitura: página, linha, coluna.
+
+        Args:
+            page_tops: Lista de coordenadas Y de cada página
+            page_sizes: Lista de (width, height) em escala 1.0
+            zoom: Fator de zoom
+            viewport: (x0, y0, x1, y1) visível em coordenadas do canvas
+            margin: Margem extra (pixels) para pré-renderizar tiles vizinhos
+
+        Returns:
+            Lista de TileSpec
+
+        Examples:
+            >>> ctrl = PdfRenderController(tile_size=512)
+            >>> tiles = ctrl.find_visible_tiles([16], [(800, 1100)], 3.0, (0, 0, 1000, 600))
+            >>> [(t.col, t.row) for t in tiles]
+            [(0, 0), (1, 0), (0, 1), (1, 1)]
+        """
+        vx0, vy0, vx1, vy1 = viewport
+        vx0, vy0, vx1, vy1 = vx0 - margin, vy0 - margin, vx1 + margin, vy1 + margin
+        size = self.tile_size
+        tiles: List[TileSpec] = []
+        for i, top in enumerate(page_tops):
+            if i >= len(page_sizes):
+                break
+            w = int(page_sizes[i][0] * zoom)
+            h = int(page_sizes[i][1] * zoom)
+            left = self._gap
+            if top + h <= vy0 or top >= vy1 or left + w <= vx0 or left >= vx1:
+                continue
+            # faixa visível em coordenadas da página
+            px0, py0 = max(0, vx0 - left), max(0, vy0 - top)
+            px1, py1 = min(w, vx1 - left), min(h, vy1 - top)
+            for row in range(py0 // size, (py1 - 1) // size + 1):
+                for col in range(px0 // size, (px1 - 1) // size + 1):
+                    tiles.append(self.tile_at(i, page_sizes[i], zoom, col, row))
+        return tiles
+
     def render_page_to_photoimage(
         self,
         page_index: int,
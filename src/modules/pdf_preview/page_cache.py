@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""Cache de páginas rasterizadas com orçamento de memória em bytes.
+
+Substitui os caches por contagem (dict sem limite no PdfRasterService e
+``LRUCache(12)`` no PdfRenderService): cada entrada é contabilizada pelo
+tamanho do bitmap (largura * altura * canais) e as menos usadas são
+descartadas quando o total passa do orçamento.
+
+Um único cache é compartilhado pelo processo (``get_page_cache``); cada
+serviço usa seu próprio namespace de chaves, então vários documentos e
+janelas dividem o mesmo orçamento sem colidir.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
+
+from src.config.environment import env_int
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "PAGE_CACHE_BUDGET_MB",
+    "PageCache",
+    "PageCacheStats",
+    "estimate_nbytes",
+    "get_page_cache",
+    "new_cache_namespace",
+]
+
+# Orçamento padrão do cache compartilhado (MB)
+PAGE_CACHE_BUDGET_MB: int = max(8, env_int("RC_PDF_CACHE_MB", 256))
+
+_namespace_counter = itertools.count(1)
+
+
+def new_cache_namespace() -> int:
+    """Retorna um identificador único para prefixar chaves de um serviço."""
+    return next(_namespace_counter)
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Estima o tamanho em memória de um bitmap (Pixmap, PIL.Image ou PhotoImage).
+
+    Examples:
+        >>> class _Pix:
+        ...     width, height, n = 100, 50, 3
+        >>> estimate_nbytes(_Pix())
+        15000
+    """
+    try:
+        # fitz.Pixmap: width/height/n são atributos inteiros
+        n = getattr(value, "n", None)
+        if isinstance(n, int) and isinstance(getattr(value, "width", None), int):
+            return int(value.width) * int(value.height) * n
+        # PIL.Image: size + bandas do modo
+        size = getattr(value, "size", None)
+        if isinstance(size, tuple) and hasattr(value, "getbands"):
+            return int(size[0]) * int(size[1]) * len(value.getbands())
+        # tk.PhotoImage: width()/height() são métodos; Tk guarda 4 bytes por pixel
+        width = getattr(value, "width", None)
+        height = getattr(value, "height", None)
+        if callable(width) and callable(height):
+            return int(width()) * int(height()) * 4
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Falha ao estimar tamanho de entrada do cache: %s", exc)
+    return sys.getsizeof(value)
+
+
+@dataclass(frozen=True)
+class PageCacheStats:
+    """Contadores do cache (snapshot)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes_used: int
+    budget_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PageCache:
+    """Cache LRU limitado pelo total de bytes, seguro para múltiplas threads.
+
+    Mantém a interface ``get/put/clear`` do ``LRUCache`` para ser um
+    substituto direto.
+    """
+
+    def __init__(
+        self,
+        budget_mb: float = PAGE_CACHE_BUDGET_MB,
+        *,
+        sizer: Callable[[Any], int] = estimate_nbytes,
+    ) -> None:
+        self.budget_bytes: int = max(1, int(budget_mb * 1024 * 1024))
+        self._sizer = sizer
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        # PhotoImages despejados fora da thread principal: o __del__ chama o Tk,
+        # então a referência final só é solta em release_deferred() (thread do Tk).
+        self._deferred: List[Any] = []
+
+    # --- API compatível com LRUCache -------------------------------------------
+    def get(self, key: Hashable) -> Any:
+        """Retorna o valor (ou None), marcando-o como usado recentemente."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        """Insere/atualiza e descarta as entradas mais antigas se passar do orçamento.
+
+        Uma entrada sozinha maior que o orçamento é mantida (é a que acabou
+        de ser pedida), mas todas as outras são descartadas.
+        """
+        size = int(nbytes) if nbytes is not None else self._sizer(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._enforce_budget_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    # --- Extras ----------------------------------------------------------------
+    def peek(self, key: Hashable) -> Any:
+        """Como get(), mas sem afetar contadores nem a ordem LRU."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[0] if entry is not None else None
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove as chaves que satisfazem predicate; retorna quantas saíram."""
+        with self._lock:
+            doomed = [k for k in self._data if predicate(k)]
+            for k in doomed:
+                _v, size = self._data.pop(k)
+                self._bytes -= size
+            return len(doomed)
+
+    def keys_where(self, predicate: Callable[[Hashable], bool]) -> List[Hashable]:
+        with self._lock:
+            return [k for k in self._data if predicate(k)]
+
+    def set_budget_mb(self, budget_mb: float) -> None:
+        """Ajusta o orçamento e descarta o excedente imediatamente."""
+        with self._lock:
+            self.budget_bytes = max(1, int(budget_mb * 1024 * 1024))
+            self._enforce_budget_locked()
+
+    def release_deferred(self) -> None:
+        """Solta PhotoImages despejados por outras threads (chamar na thread do Tk)."""
+        with self._lock:
+            doomed, self._deferred = self._deferred, []
+        doomed.clear()
+
+    def _enforce_budget_locked(self) -> None:
+        on_main = threading.current_thread() is threading.main_thread()
+        while self._bytes > self.budget_bytes and len(self._data) > 1:
+            _k, (value, evicted_size) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+            self._evictions += 1
+            if not on_main and hasattr(value, "tk"):
+                self._deferred.append(value)
+
+    @property
+    def bytes_used(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def stats(self) -> PageCacheStats:
+        with self._lock:
+            return PageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._data),
+                bytes_used=self._bytes,
+                budget_bytes=self.budget_bytes,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys_where(lambda _k: True))
+
+
+_shared_cache: PageCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    """Cache compartilhado por todos os viewers de PDF do processo."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = PageCache(PAGE_CACHE_BUDGET_MB)
+        return _shared_cache
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
@@ -9,8 +10,45 @@ try:
 except Exception:  # pragma: no cover - ambiente sem PyMuPDF
     fitz = None  # type: ignore
 
+from .page_cache import PageCache, get_page_cache, new_cache_namespace
+
 logger = logging.getLogger(__name__)
 
+# Um Pixmap em cache com zoom até 50% maior é reduzido em vez de rasterizar de novo
+NEARBY_ZOOM_RATIO = 1.5
+
+# Páginas amostradas para decidir o rótulo "OCR: OK/vazio" sem ler o documento todo
+TEXT_SAMPLE_PAGES = 5
+
+
+def sample_page_indices(page_count: int, max_pages: int = TEXT_SAMPLE_PAGES) -> List[int]:
+    """Escolhe até max_pages páginas espalhadas pelo documento (primeira e última incluídas).
+
+    Examples:
+        >>> sample_page_indices(3)
+        [0, 1, 2]
+        >>> sample_page_indices(500)
+        [0, 125, 250, 374, 499]
+        >>> sample_page_indices(0)
+        []
+    """
+    if page_count <= 0 or max_pages <= 0:
+        return []
+    if page_count <= max_pages:
+        return list(range(page_count))
+    if max_pages == 1:
+        return [0]
+    step = (page_count - 1) / (max_pages - 1)
+    return sorted({int(round(i * step)) for i in range(max_pages)})
+
+
+def _coerce_text(raw: Any) -> str:
+    if isinstance(raw, (bytes, bytearray)):
+        return raw.decode("utf-8", "ignore")
+    if raw is None:
+        return ""
+    return str(raw)
+
 
 @dataclass
 class RasterResult:
@@ -27,14 +65,30 @@ class PdfRasterService:
 
     - abre o documento via PyMuPDF (path ou bytes);
     - expõe page_count;
-    - rasteriza páginas com cache simples de Pixmaps.
+    - rasteriza páginas com cache de Pixmaps limitado por memória
+      (``PageCache`` compartilhado, contabilizado em bytes);
+    - lê tamanhos de página da árvore de páginas (sem carregar cada página)
+      e extrai texto sob demanda, página a página.
+
+    O acesso ao documento é serializado por um lock: o PyMuPDF não suporta
+    uso concorrente do mesmo documento, e o worker de renderização em
+    background chama ``get_page_pixmap`` fora da thread principal.
     """
 
-    def __init__(self, *, pdf_bytes: Optional[bytes] = None, pdf_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        *,
+        pdf_bytes: Optional[bytes] = None,
+        pdf_path: Optional[str] = None,
+        cache: Optional[PageCache] = None,
+    ) -> None:
         self._pdf_bytes = pdf_bytes
         self._pdf_path = pdf_path
+        self._doc_lock = threading.RLock()
         self._doc = self._open_document()
-        self._cache: Dict[Tuple[int, float], RasterResult] = {}
+        self._cache: PageCache = cache if cache is not None else get_page_cache()
+        self._ns = new_cache_namespace()
+        self._text_cache: Dict[int, str] = {}
 
     # --- Recursos -----------------------------------------------------------
     def _open_document(self):
@@ -50,11 +104,15 @@ class PdfRasterService:
         return None
 
     def close(self) -> None:
-        try:
-            if self._doc is not None:
-                self._doc.close()
-        except Exception as exc:  # noqa: BLE001
-            logger.debug("Falha ao fechar documento PDF: %s", exc)
+        with self._doc_lock:
+            try:
+                if self._doc is not None:
+                    self._doc.close()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Falha ao fechar documento PDF: %s", exc)
+            self._doc = None
+            self._cache.discard_where(self._owns_key)
+            self._text_cache.clear()
 
     # --- Atributos auxiliares -----------------------------------------------
     @property
@@ -70,46 +128,88 @@ class PdfRasterService:
         if self._doc is None:
             return [(800, 1100)]
         sizes: List[Tuple[int, int]] = []
-        try:
-            for p in self._doc:
-                sizes.append((int(p.rect.width), int(p.rect.height)))
-        except Exception:
-            sizes = [(800, 1100)]
+        with self._doc_lock:
+            try:
+                sizes = [self._page_size_from_tree(i) for i in range(self._doc.page_count)]
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Falha ao ler tamanhos da árvore de páginas, carregando páginas: %s", exc)
+                try:
+                    sizes = [(int(p.rect.width), int(p.rect.height)) for p in self._doc]
+                except Exception:
+                    sizes = [(800, 1100)]
         return sizes or [(800, 1100)]
 
+    def _page_size_from_tree(self, index: int) -> Tuple[int, int]:
+        """Lê /CropBox e /Rotate direto do objeto da página, sem load_page()."""
+        box = self._doc.page_cropbox(index)
+        width, height = box.width, box.height
+        if self._page_rotation(index) % 180 == 90:
+            width, height = height, width
+        return (int(width), int(height))
+
+    def _page_rotation(self, index: int) -> int:
+        """/Rotate da página, herdado dos nós /Pages quando ausente."""
+        xref = self._doc.page_xref(index)
+        for _ in range(32):  # limite contra árvores malformadas (ciclos)
+            kind, value = self._doc.xref_get_key(xref, "Rotate")
+            if kind == "int":
+                return int(value)
+            kind, value = self._doc.xref_get_key(xref, "Parent")
+            if kind != "xref":
+                return 0
+            xref = int(value.split()[0])
+        return 0
+
+    def get_page_text(self, page_index: int) -> str:
+        """Extrai (e memoriza) o texto de uma única página."""
+        cached = self._text_cache.get(page_index)
+        if cached is not None:
+            return cached
+        with self._doc_lock:
+            if self._doc is None:
+                return ""
+            try:
+                raw = self._doc.load_page(page_index).get_text("text")
+            except Exception:
+                raw = ""
+        text = _coerce_text(raw)
+        self._text_cache[page_index] = text
+        return text
+
     def get_text_buffer(self) -> List[str]:
+        """Texto de todas as páginas (cada página é extraída uma única vez)."""
         if self._doc is None:
             return ["Texto indisponível (PyMuPDF não detectado)."]
-        try:
-            buf = [p.get_text("text") for p in self._doc]
-        except Exception:
-            buf = []
-        safe: List[str] = []
-        for t in buf:
-            if isinstance(t, (bytes, bytearray)):
-                safe.append(t.decode("utf-8", "ignore"))
-            elif t is None:
-                safe.append("")
-            else:
-                safe.append(str(t))
-        return safe or ["Texto indisponível."]
+        buf = [self.get_page_text(i) for i in range(self.page_count)]
+        return buf or ["Texto indisponível."]
+
+    def sample_has_text(self, max_pages: int = TEXT_SAMPLE_PAGES) -> bool:
+        """Indica se há camada de texto/OCR olhando só uma amostra de páginas."""
+        if self._doc is None:
+            return False
+        return any(self.get_page_text(i).strip() for i in sample_page_indices(self.page_count, max_pages))
 
     # --- Raster -------------------------------------------------------------
     def get_page_pixmap(self, page_index: int, zoom: float) -> Optional[RasterResult]:
         if self._doc is None or fitz is None:
             return None
 
-        key = (page_index, zoom)
+        key = self._key(page_index, zoom)
         cached = self._cache.get(key)
         if cached is not None:
             return cached
 
-        try:
-            page = self._doc.load_page(page_index)
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-        except Exception:
-            return None
+        pix = self._downscale_nearby(page_index, zoom)
+        if pix is None:
+            with self._doc_lock:
+                if self._doc is None:
+                    return None
+                try:
+                    page = self._doc.load_page(page_index)
+                    mat = fitz.Matrix(zoom, zoom)
+                    pix = page.get_pixmap(matrix=mat, alpha=False)
+                except Exception:
+                    return None
 
         result = RasterResult(
             page_index=page_index,
@@ -118,5 +218,74 @@ class PdfRasterService:
             width=pix.width,
             height=pix.height,
         )
-        self._cache[key] = result
+        self._cache.put(key, result, nbytes=pix.width * pix.height * pix.n)
         return result
+
+    def get_tile_pixmap(
+        self,
+        page_index: int,
+        zoom: float,
+        rect: Tuple[int, int, int, int],
+    ) -> Optional[RasterResult]:
+        """Rasteriza só um retângulo da página (x0, y0, x1, y1 em pixels do zoom).
+
+        Usado no modo em tiles: o custo acompanha o tamanho do retângulo,
+        não o da página. Não guarda em cache aqui; quem cacheia os tiles é
+        o PdfRenderService, já como PhotoImage.
+        """
+        if self._doc is None or fitz is None:
+            return None
+        x0, y0, x1, y1 = rect
+        if x1 <= x0 or y1 <= y0 or zoom <= 0:
+            return None
+        # page.rect começa em (0, 0) e já considera /Rotate, como as coordenadas do tile
+        clip = fitz.Rect(x0 / zoom, y0 / zoom, x1 / zoom, y1 / zoom)
+        with self._doc_lock:
+            if self._doc is None:
+                return None
+            try:
+                page = self._doc.load_page(page_index)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip, alpha=False)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Falha ao rasterizar tile da página %d: %s", page_index, exc)
+                return None
+        return RasterResult(
+            page_index=page_index,
+            zoom=zoom,
+            pixmap=pix,
+            width=pix.width,
+            height=pix.height,
+        )
+
+    # --- Cache ----------------------------------------------------------------
+    def _key(self, page_index: int, zoom: float) -> Tuple[str, int, int, float]:
+        return ("pix", self._ns, page_index, round(float(zoom), 3))
+
+    def _owns_key(self, key: Any) -> bool:
+        return isinstance(key, tuple) and len(key) == 4 and key[0] == "pix" and key[1] == self._ns
+
+    def _downscale_nearby(self, page_index: int, zoom: float) -> Any:
+        """Reduz um Pixmap já rasterizado em zoom um pouco maior, se houver.
+
+        Só reduz (nunca amplia) para não perder nitidez; o mais próximo vence.
+        """
+        target = round(float(zoom), 3)
+        candidates = [
+            k[3]
+            for k in self._cache.keys_where(self._owns_key)
+            if k[2] == page_index and target < k[3] <= target * NEARBY_ZOOM_RATIO
+        ]
+        if not candidates:
+            return None
+        src_zoom = min(candidates)
+        src: Optional[RasterResult] = self._cache.get(self._key(page_index, src_zoom))
+        if src is None:
+            return None
+        scale = target / src_zoom
+        try:
+            width = max(1, int(round(src.width * scale)))
+            height = max(1, int(round(src.height * scale)))
+            return fitz.Pixmap(src.pixmap, width, height, None)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Falha ao reduzir Pixmap da página %d: %s", page_index, exc)
+            return None
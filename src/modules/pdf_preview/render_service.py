@@ -11,21 +11,35 @@ import logging
 import tkinter as tk
 from typing import TYPE_CHECKING, Any
 
-from src.modules.pdf_preview.utils import LRUCache, pixmap_to_photoimage
+from src.modules.pdf_preview.page_cache import PageCache, PageCacheStats, get_page_cache, new_cache_namespace
+from src.modules.pdf_preview.utils import pixmap_to_photoimage, pixmap_to_pil_image
+
+try:
+    from PIL import ImageTk
+except Exception:  # pragma: no cover - PIL é opcional
+    ImageTk = None  # type: ignore
 
 if TYPE_CHECKING:
     from src.modules.pdf_preview.controller import PdfPreviewController
+    from src.modules.pdf_preview.controllers.pdf_render_controller import TileSpec
 
 logger = logging.getLogger(__name__)
 
+# Max relative distance from a whole factor for a cached render to be reused as placeholder
+_PLACEHOLDER_RATIO_TOLERANCE = 0.05
+
 
 class PdfRenderService:
     """Headless PDF page rendering service with caching.
 
     This service handles:
     - Page rendering via PdfPreviewController
-    - LRU caching of rendered PhotoImages
+    - Byte-budgeted caching of rendered PhotoImages (shared ``PageCache``)
     - Fallback blank images when rendering fails
+    - Background-friendly split: ``prepare_page_image`` runs off the Tk
+      thread, ``photoimage_from_payload`` finishes on the main thread
+    - Tile mode for high zoom: ``prepare_tile_image`` rasterizes a single
+      clip rectangle and each tile is cached on its own
 
     The service does NOT manage UI elements - that remains in the View.
     """
@@ -33,24 +47,29 @@ class PdfRenderService:
     def __init__(
         self,
         *,
-        cache: LRUCache | None = None,
+        cache: PageCache | None = None,
         cache_round: int = 2,
         min_px: int = 200,
     ) -> None:
         """Initialize the render service.
 
         Args:
-            cache: LRU cache instance (creates new if None)
+            cache: Page cache instance (process-wide shared cache if None)
             cache_round: Decimal places for zoom rounding in cache key
             min_px: Minimum pixel size for fallback images
         """
-        self._cache = cache if cache is not None else LRUCache(12)
+        self._cache = cache if cache is not None else get_page_cache()
         self._cache_round = cache_round
         self._min_px = min_px
+        self._ns = new_cache_namespace()
 
     def clear_cache(self) -> None:
-        """Clear all cached rendered images."""
-        self._cache.clear()
+        """Clear the images rendered by this service (other viewers keep theirs)."""
+        self._cache.discard_where(lambda key: self._owns_key(key) or self._owns_tile_key(key))
+
+    def cache_stats(self) -> PageCacheStats:
+        """Hit/miss/eviction counters of the underlying (shared) cache."""
+        return self._cache.stats()
 
     def get_page_photoimage(
         self,
@@ -71,7 +90,7 @@ class PdfRenderService:
         Returns:
             PhotoImage of the rendered page (or blank fallback)
         """
-        key = (page_index, round(float(zoom), self._cache_round))
+        key = self._cache_key(page_index, zoom)
         cached = self._cache.get(key)
         if cached is not None:
             return cached
@@ -83,6 +102,179 @@ class PdfRenderService:
             pdf_controller=pdf_controller,
         )
         self._cache.put(key, img)
+        self._cache.release_deferred()
+        return img
+
+    def _cache_key(self, page_index: int, zoom: float) -> tuple[str, int, int, float]:
+        return ("img", self._ns, page_index, round(float(zoom), self._cache_round))
+
+    def _owns_key(self, key: Any) -> bool:
+        return isinstance(key, tuple) and len(key) == 4 and key[0] == "img" and key[1] == self._ns
+
+    def _tile_key(self, tile: TileSpec, zoom: float) -> tuple[str, int, int, float, int, int]:
+        return ("tile", self._ns, tile.page_index, round(float(zoom), self._cache_round), tile.col, tile.row)
+
+    def _owns_tile_key(self, key: Any) -> bool:
+        return isinstance(key, tuple) and len(key) == 6 and key[0] == "tile" and key[1] == self._ns
+
+    def get_cached_photoimage(self, page_index: int, zoom: float) -> tk.PhotoImage | None:
+        """Return the cached PhotoImage for (page, zoom) without rendering."""
+        return self._cache.get(self._cache_key(page_index, zoom))
+
+    def store_photoimage(self, page_index: int, zoom: float, image: tk.PhotoImage) -> None:
+        """Store an image rendered elsewhere (e.g. by the background worker)."""
+        self._cache.put(self._cache_key(page_index, zoom), image)
+        self._cache.release_deferred()
+
+    def prepare_page_image(
+        self,
+        *,
+        page_index: int,
+        zoom: float,
+        pdf_controller: PdfPreviewController | None,
+    ) -> Any:
+        """Rasterize a page without touching Tk (safe for worker threads).
+
+        Returns:
+            PIL.Image when PIL is available, the raw pixmap otherwise,
+            or None when rendering fails
+        """
+        if pdf_controller is None:
+            return None
+        try:
+            render = pdf_controller.rasterize_page(page_index, float(zoom))
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to rasterize page %d: %s", page_index, exc)
+            return None
+        if render is None or render.pixmap is None:
+            return None
+        img = pixmap_to_pil_image(render.pixmap)
+        return img if img is not None else render.pixmap
+
+    def photoimage_from_payload(
+        self,
+        payload: Any,
+        *,
+        page_index: int,
+        zoom: float,
+        page_sizes: list[tuple[int, int]],
+    ) -> tk.PhotoImage:
+        """Convert a ``prepare_page_image`` payload into a PhotoImage (main thread)."""
+        photo = self._payload_to_photoimage(payload, page_index=page_index)
+        if photo is not None:
+            return photo
+        return self._blank_page_image(page_index=page_index, zoom=zoom, page_sizes=page_sizes)
+
+    def get_cached_tile(self, tile: TileSpec, zoom: float) -> tk.PhotoImage | None:
+        """Return the cached PhotoImage of a tile without rendering."""
+        return self._cache.get(self._tile_key(tile, zoom))
+
+    def store_tile(self, tile: TileSpec, zoom: float, image: tk.PhotoImage) -> None:
+        """Cache a tile rendered by the background worker."""
+        self._cache.put(self._tile_key(tile, zoom), image)
+        self._cache.release_deferred()
+
+    def prepare_tile_image(
+        self,
+        *,
+        tile: TileSpec,
+        zoom: float,
+        pdf_controller: PdfPreviewController | None,
+    ) -> Any:
+        """Rasterize only the tile's clip rectangle, without touching Tk.
+
+        Returns:
+            PIL.Image when PIL is available, the raw pixmap otherwise,
+            or None when rendering fails
+        """
+        if pdf_controller is None:
+            return None
+        try:
+            render = pdf_controller.rasterize_tile(
+                tile.page_index,
+                float(zoom),
+                (tile.x0, tile.y0, tile.x1, tile.y1),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to rasterize tile %s: %s", tile, exc)
+            return None
+        if render is None or render.pixmap is None:
+            return None
+        img = pixmap_to_pil_image(render.pixmap)
+        return img if img is not None else render.pixmap
+
+    def tile_photoimage_from_payload(self, payload: Any, *, tile: TileSpec) -> tk.PhotoImage:
+        """Convert a ``prepare_tile_image`` payload into a PhotoImage (main thread)."""
+        photo = self._payload_to_photoimage(payload, page_index=tile.page_index)
+        if photo is not None:
+            return photo
+        return tk.PhotoImage(width=max(1, tile.width), height=max(1, tile.height))
+
+    def _payload_to_photoimage(self, payload: Any, *, page_index: int) -> tk.PhotoImage | None:
+        if payload is None:
+            return None
+        try:
+            if ImageTk is not None and hasattr(payload, "mode"):
+                return ImageTk.PhotoImage(payload)  # type: ignore[return-value]
+            return pixmap_to_photoimage(payload)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to convert page %d to PhotoImage: %s", page_index, exc)
+            return None
+
+    def make_placeholder(
+        self,
+        *,
+        page_index: int,
+        zoom: float,
+        page_sizes: list[tuple[int, int]],
+    ) -> tk.PhotoImage:
+        """Return a cheap stand-in image shown while the real page renders.
+
+        Reuses a cached render of the same page at another zoom when the zoom
+        ratio is (within 5%) a whole factor, so it is low-res but instant and
+        the right size; otherwise a blank page with the right dimensions keeps
+        the layout stable.
+        """
+        target = round(float(zoom), self._cache_round)
+        for key in self._cache.keys_where(self._owns_key):
+            _kind, _ns, idx, cached_zoom = key
+            if idx != page_index or not cached_zoom or cached_zoom == target:
+                continue
+            img = self._cache.peek(key)
+            if img is None:
+                continue
+            ratio = target / cached_zoom
+            # zoom/subsample only scale by whole factors; anything else would give a
+            # wrongly sized placeholder and the layout would jump on the real render
+            factor = ratio if ratio >= 1 else 1 / ratio
+            whole = round(factor)
+            if whole < 2 or abs(factor - whole) > _PLACEHOLDER_RATIO_TOLERANCE * whole:
+                continue
+            try:
+                return img.zoom(whole) if ratio > 1 else img.subsample(whole)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Failed to scale placeholder for page %d: %s", page_index, exc)
+        return self._blank_page_image(page_index=page_index, zoom=zoom, page_sizes=page_sizes, fill="#ffffff")
+
+    def _blank_page_image(
+        self,
+        *,
+        page_index: int,
+        zoom: float,
+        page_sizes: list[tuple[int, int]],
+        fill: str | None = None,
+    ) -> tk.PhotoImage:
+        if page_index < 0 or page_index >= len(page_sizes):
+            return tk.PhotoImage(width=self._min_px, height=self._min_px)
+        w1, h1 = page_sizes[page_index]
+        w = max(self._min_px, int(w1 * zoom))
+        h = max(self._min_px, int(h1 * zoom))
+        img = tk.PhotoImage(width=w, height=h)
+        if fill is not None:
+            try:
+                img.put(fill, to=(0, 0, w, h))
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Failed to fill placeholder for page %d: %s", page_index, exc)
         return img
 
     def _render_page_to_photoimage(
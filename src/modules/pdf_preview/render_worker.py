@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""PDF Render Worker - rasterização de páginas fora da thread do Tk.
+
+O viewer pede as páginas visíveis (mais uma janela de look-ahead) e recebe
+o resultado de volta na thread principal via ``after()``. Cada mudança de
+zoom invalida os jobs pendentes (geração nova), e páginas que saíram da
+janela visível antes de começarem a ser renderizadas são descartadas.
+
+Este módulo NÃO cria PhotoImage: o Tk só pode ser usado na thread
+principal, então o worker entrega o payload preparado (PIL.Image ou
+Pixmap) e a view faz a conversão final no callback.
+
+As chaves dos jobs são índices de página ou, no modo em tiles (zoom alto),
+``TileSpec``; qualquer valor hashable serve.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Set, Tuple
+
+from src.config.environment import env_int
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["PdfRenderWorker", "RENDER_WORKERS", "RENDER_LOOKAHEAD"]
+
+# Número de threads de renderização e páginas pré-renderizadas além das visíveis
+RENDER_WORKERS: int = max(1, env_int("RC_PDF_RENDER_WORKERS", 2))
+RENDER_LOOKAHEAD: int = max(0, env_int("RC_PDF_RENDER_LOOKAHEAD", 2))
+
+# (page_index | TileSpec, zoom) -> payload pronto para virar PhotoImage (ou None se falhou)
+RenderFn = Callable[[Any, float], Any]
+ReadyCallback = Callable[[Any, float, Any], None]
+
+
+class PdfRenderWorker:
+    """Pool limitado que rasteriza páginas em background.
+
+    Attributes:
+        lookahead: Quantidade de páginas antes/depois das visíveis a pré-renderizar
+    """
+
+    def __init__(
+        self,
+        tk_owner: Any,
+        render_fn: RenderFn,
+        *,
+        max_workers: int = RENDER_WORKERS,
+        lookahead: int = RENDER_LOOKAHEAD,
+    ) -> None:
+        """Inicializa o worker.
+
+        Args:
+            tk_owner: Widget usado para agendar callbacks via .after()
+            render_fn: Função executada no worker: (page_index, zoom) -> payload
+            max_workers: Máximo de páginas renderizando em paralelo
+            lookahead: Páginas extras (antes/depois) a pré-renderizar
+        """
+        self._owner = tk_owner
+        self._render_fn = render_fn
+        self.lookahead: int = max(0, int(lookahead))
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="PdfRender")
+        # Todo o estado abaixo é protegido por _lock.
+        self._lock = threading.Lock()
+        self._generation: int = 0
+        self._zoom: float | None = None
+        self._wanted: Set[Hashable] = set()
+        self._inflight: Dict[Hashable, Tuple[int, Future]] = {}
+        self._closed: bool = False
+
+    # --- Estado ---------------------------------------------------------------
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def pending_pages(self) -> List[Any]:
+        """Páginas (ou tiles) com job enfileirado ou em execução, na ordem de envio."""
+        with self._lock:
+            return list(self._inflight)
+
+    # --- API ------------------------------------------------------------------
+    def request(self, pages: Sequence[Hashable], zoom: float, on_ready: ReadyCallback) -> List[Any]:
+        """Pede a renderização das páginas informadas no zoom atual.
+
+        Páginas já em andamento não são reenfileiradas. Jobs de páginas que
+        deixaram de ser pedidas são cancelados se ainda não começaram; uma
+        mudança de zoom invalida todos os jobs anteriores.
+
+        Args:
+            pages: Índices (ou tiles) desejados, em ordem de prioridade
+            zoom: Zoom alvo
+            on_ready: Callback (thread principal) com (page_index, zoom, payload)
+
+        Returns:
+            Lista das páginas efetivamente enfileiradas nesta chamada
+        """
+        submitted: List[Any] = []
+        with self._lock:
+            if self._closed:
+                return submitted
+            if self._zoom is None or abs(float(zoom) - self._zoom) > 1e-9:
+                self._bump_generation_locked()
+                self._zoom = float(zoom)
+
+            ordered = list(dict.fromkeys(pages))
+            self._wanted = set(ordered)
+            for idx, (_gen, fut) in list(self._inflight.items()):
+                if idx not in self._wanted and fut.cancel():
+                    del self._inflight[idx]
+
+            gen = self._generation
+            for idx in ordered:
+                if idx in self._inflight:
+                    continue
+                try:
+                    fut = self._executor.submit(self._run_job, idx, float(zoom), gen, on_ready)
+                except RuntimeError:
+                    # Executor já encerrado (janela fechando)
+                    break
+                self._inflight[idx] = (gen, fut)
+                submitted.append(idx)
+        return submitted
+
+    def run_task(self, fn: Callable[[], Any], on_done: Callable[[Any], None]) -> bool:
+        """Executa uma tarefa avulsa no pool (ex.: extração de texto) e entrega via after().
+
+        Não participa do controle de geração: o chamador valida se o
+        resultado ainda é relevante. Retorna False se o worker já encerrou.
+        """
+
+        def _job() -> None:
+            try:
+                result = fn()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Falha em tarefa de background do PDF viewer: %s", exc)
+                result = None
+
+            def _deliver() -> None:
+                with self._lock:
+                    if self._closed:
+                        return
+                on_done(result)
+
+            try:
+                self._owner.after(0, _deliver)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Falha ao agendar entrega de tarefa do PDF viewer: %s", exc)
+
+        with self._lock:
+            if self._closed:
+                return False
+            try:
+                self._executor.submit(_job)
+            except RuntimeError:
+                return False
+        return True
+
+    def cancel(self) -> None:
+        """Invalida todos os jobs pendentes (ex.: troca de documento)."""
+        with self._lock:
+            self._bump_generation_locked()
+            self._zoom = None
+
+    def shutdown(self) -> None:
+        """Cancela jobs pendentes e encerra o pool sem bloquear a UI."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._bump_generation_locked()
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Falha ao encerrar worker de renderização do PDF: %s", exc)
+
+    # --- Internos -------------------------------------------------------------
+    def _bump_generation_locked(self) -> None:
+        self._generation += 1
+        self._wanted = set()
+        for _gen, fut in self._inflight.values():
+            fut.cancel()
+        self._inflight.clear()
+
+    def _release_locked(self, idx: Hashable, gen: int) -> None:
+        entry = self._inflight.get(idx)
+        if entry is not None and entry[0] == gen:
+            del self._inflight[idx]
+
+    def _run_job(self, idx: Hashable, zoom: float, gen: int, on_ready: ReadyCallback) -> None:
+        with self._lock:
+            if self._closed or gen != self._generation or idx not in self._wanted:
+                # Página saiu da janela visível antes de começar: descarta
+                self._release_locked(idx, gen)
+                return
+
+        try:
+            payload = self._render_fn(idx, zoom)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Falha ao renderizar página %s em background: %s", idx, exc)
+            payload = None
+
+        def _deliver() -> None:
+            with self._lock:
+                stale = self._closed or gen != self._generation
+                self._release_locked(idx, gen)
+            if stale:
+                return
+            on_ready(idx, zoom, payload)
+
+        try:
+            self._owner.after(0, _deliver)
+        except Exception as exc:  # noqa: BLE001
+            # Widget destruído (TclError) ou interpretador encerrando
+            logger.debug("Falha ao agendar entrega da página %s: %s", idx, exc)
+            with self._lock:
+                self._release_locked(idx, gen)
@@ -38,6 +38,30 @@ class LRUCache:
         self.data.clear()
 
 
+def pixmap_to_pil_image(pixmap: Any) -> Any:
+    """
+    Converte um fitz.Pixmap (PyMuPDF) para PIL.Image.
+
+    Não toca no Tk, portanto pode ser chamada fora da thread principal
+    (ex.: no worker de renderização em background).
+
+    Args:
+        pixmap: Objeto Pixmap do PyMuPDF (fitz)
+
+    Returns:
+        PIL.Image ou None se PIL não estiver disponível ou a conversão falhar
+    """
+    if pixmap is None or Image is None:
+        return None
+    try:
+        mode = "RGB" if pixmap.n < 4 else "RGBA"
+        # Converter para tuple para Image.frombytes
+        size_tuple: Tuple[int, int] = (int(pixmap.width), int(pixmap.height))
+        return Image.frombytes(mode, size_tuple, pixmap.samples)
+    except Exception:
+        return None
+
+
 def pixmap_to_photoimage(pixmap: Any) -> Optional[tk.PhotoImage]:
     """
     Converte um fitz.Pixmap (PyMuPDF) para tk.PhotoImage.
@@ -54,11 +78,9 @@ def pixmap_to_photoimage(pixmap: Any) -> Optional[tk.PhotoImage]:
     try:
         # Tenta usar PIL se disponível (melhor qualidade)
         if Image is not None and ImageTk is not None:
-            mode = "RGB" if pixmap.n < 4 else "RGBA"
-            # Converter para tuple para Image.frombytes
-            size_tuple: Tuple[int, int] = (int(pixmap.width), int(pixmap.height))
-            img = Image.frombytes(mode, size_tuple, pixmap.samples)
-            return ImageTk.PhotoImage(img)  # type: ignore
+            img = pixmap_to_pil_image(pixmap)
+            if img is not None:
+                return ImageTk.PhotoImage(img)  # type: ignore
 
         # Fallback sem PIL (formato PPM)
         data = pixmap.tobytes("ppm")
@@ -19,8 +19,9 @@ except Exception as exc:  # noqa: BLE001
 
 from src.ui.window_utils import show_centered
 from src.modules.pdf_preview.controller import PdfPreviewController
-from src.modules.pdf_preview.utils import LRUCache
+from src.modules.pdf_preview.page_cache import PageCache, get_page_cache
 from src.modules.pdf_preview.render_service import PdfRenderService
+from src.modules.pdf_preview.render_worker import PdfRenderWorker
 from src.modules.pdf_preview.views.page_view import PdfPageView
 from src.modules.pdf_preview.views.text_panel import PdfTextPanel
 from src.modules.pdf_preview.views.toolbar import PdfToolbar
@@ -33,6 +34,7 @@ from src.modules.pdf_preview.views.view_helpers import (
 
 # Módulos refatorados
 from src.modules.pdf_preview.controllers import PdfZoomController, PdfRenderController
+from src.modules.pdf_preview.controllers.pdf_render_controller import TileSpec
 from src.modules.pdf_preview.views import pdf_viewer_handlers, pdf_viewer_actions
 
 logger = logging.getLogger(__name__)
@@ -81,7 +83,11 @@ class PdfViewerWin(ctk.CTkToplevel):
         self._items: List[int] = []  # ids de imagens por página
         self._page_tops: List[int] = []  # y de cada página
         self._page_sizes: List[Tuple[int, int]] = []  # (w,h) em 1.0
-        self.cache: LRUCache = LRUCache(12)
+        # Modo em tiles (zoom alto): itens do canvas por tile e fundo branco por página
+        self._tile_items: Dict[TileSpec, int] = {}
+        self._page_bg_items: List[int] = []
+        # Cache compartilhado (orçamento em MB) para Pixmaps e PhotoImages
+        self.cache: PageCache = get_page_cache()
         self._render_service: PdfRenderService = PdfRenderService(cache=self.cache)
         self._pan_active: bool = False
         self._closing: bool = False
@@ -103,7 +109,6 @@ class PdfViewerWin(ctk.CTkToplevel):
         self._pdf_bytes: bytes | None = None
         self._pdf_path: str | None = None
         self._controller: Optional[PdfPreviewController] = None
-        self._text_buffer: List[str] = []
         self._empty_state_item: int | None = None
         # Callback resolver para conversor PDF
         self._context_master: tk.Misc = master
@@ -112,6 +117,8 @@ class PdfViewerWin(ctk.CTkToplevel):
         # Controllers refatorados (headless)
         self._zoom_ctrl = PdfZoomController(min_zoom=0.2, max_zoom=6.0, zoom_step=0.1)
         self._render_ctrl = PdfRenderController(gap=GAP)
+        # Rasterização em background; resultado volta via after()
+        self._render_worker = PdfRenderWorker(self, self._rasterize_page_in_worker)
         # ---------------------------------------------------
 
         # Top bar
@@ -300,12 +307,17 @@ class PdfViewerWin(ctk.CTkToplevel):
     # ======== PDF load / render ========
     def _load_pdf(self, path: str) -> None:
         self._clear_empty_state()
+        self._render_worker.cancel()
         self._pdf_path = path
         self._pdf_bytes = None
         self._is_pdf = True
         self._update_download_buttons(source=path, is_pdf=True, is_image=False)
+        self._render_service.clear_cache()
+        if self._controller is not None:
+            # libera os Pixmaps do documento anterior no cache compartilhado
+            self._controller.close()
         try:
-            self._controller = PdfPreviewController(pdf_path=path)
+            self._controller = PdfPreviewController(pdf_path=path, page_cache=self.cache)
         except Exception as exc:  # noqa: BLE001
             # PDF inválido - UI mostra mensagem de erro
             log.debug("Falha ao criar controller PDF: %s", type(exc).__name__)
@@ -314,15 +326,16 @@ class PdfViewerWin(ctk.CTkToplevel):
         if self._controller is not None:
             self.page_count = self._controller.state.page_count
             self._page_sizes = self._controller.page_sizes
-            self._text_buffer = self._controller.text_buffer
+            # texto completo só é extraído (pelo controller) quando o painel de texto for aberto
             self.zoom = self._controller.state.zoom
+            self._has_text = self._controller.has_text_sample()
         else:
             self.page_count = 1
             self._page_sizes = [(800, 1100)]
-            self._text_buffer = ["Texto indisponível (PyMuPDF não detectado)."]
             self.zoom = 1.0
+            # painel de texto mostra o aviso de PyMuPDF ausente
+            self._has_text = True
 
-        self._has_text = any((t or "").strip() for t in self._text_buffer)
         self._page_label_suffix = "•  OCR: OK" if self._has_text else "•  OCR: vazio"
         self._ocr_loaded = False
         self.var_show_text.set(False)
@@ -374,6 +387,7 @@ class PdfViewerWin(ctk.CTkToplevel):
         self._is_pdf = False
         self._img_pil = None
         self._img_ref = None
+        self._render_worker.cancel()
         self._controller = None
         self._pdf_bytes = None
         self._pdf_path = None
@@ -384,7 +398,8 @@ class PdfViewerWin(ctk.CTkToplevel):
         self._page_tops = []
         self._items.clear()
         self._img_refs.clear()
-        self.cache.clear()
+        self._clear_tiles()
+        self._render_service.clear_cache()
         self._has_text = False
         self._page_label_suffix = ""
         self.var_show_text.set(False)
@@ -431,12 +446,13 @@ class PdfViewerWin(ctk.CTkToplevel):
 
         self._clear_empty_state()
 
-        # Limpa canvas
+        # Limpa canvas (o cache é por (página, zoom) e fica: serve de placeholder)
         for it in self._items:
             self.canvas.delete(it)
         self._items.clear()
         self._img_refs.clear()
-        self.cache.clear()
+        self._clear_tiles()
+        tiled = self._render_ctrl.use_tiles(self.zoom)
 
         # calcula alturas na escala atual e topos
         self._page_tops = []
@@ -446,6 +462,10 @@ class PdfViewerWin(ctk.CTkToplevel):
             w = int(w1 * self.zoom)
             h = int(h1 * self.zoom)
             self._page_tops.append(y)
+            if tiled:
+                # retângulo é barato em qualquer zoom; os tiles são desenhados por cima
+                bg = self.canvas.create_rectangle(GAP, y, GAP + w, y + h, fill="#ffffff", outline="")
+                self._page_bg_items.append(bg)
             # cria item imagem vazio
             it = self.canvas.create_image(GAP, y, anchor="nw")
             self._items.append(it)
@@ -472,29 +492,147 @@ class PdfViewerWin(ctk.CTkToplevel):
         if self._closing or not self.canvas.winfo_exists():
             return
 
-        # faixa visível
-        y0 = self.canvas.canvasy(0)
-        y1 = y0 + self.canvas.winfo_height()
-        margin = 2 * GAP
-        for i, top in enumerate(self._page_tops):
-            h = int(self._page_sizes[i][1] * self.zoom)
-            if top > y1 + margin or (top + h) < y0 - margin:
+        if self._page_bg_items:
+            self._render_visible_tiles()
+            self._update_page_label(self._first_visible_page())
+            self._update_scrollregion()
+            return
+
+        # faixa visível + look-ahead; páginas sem cache ganham placeholder e vão pro worker
+        visible = self._render_ctrl.find_visible_page_indices(
+            self._page_tops,
+            self._page_sizes,
+            self.zoom,
+            int(self.canvas.canvasy(0)),
+            self.canvas.winfo_height(),
+            margin=2 * GAP,
+        )
+        wanted = self._render_ctrl.expand_with_lookahead(visible, len(self._items), self._render_worker.lookahead)
+        pending: List[int] = []
+        for i in wanted:
+            img = self._render_service.get_cached_photoimage(i, self.zoom)
+            if img is not None:
+                self._show_page_image(i, img)
                 continue
-            self._ensure_page_rendered(i)
+            if i in visible and self._items[i] not in self._img_refs:
+                placeholder = self._render_service.make_placeholder(
+                    page_index=i,
+                    zoom=self.zoom,
+                    page_sizes=self._page_sizes,
+                )
+                self._show_page_image(i, placeholder)
+            pending.append(i)
+        if pending:
+            self._render_worker.request(pending, self.zoom, self._on_page_rasterized)
         self._update_page_label(self._first_visible_page())
         self._update_scrollregion()
 
-    def _ensure_page_rendered(self, i: int) -> None:
-        """Ensure page is rendered and displayed on canvas."""
-        img = self._render_service.get_page_photoimage(
-            page_index=i,
-            zoom=self.zoom,
-            page_sizes=self._page_sizes,
+    def _render_visible_tiles(self) -> None:
+        """Modo em tiles: só os tiles na área visível (mais um anel) ficam no canvas."""
+        x0 = int(self.canvas.canvasx(0))
+        y0 = int(self.canvas.canvasy(0))
+        viewport = (x0, y0, x0 + self.canvas.winfo_width(), y0 + self.canvas.winfo_height())
+        tiles = self._render_ctrl.find_visible_tiles(
+            self._page_tops,
+            self._page_sizes,
+            self.zoom,
+            viewport,
+            margin=self._render_ctrl.tile_size // 2,
+        )
+        wanted = set(tiles)
+        # tiles fora da janela saem do canvas; a PhotoImage continua no cache compartilhado
+        for tile in [t for t in self._tile_items if t not in wanted]:
+            it = self._tile_items.pop(tile)
+            self._img_refs.pop(it, None)
+            try:
+                self.canvas.delete(it)
+            except tk.TclError as exc:
+                logger.debug("Falha ao remover tile do canvas: %s", exc)
+
+        pending: List[TileSpec] = []
+        for tile in tiles:
+            if tile in self._tile_items:
+                continue
+            img = self._render_service.get_cached_tile(tile, self.zoom)
+            if img is not None:
+                self._show_tile_image(tile, img)
+            else:
+                pending.append(tile)
+        self._render_worker.request(pending, self.zoom, self._on_tile_rasterized)
+
+    def _on_tile_rasterized(self, tile: TileSpec, zoom: float, payload: Any) -> None:
+        """Callback (thread principal) com um tile renderizado pelo worker."""
+        if self._closing or abs(zoom - self.zoom) > 1e-9 or not self._page_bg_items:
+            return
+        if tile.page_index >= len(self._page_tops):
+            return
+        try:
+            img = self._render_service.tile_photoimage_from_payload(payload, tile=tile)
+        except tk.TclError as exc:
+            logger.debug("Falha ao converter tile da página %d: %s", tile.page_index, exc)
+            return
+        self._render_service.store_tile(tile, zoom, img)
+        if tile not in self._tile_items:
+            self._show_tile_image(tile, img)
+
+    def _show_tile_image(self, tile: TileSpec, img: tk.PhotoImage) -> None:
+        top = self._page_tops[tile.page_index]
+        try:
+            it = self.canvas.create_image(GAP + tile.x0, top + tile.y0, anchor="nw", image=img)
+        except tk.TclError as exc:
+            logger.debug("Falha ao exibir tile da página %d: %s", tile.page_index, exc)
+            return
+        self._tile_items[tile] = it
+        self._img_refs[it] = img  # manter referência viva
+
+    def _clear_tiles(self) -> None:
+        for it in [*self._tile_items.values(), *self._page_bg_items]:
+            self._img_refs.pop(it, None)
+            try:
+                self.canvas.delete(it)
+            except tk.TclError as exc:
+                logger.debug("Falha ao remover tile do canvas: %s", exc)
+        self._tile_items.clear()
+        self._page_bg_items.clear()
+
+    def _rasterize_page_in_worker(self, index: Any, zoom: float) -> Any:
+        """Executado no worker: rasteriza (página inteira ou tile) sem tocar no Tk."""
+        if isinstance(index, TileSpec):
+            return self._render_service.prepare_tile_image(
+                tile=index,
+                zoom=zoom,
+                pdf_controller=self._controller,
+            )
+        return self._render_service.prepare_page_image(
+            page_index=index,
+            zoom=zoom,
             pdf_controller=self._controller,
         )
+
+    def _on_page_rasterized(self, index: int, zoom: float, payload: Any) -> None:
+        """Callback (thread principal) com o resultado do worker."""
+        if self._closing or abs(zoom - self.zoom) > 1e-9 or index >= len(self._items):
+            return
+        try:
+            img = self._render_service.photoimage_from_payload(
+                payload,
+                page_index=index,
+                zoom=zoom,
+                page_sizes=self._page_sizes,
+            )
+        except tk.TclError as exc:
+            logger.debug("Falha ao converter página %d renderizada em background: %s", index, exc)
+            return
+        self._render_service.store_photoimage(index, zoom, img)
+        self._show_page_image(index, img)
+
+    def _show_page_image(self, i: int, img: tk.PhotoImage) -> None:
         it = self._items[i]
-        # posiciona pela esquerda com GAP
-        self.canvas.itemconfig(it, image=img)
+        try:
+            self.canvas.itemconfig(it, image=img)
+        except tk.TclError as exc:
+            logger.debug("Falha ao exibir página %d no canvas: %s", i, exc)
+            return
         self._img_refs[it] = img  # manter referência viva
 
     def _render_page_image(self, index: int, zoom: float) -> tk.PhotoImage:
@@ -657,11 +795,33 @@ class PdfViewerWin(ctk.CTkToplevel):
             self._pane_right_added = False
 
     def _populate_ocr_text(self) -> None:
+        self._ocr_loaded = True
+        controller = self._controller
+        if controller is None:
+            self._fill_text_panel(["Texto indisponível (PyMuPDF não detectado)."])
+            return
+        if controller.text_loaded:
+            self._fill_text_panel(controller.text_buffer)
+            return
+        # Extração página a página em background; a UI segue responsiva
+        self.text_panel.set_text("Extraindo texto do documento...")
+        started = self._render_worker.run_task(
+            lambda: controller.text_buffer,
+            lambda buf: self._on_text_extracted(controller, buf),
+        )
+        if not started:
+            self._ocr_loaded = False
+
+    def _on_text_extracted(self, controller: PdfPreviewController, buf: Optional[List[str]]) -> None:
+        if self._closing or controller is not self._controller:
+            return
+        self._fill_text_panel(buf or ["Texto indisponível."])
+
+    def _fill_text_panel(self, text_buffer: List[str]) -> None:
         sep = "\n" + ("\u2014" * 40) + "\n"
-        # _text_buffer j? foi normalizado para List[str] em _load_pdf
-        text_buffer_str: List[str] = cast(List[str], self._text_buffer)
+        # text_buffer já é List[str] (normalizado no PdfRasterService)
+        text_buffer_str: List[str] = cast(List[str], text_buffer)
         self.text_panel.set_text(sep.join(text_buffer_str))
-        self._ocr_loaded = True
 
     def _on_search_next(self, _query: str) -> None:
         return None
@@ -715,6 +875,8 @@ class PdfViewerWin(ctk.CTkToplevel):
             return
         self._closing = True
         try:
+            self._render_worker.shutdown()
+            self._render_service.clear_cache()
             if self._controller is not None:
                 self._controller.close()
         finally:
@@ -729,6 +891,7 @@ class PdfViewerWin(ctk.CTkToplevel):
         # Only run once for the window itself
         if event is not None and event.widget is not self:
             return
+        self._render_worker.shutdown()
         try:
             self.unbind("<MouseWheel>")
             self.unbind("<Control-MouseWheel>")
@@ -171,7 +171,9 @@ def populate_ocr_text(viewer: PdfViewerWin) -> None:
         return
 
     try:
-        text_buffer = getattr(viewer, "_text_buffer", [])
+        controller = getattr(viewer, "_controller", None)
+        # Extraído sob demanda pelo controller na primeira leitura
+        text_buffer = controller.text_buffer if controller is not None else []
         if not text_buffer:
             viewer.text_panel.set_text("Nenhum texto disponível.")
             viewer._ocr_loaded = True
@@ -7,6 +7,7 @@ Hierarquia:
     UploadError (base)
     ├── UploadValidationError (arquivo inválido antes do upload)
     ├── UploadNetworkError (falha de conexão/timeout)
+    ├── UploadCancelledError (lote cancelado antes de enviar o arquivo)
     └── UploadServerError (5xx, servidor fora, RLS bloqueou)
         └── UploadDuplicateError (409 / 400 "already exists" — arquivo já existe)
 
@@ -70,6 +71,16 @@ class UploadNetworkError(UploadError):
     pass
 
 
+class UploadCancelledError(UploadError):
+    """Arquivo não enviado porque o usuário cancelou o lote.
+
+    Reportado em failures para os arquivos que ainda não tinham começado;
+    os que já estavam em envio terminam normalmente.
+    """
+
+    pass
+
+
 class UploadServerError(UploadError):
     """Erro do servidor durante upload.
 
@@ -104,6 +115,7 @@ ERROR_MESSAGES = {
     "server": "Erro temporário no servidor. Tente novamente em alguns minutos.",
     "permission": "Sem permissão para enviar arquivos. Contate o administrador.",
     "duplicate": "Arquivo já existe no destino; upload ignorado.",
+    "cancelled": "Envio cancelado pelo usuário.",
     "unknown": "Ocorreu um erro inesperado ao enviar o arquivo.",
 }
 
@@ -179,6 +191,7 @@ __all__ = [
     "UploadValidationError",
     "UploadNetworkError",
     "UploadServerError",
+    "UploadCancelledError",
     "UploadDuplicateError",
     "ERROR_MESSAGES",
     "make_validation_error",
@@ -0,0 +1,74 @@
+"""Cache em disco de SHA-256 de arquivos locais para uploads de pasta.
+
+Recalcular o SHA-256 de uma pasta inteira a cada envio lê todos os bytes do
+disco. Aqui o hash fica guardado por (caminho, tamanho, mtime): enquanto o
+arquivo não muda, o hash vem do cache; qualquer alteração de tamanho ou
+mtime gera uma chave nova e o arquivo é relido.
+
+O cache usa ``JsonCacheStore`` (em memória, gravado em lote) em
+``<dados>/runtime/upload_hashes.json``; em modo cloud-only essa base já é
+redirecionada para a área temporária do sistema.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable
+
+from src.config.paths import DB_DIR
+from src.infra.cache_store import JsonCacheStore
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FileHashCache", "UPLOAD_HASH_CACHE_PATH", "get_hash_cache"]
+
+UPLOAD_HASH_CACHE_PATH: Path = DB_DIR.parent / "runtime" / "upload_hashes.json"
+# Validade de cada hash: um arquivo inalterado é relido no máximo uma vez nesse período
+_HASH_TTL_HOURS = 24 * 30
+
+
+class FileHashCache:
+    """Memoriza ``hash_func(path)`` por caminho + tamanho + mtime."""
+
+    def __init__(self, store: JsonCacheStore, hash_func: Callable[[Path | str], str]) -> None:
+        self._store = store
+        self._hash_func = hash_func
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        stat = path.stat()
+        return f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def sha256(self, path: Path | str) -> str:
+        file_path = Path(path)
+        key = self._key(file_path)
+        cached = self._store.get(key)
+        if isinstance(cached, str) and cached:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        value = self._hash_func(file_path)
+        # Arquivo alterado durante a leitura: não guarda um hash que não casa com a chave
+        if self._key(file_path) == key:
+            self._store.set(key, value)
+        return value
+
+    __call__ = sha256
+
+
+_shared: FileHashCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_hash_cache(hash_func: Callable[[Path | str], str]) -> FileHashCache:
+    """Cache compartilhado do processo (criado no primeiro uso)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            store = JsonCacheStore(str(UPLOAD_HASH_CACHE_PATH), ttl_hours=_HASH_TTL_HOURS)
+            _shared = FileHashCache(store, hash_func)
+        return _shared
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Cache de listagens do Storage para o navegador de arquivos.
+
+Cada entrada guarda a listagem completa de um nível ``(bucket, prefixo)``
+por ``LISTING_CACHE_TTL_S`` segundos. Ir e voltar entre pastas, expandir de
+novo uma subpasta ou reabrir a janela do mesmo cliente dentro do TTL não
+refaz chamadas ``list``.
+
+- Invalidação explícita: uploads e exclusões (da janela, dos envios de
+  arquivos do cliente e da exclusão definitiva de clientes) chamam
+  ``invalidate`` (prefixo, pai e, se pedido, toda a subárvore).
+- Carga única por chave: se uma pré-busca em segundo plano já está
+  listando um prefixo, quem expandir a pasta espera essa carga em vez de
+  disparar outra chamada.
+- Uma carga iniciada antes de uma invalidação não grava o resultado
+  (evita repor uma listagem anterior ao upload/exclusão) e deixa de ser
+  compartilhada: quem pedir o prefixo depois dispara uma carga nova.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.config.environment import env_int
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "LISTING_CACHE_TTL_S",
+    "ListingCacheStats",
+    "StorageListingCache",
+    "get_listing_cache",
+]
+
+# Validade (s) de uma listagem em cache
+LISTING_CACHE_TTL_S: int = max(0, env_int("RC_BROWSER_LIST_TTL_S", 30))
+_MAX_ENTRIES = 512
+
+_Key = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ListingCacheStats:
+    """Contadores do cache de listagens (snapshot)."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _norm(prefix: str) -> str:
+    return (prefix or "").strip("/")
+
+
+class StorageListingCache:
+    """Listagens por ``(bucket, prefixo)`` com TTL, LRU e carga única por chave."""
+
+    def __init__(
+        self,
+        ttl_s: float = LISTING_CACHE_TTL_S,
+        *,
+        max_entries: int = _MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_s = max(0.0, float(ttl_s))
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # chave -> (expira_em, itens); ordem = LRU
+        self._entries: OrderedDict[_Key, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._loading: dict[_Key, Future[list[dict[str, Any]]]] = {}
+        self._epoch = 0
+        # época da última invalidação de cada chave/subárvore (cargas anteriores são descartadas)
+        self._invalidated_at: dict[_Key, int] = {}
+        self._subtree_invalidated_at: dict[_Key, int] = {}
+        self._cleared_at = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, bucket: str, prefix: str) -> Optional[list[dict[str, Any]]]:
+        """Listagem em cache (cópia rasa) ou None se ausente/vencida."""
+        key = (bucket, _norm(prefix))
+        with self._lock:
+            items = self._get_locked(key)
+            if items is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return list(items)
+
+    def _get_locked(self, key: _Key) -> Optional[list[dict[str, Any]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, bucket: str, prefix: str, items: list[dict[str, Any]], *, token: Optional[int] = None) -> bool:
+        """Grava a listagem; ignorada se a chave foi invalidada depois de ``token``.
+
+        Returns:
+            True se a listagem foi gravada.
+        """
+        if self.ttl_s <= 0:
+            return False
+        key = (bucket, _norm(prefix))
+        with self._lock:
+            if token is not None and self._invalidated_since_locked(key, token):
+                return False
+            self._entries[key] = (self._clock() + self.ttl_s, list(items))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def _invalidated_since_locked(self, key: _Key, token: int) -> bool:
+        if self._cleared_at >= token or self._invalidated_at.get(key, -1) >= token:
+            return True
+        bucket, prefix = key
+        return any(
+            epoch >= token and b == bucket and (prefix == base or prefix.startswith(base + "/"))
+            for (b, base), epoch in self._subtree_invalidated_at.items()
+        )
+
+    def token(self) -> int:
+        """Marca o início de uma carga (passar para ``put``)."""
+        with self._lock:
+            self._epoch += 1
+            return self._epoch
+
+    def get_or_load(self, bucket: str, prefix: str, loader: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Devolve a listagem do cache ou carrega com ``loader`` (uma carga por chave)."""
+        key = (bucket, _norm(prefix))
+        with self._lock:
+            items = self._get_locked(key)
+            if items is not None:
+                self._hits += 1
+                return list(items)
+            self._misses += 1
+            pending = self._loading.get(key)
+            if pending is None:
+                owner = True
+                pending = Future()
+                self._loading[key] = pending
+                self._epoch += 1
+                token = self._epoch
+            else:
+                owner = False
+        if not owner:
+            return list(pending.result())
+
+        try:
+            loaded = list(loader())
+        except BaseException as exc:
+            self._finish_loading(key, pending)
+            pending.set_exception(exc)
+            raise
+        self.put(bucket, key[1], loaded, token=token)
+        self._finish_loading(key, pending)
+        pending.set_result(loaded)
+        return list(loaded)
+
+    def _finish_loading(self, key: _Key, pending: Future) -> None:
+        with self._lock:
+            # Após uma invalidação a chave pode já ter outra carga em andamento
+            if self._loading.get(key) is pending:
+                del self._loading[key]
+
+    def invalidate(self, bucket: str, prefix: str, *, recursive: bool = False) -> None:
+        """Descarta a listagem de ``prefix`` e do pai (e da subárvore, se ``recursive``)."""
+        base = _norm(prefix)
+        parent = base.rsplit("/", 1)[0] if "/" in base else ""
+        targets = {(bucket, base), (bucket, parent)}
+        with self._lock:
+            self._epoch += 1
+            if recursive:
+                inside = base + "/"
+                for known in (self._entries, self._loading):
+                    targets.update(k for k in known if k[0] == bucket and k[1].startswith(inside))
+                self._subtree_invalidated_at[(bucket, base)] = self._epoch
+            for key in targets:
+                self._entries.pop(key, None)
+                # Carga anterior à invalidação: quem chegar depois começa outra
+                self._loading.pop(key, None)
+                self._invalidated_at[key] = self._epoch
+            self._invalidations += 1
+        logger.debug("listing_cache.invalidate: bucket=%s, prefix=%s, recursive=%s", bucket, base, recursive)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._cleared_at = self._epoch
+            self._entries.clear()
+            self._loading.clear()
+            self._invalidated_at.clear()
+            self._subtree_invalidated_at.clear()
+
+    def stats(self) -> ListingCacheStats:
+        with self._lock:
+            return ListingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+            )
+
+
+_shared: Optional[StorageListingCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_listing_cache() -> StorageListingCache:
+    """Cache compartilhado do processo (criado no primeiro uso)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = StorageListingCache()
+        return _shared
@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import mimetypes
 import os
+import threading
 from pathlib import Path
 from typing import Any, Callable, Sequence, Tuple, TypeVar, cast
+from urllib.parse import urlparse
 
 from src.adapters.storage.api import list_files as _storage_list_files, upload_file as _storage_upload_file
 from src.adapters.storage.supabase_storage import SupabaseStorageAdapter
 from src.infra.db_schemas import MEMBERSHIPS_SELECT_ORG_ID
 from src.infra.supabase_client import exec_postgrest, supabase
-from src.modules.uploads.exceptions import UploadDuplicateError
+from src.modules.uploads.exceptions import ERROR_MESSAGES, UploadCancelledError, UploadDuplicateError
 from src.modules.uploads.upload_retry import (
     DEFAULT_MAX_RETRIES,
     upload_with_retry,
     classify_upload_exception,
 )
+from src.modules.uploads.upload_scheduler import (
+    UPLOAD_MAX_WORKERS,
+    UploadJob,
+    UploadProgress,
+    host_budget,
+    run_upload_jobs,
+)
 
 _TUploadItem = TypeVar("_TUploadItem")
 logger = logging.getLogger(__name__)
@@ -72,6 +82,66 @@ def ensure_storage_object_absent(path_key: str) -> None:
             raise RuntimeError(f"Arquivo ja existente no storage: {path_key}")
 
 
+def list_storage_names(folder_prefix: str) -> set[str]:
+    """Return the names of the objects directly under ``folder_prefix`` (one list call)."""
+
+    names: set[str] = set()
+    for item in _storage_list_files(folder_prefix):
+        if isinstance(item, dict):
+            name = item.get("name")
+            if name:
+                names.add(str(name))
+        elif isinstance(item, str):
+            names.add(item.strip("/").rpartition("/")[2])
+    return names
+
+
+# storage_path por query .in_(): paths longos, lote pequeno mantém a URL abaixo dos limites
+DOCUMENT_VERSION_PATHS_CHUNK = 40
+
+
+def fetch_document_versions_by_path(storage_paths: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Return ``{storage_path: {id, document_id, storage_path, sha256, size_bytes}}`` for stored documents.
+
+    ``storage_path`` é o caminho original do arquivo; o valor é a versão mais
+    recente do documento registrado nesse caminho (versões posteriores ficam
+    em chaves próprias, ver ``upload_folder_to_supabase``). Consulta em lotes
+    de ``DOCUMENT_VERSION_PATHS_CHUNK`` caminhos: uma requisição pelos
+    caminhos e outra pelas versões dos documentos encontrados, por lote.
+    """
+
+    unique = list(dict.fromkeys(p for p in storage_paths if p))
+    found: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(unique), DOCUMENT_VERSION_PATHS_CHUNK):
+        batch = unique[start : start + DOCUMENT_VERSION_PATHS_CHUNK]
+        response = exec_postgrest(
+            supabase.table("document_versions")
+            .select("id,document_id,storage_path,sha256,size_bytes")
+            .in_("storage_path", batch)
+            .order("id")
+        )
+        doc_by_path: dict[str, Any] = {}
+        for row in getattr(response, "data", None) or []:
+            path = row.get("storage_path")
+            if path:
+                found[str(path)] = row
+                doc_by_path[str(path)] = row.get("document_id")
+        doc_ids = list(dict.fromkeys(d for d in doc_by_path.values() if d is not None))
+        if not doc_ids:
+            continue
+        response = exec_postgrest(
+            supabase.table("document_versions")
+            .select("id,document_id,storage_path,sha256,size_bytes")
+            .in_("document_id", doc_ids)
+            .order("id")
+        )
+        latest = {row.get("document_id"): row for row in getattr(response, "data", None) or []}
+        for path, doc_id in doc_by_path.items():
+            if doc_id in latest:
+                found[path] = latest[doc_id]
+    return found
+
+
 def upload_local_file(local_path: Path | str, storage_path: str, mime_type: str) -> None:
     """Upload a file to Supabase storage."""
 
@@ -159,6 +229,58 @@ def build_storage_adapter(
     )
 
 
+def _storage_host(adapter: Any) -> str:
+    """Host do Storage usado pelo adapter (chave do orçamento de conexões)."""
+    client = getattr(adapter, "_client", None)
+    url = str(getattr(client, "supabase_url", "") or os.getenv("SUPABASE_URL") or "")
+    return urlparse(url).netloc or "storage"
+
+
+def _plan_upload_jobs(
+    items: Sequence[_TUploadItem],
+    cnpj_digits: str,
+    subfolder: str | None,
+    remote_path_builder: Callable[[str, str, str | None], str],
+    client_id: int | None,
+    org_id: str | None,
+) -> Tuple[list[UploadJob[_TUploadItem]], dict[int, Exception]]:
+    """Resolve destino, tamanho e MIME de cada item uma única vez, antes do envio."""
+    # build_remote_path aceita client_id/org_id como keyword-only, mas o tipo
+    # do parâmetro remote_path_builder não inclui isso. Usamos cast para chamar corretamente.
+    builder_fn = cast(Any, remote_path_builder)
+    jobs: list[UploadJob[_TUploadItem]] = []
+    errors: dict[int, Exception] = {}
+    for index, item in enumerate(items):
+        try:
+            remote_key = builder_fn(
+                cnpj_digits,
+                getattr(item, "relative_path"),
+                subfolder,
+                client_id=client_id,
+                org_id=org_id,
+            )
+            local_path = getattr(item, "path")
+        except Exception as exc:  # noqa: BLE001 - reportado como falha do item
+            errors[index] = exc
+            continue
+        try:
+            size_bytes = Path(local_path).stat().st_size
+        except Exception:
+            size_bytes = 0
+        mime_type, _ = mimetypes.guess_type(str(Path(local_path)))
+        jobs.append(
+            UploadJob(
+                index=index,
+                item=item,
+                local_path=local_path,
+                remote_key=remote_key,
+                size_bytes=size_bytes,
+                content_type=mime_type or "application/octet-stream",
+            )
+        )
+    return jobs, errors
+
+
 def upload_items_with_adapter(
     adapter: SupabaseStorageAdapter,
     items: Sequence[_TUploadItem],
@@ -169,101 +291,115 @@ def upload_items_with_adapter(
     remote_path_builder: Callable[[str, str, str | None], str],
     client_id: int | None = None,
     org_id: str | None = None,
+    max_workers: int | None = None,
+    cancel_event: threading.Event | None = None,
+    on_progress: Callable[[UploadProgress], None] | None = None,
 ) -> Tuple[int, list[Tuple[_TUploadItem, Exception]]]:
-    """Upload items using the provided adapter and collect failures."""
+    """Upload items using the provided adapter and collect failures.
+
+    Os arquivos são enviados em paralelo (``max_workers``, padrão
+    ``UPLOAD_MAX_WORKERS``), maiores primeiro, respeitando o orçamento de
+    conexões do host. ``progress_callback(item)`` é chamado ao iniciar cada
+    arquivo (se levantar exceção, o lote para de iniciar arquivos e a exceção
+    é relançada); ``on_progress`` recebe o progresso agregado (bytes, vazão,
+    ETA). Com ``cancel_event`` setado, arquivos ainda não iniciados entram em
+    failures como ``UploadCancelledError``. A ordem de failures segue ``items``.
+    """
 
-    ok = 0
-    failures: list[Tuple[_TUploadItem, Exception]] = []
-    duplicates = 0
     total = len(items)
+    jobs, plan_errors = _plan_upload_jobs(items, cnpj_digits, subfolder, remote_path_builder, client_id, org_id)
+    started = itertools.count(1)
 
-    for _i, item in enumerate(items, start=1):
+    def _on_start(job: UploadJob[_TUploadItem]) -> None:
         if progress_callback:
-            progress_callback(item)
-        try:
-            # build_remote_path aceita client_id/org_id como keyword-only, mas o tipo
-            # do parâmetro remote_path_builder não inclui isso. Usamos cast para chamar corretamente.
-            builder_fn = cast(Any, remote_path_builder)
-            remote_key = builder_fn(
-                cnpj_digits,
-                getattr(item, "relative_path"),
-                subfolder,
-                client_id=client_id,
-                org_id=org_id,
-            )
-            local_path = getattr(item, "path")
-
-            try:
-                _mb = Path(local_path).stat().st_size / (1024 * 1024)
-                _size_str = f"{_mb:.2f} MB"
-            except Exception:
-                _size_str = "? MB"
+            progress_callback(job.item)
+        logger.info(
+            "Enviando %d/%d: %s (%.2f MB) -> %s",
+            next(started),
+            total,
+            Path(job.local_path).name,
+            job.size_bytes / (1024 * 1024),
+            job.remote_key,
+        )
 
-            logger.info(
-                "Enviando %d/%d: %s (%s) -> %s",
-                _i,
-                total,
-                Path(local_path).name,
-                _size_str,
-                remote_key,
-            )
+    def _upload(job: UploadJob[_TUploadItem]) -> None:
+        # Usar upload_with_retry para lidar com erros transientes de rede/servidor
+        upload_with_retry(
+            adapter.upload_file,
+            job.local_path,
+            job.remote_key,
+            content_type=job.content_type,
+            max_retries=DEFAULT_MAX_RETRIES,
+        )
+        logger.info("Upload concluído: %s -> %s", Path(job.local_path).name, job.remote_key)
+
+    results = run_upload_jobs(
+        jobs,
+        _upload,
+        max_workers=max_workers or UPLOAD_MAX_WORKERS,
+        budget=host_budget(_storage_host(adapter)),
+        cancel_event=cancel_event,
+        on_start=_on_start,
+        on_progress=on_progress,
+    )
 
-            # Usar upload_with_retry para lidar com erros transientes de rede/servidor
-            _mime_type, _ = mimetypes.guess_type(str(Path(local_path)))
-            upload_with_retry(
-                adapter.upload_file,
-                local_path,
-                remote_key,
-                content_type=_mime_type or "application/octet-stream",
-                max_retries=DEFAULT_MAX_RETRIES,
-            )
+    ok = 0
+    duplicates = 0
+    cancelled = 0
+    failures: list[Tuple[_TUploadItem, Exception]] = []
+    remote_keys = {job.index: job.remote_key for job in jobs}
+    for index, item in enumerate(items):
+        if index in plan_errors:
+            exc: BaseException | None = plan_errors[index]
+        elif index not in results:
+            cancelled += 1
+            failures.append((item, UploadCancelledError(ERROR_MESSAGES["cancelled"])))
+            continue
+        else:
+            exc = results[index]
+        if exc is None:
             ok += 1
+            continue
+
+        remote_key = remote_keys.get(index, "N/A")
+        # Classificar exceção para tratamento apropriado
+        classified_exc = classify_upload_exception(cast(Exception, exc))
+
+        # UploadDuplicateError: arquivo já existe — SKIPPED, nunca SUCCESS
+        if isinstance(classified_exc, UploadDuplicateError):
+            duplicates += 1
+            dup_exc = UploadDuplicateError(
+                "Arquivo já existe no destino; upload ignorado.",
+                detail=classified_exc.detail,
+            )
+            failures.append((item, dup_exc))
             logger.info(
-                "Upload concluído (%d/%d): %s -> %s",
-                _i,
-                total,
-                Path(local_path).name,
+                "Upload SKIPPED (duplicate): %s -> %s (client_id=%s, org_id=%s)",
+                Path(getattr(item, "path")).name,
                 remote_key,
-            )
-
-        except Exception as exc:  # pragma: no cover - integration behavior
-            # Classificar exceção para tratamento apropriado
-            classified_exc = classify_upload_exception(exc)
-
-            # UploadDuplicateError: arquivo já existe — SKIPPED, nunca SUCCESS
-            if isinstance(classified_exc, UploadDuplicateError):
-                duplicates += 1
-                dup_exc = UploadDuplicateError(
-                    "Arquivo já existe no destino; upload ignorado.",
-                    detail=classified_exc.detail,
-                )
-                failures.append((item, dup_exc))
-                logger.info(
-                    "Upload SKIPPED (duplicate): %s -> %s (client_id=%s, org_id=%s)",
-                    Path(getattr(item, "path")).name,
-                    remote_key if "remote_key" in locals() else "N/A",
-                    client_id,
-                    org_id,
-                )
-                continue
-
-            # Outros erros: registra como falha real
-            logger.error(
-                "Upload FAILED: %s -> %s (client_id=%s, org_id=%s): %s",
-                getattr(item, "path"),
-                remote_key if "remote_key" in locals() else "N/A",
                 client_id,
                 org_id,
-                repr(classified_exc),
             )
-            failures.append((item, classified_exc))
+            continue
+
+        # Outros erros: registra como falha real
+        logger.error(
+            "Upload FAILED: %s -> %s (client_id=%s, org_id=%s): %s",
+            getattr(item, "path", "?"),
+            remote_key,
+            client_id,
+            org_id,
+            repr(classified_exc),
+        )
+        failures.append((item, classified_exc))
 
     logger.info(
-        "Lote concluído: %d/%d enviados, %d duplicados, %d falhas.",
+        "Lote concluído: %d/%d enviados, %d duplicados, %d falhas, %d cancelados.",
         ok,
         total,
         duplicates,
-        len(failures),
+        len(failures) - duplicates - cancelled,
+        cancelled,
     )
     return ok, failures
 
@@ -272,6 +408,8 @@ __all__ = [
     "current_user_id",
     "resolve_org_id",
     "ensure_storage_object_absent",
+    "list_storage_names",
+    "fetch_document_versions_by_path",
     "upload_local_file",
     "insert_document_record",
     "insert_document_version_record",
@@ -279,5 +417,6 @@ __all__ = [
     "normalize_bucket",
     "build_storage_adapter",
     "upload_items_with_adapter",
+    "UploadCancelledError",
     "UploadDuplicateError",
 ]
@@ -13,17 +13,18 @@ import os
 import shutil
 import subprocess  # nosec B404  # Uso controlado: abrir arquivos locais do app, sem shell=True
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
 
 from src.adapters.storage.api import (
     DownloadCancelledError as _DownloadCancelledError,
     delete_file as _delete_file,
     download_folder_zip as _download_folder_zip,
-    using_storage_backend,
 )
+from src.adapters.storage.listing import LIST_MAX_WORKERS, LIST_PAGE_SIZE, entry_size
 from src.adapters.storage.supabase_storage import SupabaseStorageAdapter
 from src.infra.supabase.storage_helpers import download_bytes as _download_bytes
 from src.modules.uploads.components.helpers import (
@@ -36,9 +37,13 @@ from src.modules.uploads.components.helpers import (
 )
 from src.modules.uploads.storage_browser_service import (
     download_file_service as _download_file_svc,
+    iter_storage_object_pages as _iter_storage_object_pages,
     list_storage_objects_service as _list_storage_objects_svc,
 )
+from src.modules.uploads.hash_cache import get_hash_cache
+from src.modules.uploads.listing_cache import get_listing_cache
 from src.modules.uploads.temp_files import create_temp_file
+from src.modules.uploads.upload_scheduler import UploadProgress
 
 from . import repository, validation
 
@@ -75,7 +80,23 @@ def upload_folder_to_supabase(
     client_id: int,
     *,
     subdir: str = "SIFAP",
+    incremental: bool = False,
 ) -> list[dict[str, Any]]:
+    """Envia uma pasta local para o storage do cliente e registra as versões.
+
+    Os SHA-256 ficam em cache por caminho+tamanho+mtime (``hash_cache``), e a
+    existência no storage é verificada com uma listagem por subpasta (não por
+    arquivo).
+
+    Args:
+        incremental: Pula arquivos com o mesmo SHA-256 da versão registrada e
+            envia os alterados como nova versão, em chave própria
+            (``nome.<sha256>.ext``); sem ele, um arquivo já existente no
+            storage interrompe o envio.
+
+    Returns:
+        Um dict por arquivo com ``status`` = ``uploaded``/``updated``/``skipped``.
+    """
     base = validation.ensure_existing_folder(folder)
 
     user_id = repository.current_user_id()
@@ -84,24 +105,58 @@ def upload_folder_to_supabase(
 
     org_id = repository.resolve_org_id()
     results: list[dict[str, Any]] = []
-    prepared_entries = validation.prepare_folder_entries(base, client_id, subdir, org_id, _sha256)
+    hash_cache = get_hash_cache(_sha256)
+    hits_before, misses_before = hash_cache.hits, hash_cache.misses
+    prepared_entries = validation.prepare_folder_entries(base, client_id, subdir, org_id, hash_cache)
+
+    stored_versions: dict[str, dict[str, Any]] = {}
+    if incremental:
+        stored_versions = repository.fetch_document_versions_by_path([e.storage_path for e in prepared_entries])
+    folder_names: dict[str, set[str]] = {}
 
     for entry in prepared_entries:
-        logger.info("Upload Storage: original=%r -> key=%s", entry.relative_path, entry.storage_path)
-        repository.ensure_storage_object_absent(entry.storage_path)
-        repository.upload_local_file(entry.path, entry.storage_path, entry.mime_type)
-
-        document_row = repository.insert_document_record(
-            client_id=int(client_id),
-            title=entry.path.name,
-            mime_type=entry.mime_type,
-            user_id=user_id,
-        )
-        document_id = document_row["id"]
+        stored = stored_versions.get(entry.storage_path)
+        if stored is not None and stored.get("sha256") == entry.sha256:
+            results.append(
+                _folder_upload_result(
+                    entry, "skipped", stored.get("document_id"), stored.get("id"), stored.get("storage_path")
+                )
+            )
+            continue
+
+        if stored is None:
+            # Uma listagem por subpasta do storage (em vez de uma por arquivo)
+            folder_prefix, _, filename = entry.storage_path.rpartition("/")
+            names = folder_names.get(folder_prefix)
+            if names is None:
+                names = folder_names[folder_prefix] = repository.list_storage_names(folder_prefix)
+            if filename in names:
+                raise RuntimeError(f"Arquivo ja existente no storage: {entry.storage_path}")
+
+        storage_path = entry.storage_path
+        if stored is not None:
+            # Conteúdo alterado: nova versão do mesmo documento, em chave própria
+            # (o objeto da versão anterior continua intacto)
+            storage_path = _versioned_storage_path(entry.storage_path, entry.sha256)
+        logger.info("Upload Storage: original=%r -> key=%s", entry.relative_path, storage_path)
+        repository.upload_local_file(entry.path, storage_path, entry.mime_type)
+
+        if stored is not None:
+            document_id = stored["document_id"]
+            status = "updated"
+        else:
+            document_row = repository.insert_document_record(
+                client_id=int(client_id),
+                title=entry.path.name,
+                mime_type=entry.mime_type,
+                user_id=user_id,
+            )
+            document_id = document_row["id"]
+            status = "uploaded"
 
         version_row = repository.insert_document_version_record(
             document_id=document_id,
-            storage_path=entry.storage_path,
+            storage_path=storage_path,
             size_bytes=entry.size_bytes,
             sha_value=entry.sha256,
             uploaded_by=user_id,
@@ -109,22 +164,50 @@ def upload_folder_to_supabase(
         version_id = version_row["id"]
 
         repository.update_document_current_version(document_id, version_id)
+        results.append(_folder_upload_result(entry, status, document_id, version_id, storage_path))
 
-        results.append(
-            {
-                "relative_path": entry.safe_relative_path,
-                "storage_path": entry.storage_path,
-                "document_id": document_id,
-                "version_id": version_id,
-                "size_bytes": entry.size_bytes,
-                "sha256": entry.sha256,
-                "mime": entry.mime_type,
-            }
-        )
-
+    skipped = sum(1 for r in results if r["status"] == "skipped")
+    cached = hash_cache.hits - hits_before
+    logger.info(
+        "Upload de pasta concluído: %d arquivo(s), %d enviado(s), %d pulado(s) sem alteração (hash cache: %d/%d)",
+        len(results),
+        len(results) - skipped,
+        skipped,
+        cached,
+        cached + hash_cache.misses - misses_before,
+    )
     return results
 
 
+def _versioned_storage_path(storage_path: str, sha256: str) -> str:
+    """Chave de uma nova versão: ``pasta/nome.<sha256[:12]>.ext``.
+
+    Derivada do conteúdo, então reenviar os mesmos bytes reutiliza a chave e
+    nunca sobrescreve o objeto de outra versão.
+    """
+    folder, sep, filename = storage_path.rpartition("/")
+    stem, dot, ext = filename.rpartition(".")
+    if not dot or not stem:
+        stem, ext = filename, ""
+    versioned = f"{stem}.{sha256[:12]}" + (f".{ext}" if ext else "")
+    return f"{folder}{sep}{versioned}"
+
+
+def _folder_upload_result(
+    entry: Any, status: str, document_id: Any, version_id: Any, storage_path: str | None = None
+) -> dict[str, Any]:
+    return {
+        "relative_path": entry.safe_relative_path,
+        "storage_path": storage_path or entry.storage_path,
+        "document_id": document_id,
+        "version_id": version_id,
+        "size_bytes": entry.size_bytes,
+        "sha256": entry.sha256,
+        "mime": entry.mime_type,
+        "status": status,
+    }
+
+
 def collect_files_from_folder(dirpath: str) -> list[UploadItem]:
     """Coleta todos os arquivos permitidos de uma pasta recursivamente."""
     return validation.collect_pdf_items_from_folder(dirpath, _make_upload_item)
@@ -150,6 +233,9 @@ def upload_items_for_client(
     client_id: int | None = None,
     org_id: str | None = None,
     overwrite: bool = False,
+    max_workers: int | None = None,
+    cancel_event: threading.Event | None = None,
+    on_progress: Optional[Callable[[UploadProgress], None]] = None,
 ) -> Tuple[int, list[Tuple[UploadItem, Exception]]]:
     """Faz upload de itens para o storage do cliente.
 
@@ -157,6 +243,11 @@ def upload_items_for_client(
         overwrite: Se True, sobrescreve arquivos existentes (upsert).  Padrão
             False: arquivos duplicados são ignorados e reportados como
             UploadDuplicateError em failures, nunca contados como sucesso.
+        max_workers: Uploads simultâneos do lote (padrão ``RC_UPLOAD_WORKERS``).
+        cancel_event: Cancelamento cooperativo; arquivos não iniciados voltam
+            em failures como UploadCancelledError.
+        on_progress: Recebe ``UploadProgress`` (bytes, vazão, ETA) a cada
+            arquivo concluído; chamado a partir das threads de upload.
     """
     # Fallback: se client_id conhecido mas org_id não foi resolvido, buscar agora
     if client_id is not None and not org_id:
@@ -166,21 +257,30 @@ def upload_items_for_client(
         except Exception as exc:  # noqa: BLE001
             logger.warning("upload_items_for_client: não foi possível resolver org_id: %s", exc)
 
+    bucket_name = repository.normalize_bucket(bucket)
     adapter = repository.build_storage_adapter(
-        bucket=repository.normalize_bucket(bucket),
+        bucket=bucket_name,
         supabase_client=supabase_client,
         overwrite=overwrite,
     )
-    return repository.upload_items_with_adapter(
-        adapter,
-        items,
-        cnpj_digits,
-        subfolder,
-        progress_callback=progress_callback,
-        remote_path_builder=validation.build_remote_path,
-        client_id=client_id,
-        org_id=org_id,
-    )
+    try:
+        return repository.upload_items_with_adapter(
+            adapter,
+            items,
+            cnpj_digits,
+            subfolder,
+            progress_callback=progress_callback,
+            remote_path_builder=validation.build_remote_path,
+            client_id=client_id,
+            org_id=org_id,
+            max_workers=max_workers,
+            cancel_event=cancel_event,
+            on_progress=on_progress,
+        )
+    finally:
+        # Mesmo com falha parcial alguns arquivos podem ter subido
+        root = client_prefix_for_id(client_id, org_id) if client_id is not None and org_id else cnpj_digits
+        get_listing_cache().invalidate(bucket_name, root, recursive=True)
 
 
 def download_folder_zip(*args: Any, **kwargs: Any) -> Any:
@@ -226,6 +326,35 @@ def list_browser_items(prefix: str, *, bucket: str | None = None) -> list[Any]:
     return list_storage_objects(bn, normalized_prefix)
 
 
+def iter_browser_pages(
+    prefix: str, *, bucket: str | None = None, page_size: int = LIST_PAGE_SIZE
+) -> Iterator[list[Any]]:
+    """
+    Lista objetos para o navegador página a página (pastas com mais de 1000 itens).
+
+    Cada página é entregue assim que chega do Storage; o navegador desenha a
+    primeira imediatamente e acrescenta as seguintes.
+    """
+    bn = (bucket or get_clients_bucket()).strip()
+    normalized_prefix = (prefix or "").strip("/")
+    return _iter_storage_object_pages(bn, normalized_prefix, page_size=page_size)
+
+
+def walk_storage_folder(
+    prefix: str, *, bucket: str | None = None, max_workers: int = LIST_MAX_WORKERS
+) -> Iterator[dict[str, Any]]:
+    """
+    Gera todos os arquivos sob ``prefix`` (recursivo), com ``full_path`` e ``size_bytes``.
+
+    As subpastas são listadas em paralelo e os arquivos saem conforme cada
+    pasta termina de ser listada.
+    """
+    bn = (bucket or get_clients_bucket()).strip()
+    adapter = SupabaseStorageAdapter(bucket=bn)
+    for entry in adapter.walk_files((prefix or "").strip("/"), max_workers=max_workers):
+        yield {**entry, "size_bytes": entry_size(entry)}
+
+
 def download_storage_object(remote_key: str, destination: str, *, bucket: str | None = None) -> dict[str, Any]:
     """
     Baixa um objeto do storage no bucket de clientes.
@@ -266,30 +395,19 @@ def delete_storage_object(remote_key: str, *, bucket: str | None = None) -> bool
         return False
 
 
-def _collect_storage_keys(bucket: str, prefix: str) -> list[str]:
-    entries = list_storage_objects(bucket, prefix=prefix) or []
-    collected: list[str] = []
-    for entry in entries:
-        full_path = (entry.get("full_path") or "").strip("/")
-        if not full_path:
-            continue
-        if entry.get("is_folder"):
-            collected.extend(_collect_storage_keys(bucket, full_path))
-        else:
-            collected.append(full_path)
-    return collected
-
-
 def delete_storage_folder(prefix: str, *, bucket: str | None = None) -> dict[str, Any]:
     """
     Remove recursivamente todos os arquivos dentro de um prefixo (pasta) no bucket.
 
+    A árvore é listada em paralelo e os arquivos são removidos em lotes de até
+    1000 chaves (``SupabaseStorageAdapter.delete_prefix``).
+
     Retorna dict com:
-        {"ok": bool, "deleted": int, "errors": list[str], "message": str}
+        {"ok": bool, "deleted": int, "errors": list[str], "remaining": list[str], "message": str}
     """
     bn = (bucket or get_clients_bucket()).strip()
     target_prefix = (prefix or "").strip("/")
-    result: dict[str, Any] = {"ok": False, "deleted": 0, "errors": [], "message": ""}
+    result: dict[str, Any] = {"ok": False, "deleted": 0, "errors": [], "remaining": [], "message": ""}
 
     if not target_prefix:
         result["errors"].append("prefix vazio")
@@ -298,52 +416,36 @@ def delete_storage_folder(prefix: str, *, bucket: str | None = None) -> dict[str
         return result
 
     try:
-        keys = _collect_storage_keys(bn, target_prefix)
-    except Exception as exc:  # pragma: no cover - log e propaga erro tratado
-        logger.error("Erro ao coletar objetos para exclusão recursiva: %s", exc, exc_info=True)
-        result["errors"].append(str(exc))
-        result["message"] = f"Erro ao listar objetos sob {target_prefix}"
-        return result
-
-    adapter = SupabaseStorageAdapter(bucket=bn)
-    deleted_count = 0
-
-    try:
-        with using_storage_backend(adapter):
-            for key in keys:
-                try:
-                    if _delete_file(key):
-                        deleted_count += 1
-                    else:
-                        result["errors"].append(f"Falha ao excluir {key}")
-                except Exception as exc:  # noqa: BLE001
-                    result["errors"].append(f"{key}: {exc}")
-
-        result["deleted"] = deleted_count
-        result["ok"] = not result["errors"]
-        result["message"] = (
-            f"Removidos {deleted_count} arquivo(s) de {target_prefix}"
-            if result["ok"]
-            else "Falha ao excluir alguns arquivos da pasta"
-        )
-
-        if result["ok"]:
-            logger.info("Pasta excluída: %s (bucket=%s, %d arquivos)", target_prefix, bn, deleted_count)
-        else:
-            logger.warning(
-                "Exclusão parcial da pasta %s (bucket=%s). Removidos=%d Erros=%d",
-                target_prefix,
-                bn,
-                deleted_count,
-                len(result["errors"]),
-            )
-        return result
+        report = SupabaseStorageAdapter(bucket=bn).delete_prefix(target_prefix)
     except Exception as exc:  # pragma: no cover - log de falha inesperada
         logger.error("Erro ao excluir pasta %s no bucket %s: %s", target_prefix, bn, exc, exc_info=True)
         result["errors"].append(str(exc))
         result["message"] = f"Erro ao excluir pasta: {exc}"
         return result
 
+    result["deleted"] = report.deleted
+    result["errors"] = report.error_messages()
+    result["remaining"] = report.remaining
+    result["ok"] = report.ok
+    if report.ok:
+        result["message"] = f"Removidos {report.deleted} arquivo(s) de {target_prefix}"
+        logger.info("Pasta excluída: %s (bucket=%s, %d arquivos)", target_prefix, bn, report.deleted)
+    else:
+        result["message"] = (
+            f"Falha ao excluir alguns arquivos da pasta: {len(report.remaining)} arquivo(s) não removidos"
+            if report.remaining
+            else f"Erro ao listar objetos sob {target_prefix}"
+        )
+        logger.warning(
+            "Exclusão parcial da pasta %s (bucket=%s). Removidos=%d Restantes=%d Erros=%d",
+            target_prefix,
+            bn,
+            report.deleted,
+            len(report.remaining),
+            len(result["errors"]),
+        )
+    return result
+
 
 def download_and_open_file(remote_key: str, *, bucket: str | None = None, mode: str = "external") -> dict[str, Any]:
     """
@@ -493,6 +595,8 @@ __all__ = [
     "download_file",
     "list_storage_objects",
     "list_browser_items",
+    "iter_browser_pages",
+    "walk_storage_folder",
     "delete_storage_object",
     "download_and_open_file",
     "download_storage_object",
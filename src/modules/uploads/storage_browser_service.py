@@ -10,17 +10,59 @@ Este módulo centraliza a lógica de negócio (não-UI) para:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from src.adapters.storage.api import download_file as storage_download_file
 from src.adapters.storage.api import list_files as storage_list_files
 from src.adapters.storage.api import using_storage_backend
+from src.adapters.storage.listing import LIST_PAGE_SIZE, entry_size
 from src.adapters.storage.supabase_storage import SupabaseStorageAdapter
 from src.utils.storage_utils import get_bucket_name
 
 log = logging.getLogger(__name__)
 
 
+def _normalize_target(bucket_name: str | None, prefix: str | None) -> tuple[str, str]:
+    provided_bucket = (bucket_name or "").strip()
+    normalized_prefix = (prefix or "").strip("/")
+
+    # Chamadas legadas frequentemente enviam apenas o prefixo como primeiro argumento.
+    if provided_bucket and not normalized_prefix and "/" in provided_bucket:
+        normalized_prefix = provided_bucket
+        provided_bucket = ""
+
+    return get_bucket_name(provided_bucket), normalized_prefix
+
+
+def _to_browser_object(obj: dict[str, Any], normalized_prefix: str) -> dict[str, Any]:
+    is_folder = obj.get("metadata") is None
+    name = obj.get("name")
+    full_path = obj.get("full_path") or (f"{normalized_prefix}/{name}".strip("/") if normalized_prefix else name)
+    return {
+        "name": name,
+        "is_folder": is_folder,
+        "full_path": full_path,
+        "size_bytes": 0 if is_folder else entry_size(obj),
+    }
+
+
+def iter_storage_object_pages(
+    bucket_name: str | None,
+    prefix: str = "",
+    *,
+    page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[list[Dict[str, Any]]]:
+    """Gera os objetos de um nível do Storage página a página, conforme chegam.
+
+    Mesmo formato de ``list_storage_objects_service`` (``objects``), mas sem
+    esperar a listagem inteira; erros de rede propagam para o chamador.
+    """
+    bucket, normalized_prefix = _normalize_target(bucket_name, prefix)
+    adapter = SupabaseStorageAdapter(bucket=bucket)
+    for page in adapter.iter_file_pages(normalized_prefix, page_size=page_size):
+        yield [_to_browser_object(obj, normalized_prefix) for obj in page if isinstance(obj, dict)]
+
+
 def list_storage_objects_service(ctx: Dict[str, Any]) -> Dict[str, Any]:
     """
     Lista arquivos do Storage para um determinado cliente/prefixo.
@@ -62,15 +104,7 @@ def list_storage_objects_service(ctx: Dict[str, Any]) -> Dict[str, Any]:
         bucket_name = ctx.get("bucket_name")
         prefix = ctx.get("prefix", "")
 
-        provided_bucket = (bucket_name or "").strip()
-        normalized_prefix = (prefix or "").strip("/")
-
-        # Chamadas legadas frequentemente enviam apenas o prefixo como primeiro argumento.
-        if provided_bucket and not normalized_prefix and "/" in provided_bucket:
-            normalized_prefix = provided_bucket
-            provided_bucket = ""
-
-        bucket = get_bucket_name(provided_bucket)
+        bucket, normalized_prefix = _normalize_target(bucket_name, prefix)
 
         log.info("Service: Listando arquivos no bucket=%s prefix=%s", bucket, normalized_prefix)
 
@@ -80,15 +114,7 @@ def list_storage_objects_service(ctx: Dict[str, Any]) -> Dict[str, Any]:
             response = list(storage_list_files(normalized_prefix))
 
         # 3. Processar resposta e montar lista de objetos
-        objects = []
-        for obj in response:
-            if isinstance(obj, dict):
-                is_folder = obj.get("metadata") is None
-                name = obj.get("name")
-                full_path = obj.get("full_path") or (
-                    f"{normalized_prefix}/{name}".strip("/") if normalized_prefix else name
-                )
-                objects.append({"name": name, "is_folder": is_folder, "full_path": full_path})
+        objects = [_to_browser_object(obj, normalized_prefix) for obj in response if isinstance(obj, dict)]
 
         result["ok"] = True
         result["objects"] = objects
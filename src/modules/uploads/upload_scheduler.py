@@ -0,0 +1,213 @@
+"""Agendador de uploads paralelos com orçamento de conexões por host.
+
+Usado por ``repository.upload_items_with_adapter``: em vez de enviar um
+arquivo por vez (tempo total = soma dos round-trips), os arquivos de um lote
+são distribuídos entre ``max_workers`` threads.
+
+- Ordem por tamanho: os maiores começam primeiro, para que o lote não termine
+  esperando um arquivo grande iniciado por último.
+- Orçamento por host: um semáforo compartilhado por host do Storage limita as
+  conexões simultâneas mesmo com vários lotes rodando ao mesmo tempo.
+- Cancelamento cooperativo: ao setar ``cancel_event`` (ou se o callback de
+  início levantar exceção), nenhum arquivo novo é iniciado; os que já estão
+  em envio terminam normalmente.
+- Progresso agregado: ``UploadProgress`` com arquivos/bytes concluídos,
+  vazão e ETA, emitido a cada arquivo finalizado.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
+
+from src.config.environment import env_int
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "UPLOAD_MAX_WORKERS",
+    "UploadJob",
+    "UploadProgress",
+    "UploadProgressTracker",
+    "host_budget",
+    "run_upload_jobs",
+]
+
+_T = TypeVar("_T")
+
+# Uploads simultâneos por host do Storage (também o padrão de workers por lote)
+UPLOAD_MAX_WORKERS: int = max(1, env_int("RC_UPLOAD_WORKERS", 4))
+
+_budgets: dict[str, threading.BoundedSemaphore] = {}
+_budgets_lock = threading.Lock()
+
+
+def host_budget(host: str) -> threading.BoundedSemaphore:
+    """Semáforo compartilhado que limita uploads simultâneos para ``host``."""
+    key = (host or "").lower()
+    with _budgets_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = threading.BoundedSemaphore(UPLOAD_MAX_WORKERS)
+            _budgets[key] = budget
+        return budget
+
+
+@dataclass(slots=True)
+class UploadJob(Generic[_T]):
+    """Arquivo de um lote já resolvido (destino, tamanho e MIME calculados uma vez)."""
+
+    index: int
+    item: _T
+    local_path: Any
+    remote_key: str
+    size_bytes: int
+    content_type: str
+
+
+@dataclass(frozen=True)
+class UploadProgress:
+    """Snapshot do progresso agregado de um lote."""
+
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+    elapsed_s: float
+
+    @property
+    def fraction(self) -> float:
+        """Fração concluída, ponderada por bytes (por arquivos se o total for 0)."""
+        if self.bytes_total > 0:
+            return min(1.0, self.bytes_done / self.bytes_total)
+        if self.files_total > 0:
+            return min(1.0, self.files_done / self.files_total)
+        return 1.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_done / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def eta_s(self) -> float | None:
+        """Segundos restantes estimados pela vazão média (None sem amostra)."""
+        if self.files_done >= self.files_total:
+            return 0.0
+        if self.bytes_total > 0 and self.bytes_done > 0:
+            return (self.bytes_total - self.bytes_done) / self.bytes_per_second
+        if self.files_done > 0:
+            return self.elapsed_s / self.files_done * (self.files_total - self.files_done)
+        return None
+
+
+class UploadProgressTracker:
+    """Acumula o progresso de um lote de forma thread-safe."""
+
+    def __init__(self, files_total: int, bytes_total: int, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._files_total = files_total
+        self._bytes_total = bytes_total
+        self._files_done = 0
+        self._bytes_done = 0
+
+    def file_done(self, size_bytes: int) -> UploadProgress:
+        with self._lock:
+            self._files_done += 1
+            self._bytes_done += max(0, size_bytes)
+            return self._snapshot_locked()
+
+    def snapshot(self) -> UploadProgress:
+        with self._lock:
+            return self._snapshot_locked()
+
+    def _snapshot_locked(self) -> UploadProgress:
+        return UploadProgress(
+            files_done=self._files_done,
+            files_total=self._files_total,
+            bytes_done=self._bytes_done,
+            bytes_total=self._bytes_total,
+            elapsed_s=max(0.0, self._clock() - self._started),
+        )
+
+
+def run_upload_jobs(
+    jobs: Sequence[UploadJob[_T]],
+    upload_fn: Callable[[UploadJob[_T]], None],
+    *,
+    max_workers: int = UPLOAD_MAX_WORKERS,
+    budget: Optional[threading.BoundedSemaphore] = None,
+    cancel_event: Optional[threading.Event] = None,
+    on_start: Optional[Callable[[UploadJob[_T]], None]] = None,
+    on_progress: Optional[Callable[[UploadProgress], None]] = None,
+) -> dict[int, Optional[BaseException]]:
+    """Executa ``upload_fn`` para cada job, maiores primeiro, em paralelo.
+
+    Args:
+        jobs: Jobs do lote (``index`` identifica o resultado).
+        upload_fn: Envia um job; exceção = falha daquele arquivo.
+        max_workers: Threads do lote (1 = sequencial na thread atual).
+        budget: Semáforo de conexões por host adquirido em volta de cada envio.
+        cancel_event: Quando setado, jobs ainda não iniciados são pulados.
+        on_start: Chamado ao iniciar cada job; se levantar exceção, o lote
+            para de iniciar jobs e a exceção é relançada ao final.
+        on_progress: Recebe o progresso agregado após cada job concluído.
+
+    Returns:
+        ``{index: None | exceção}`` apenas dos jobs iniciados; jobs pulados
+        por cancelamento ficam de fora.
+    """
+    ordered = sorted(jobs, key=lambda job: job.size_bytes, reverse=True)
+    tracker = UploadProgressTracker(len(ordered), sum(max(0, job.size_bytes) for job in ordered))
+    results: dict[int, Optional[BaseException]] = {}
+    results_lock = threading.Lock()
+    stop = threading.Event()
+    abort: list[BaseException] = []
+
+    def _run(job: UploadJob[_T]) -> None:
+        if stop.is_set() or (cancel_event is not None and cancel_event.is_set()):
+            return
+        if on_start is not None:
+            try:
+                on_start(job)
+            except BaseException as exc:  # noqa: BLE001 - relançada por run_upload_jobs
+                stop.set()
+                with results_lock:
+                    abort.append(exc)
+                return
+        error: Optional[BaseException] = None
+        if budget is not None:
+            budget.acquire()
+        try:
+            upload_fn(job)
+        except Exception as exc:  # noqa: BLE001 - classificada pelo chamador
+            error = exc
+        finally:
+            if budget is not None:
+                budget.release()
+        with results_lock:
+            results[job.index] = error
+        snapshot = tracker.file_done(job.size_bytes)
+        if on_progress is not None:
+            try:
+                on_progress(snapshot)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Falha no callback de progresso do upload: %s", exc)
+
+    workers = max(1, min(int(max_workers), len(ordered)))
+    if workers == 1:
+        for job in ordered:
+            _run(job)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Upload") as executor:
+            for future in [executor.submit(_run, job) for job in ordered]:
+                future.result()
+
+    if abort:
+        raise abort[0]
+    return results
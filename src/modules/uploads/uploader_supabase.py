@@ -18,12 +18,14 @@ from src.ui.dialogs.rc_dialogs import show_info, show_error, show_warning, ask_y
 from src.modules.uploads import service as uploads_service
 from src.modules.uploads.components.helpers import _cnpj_only_digits
 from src.modules.uploads.exceptions import (
+    UploadCancelledError,
     UploadDuplicateError,
     UploadNetworkError,
     UploadServerError,
     UploadValidationError,
 )
 from src.modules.uploads.upload_retry import classify_upload_exception
+from src.modules.uploads.upload_scheduler import UploadProgress
 from src.modules.uploads.file_validator import (
     validate_upload_files,
     FileValidationResult,
@@ -46,7 +48,7 @@ build_items_from_files = uploads_service.build_items_from_files
 class UploadProgressDialog:
     """Wrapper fino que reutiliza ProgressDialog."""
 
-    def __init__(self, parent: tk.Misc, total: int) -> None:
+    def __init__(self, parent: tk.Misc, total: int, *, on_cancel: Optional[Callable[[], None]] = None) -> None:
         self._total = max(int(total), 1)
         self._value = 0
         self._dialog = ProgressDialog(
@@ -54,6 +56,8 @@ class UploadProgressDialog:
             title="Enviando arquivos",
             message="Preparando...",
             detail=self._detail_text(),
+            can_cancel=on_cancel is not None,
+            on_cancel=on_cancel,
         )
         self._dialog.set_progress(0.0)
 
@@ -87,6 +91,29 @@ class UploadProgressDialog:
         except tk.TclError as exc:
             log.debug("Failed to update progress bar: %s", exc)
 
+    def set_current(self, label: str) -> None:
+        """Mostra o arquivo que acabou de iniciar (sem avançar a barra)."""
+        try:
+            self._dialog.set_message(label)
+        except tk.TclError as exc:
+            log.debug("Failed to update progress message: %s", exc)
+
+    def update_stats(self, stats: UploadProgress) -> None:
+        """Atualiza barra, detalhe e ETA com o progresso agregado do lote."""
+        self._value = min(self._total, stats.files_done)
+        detail = self._detail_text()
+        if stats.bytes_total > 0:
+            detail += (
+                f" · {format_file_size(stats.bytes_done)} de {format_file_size(stats.bytes_total)}"
+                f" · {format_file_size(int(stats.bytes_per_second))}/s"
+            )
+        try:
+            self._dialog.set_detail(detail)
+            self._dialog.set_progress(stats.fraction)
+            self._dialog.set_eta(stats.eta_s)
+        except tk.TclError as exc:
+            log.debug("Failed to update progress stats: %s", exc)
+
     def close(self) -> None:
         try:
             self._dialog.close()
@@ -134,6 +161,7 @@ def _show_upload_summary(
     """
     # Coletar mensagens de erro por categoria
     duplicate_errors: List[str] = []
+    cancelled: List[str] = []
     network_errors: List[str] = []
     server_errors: List[str] = []
     validation_msgs: List[str] = []
@@ -147,6 +175,8 @@ def _show_upload_summary(
         # IMPORTANTE: checar DuplicateError ANTES de ServerError (herança)
         if isinstance(typed_exc, UploadDuplicateError):
             duplicate_errors.append(filename)
+        elif isinstance(typed_exc, UploadCancelledError):
+            cancelled.append(filename)
         elif isinstance(typed_exc, UploadNetworkError):
             network_errors.append(filename)
         elif isinstance(typed_exc, UploadServerError):
@@ -195,6 +225,10 @@ def _show_upload_summary(
             lines.append(f"  ... e mais {len(duplicate_errors) - 5} arquivo(s)")
         lines.append("")
 
+    if cancelled:
+        lines.append(f"↷ {len(cancelled)} arquivo(s) não enviado(s): envio cancelado.")
+        lines.append("")
+
     if network_errors:
         lines.append("⚠ Falha de conexão (verifique sua internet):")
         for name in network_errors[:3]:
@@ -381,8 +415,13 @@ def _upload_batch(
     - ``done_event`` é setado no ``finally`` do worker (sempre, mesmo em erro).
     - ``_ProgressPump`` drena a fila em loop antes de decidir fechar.
     - Diálogo nunca fecha enquanto ``done_event`` não estiver setado.
+
+    Os arquivos sobem em paralelo (``RC_UPLOAD_WORKERS``); o diálogo mostra
+    bytes, vazão e ETA agregados. "Cancelar" para de iniciar arquivos novos;
+    os não enviados voltam em failures como ``UploadCancelledError``.
     """
-    progress = UploadProgressDialog(parent, len(items))
+    cancel_event = threading.Event()
+    progress = UploadProgressDialog(parent, len(items), on_cancel=cancel_event.set)
     result_queue: queue.Queue[tuple] = queue.Queue()
     done_event = threading.Event()
 
@@ -395,15 +434,10 @@ def _upload_batch(
 
     def _progress(item: UploadItem) -> None:
         label = Path(item.relative_path).name
-        try:
-            item_path = Path(item.path)
-            if item_path.exists():
-                size_str = format_file_size(item_path.stat().st_size)
-                _safe_after(0, lambda: progress.advance(f"Enviando {label} ({size_str})"))
-            else:
-                _safe_after(0, lambda: progress.advance(f"Enviando {label}"))
-        except OSError:
-            _safe_after(0, lambda: progress.advance(f"Enviando {label}"))
+        _safe_after(0, lambda: progress.set_current(f"Enviando {label}"))
+
+    def _stats(stats: UploadProgress) -> None:
+        _safe_after(0, lambda: progress.update_stats(stats))
 
     def _upload_worker() -> None:
         """Executa upload em thread background; sinaliza done_event sempre."""
@@ -417,6 +451,8 @@ def _upload_batch(
                 progress_callback=_progress,
                 client_id=client_id,
                 org_id=org_id,
+                cancel_event=cancel_event,
+                on_progress=_stats,
             )
             result_queue.put(("success", ok, failures))
         except Exception as exc:
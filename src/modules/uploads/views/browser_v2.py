@@ -37,15 +37,16 @@ from typing import Any, Callable
 
 from src.ui.dialogs.download_result_dialog import DownloadResultDialog
 from src.modules.pdf_preview import open_pdf_viewer
+from src.modules.uploads.listing_cache import get_listing_cache
 from src.modules.uploads.service import (
     build_items_from_files,
     delete_storage_folder,
     delete_storage_object,
     download_bytes,
     download_storage_object,
-    list_browser_items,
-    list_storage_objects,
+    iter_browser_pages,
     upload_items_for_client,
+    walk_storage_folder,
 )
 from src.ui.ctk_config import ctk
 from src.ui.dialogs.rc_dialogs import show_info, show_error, ask_yes_no_danger
@@ -75,23 +76,26 @@ _log = logging.getLogger(__name__)
 _executor = ThreadPoolExecutor(max_workers=4)
 _atexit.register(_executor.shutdown, wait=False)
 
+# Subpastas pré-carregadas por pasta aberta (as demais carregam ao expandir)
+_PREFETCH_MAX_FOLDERS = 8
+
 
 class _LocalZipCancelledError(Exception):
     """Sinal interno de cancelamento no fluxo ZIP local."""
 
 
-def _collect_folder_entries(bucket: str, prefix: str) -> list[tuple[str, int]]:
-    """Lista recursivamente todos os arquivos sob prefix retornando (storage_path, size_bytes)."""
+def _collect_folder_entries(
+    bucket: str, prefix: str, cancel_event: threading.Event | None = None
+) -> list[tuple[str, int]]:
+    """Lista recursivamente todos os arquivos sob prefix retornando (storage_path, size_bytes).
+
+    Subpastas são listadas em paralelo; ``cancel_event`` interrompe a listagem.
+    """
     results: list[tuple[str, int]] = []
-    entries = list_storage_objects(bucket, prefix=(prefix or "").strip("/")) or []
-    for entry in entries:
-        full_path = (entry.get("full_path") or "").strip("/")
-        if not full_path:
-            continue
-        if entry.get("is_folder"):
-            results.extend(_collect_folder_entries(bucket, full_path))
-        else:
-            results.append((full_path, entry.get("size_bytes") or 0))
+    for entry in walk_storage_folder(prefix, bucket=bucket):
+        if cancel_event is not None and cancel_event.is_set():
+            raise _LocalZipCancelledError()
+        results.append((entry["full_path"], entry.get("size_bytes") or 0))
     return results
 
 
@@ -206,6 +210,9 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
         self._nav_stack: list[str] = []
         self._progress_queue: queue.Queue = queue.Queue()
         self._cancel_event = threading.Event()
+        self._listing_generation = 0
+        self._listing_count = 0
+        self._listing_cache = get_listing_cache()
 
         # PASSO 4 — título (ID + razão + CNPJ formatado)
         razao_display = razao.strip() or f"ID {client_id}"
@@ -592,7 +599,11 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
             self.btn_excluir.configure(state="normal")
 
     def _refresh_listing(self) -> None:
-        """Carrega a árvore completa de arquivos do prefixo base do cliente."""
+        """Carrega o primeiro nível do prefixo base do cliente.
+
+        Usa a listagem em cache quando ainda válida. Sem cache, a primeira
+        página é desenhada na hora e as seguintes chegam em segundo plano.
+        """
         prefix = self._base_prefix
         _log.info(
             "[BrowserV2] Listando: prefix=%s bucket=%s client_id=%s",
@@ -600,25 +611,100 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
             self._bucket,
             self._client_id,
         )
-        items = list(list_browser_items(prefix, bucket=self._bucket))
+        self._listing_generation += 1
+        generation = self._listing_generation
+        cached = self._listing_cache.get(self._bucket, prefix)
+        if cached is not None:
+            self.file_list.populate_tree_hierarchical(cached, self._base_prefix, self._status_cache)
+            self._listing_count = len(cached)
+            self._update_listing_status()
+            self._sync_actions_state()
+            self._prefetch_subfolders(cached, generation)
+            return
+
+        token = self._listing_cache.token()
+        pages = iter_browser_pages(prefix, bucket=self._bucket)
+        try:
+            items = next(pages, [])
+        except Exception:  # noqa: BLE001
+            _log.exception("[BrowserV2] Erro ao listar %s", prefix)
+            items = []
+            pages = None
         self.file_list.populate_tree_hierarchical(items, self._base_prefix, self._status_cache)
-        n = len(items)
-        if hasattr(self, "status_label") and self.status_label.winfo_exists():
-            if n == 0:
-                self.status_label.configure(text="Nenhum arquivo encontrado nesta pasta")
-            elif n == 1:
-                self.status_label.configure(text="1 arquivo encontrado")
-            else:
-                self.status_label.configure(text=f"{n} arquivos encontrados")
+        self._listing_count = len(items)
+        self._update_listing_status()
         self._sync_actions_state()
+        if pages is not None:
+            _executor.submit(self._stream_listing_pages, pages, generation, list(items), token)
+
+    def _stream_listing_pages(self, pages: Any, generation: int, collected: list[dict], token: int) -> None:
+        """Worker: consome as páginas restantes, entrega à UI e grava a listagem no cache."""
+        prefix = self._base_prefix
+        try:
+            for page in pages:
+                if self._is_closing or generation != self._listing_generation:
+                    return
+                collected.extend(page)
+                self._safe_after(0, lambda p=page: self._append_listing_page(p, generation))
+        except Exception as exc:  # noqa: BLE001
+            _log.warning("[BrowserV2] Listagem incompleta de %s: %s", prefix, exc)
+            self._safe_after(0, lambda: self._update_listing_status(incomplete=True))
+            return
+        self._listing_cache.put(self._bucket, prefix, collected, token=token)
+        self._prefetch_subfolders(collected, generation)
+
+    def _append_listing_page(self, page: list[dict], generation: int) -> None:
+        if self._is_closing or generation != self._listing_generation:
+            return
+        self.file_list.append_root_items(page)
+        self._listing_count += len(page)
+        self._update_listing_status()
+
+    def _fetch_folder(self, folder_path: str) -> list[dict]:
+        return [entry for page in iter_browser_pages(folder_path, bucket=self._bucket) for entry in page]
+
+    def _prefetch_subfolders(self, items: list[dict], generation: int) -> None:
+        """Pré-carrega (em segundo plano) as subpastas da pasta aberta no cache."""
+        folders = [e.get("full_path") for e in items if e.get("is_folder") and e.get("full_path")]
+        for folder_path in folders[:_PREFETCH_MAX_FOLDERS]:
+            _executor.submit(self._prefetch_folder, folder_path, generation)
+
+    def _prefetch_folder(self, folder_path: str, generation: int) -> None:
+        if self._is_closing or generation != self._listing_generation:
+            return
+        try:
+            self._listing_cache.get_or_load(self._bucket, folder_path, lambda: self._fetch_folder(folder_path))
+        except Exception as exc:  # noqa: BLE001
+            _log.debug("[BrowserV2] Pré-busca de %s falhou: %s", folder_path, exc)
+
+    def _invalidate_listing(self, prefix: str, *, recursive: bool = False) -> None:
+        """Descarta listagens em cache afetadas por upload/exclusão feitos nesta janela."""
+        self._listing_cache.invalidate(self._bucket, prefix, recursive=recursive)
+
+    def _update_listing_status(self, *, incomplete: bool = False) -> None:
+        if not hasattr(self, "status_label") or not self.status_label.winfo_exists():
+            return
+        n = self._listing_count
+        if n == 0:
+            text = "Nenhum arquivo encontrado nesta pasta"
+        elif n == 1:
+            text = "1 arquivo encontrado"
+        else:
+            text = f"{n} arquivos encontrados"
+        if incomplete:
+            text += " (listagem incompleta)"
+        self.status_label.configure(text=text)
 
     def _load_folder_children(self, folder_path: str) -> list[dict]:
-        """Carrega filhos de uma pasta específica (lazy loading)."""
+        """Carrega filhos de uma pasta específica (lazy loading, via cache)."""
         _log.info("[BrowserV2] Carregando filhos de: %s", folder_path)
-        if not folder_path.endswith("/"):
-            folder_path = folder_path + "/"
-        items = list_browser_items(folder_path, bucket=self._bucket)
-        return list(items)
+        try:
+            items = self._listing_cache.get_or_load(self._bucket, folder_path, lambda: self._fetch_folder(folder_path))
+        except Exception:  # noqa: BLE001
+            _log.exception("[BrowserV2] Erro ao listar %s", folder_path)
+            return []
+        self._prefetch_subfolders(items, self._listing_generation)
+        return items
 
     # ------------------------------------------------------------------
     # Ações: Visualizar
@@ -757,7 +843,7 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
             part_path = save_path + ".part"
             try:
                 # 1. Listar arquivos recursivamente (com tamanho para progresso real)
-                entries = _collect_folder_entries(bucket, folder_prefix)
+                entries = _collect_folder_entries(bucket, folder_prefix, self._cancel_event)
 
                 if self._cancel_event.is_set():
                     raise _LocalZipCancelledError()
@@ -926,9 +1012,12 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
             try:
                 result = delete_storage_folder(full_path, bucket=self._bucket)
             except Exception as exc:  # noqa: BLE001
+                self._invalidate_listing(full_path, recursive=True)
                 _log.exception("[BrowserV2] Erro ao excluir pasta")
                 show_error(self, "Excluir pasta", f"Falha ao excluir a pasta:\n{exc}")
                 return
+            # mesmo exclusão parcial altera a pasta
+            self._invalidate_listing(full_path, recursive=True)
             if not result.get("ok"):
                 error_txt = result.get("message") or "Falha ao excluir a pasta."
                 show_error(self, "Excluir pasta", error_txt)
@@ -952,6 +1041,7 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
             try:
                 ok = delete_storage_object(full_path, bucket=self._bucket)
                 if ok:
+                    self._invalidate_listing(full_path)
                     self._refresh_listing()
                     show_info(self, "Excluir", f"Arquivo '{item_name}' excluído com sucesso.")
                     if self._on_mutation is not None:
@@ -1004,6 +1094,7 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
             )
         except Exception as exc:
             _log.exception("[BrowserV2] Upload falhou")
+            self._invalidate_listing(self._base_prefix, recursive=True)
             show_error(self, "Upload", f"Falha ao enviar arquivos:\n{exc}")
             return
 
@@ -1013,6 +1104,7 @@ class UploadsBrowserWindowV2(ctk.CTkToplevel):  # type: ignore[misc]
         else:
             show_info(self, "Upload", f"{ok_count} arquivo(s) enviado(s) com sucesso.")
 
+        self._invalidate_listing(self._base_prefix, recursive=True)
         self._refresh_listing()
         if ok_count and self._on_mutation is not None:
             _log.info(
@@ -167,8 +167,12 @@ class FileList(ctk.CTkFrame):  # type: ignore[misc]
         self._base_prefix = base_prefix
         self._status_cache = status_cache
         self._item_data = {}
+        self.append_root_items(items)
 
-        for idx, entry in enumerate(items):
+    def append_root_items(self, items: Iterable[dict]) -> None:
+        """Acrescenta itens ao primeiro nível (páginas seguintes de uma listagem em streaming)."""
+        offset = len(self.tree.get_children(""))
+        for idx, entry in enumerate(items, start=offset):
             name = entry.get("name") or ""
             if not name:
                 continue
@@ -43,6 +43,8 @@ class UploadDialogContext:
         self._total = max(int(total or 0), 0)
         self._completed = 0
         self._started_at = time.monotonic()
+        # advance() é chamado por várias threads de upload ao mesmo tempo
+        self._lock = threading.Lock()
 
     # ---- Cancelamento --------------------------------------------------
     @property
@@ -58,23 +60,26 @@ class UploadDialogContext:
 
     # ---- Progresso -----------------------------------------------------
     def set_total(self, total: int) -> None:
-        self._total = max(int(total or 0), 0)
-        if self._total == 0:
-            self._completed = 0
-        else:
-            self._completed = min(self._completed, self._total)
-        self._dialog._update_progress(detail=self._detail_text(), fraction=self._fraction())  # noqa: SLF001
+        with self._lock:
+            self._total = max(int(total or 0), 0)
+            if self._total == 0:
+                self._completed = 0
+            else:
+                self._completed = min(self._completed, self._total)
+            self._dialog._update_progress(detail=self._detail_text(), fraction=self._fraction())  # noqa: SLF001
 
     def advance(self, label: str | None = None) -> None:
-        """Incrementa progresso em 1 passo."""
-        if self._total:
-            self._completed = min(self._total, self._completed + 1)
-        self._dialog._update_progress(  # noqa: SLF001
-            label=label,
-            detail=self._detail_text(),
-            fraction=self._fraction(),
-            eta_text=self._eta_text(),
-        )
+        """Incrementa progresso em 1 passo (seguro entre threads)."""
+        with self._lock:
+            if self._total:
+                self._completed = min(self._total, self._completed + 1)
+            # Agendado sob o lock: a UI recebe os passos na ordem dos incrementos
+            self._dialog._update_progress(  # noqa: SLF001
+                label=label,
+                detail=self._detail_text(),
+                fraction=self._fraction(),
+                eta_text=self._eta_text(),
+            )
 
     def report(
         self,
@@ -86,15 +91,16 @@ class UploadDialogContext:
         fraction: float | None = None,
     ) -> None:
         """Atualiza estado de progresso com flexibilidade."""
-        if total is not None:
-            self._total = max(int(total or 0), 0)
-        if completed is not None:
-            self._completed = max(0, int(completed))
-        self._dialog._update_progress(  # noqa: SLF001
-            label=label,
-            detail=detail or self._detail_text(),
-            fraction=fraction if fraction is not None else self._fraction(),
-        )
+        with self._lock:
+            if total is not None:
+                self._total = max(int(total or 0), 0)
+            if completed is not None:
+                self._completed = max(0, int(completed))
+            self._dialog._update_progress(  # noqa: SLF001
+                label=label,
+                detail=detail or self._detail_text(),
+                fraction=fraction if fraction is not None else self._fraction(),
+            )
 
     # ---- Helpers internos ----------------------------------------------
     def _detail_text(self) -> str:
@@ -11,7 +11,7 @@ O desktop app apenas cria, acompanha e baixa o artefato final.
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Optional
 
@@ -214,6 +214,46 @@ class ZipJob:
             updated_at=_parse_ts(row.get("updated_at")),
         )
 
+    def with_status(self, row: dict) -> ZipJob:
+        """Cópia do job com as colunas de ``STATUS_COLUMNS`` presentes em ``row``."""
+        progress = replace(
+            self.progress,
+            **{f: row[f] or 0 for f in ZipJobProgress.__dataclass_fields__ if f in row},
+        )
+        changes: dict = {"progress": progress}
+        if "phase" in row:
+            changes["phase"] = ZipJobPhase(row["phase"])
+        if "message" in row:
+            changes["message"] = row["message"] or ""
+        for name in ("artifact_storage_path", "error_detail"):
+            if name in row:
+                changes[name] = row[name]
+        if "cancel_requested" in row:
+            changes["cancel_requested"] = bool(row["cancel_requested"])
+        for name in ("started_at", "completed_at", "updated_at"):
+            if name in row:
+                changes[name] = _parse_ts(row[name])
+        return replace(self, **changes)
+
+
+# Colunas que mudam durante a execução (polling leve / payload do Realtime)
+STATUS_COLUMNS: tuple[str, ...] = (
+    "phase",
+    "message",
+    "total_files",
+    "processed_files",
+    "total_source_bytes",
+    "processed_source_bytes",
+    "artifact_bytes_total",
+    "artifact_bytes_uploaded",
+    "artifact_storage_path",
+    "error_detail",
+    "cancel_requested",
+    "started_at",
+    "completed_at",
+    "updated_at",
+)
+
 
 def _parse_ts(value: Optional[str | datetime]) -> Optional[datetime]:
     """Parse de timestamp ISO do Postgres."""
@@ -22,7 +22,9 @@ import time
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from src.config.environment import env_bool
 from src.modules.uploads.zip_job_models import (
+    STATUS_COLUMNS,
     ZipJob,
     ZipJobPhase,
 )
@@ -73,6 +75,15 @@ def _exec(builder: Any) -> Any:
 
 
 _TABLE = "zip_export_jobs"
+_STATUS_SELECT = ",".join(STATUS_COLUMNS)
+
+# Progresso por Realtime (push); desligado → só polling adaptativo
+ZIP_JOB_REALTIME: bool = env_bool("RC_ZIP_JOB_REALTIME", True)
+# Com o Realtime ativo (e já entregando eventos), um poll leve de segurança a cada N segundos sem eventos
+_REALTIME_SAFETY_POLL_S = 15.0
+# Espera por eventos em passos curtos para notar o cancelamento local
+_REALTIME_WAIT_STEP_S = 0.5
+_POLL_BACKOFF = 1.6
 
 # ---------------------------------------------------------------------------
 # Edge Function URL
@@ -153,6 +164,16 @@ def get_zip_job(job_id: str) -> ZipJob:
     return ZipJob.from_row(rows[0])
 
 
+def get_zip_job_status(job_id: str) -> dict[str, Any]:
+    """Lê só as colunas de fase/progresso do job (poll leve)."""
+    sb = _get_supabase()
+    resp = _exec(sb.table(_TABLE).select(_STATUS_SELECT).eq("id", job_id).limit(1))
+    rows = resp.data if hasattr(resp, "data") else resp
+    if not rows:
+        raise ZipJobNotFoundError(f"Job {job_id} não encontrado")
+    return rows[0]
+
+
 def update_zip_job(
     job_id: str,
     *,
@@ -189,8 +210,12 @@ def update_zip_job(
         return get_zip_job(job_id)
 
     sb = _get_supabase()
-    _exec(sb.table(_TABLE).update(patch).eq("id", job_id))
-    # Reler o job atualizado (select após update não suportado nesta versão do client)
+    resp = _exec(sb.table(_TABLE).update(patch).eq("id", job_id))
+    # O PATCH devolve a linha atualizada (return=representation); sem ela
+    # (ex.: RLS sem SELECT na linha), relê o job
+    rows = resp.data if hasattr(resp, "data") else resp
+    if rows and isinstance(rows, list) and isinstance(rows[0], dict) and "org_id" in rows[0]:
+        return ZipJob.from_row(rows[0])
     return get_zip_job(job_id)
 
 
@@ -288,22 +313,57 @@ def cancel_zip_job(job_id: str) -> ZipJob:
     return updated
 
 
+def _open_progress_feed(job_id: str) -> Any:
+    """Feed Realtime de UPDATEs do job (None se indisponível)."""
+    from src.infra.supabase.realtime_feed import open_row_feed
+
+    return open_row_feed(_TABLE, f"id=eq.{job_id}")
+
+
+def _wait_feed_row(feed: Any, timeout_s: float, cancel_event: Optional[threading.Event]) -> Optional[dict[str, Any]]:
+    """Próximo evento do feed em até ``timeout_s``; None se nada chegou, o canal caiu ou houve cancelamento."""
+    deadline = time.monotonic() + timeout_s
+    while feed.connected and not (cancel_event and cancel_event.is_set()):
+        step = deadline - time.monotonic()
+        if step <= 0:
+            break
+        row = feed.get(timeout=min(_REALTIME_WAIT_STEP_S, step))
+        if row is not None:
+            return row
+    return None
+
+
+def _status_key(job: ZipJob) -> tuple:
+    return (job.phase, job.message, job.progress, job.error_detail, job.cancel_requested)
+
+
 def poll_zip_job(
     job_id: str,
     *,
-    interval_s: float = 1.5,
+    interval_s: float = 1.0,
+    max_interval_s: float = 8.0,
     timeout_s: float = 600.0,
     on_progress: Optional[Callable[[ZipJob], None]] = None,
     cancel_event: Optional[threading.Event] = None,
+    realtime: Optional[bool] = None,
 ) -> ZipJob:
-    """Faz polling do status de um job até que ele atinja uma fase terminal ou 'ready'.
+    """Acompanha um job até que ele atinja uma fase terminal ou 'ready'.
+
+    O progresso chega por Supabase Realtime (UPDATEs da linha do job) quando
+    disponível, com um poll leve de segurança a cada 15s sem eventos. Até
+    chegar o primeiro evento, ou sem Realtime, faz polling só das colunas de
+    fase/progresso com backoff exponencial: o intervalo começa em
+    ``interval_s``, cresce até ``max_interval_s`` enquanto nada muda e volta
+    ao mínimo a cada mudança.
 
     Args:
         job_id: ID do job a acompanhar.
-        interval_s: Intervalo entre polls (segundos).
+        interval_s: Intervalo inicial entre polls (segundos).
+        max_interval_s: Intervalo máximo entre polls (segundos).
         timeout_s: Timeout máximo de espera (segundos).
-        on_progress: Callback chamado a cada poll com estado atualizado.
-        cancel_event: Event para interromper o polling (cancelamento local).
+        on_progress: Callback chamado com o estado inicial e a cada mudança.
+        cancel_event: Event para interromper o acompanhamento (cancelamento local).
+        realtime: Usa Realtime (padrão: ``RC_ZIP_JOB_REALTIME``).
 
     Returns:
         ZipJob na fase 'ready' ou terminal.
@@ -313,56 +373,128 @@ def poll_zip_job(
         ZipJobFailedError: Se job falhou.
         TimeoutError: Se timeout expirou sem atingir fase terminal/ready.
     """
-    deadline = time.monotonic() + timeout_s
+    started = time.monotonic()
+    deadline = started + timeout_s
+    min_interval = max(0.01, interval_s)
+    max_interval = max(min_interval, max_interval_s)
+    interval = min_interval
     _prev_phase: str | None = None
-    _poll_count = 0
-    _last_heartbeat = time.monotonic()
+    _prev_key: tuple | None = None
+    _reads = 0
+    _events = 0
+    _last_heartbeat = started
     _heartbeat_interval = 30  # segundos entre heartbeats no console
 
-    while True:
-        if cancel_event and cancel_event.is_set():
-            _log.info("[zip-export] Polling cancelado localmente (job %s, polls=%d)", job_id[:8], _poll_count)
-            raise ZipJobCancelledError("Polling cancelado pelo cliente")
-
-        job = get_zip_job(job_id)
-        _poll_count += 1
-
-        # Log quando a fase muda (evita spam)
-        cur_phase = job.phase.value
-        if cur_phase != _prev_phase:
-            _log.info(
-                "[zip-export] job %s fase: %s → %s (poll #%d)", job_id[:8], _prev_phase or "—", cur_phase, _poll_count
-            )
-            _prev_phase = cur_phase
-            _last_heartbeat = time.monotonic()
-        elif time.monotonic() - _last_heartbeat >= _heartbeat_interval:
-            elapsed = int(time.monotonic() - (deadline - timeout_s))
-            _log.info("[zip-export] job %s ainda em %s (poll #%d, %ds)", job_id[:8], cur_phase, _poll_count, elapsed)
-            _last_heartbeat = time.monotonic()
-
-        if on_progress:
-            on_progress(job)
-
-        if job.phase == ZipJobPhase.READY:
-            _log.info("[zip-export] job %s pronto após %d polls", job_id[:8], _poll_count)
-            return job
-
-        if job.phase == ZipJobPhase.CANCELLED:
-            _log.info("[zip-export] job %s cancelado pelo servidor (polls=%d)", job_id[:8], _poll_count)
-            raise ZipJobCancelledError(job.message or "Job cancelado")
-
-        if job.phase == ZipJobPhase.FAILED:
-            _log.error("[zip-export] job %s FALHOU: %s", job_id[:8], job.error_detail or job.message)
-            raise ZipJobFailedError(job.error_detail or job.message or "Job falhou")
-
-        if job.phase == ZipJobPhase.COMPLETED:
-            return job
+    job = get_zip_job(job_id)
+    _reads += 1
+    use_realtime = ZIP_JOB_REALTIME if realtime is None else realtime
+    feed: Any = None
 
-        if time.monotonic() >= deadline:
-            _log.error("[zip-export] job %s TIMEOUT após %ds (%d polls)", job_id[:8], timeout_s, _poll_count)
-            raise TimeoutError(f"Timeout ({timeout_s}s) aguardando job {job_id}")
+    try:
+        while True:
+            if cancel_event and cancel_event.is_set():
+                _log.info(
+                    "[zip-export] Polling cancelado localmente (job %s, leituras=%d, eventos=%d)",
+                    job_id[:8],
+                    _reads,
+                    _events,
+                )
+                raise ZipJobCancelledError("Polling cancelado pelo cliente")
+
+            key = _status_key(job)
+            changed = key != _prev_key
+            _prev_key = key
+
+            # Log quando a fase muda (evita spam)
+            cur_phase = job.phase.value
+            if cur_phase != _prev_phase:
+                _log.info(
+                    "[zip-export] job %s fase: %s → %s (leituras=%d, eventos=%d)",
+                    job_id[:8],
+                    _prev_phase or "—",
+                    cur_phase,
+                    _reads,
+                    _events,
+                )
+                _prev_phase = cur_phase
+                _last_heartbeat = time.monotonic()
+            elif time.monotonic() - _last_heartbeat >= _heartbeat_interval:
+                elapsed = int(time.monotonic() - started)
+                _log.info("[zip-export] job %s ainda em %s (leituras=%d, %ds)", job_id[:8], cur_phase, _reads, elapsed)
+                _last_heartbeat = time.monotonic()
+
+            if on_progress and changed:
+                on_progress(job)
+
+            if job.phase == ZipJobPhase.READY:
+                _log.info("[zip-export] job %s pronto (leituras=%d, eventos=%d)", job_id[:8], _reads, _events)
+                return job
+
+            if job.phase == ZipJobPhase.CANCELLED:
+                _log.info("[zip-export] job %s cancelado pelo servidor (leituras=%d)", job_id[:8], _reads)
+                raise ZipJobCancelledError(job.message or "Job cancelado")
+
+            if job.phase == ZipJobPhase.FAILED:
+                _log.error("[zip-export] job %s FALHOU: %s", job_id[:8], job.error_detail or job.message)
+                raise ZipJobFailedError(job.error_detail or job.message or "Job falhou")
+
+            if job.phase == ZipJobPhase.COMPLETED:
+                return job
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _log.error("[zip-export] job %s TIMEOUT após %ds (%d leituras)", job_id[:8], timeout_s, _reads)
+                raise TimeoutError(f"Timeout ({timeout_s}s) aguardando job {job_id}")
+
+            if use_realtime:
+                # Só depois do primeiro on_progress: a inscrição pode levar alguns segundos
+                use_realtime = False
+                feed = _open_progress_feed(job_id)
+                _log.info(
+                    "[zip-export] Acompanhando job %s via %s",
+                    job_id[:8],
+                    "Realtime" if feed is not None else "polling adaptativo",
+                )
+                if feed is not None:
+                    # Mudanças entre a primeira leitura e a inscrição não geram evento
+                    job = job.with_status(get_zip_job_status(job_id))
+                    _reads += 1
+                    continue
+
+            if feed is not None and not feed.connected:
+                _log.info("[zip-export] Realtime desconectado (job %s); voltando ao polling", job_id[:8])
+                feed.close()
+                feed = None
+                interval = min_interval
+
+            if feed is not None:
+                if _events:
+                    window = _REALTIME_SAFETY_POLL_S
+                else:
+                    # Até o primeiro evento o feed não provou que entrega: poll com backoff
+                    interval = min_interval if changed else min(max_interval, interval * _POLL_BACKOFF)
+                    window = interval
+                row = _wait_feed_row(feed, min(window, remaining), cancel_event)
+                if row is not None:
+                    _events += 1
+                    job = job.with_status(row)
+                    continue
+                if (cancel_event and cancel_event.is_set()) or not feed.connected:
+                    continue
+            else:
+                interval = min_interval if changed else min(max_interval, interval * _POLL_BACKOFF)
+                wait_s = min(interval, remaining)
+                if cancel_event is not None:
+                    if cancel_event.wait(wait_s):
+                        continue
+                else:
+                    time.sleep(wait_s)
 
-        time.sleep(interval_s)
+            job = job.with_status(get_zip_job_status(job_id))
+            _reads += 1
+    finally:
+        if feed is not None:
+            feed.close()
 
 
 def get_artifact_url(
@@ -432,6 +564,10 @@ def download_artifact(
 ) -> Path:
     """Baixa o artefato ZIP pronto para o disco local via signed URL.
 
+    Uma queda no meio do download mantém o ``.part`` e retoma por Range
+    (também numa nova chamada para o mesmo job); o MD5 do ETag é conferido
+    antes de promover o arquivo.
+
     Args:
         job_id: ID do job.
         save_path: Caminho local de destino.
@@ -441,6 +577,7 @@ def download_artifact(
     Returns:
         Path do arquivo salvo.
     """
+    from src.infra.supabase.resumable_download import DownloadHTTPError, ResumableDownload
     from src.infra.supabase.storage_client import DownloadCancelledError
     from src.infra.net_session import make_session
 
@@ -466,58 +603,21 @@ def download_artifact(
     except Exception:
         _log.debug("Erro ao marcar job %s como downloading_artifact", job_id)
 
-    dest = Path(save_path)
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = dest.with_suffix(dest.suffix + ".part")
-
-    sess = make_session()
-    _promoted = False
-
+    # Retomada por Range: o id do job identifica o artefato mesmo com signed URLs novas
+    downloader = ResumableDownload(
+        make_session(),
+        url,
+        Path(save_path),
+        resume_key=f"zip-job:{job_id}",
+        cancel_event=cancel_event,
+        progress_cb=progress_cb,
+        verify_etag_md5=True,
+    )
     try:
-        with sess.get(url, stream=True, timeout=(15, 300)) as resp:
-            if resp.status_code != 200:
-                raise ZipJobError(f"Falha ao baixar artefato (HTTP {resp.status_code})")
-
-            expected = 0
-            try:
-                expected = int(resp.headers.get("Content-Length") or "0")
-            except (ValueError, TypeError):
-                pass
-
-            written = 0
-            with open(tmp_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=256 * 1024):
-                    if cancel_event and cancel_event.is_set():
-                        raise DownloadCancelledError("Download cancelado pelo usuário")
-
-                    if not chunk:
-                        continue
-
-                    f.write(chunk)
-                    written += len(chunk)
-
-                    if progress_cb:
-                        try:
-                            progress_cb(written, expected)
-                        except Exception:
-                            pass
-
-            if cancel_event and cancel_event.is_set():
-                raise DownloadCancelledError("Download cancelado no final")
-
-            if expected and written != expected:
-                raise IOError(f"Download truncado: {written}B != {expected}B")
-
-            os.replace(tmp_path, dest)
-            _promoted = True
-            _log.info("[zip-export] Download concluído: %s (%d bytes)", dest.name, written)
-
-    finally:
-        if not _promoted:
-            try:
-                tmp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+        dest = downloader.run()
+    except DownloadHTTPError as exc:
+        raise ZipJobError(f"Falha ao baixar artefato (HTTP {exc.status})") from exc
+    _log.info("[zip-export] Download concluído: %s", dest.name)
 
     # Marcar job como completed
     try:
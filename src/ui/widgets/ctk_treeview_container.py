@@ -187,6 +187,14 @@ class CTkTreeviewContainer(ctk.CTkFrame):
         """
         return self._tree
 
+    def get_vscrollbar(self) -> ctk.CTkScrollbar:
+        """Retorna a scrollbar vertical (para quem controla a rolagem, ex.: lista virtual).
+
+        Returns:
+            Instância do CTkScrollbar vertical
+        """
+        return self._vsb
+
     def get_colors(self) -> Optional[TreeColors]:
         """Retorna as cores atuais do tema.
 
@@ -1,4 +1,5 @@
 from .bytes_utils import (
+    find_cartao_cnpj,
     find_cartao_cnpj_pdf,
     format_datetime,
     list_and_classify_pdfs,
@@ -7,6 +8,7 @@ from .bytes_utils import (
 
 __all__ = [
     "read_pdf_text",
+    "find_cartao_cnpj",
     "find_cartao_cnpj_pdf",
     "list_and_classify_pdfs",
     "format_datetime",
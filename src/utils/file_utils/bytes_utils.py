@@ -12,6 +12,7 @@ from src.core import classify_document
 
 __all__ = [
     "read_pdf_text",
+    "find_cartao_cnpj",
     "find_cartao_cnpj_pdf",
     "list_and_classify_pdfs",
     "format_datetime",
@@ -156,7 +157,15 @@ def _looks_like_cartao_cnpj(text: str) -> bool:
     return has_cnpj and has_kw
 
 
-def find_cartao_cnpj_pdf(base: PathLike, max_mb: int = 10) -> Path | None:
+def find_cartao_cnpj(base: PathLike, max_mb: int = 10) -> tuple[Path, str] | None:
+    """Localiza o Cartão CNPJ na pasta e devolve ``(caminho, texto)``.
+
+    Usa ``scan_pdfs``: ordem pela classificação do nome, cache de texto por
+    hash, primeira página antes do documento inteiro e parada no primeiro
+    match.
+    """
+    from src.utils.file_utils.pdf_scan import scan_pdfs
+
     base = Path(base)
     if not base.exists():
         return None
@@ -169,15 +178,16 @@ def find_cartao_cnpj_pdf(base: PathLike, max_mb: int = 10) -> Path | None:
     if not pdfs:
         return None
 
-    for p in pdfs:
-        try:
-            text = read_pdf_text(p)
-        except Exception:
-            text = None
-        if text and _looks_like_cartao_cnpj(text):
-            return p
+    try:
+        return scan_pdfs(pdfs, _looks_like_cartao_cnpj, kind="cartao_cnpj")
+    except Exception as exc:  # noqa: BLE001
+        log.warning("Falha ao procurar Cartão CNPJ em %s: %s", base, exc)
+        return None
 
-    return None
+
+def find_cartao_cnpj_pdf(base: PathLike, max_mb: int = 10) -> Path | None:
+    found = find_cartao_cnpj(base, max_mb=max_mb)
+    return found[0] if found else None
 
 
 def list_and_classify_pdfs(base: PathLike) -> list[dict[str, Any]]:
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""Extração de texto em lote para localizar um PDF numa pasta (ex.: Cartão CNPJ).
+
+Ler cada PDF em sequência com a cascata completa de ``read_pdf_text``
+(pypdf → PyMuPDF → OCR de até 5 páginas) deixava uma pasta de
+digitalizações levando minutos. ``scan_pdfs``:
+
+1. Ordena os arquivos pela classificação por nome (``classify_document``):
+   o que parece ser o documento procurado é lido primeiro.
+2. Consulta o cache em disco (texto por SHA-256 do arquivo): reabrir a
+   mesma pasta não lê nem faz OCR de nada.
+3. Lê só a primeira página (OCR só se ela não tiver texto) dos arquivos
+   restantes num pool de processos (``RC_PDF_SCAN_WORKERS``), parando no
+   primeiro arquivo que satisfaz o critério.
+4. Só então lê as demais páginas (cascata completa) dos PDFs com mais de
+   uma página.
+
+O pool de processos também isola falhas nativas do PyMuPDF/Tesseract: se
+um worker morrer, os arquivos pendentes são lidos no processo atual.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from src.config.environment import env_int
+from src.config.paths import DB_DIR
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "PDF_SCAN_WORKERS",
+    "PDF_TEXT_CACHE_PATH",
+    "PdfTextCache",
+    "extract_first_page",
+    "extract_full_text",
+    "get_pdf_text_cache",
+    "rank_pdfs",
+    "scan_pdfs",
+]
+
+PDF_TEXT_CACHE_PATH: Path = DB_DIR.parent / "runtime" / "pdf_text.json"
+PDF_SCAN_WORKERS: int = max(1, env_int("RC_PDF_SCAN_WORKERS", min(4, os.cpu_count() or 1)))
+_TEXT_TTL_HOURS = 24 * 30
+
+# Ordem de leitura por tipo detectado no nome; o tipo procurado vai na frente
+_RANK_UNKNOWN = 1
+_RANK_OTHER = 2
+
+Payload = dict[str, Any]
+
+
+# ---------------------------------------------------------------------------
+# Extração (executada nos workers; só argumentos/retornos serializáveis)
+# ---------------------------------------------------------------------------
+
+
+def _ocr_allowed() -> bool:
+    return os.getenv("RC_DISABLE_PYMUPDF") != "1"
+
+
+def extract_first_page(path: str) -> Payload:
+    """Texto da primeira página (pypdf → PyMuPDF → OCR) e total de páginas."""
+    text = ""
+    pages = 0
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(path)
+        pages = len(reader.pages)
+        if pages:
+            text = (reader.pages[0].extract_text() or "").strip()
+    except Exception as exc:  # noqa: BLE001
+        log.debug("pdf_scan: pypdf falhou em %s: %s", path, exc)
+
+    if not text and _ocr_allowed():
+        try:
+            import fitz  # PyMuPDF
+
+            with fitz.open(path) as doc:
+                pages = pages or doc.page_count
+                if doc.page_count:
+                    page = doc.load_page(0)
+                    text = str(page.get_text() or "").strip()
+                    if not text:
+                        text = _ocr_page(page)
+        except Exception as exc:  # noqa: BLE001
+            log.debug("pdf_scan: PyMuPDF/OCR falhou em %s: %s", path, exc)
+
+    return {"text": text, "pages": pages}
+
+
+def _ocr_page(page: Any, dpi: int = 200) -> str:
+    try:
+        import pytesseract
+        from PIL import Image
+    except Exception:  # noqa: BLE001
+        return ""
+    pm = page.get_pixmap(dpi=dpi)
+    img = Image.frombytes("RGB", (pm.width, pm.height), pm.samples)
+    return (pytesseract.image_to_string(img, lang="por+eng") or "").strip()
+
+
+def extract_full_text(path: str) -> Payload:
+    """Texto do documento pela cascata completa de ``read_pdf_text``."""
+    from src.utils.file_utils.bytes_utils import read_pdf_text
+
+    return {"text": read_pdf_text(path) or ""}
+
+
+# ---------------------------------------------------------------------------
+# Cache em disco
+# ---------------------------------------------------------------------------
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class PdfTextCache:
+    """Texto extraído por (SHA-256 do arquivo, modo); inclui resultados vazios."""
+
+    def __init__(self, store: Any) -> None:
+        self._store = store
+
+    def get(self, digest: str, mode: str) -> Optional[Payload]:
+        value = self._store.get(f"{digest}|{mode}")
+        return value if isinstance(value, dict) and "text" in value else None
+
+    def set(self, digest: str, mode: str, payload: Payload) -> None:
+        self._store.set(f"{digest}|{mode}", payload)
+
+
+_shared: Optional[PdfTextCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_pdf_text_cache() -> PdfTextCache:
+    """Cache compartilhado do processo (criado no primeiro uso)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            from src.infra.cache_store import JsonCacheStore
+
+            store = JsonCacheStore(str(PDF_TEXT_CACHE_PATH), ttl_hours=_TEXT_TTL_HOURS)
+            _shared = PdfTextCache(store)
+        return _shared
+
+
+# ---------------------------------------------------------------------------
+# Varredura
+# ---------------------------------------------------------------------------
+
+
+def rank_pdfs(paths: Iterable[Path], kind: str) -> list[Path]:
+    """Ordena por classificação do nome: ``kind`` primeiro, depois não identificados."""
+    from src.core.classify_document import classify_document
+
+    def _rank(p: Path) -> int:
+        try:
+            guessed = classify_document(str(p)).get("kind")
+        except Exception:  # noqa: BLE001
+            guessed = None
+        if guessed == kind:
+            return 0
+        return _RANK_UNKNOWN if guessed in (None, "desconhecido") else _RANK_OTHER
+
+    return sorted(paths, key=_rank)  # sort estável: mantém a ordem original no empate
+
+
+def _make_executor(max_workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _extract_ranked(
+    paths: list[Path],
+    extractor: Callable[[str], Payload],
+    match: Callable[[str], bool],
+    on_result: Callable[[Path, Payload], None],
+    max_workers: int,
+) -> Optional[tuple[Path, str]]:
+    """Extrai em paralelo e avalia na ordem do ranking; para no primeiro match."""
+    if len(paths) <= 1 or max_workers <= 1:
+        for p in paths:
+            payload = extractor(str(p))
+            on_result(p, payload)
+            if match(payload["text"]):
+                return p, payload["text"]
+        return None
+
+    executor = _make_executor(min(max_workers, len(paths)))
+    futures: list[tuple[Path, Future[Payload]]] = [(p, executor.submit(extractor, str(p))) for p in paths]
+    consumed = 0
+    try:
+        for p, future in futures:
+            try:
+                payload = future.result()
+            except BrokenProcessPool:
+                log.warning(
+                    "pdf_scan: pool de extração encerrado; lendo %d arquivo(s) no processo atual", len(paths) - consumed
+                )
+                return _extract_ranked(paths[consumed:], extractor, match, on_result, 1)
+            except Exception as exc:  # noqa: BLE001
+                log.debug("pdf_scan: falha ao extrair %s: %s", p, exc)
+                consumed += 1
+                continue
+            consumed += 1
+            on_result(p, payload)
+            if match(payload["text"]):
+                return p, payload["text"]
+        return None
+    finally:
+        # Guarda no cache o que já terminou; o restante é cancelado
+        for p, future in futures[consumed:]:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                on_result(p, future.result())
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scan_pdfs(
+    paths: Iterable[Path],
+    match: Callable[[str], bool],
+    *,
+    kind: str,
+    max_workers: int = PDF_SCAN_WORKERS,
+    cache: Optional[PdfTextCache] = None,
+) -> Optional[tuple[Path, str]]:
+    """Primeiro PDF (no ranking de ``kind``) cujo texto satisfaz ``match``.
+
+    Returns:
+        ``(caminho, texto)`` ou None.
+    """
+    ranked = rank_pdfs(paths, kind)
+    if not ranked:
+        return None
+    cache = cache if cache is not None else get_pdf_text_cache()
+
+    digests: dict[Path, str] = {}
+    for p in ranked:
+        try:
+            digests[p] = _file_sha256(p)
+        except OSError as exc:
+            log.debug("pdf_scan: não foi possível ler %s: %s", p, exc)
+
+    multi_page: list[Path] = []
+    for mode, extractor in (("first", extract_first_page), ("full", extract_full_text)):
+        candidates = list(digests) if mode == "first" else multi_page
+        pending: list[Path] = []
+        for p in candidates:
+            payload = cache.get(digests[p], mode)
+            if payload is None:
+                pending.append(p)
+                continue
+            if mode == "first" and int(payload.get("pages") or 0) > 1:
+                multi_page.append(p)
+            if match(payload["text"]):
+                log.debug("pdf_scan: %s encontrado no cache (%s)", p.name, mode)
+                return p, payload["text"]
+
+        def _store(p: Path, payload: Payload, mode: str = mode) -> None:
+            cache.set(digests[p], mode, payload)
+            if mode == "first" and int(payload.get("pages") or 0) > 1:
+                multi_page.append(p)
+
+        hit = _extract_ranked(pending, extractor, match, _store, max_workers)
+        if hit is not None:
+            log.debug("pdf_scan: %s encontrado (%s, %d lido(s))", hit[0].name, mode, len(pending))
+            return hit
+        # mantém a ordem do ranking para a segunda etapa
+        multi_page.sort(key=ranked.index)
+    return None
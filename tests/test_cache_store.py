@@ -59,6 +59,7 @@ class TestSetGet(unittest.TestCase):
 
             with patch(_MODULE, return_value=t0 + 3601.0):
                 store.get("k")
+            store.flush()
 
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -73,6 +74,7 @@ class TestSetGet(unittest.TestCase):
 
             with patch(_MODULE, return_value=t0):
                 store.set("k", [1, 2])
+            store.flush()
 
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -133,6 +135,7 @@ class TestLegacyEntries(unittest.TestCase):
 
             store = _make_store(path, ttl_hours=1)
             store.get("leg")  # deve migrar automaticamente
+            store.flush()
 
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Testes do JsonCacheStore em memória: expiração preguiçosa, LRU e flush em lote."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.infra.cache_store import JsonCacheStore
+
+_MODULE = "src.infra.cache_store.time.time"
+
+
+class _StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)  # roda depois dos store.close()
+        self.path = os.path.join(self._tmp.name, "cache.json")
+
+    def _store(self, **kw) -> JsonCacheStore:
+        kw.setdefault("flush_delay", 60.0)
+        store = JsonCacheStore(file_path=self.path, ttl_hours=1, **kw)
+        self.addCleanup(store.close)
+        return store
+
+    def _file(self) -> dict:
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+class TestInMemory(_StoreTestCase):
+    def test_get_does_not_touch_disk(self):
+        store = self._store()
+        store.set("k", {"x": 1})
+        with patch("builtins.open", side_effect=AssertionError("leu o arquivo")):
+            for _ in range(10):
+                self.assertEqual(store.get("k"), {"x": 1})
+            self.assertIsNone(store.get("nope"))
+
+    def test_lazy_expiry_via_heap(self):
+        store = self._store()
+        t0 = 1_000_000.0
+        with patch(_MODULE, return_value=t0):
+            store.set("old", 1)
+        with patch(_MODULE, return_value=t0 + 1800):
+            store.set("new", 2)
+        with patch(_MODULE, return_value=t0 + 3601):
+            self.assertEqual(store.get("new"), 2)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.stats().expirations, 1)
+
+    def test_overwrite_extends_expiry(self):
+        store = self._store()
+        t0 = 1_000_000.0
+        with patch(_MODULE, return_value=t0):
+            store.set("k", "a")
+        with patch(_MODULE, return_value=t0 + 3000):
+            store.set("k", "b")
+        with patch(_MODULE, return_value=t0 + 3601):
+            self.assertEqual(store.get("k"), "b")
+
+    def test_non_serializable_payload_fails_on_set(self):
+        store = self._store()
+        with self.assertRaises(TypeError):
+            store.set("k", object())
+        self.assertIsNone(store.get("k"))
+
+
+class TestLimits(_StoreTestCase):
+    def test_lru_eviction_by_count(self):
+        store = self._store(max_entries=3)
+        for k in ("a", "b", "c"):
+            store.set(k, k)
+        store.get("a")  # "b" passa a ser o menos usado
+        store.set("d", "d")
+        self.assertIsNone(store.get("b"))
+        self.assertEqual([store.get(k) for k in ("a", "c", "d")], ["a", "c", "d"])
+        self.assertEqual(store.stats().evictions, 1)
+
+    def test_eviction_by_bytes(self):
+        store = self._store(max_bytes=100)
+        store.set("a", "x" * 40)
+        store.set("b", "y" * 40)
+        store.set("c", "z" * 40)
+        stats = store.stats()
+        self.assertEqual(stats.entries, 2)
+        self.assertLessEqual(stats.bytes_used, 100)
+        self.assertIsNone(store.get("a"))
+
+    def test_stats_count_hits_and_misses(self):
+        store = self._store()
+        store.set("k", 1)
+        store.get("k")
+        store.get("k")
+        store.get("x")
+        stats = store.stats()
+        self.assertEqual((stats.hits, stats.misses), (2, 1))
+        self.assertAlmostEqual(stats.hit_ratio, 2 / 3)
+
+    def test_mutating_results_does_not_change_cache(self):
+        store = self._store()
+        original = {"items": [1]}
+        store.set("k", original)
+        original["items"].append(2)
+        store.get("k")["items"].append(3)
+        store.get_entry("k")["payload"]["items"].append(4)
+        self.assertEqual(store.get("k"), {"items": [1]})
+        store.flush()
+        self.assertEqual(self._file()["k"]["payload"], {"items": [1]})
+
+
+class TestBatchedFlush(_StoreTestCase):
+    def test_sets_are_coalesced_into_one_write(self):
+        store = self._store()
+        for i in range(100):
+            store.set(f"k{i}", i)
+        self.assertEqual(self._file(), {})
+        self.assertTrue(store.flush())
+        self.assertFalse(store.flush())  # nada pendente
+        self.assertEqual(len(self._file()), 100)
+        self.assertEqual(store.stats().flushes, 1)
+
+    def test_timer_flushes_after_delay(self):
+        store = self._store(flush_delay=0.05)
+        store.set("k", "v")
+        timer = store._timer
+        self.assertIsNotNone(timer)
+        timer.join(2)
+        self.assertEqual(self._file()["k"]["payload"], "v")
+
+    def test_zero_delay_writes_through(self):
+        store = self._store(flush_delay=0)
+        store.set("k", "v")
+        self.assertEqual(self._file()["k"]["payload"], "v")
+        store.delete("k")
+        self.assertEqual(self._file(), {})
+
+    def test_reopen_restores_entries(self):
+        store = self._store()
+        store.set("k", {"a": [1, 2]})
+        store.close()
+        self.assertEqual(self._store().get("k"), {"a": [1, 2]})
+
+    def test_corrupt_file_starts_empty(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{nao json")
+        store = self._store()
+        self.assertEqual(len(store), 0)
+        store.set("k", 1)
+        store.flush()
+        self.assertEqual(self._file()["k"]["payload"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Testes dos totais/resumos do Fluxo de Caixa (src/features/cashflow/repository.py)."""
+
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.db.supabase_repo import PostgrestAPIError
+from src.features.cashflow import repository as repo
+
+_ENTRIES = [
+    {"id": "1", "date": "2026-01-05", "type": "IN", "category": "Vendas", "amount": 100, "description": "a"},
+    {"id": "2", "date": "2026-01-20", "type": "OUT", "category": "Aluguel", "amount": 40, "description": "b"},
+    {"id": "3", "date": "2026-02-01", "type": "in", "category": "Vendas", "amount": "10.5", "description": "c"},
+    {"id": "4", "date": "2026-02-01", "type": "OUT", "category": None, "amount": None, "description": "d"},
+]
+
+
+class _FakeQuery:
+    def __init__(self, backend: "_FakeCashflow") -> None:
+        self._backend = backend
+        self.columns = "*"
+        self.range_args: tuple[int, int] | None = None
+
+    def select(self, columns):
+        self.columns = columns
+        return self
+
+    def order(self, *_a, **_kw):
+        return self
+
+    def eq(self, *_a):
+        return self
+
+    def gte(self, *_a):
+        return self
+
+    def lte(self, *_a):
+        return self
+
+    def range(self, start, end):
+        self.range_args = (start, end)
+        return self
+
+    def execute(self):
+        self._backend.selects.append(self)
+        rows = self._backend.rows
+        if self.range_args is not None:
+            rows = rows[self.range_args[0] : self.range_args[1] + 1]
+        return SimpleNamespace(data=list(rows))
+
+
+class _FakeRpc:
+    def __init__(self, backend: "_FakeCashflow", name: str, params: dict) -> None:
+        self._backend = backend
+        self._name = name
+        self._params = params
+
+    def execute(self):
+        self._backend.rpcs.append((self._name, self._params))
+        if self._backend.rpc_error is not None:
+            raise self._backend.rpc_error
+        return SimpleNamespace(data=self._backend.rpc_rows)
+
+
+class _FakeCashflow:
+    def __init__(self, rows=None, rpc_rows=None, rpc_error=None) -> None:
+        self.rows = list(rows or _ENTRIES)
+        self.rpc_rows = rpc_rows or []
+        self.rpc_error = rpc_error
+        self.selects: list[_FakeQuery] = []
+        self.rpcs: list[tuple[str, dict]] = []
+
+    def table(self, name):
+        assert name == repo.TABLE
+        return _FakeQuery(self)
+
+    def rpc(self, name, params):
+        return _FakeRpc(self, name, params)
+
+
+class _RepoTestCase(unittest.TestCase):
+    backend: _FakeCashflow
+
+    def _use(self, backend: _FakeCashflow) -> _FakeCashflow:
+        self.backend = backend
+        for p in (
+            patch.object(repo, "get_supabase_client", lambda: backend),
+            patch.object(repo, "_summary_rpc_missing", False),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        return backend
+
+
+class TestSummaryRpc(_RepoTestCase):
+    def test_totals_come_from_the_rpc_without_listing(self):
+        backend = self._use(
+            _FakeCashflow(
+                rpc_rows=[{"bucket": None, "total_in": "110.5", "total_out": 40, "balance": 70.5, "entries": 4}]
+            )
+        )
+
+        tot = repo.totals("2026-01-01", "2026-12-31", org_id="org-1")
+
+        self.assertEqual(tot, {"in": 110.5, "out": 40.0, "balance": 70.5})
+        self.assertEqual(backend.selects, [])
+        name, params = backend.rpcs[0]
+        self.assertEqual(name, repo.SUMMARY_RPC)
+        self.assertEqual(params["p_org_id"], "org-1")
+        self.assertEqual((params["p_from"], params["p_to"], params["p_group"]), ("2026-01-01", "2026-12-31", None))
+
+    def test_empty_period_is_zero(self):
+        self._use(_FakeCashflow(rpc_rows=[]))
+        self.assertEqual(repo.totals(None, None), {"in": 0.0, "out": 0.0, "balance": 0.0})
+
+    def test_grouped_summary_is_passed_through(self):
+        backend = self._use(
+            _FakeCashflow(
+                rpc_rows=[
+                    {"bucket": "2026-01", "total_in": 100, "total_out": 40, "balance": 60, "entries": 2},
+                    {"bucket": "2026-02", "total_in": 10.5, "total_out": 0, "balance": 10.5, "entries": 2},
+                ]
+            )
+        )
+
+        summary = repo.summarize("2026-01-01", "2026-02-28", group_by="month", type_filter="IN")
+
+        self.assertEqual([s["bucket"] for s in summary], ["2026-01", "2026-02"])
+        self.assertEqual(summary[1]["count"], 2)
+        self.assertEqual(backend.rpcs[0][1]["p_type"], "IN")
+
+    def test_invalid_group_is_rejected(self):
+        self._use(_FakeCashflow())
+        with self.assertRaises(ValueError):
+            repo.summarize(None, None, group_by="week")
+
+    def test_other_rpc_errors_are_raised(self):
+        self._use(_FakeCashflow(rpc_error=PostgrestAPIError({"code": "57014", "message": "statement timeout"})))
+        with self.assertRaises(RuntimeError):
+            repo.totals(None, None)
+
+
+class TestSummaryFallback(_RepoTestCase):
+    def setUp(self):
+        missing = PostgrestAPIError({"code": "PGRST202", "message": "Could not find the function"})
+        self._use(_FakeCashflow(rpc_error=missing))
+
+    def test_missing_function_sums_projected_rows_and_is_remembered(self):
+        first = repo.totals("2026-01-01", "2026-12-31")
+        second = repo.totals("2026-01-01", "2026-12-31")
+
+        self.assertEqual(first, {"in": 110.5, "out": 40.0, "balance": 70.5})
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.backend.rpcs), 1)
+        self.assertEqual([q.columns for q in self.backend.selects], ["type,amount", "type,amount"])
+
+    def test_fallback_groups_like_the_rpc(self):
+        by_month = repo.summarize(None, None, group_by="month")
+        by_category = repo.summarize(None, None, group_by="category")
+
+        self.assertEqual(
+            [(s["bucket"], s["in"], s["out"], s["count"]) for s in by_month],
+            [("2026-01", 100.0, 40.0, 2), ("2026-02", 10.5, 0.0, 2)],
+        )
+        self.assertEqual([s["bucket"] for s in by_category], ["", "Aluguel", "Vendas"])
+
+
+class TestListEntries(_RepoTestCase):
+    def test_projection_and_page(self):
+        backend = self._use(_FakeCashflow())
+
+        page = repo.list_entries(None, None, columns=repo.LIST_COLUMNS, limit=2, offset=2)
+
+        self.assertEqual([r["id"] for r in page], ["3", "4"])
+        self.assertEqual(backend.selects[0].columns, repo.LIST_COLUMNS)
+        self.assertEqual(backend.selects[0].range_args, (2, 3))
+
+    def test_without_limit_returns_whole_period(self):
+        self._use(_FakeCashflow())
+        self.assertEqual(len(repo.list_entries(None, None)), len(_ENTRIES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Testes da resolução em lote de nomes de clientes (clientes_service + Hub)."""
+
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.core.services import clientes_service as svc
+
+
+class _FakeQuery:
+    def __init__(self, backend: "_FakeClients") -> None:
+        self._backend = backend
+        self._ids: list[int] = []
+        self._org: str | None = None
+
+    def select(self, _cols):
+        return self
+
+    def eq(self, col, value):
+        assert col == "org_id"
+        self._org = value
+        return self
+
+    def in_(self, _col, ids):
+        self._ids = list(ids)
+        return self
+
+    def run(self):
+        self._backend.queries.append(self._ids)
+        self._backend.orgs.append(self._org)
+        rows = [self._backend.rows[i] for i in self._ids if i in self._backend.rows]
+        if self._org is not None:
+            rows = [r for r in rows if r["org_id"] == self._org]
+        return SimpleNamespace(data=rows)
+
+
+class _FakeClients:
+    """Tabela clients em memória; exec_postgrest executa a query montada."""
+
+    def __init__(self, rows: dict[int, dict]) -> None:
+        self.rows = rows
+        self.queries: list[list[int]] = []
+        self.orgs: list[str | None] = []
+        self.fail = False
+
+    def table(self, name):
+        assert name == "clients"
+        return _FakeQuery(self)
+
+    def exec_postgrest(self, query):
+        if self.fail:
+            raise ConnectionError("offline")
+        return query.run()
+
+
+def _rows(n: int) -> dict[int, dict]:
+    return {
+        i: {"id": i, "org_id": "o", "razao_social": f"Farmácia {i}", "nome": "", "cnpj": f"{i:014d}"}
+        for i in range(1, n + 1)
+    }
+
+
+class _ResolverTestCase(unittest.TestCase):
+    rows = _rows(400)
+
+    def setUp(self):
+        self.backend = _FakeClients(dict(self.rows))
+        self._patchers = [
+            patch.object(svc, "supabase", self.backend),
+            patch.object(svc, "exec_postgrest", self.backend.exec_postgrest),
+            patch.object(svc, "_client_info_cache", svc.ClientInfoCache()),
+        ]
+        for p in self._patchers:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self._patchers):
+            p.stop()
+
+
+class TestBatchResolver(_ResolverTestCase):
+    def test_single_query_for_small_id_set(self):
+        names = svc.resolve_client_names([3, 1, 2, 3])
+        self.assertEqual(names, {3: "Farmácia 3", 1: "Farmácia 1", 2: "Farmácia 2"})
+        self.assertEqual(len(self.backend.queries), 1)
+
+    def test_large_id_set_is_chunked(self):
+        svc.resolve_client_names(range(1, 351))
+        self.assertEqual([len(q) for q in self.backend.queries], [150, 150, 50])
+
+    def test_cached_ids_are_not_requeried(self):
+        svc.resolve_client_names([1, 2])
+        svc.resolve_client_names([2, 3])
+        self.assertEqual(self.backend.queries, [[1, 2], [3]])
+
+    def test_unknown_id_gets_fallback_and_negative_cache(self):
+        self.assertEqual(svc.resolve_client_names([999]), {999: "Cliente #999"})
+        svc.resolve_client_names([999])
+        self.assertEqual(len(self.backend.queries), 1)
+
+    def test_expired_entries_are_refetched(self):
+        with patch.object(svc.time, "monotonic", return_value=1000.0):
+            svc.resolve_client_names([1])
+        with patch.object(svc.time, "monotonic", return_value=1000.0 + svc.CLIENT_INFO_TTL_SECONDS + 1):
+            svc.resolve_client_names([1])
+        self.assertEqual(len(self.backend.queries), 2)
+
+    def test_falls_back_to_nome_then_placeholder(self):
+        self.backend.rows[5] = {"id": 5, "razao_social": None, "nome": "Drogaria Centro", "cnpj": None}
+        self.backend.rows[6] = {"id": 6, "razao_social": "", "nome": "", "cnpj": ""}
+        self.assertEqual(svc.resolve_client_names([5, 6]), {5: "Drogaria Centro", 6: "Cliente #6"})
+
+    def test_network_error_is_not_cached(self):
+        self.backend.fail = True
+        self.assertEqual(svc.resolve_client_names([1]), {1: "Cliente #1"})
+        self.backend.fail = False
+        self.assertEqual(svc.resolve_client_names([1]), {1: "Farmácia 1"})
+
+    def test_invalidate_forces_refetch(self):
+        svc.resolve_client_names([1])
+        svc.invalidate_client_info_cache([1])
+        svc.resolve_client_names([1])
+        self.assertEqual(len(self.backend.queries), 2)
+
+    def test_org_filter_and_cache_are_per_organization(self):
+        self.assertEqual(svc.resolve_client_names([1], org_id="o"), {1: "Farmácia 1"})
+        # mesmo id visto por outra organização: nova consulta filtrada, sem reaproveitar o cache
+        self.assertEqual(svc.resolve_client_names([1], org_id="outra"), {1: "Cliente #1"})
+        svc.resolve_client_names([1], org_id="o")
+        self.assertEqual(self.backend.orgs, ["o", "outra"])
+
+    def test_invalidate_drops_id_in_every_org(self):
+        svc.resolve_client_names([1], org_id="o")
+        svc.resolve_client_names([1])
+        svc.invalidate_client_info_cache([1])
+        svc.resolve_client_names([1], org_id="o")
+        svc.resolve_client_names([1])
+        self.assertEqual(len(self.backend.queries), 4)
+
+    def test_logout_clears_cache(self):
+        from src.infra import supabase_auth
+
+        svc.resolve_client_names([1], org_id="o")
+        with (
+            patch.object(supabase_auth.session, "set_tokens"),
+            patch.object(supabase_auth.prefs_utils, "clear_auth_session"),
+            patch("src.core.db_manager.replica.stop_clients_replica"),
+        ):
+            supabase_auth.logout(client=SimpleNamespace(auth=SimpleNamespace(sign_out=lambda: None)))
+        svc.resolve_client_names([1], org_id="o")
+        self.assertEqual(len(self.backend.queries), 2)
+
+    def test_ignores_invalid_ids(self):
+        self.assertEqual(svc.resolve_clients_info([None, "x", True]), {})
+        self.assertEqual(self.backend.queries, [])
+
+
+class TestHubUsesResolver(_ResolverTestCase):
+    def test_dashboard_names_keep_original_keys(self):
+        from src.modules.hub.dashboard.data_access import fetch_client_names_impl
+
+        names = fetch_client_names_impl([1, "2"])
+        self.assertEqual(names, {1: "Farmácia 1", "2": "Farmácia 2"})
+        self.assertEqual(len(self.backend.queries), 1)
+
+    def test_recent_activity_resolves_within_org_and_caches(self):
+        from src.modules.hub.recent_activity_store import ActivityEvent, RecentActivityStore
+
+        def _events():
+            return [
+                ActivityEvent(org_id="o", module="ANVISA", action="Concluída", message="m", client_id=7),
+                ActivityEvent(org_id="o", module="SIFAP", action="Criada", message="m", client_id=8),
+            ]
+
+        store = RecentActivityStore()
+        events = store._enrich_events_with_client_info(_events(), "o")
+        self.assertEqual([e.metadata.get("razao_social") for e in events], ["Farmácia 7", "Farmácia 8"])
+        self.assertEqual(events[0].cnpj, "00000000000007")
+        store._enrich_events_with_client_info(_events(), "o")
+        self.assertEqual(self.backend.orgs, ["o"])
+
+        foreign = store._enrich_events_with_client_info(_events(), "outra")
+        self.assertEqual([e.metadata.get("razao_social") for e in foreign], [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
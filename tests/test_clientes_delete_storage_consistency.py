@@ -219,5 +219,23 @@ class TestExcluirClientesStorageConsistency(unittest.TestCase):
         self.assertEqual(calls, [(1, 1, 7)])
 
 
+class TestRemoveClienteStorageListingCache(unittest.TestCase):
+    """A limpeza do storage descarta a listagem do cliente no cache do navegador."""
+
+    def test_invalida_cache_mesmo_com_falha(self):
+        from src.modules.clientes.core.service import _remove_cliente_storage
+
+        with (
+            patch(f"{_MOD}.SupabaseStorageAdapter") as mock_adapter,
+            patch(f"{_MOD}.get_listing_cache") as mock_cache,
+        ):
+            mock_adapter.return_value.delete_prefix.side_effect = RuntimeError("rede")
+
+            with self.assertRaises(ClienteStorageRemovalError):
+                _remove_cliente_storage("rc-docs", "org-test-123", 42)
+
+        mock_cache.return_value.invalidate.assert_called_once_with("rc-docs", "org-test-123/42", recursive=True)
+
+
 if __name__ == "__main__":
     unittest.main()
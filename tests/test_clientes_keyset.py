@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Testes da paginação por cursor (keyset) de clientes (src/core/db_manager/keyset.py)."""
+
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.core.db_manager import db_manager as dbm
+from src.core.db_manager.keyset import (
+    ClientesPage,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    page_from_rows,
+)
+from src.core.models import Cliente
+from src.core.search import search as search_mod
+from src.core.search.search import search_clientes
+
+_USER = SimpleNamespace(org_id="org-1")
+
+
+def _cliente(cid: int) -> Cliente:
+    return Cliente(
+        id=cid,
+        numero=None,
+        nome=None,
+        razao_social=f"C{cid}",
+        cnpj=None,
+        cnpj_norm=None,
+        ultima_alteracao=None,
+        obs=None,
+        ultima_por=None,
+    )
+
+
+def _query_builder() -> tuple[MagicMock, MagicMock]:
+    supabase = MagicMock()
+    qb = supabase.table.return_value.select.return_value
+    qb.not_.is_.return_value = qb
+    for name in ("is_", "eq", "ilike", "or_", "order", "range", "limit", "lt", "gt"):
+        getattr(qb, name).return_value = qb
+    return supabase, qb
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        row = {"id": 42, "ultima_alteracao": "2026-03-01T10:00:00+00:00"}
+        cursor = encode_cursor("ultima_alteracao", True, row)
+        self.assertEqual(decode_cursor(cursor, "ultima_alteracao", True), ("2026-03-01T10:00:00+00:00", 42))
+
+    def test_cursor_from_other_ordering_is_rejected(self):
+        cursor = encode_cursor("razao_social", False, {"id": 1, "razao_social": "A"})
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(cursor, "razao_social", True)
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(cursor, "nome", False)
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor("não-é-cursor", "razao_social", False)
+
+    def test_filter_follows_order_and_null_placement(self):
+        self.assertEqual(
+            keyset_filter("razao_social", False, "A, B", 7, id_desc=False),
+            'razao_social.gt."A, B",and(razao_social.eq."A, B",id.gt."7"),razao_social.is.null',
+        )
+        self.assertEqual(
+            keyset_filter("ultima_alteracao", True, "2026-03-01", 7, id_desc=True),
+            'ultima_alteracao.lt."2026-03-01",and(ultima_alteracao.eq."2026-03-01",id.lt."7")',
+        )
+        # ASC → NULLS LAST: depois de um NULL só restam NULLs
+        self.assertEqual(keyset_filter("nome", False, None, 7, id_desc=True), 'and(nome.is.null,id.lt."7")')
+        # DESC → NULLS FIRST: depois dos NULLs vêm os não nulos
+        self.assertEqual(
+            keyset_filter("nome", True, None, 7, id_desc=True), 'nome.not.is.null,and(nome.is.null,id.lt."7")'
+        )
+
+    def test_short_page_has_no_next_cursor(self):
+        rows = [{"id": 1}, {"id": 2}]
+        self.assertIsNone(page_from_rows(rows, rows, None, False, 5).next_cursor)
+        self.assertIsNone(page_from_rows(rows, rows, None, False, None).next_cursor)
+        page = page_from_rows(rows, rows, None, False, 2)
+        self.assertEqual(decode_cursor(page.next_cursor, None, False), (2, 2))
+
+
+class TestSearchWithCursor(unittest.TestCase):
+    def setUp(self):
+        self.supabase, self.qb = _query_builder()
+        rows = [{"id": 9, "razao_social": "Beta"}, {"id": 8, "razao_social": "Beta"}]
+        self.exec = MagicMock(return_value=SimpleNamespace(data=rows))
+        for p in (
+            patch.object(search_mod, "supabase", self.supabase),
+            patch.object(search_mod, "exec_postgrest", self.exec),
+            patch.object(search_mod, "is_supabase_online", return_value=True),
+            patch.object(search_mod, "get_current_user", return_value=_USER),
+            patch.object(search_mod, "_server_norm_available", None),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_full_page_returns_cursor_and_next_page_uses_keyset(self):
+        first = search_clientes("", "-razao_social", limit=2)
+        self.assertIsInstance(first, ClientesPage)
+        self.assertEqual(decode_cursor(first.next_cursor, "razao_social", True), ("Beta", 8))
+
+        self.qb.range.reset_mock()
+        second = search_clientes("", "-razao_social", limit=2, cursor=first.next_cursor)
+
+        self.qb.range.assert_not_called()
+        self.qb.limit.assert_called_once_with(2)
+        self.qb.or_.assert_called_once_with('razao_social.lt."Beta",and(razao_social.eq."Beta",id.lt."8")')
+        self.assertEqual([c.id for c in second], [9, 8])
+
+    def test_default_order_uses_id_comparison(self):
+        first = search_clientes("", None, limit=2)
+        search_clientes("", None, limit=2, cursor=first.next_cursor)
+        self.qb.gt.assert_called_once_with("id", 8)
+        self.qb.or_.assert_not_called()
+
+    def test_cursor_from_other_ordering_raises(self):
+        first = search_clientes("", "-razao_social", limit=2)
+        with self.assertRaises(InvalidCursorError):
+            search_clientes("", "+razao_social", limit=2, cursor=first.next_cursor)
+
+
+class TestListWithCursor(unittest.TestCase):
+    def test_list_by_org_uses_keyset_instead_of_range(self):
+        supabase, qb = _query_builder()
+        rows = [{"id": 5, "ultima_alteracao": "2026-03-02"}, {"id": 4, "ultima_alteracao": "2026-03-01"}]
+        with (
+            patch.object(dbm, "supabase", supabase),
+            patch.object(dbm, "exec_postgrest", return_value=SimpleNamespace(data=rows)),
+        ):
+            first = dbm.list_clientes_by_org("org-1", order_by="ultima_alteracao", limit=2)
+            qb.range.reset_mock()
+            dbm.list_clientes_by_org("org-1", order_by="ultima_alteracao", limit=2, cursor=first.next_cursor)
+
+        qb.range.assert_not_called()
+        qb.limit.assert_called_once_with(2)
+        qb.or_.assert_called_once_with(
+            'ultima_alteracao.lt."2026-03-01",and(ultima_alteracao.eq."2026-03-01",id.lt."4")'
+        )
+
+
+class TestViewModelCursor(unittest.TestCase):
+    def test_load_next_page_passes_cursor_from_previous_page(self):
+        from src.modules.clientes.core.viewmodel import ClientesViewModel
+
+        pages = [ClientesPage([_cliente(1), _cliente(2)], "cur-1"), ClientesPage([_cliente(3)], None)]
+        vm = ClientesViewModel()
+        vm._page_size = 2
+        with patch("src.modules.clientes.core.viewmodel.search_clientes", side_effect=pages) as fake:
+            vm.refresh_from_service()
+            self.assertTrue(vm.load_next_page())
+
+        _args, kwargs = fake.call_args
+        self.assertEqual(kwargs, {"limit": 2, "cursor": "cur-1"})
+        self.assertFalse(vm.has_more)
+        self.assertEqual(len(vm._clientes_raw), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
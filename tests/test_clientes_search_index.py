@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Testes do índice de busca incremental da lista de Clientes."""
+
+from __future__ import annotations
+
+import random
+import unicodedata as ud
+import unittest
+from unittest.mock import patch
+
+from src.core.text_normalization import strip_diacritics
+from src.core.textnorm import normalize_search
+from src.modules.clientes.core import search_index as si
+from src.modules.clientes.core.search_index import ClientesSearchIndex
+from src.modules.clientes.core.viewmodel import ClientesViewModel
+
+ORDER_CHOICES = {
+    "Razão Social (A→Z)": ("razao_social", False),
+    "CNPJ (A→Z)": ("cnpj", False),
+}
+
+
+def _cliente(i: int, razao: str | None = None, obs: str = "") -> dict:
+    return {
+        "id": i,
+        "razao_social": razao or f"Farmácia {i:05d}",
+        "cnpj": f"{i:014d}",
+        "nome": f"Contato {i}",
+        "observacoes": obs,
+    }
+
+
+class TestNormalizeSearch(unittest.TestCase):
+    @staticmethod
+    def _reference(value: object) -> str:
+        folded = strip_diacritics("" if value is None else str(value)).casefold()
+        return "".join(ch for ch in folded if ud.category(ch)[0] not in "PZCS")
+
+    def test_ascii_fast_path_matches_unicode_rules(self):
+        for code in range(128):
+            self.assertEqual(normalize_search(chr(code)), self._reference(chr(code)))
+        self.assertEqual(normalize_search("12.345.678/0001-90"), "12345678000190")
+
+    def test_non_ascii_unchanged(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            text = "".join(chr(rng.randrange(0, 400)) for _ in range(12))
+            self.assertEqual(normalize_search(text), self._reference(text))
+        self.assertEqual(normalize_search("Farmácia São João"), "farmaciasaojoao")
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.idx: ClientesSearchIndex[str] = ClientesSearchIndex()
+        for i, text in enumerate(["farmaciacentral", "drogariasul", "farmacianorte", "centralfarma"]):
+            self.idx.add(text, f"r{i}", key=str(i))
+
+    def test_substring_results_keep_insertion_order(self):
+        self.assertEqual(self.idx.search("central"), ["r0", "r3"])
+        self.assertEqual(self.idx.search("fa"), ["r0", "r2", "r3"])
+        self.assertEqual(self.idx.search(""), ["r0", "r1", "r2", "r3"])
+        self.assertEqual(self.idx.search("xyz"), [])
+
+    def test_results_match_linear_scan(self):
+        rng = random.Random(3)
+        alphabet = "abcde"
+        texts = ["".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 20))) for _ in range(300)]
+        idx: ClientesSearchIndex[int] = ClientesSearchIndex()
+        for n, text in enumerate(texts):
+            idx.add(text, n)
+        for _ in range(200):
+            q = "".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 6)))
+            self.assertEqual(idx.search(q), [n for n, t in enumerate(texts) if q in t], q)
+
+    def test_refinement_reuses_previous_result(self):
+        self.idx.search("farma")
+        with patch.object(self.idx, "_build_postings", side_effect=AssertionError("consultou postings")):
+            self.assertEqual(self.idx.search("farmacian"), ["r2"])
+
+    def test_short_queries_do_not_build_postings(self):
+        self.idx.search("fa")
+        self.assertIsNone(self.idx._postings)
+
+    def test_replace_keeps_position_and_reindexes(self):
+        self.idx.search("central")  # força postings
+        self.assertTrue(self.idx.replace("0", "drogarianova", "r0b"))
+        self.assertEqual(self.idx.search("central"), ["r3"])
+        self.assertEqual(self.idx.search("drogaria"), ["r0b", "r1"])
+        self.assertFalse(self.idx.replace("99", "x", "x"))
+
+    def test_remove_and_compaction(self):
+        idx: ClientesSearchIndex[int] = ClientesSearchIndex()
+        for n in range(600):
+            idx.add(f"cliente{n:04d}", n, key=n)
+        idx.search("cliente")
+        with patch.object(si, "_COMPACT_MIN_DEAD", 10):
+            for n in range(0, 600, 2):
+                self.assertEqual(idx.remove(n), 1)
+        self.assertEqual(len(idx), 300)
+        self.assertLess(len(idx._texts), 600)  # compactou
+        self.assertEqual(idx.search("cliente000"), [1, 3, 5, 7, 9])
+        self.assertEqual(idx.remove(0), 0)
+
+
+class TestViewModelUsesIndex(unittest.TestCase):
+    def setUp(self):
+        self.vm = ClientesViewModel(order_choices=ORDER_CHOICES, default_order_label="Razão Social (A→Z)")
+        clientes = [_cliente(i) for i in range(1, 51)]
+        clientes.append(_cliente(99, "Drogaria Ávila", obs="[Ativo] cliente antigo"))
+        self.vm.load_from_iterable(clientes)
+
+    def test_rows_built_once_per_cliente(self):
+        with patch.object(ClientesViewModel, "_build_row_from_cliente", side_effect=AssertionError("reconstruiu")):
+            for text in ("f", "fa", "far", "farm", "avila", ""):
+                self.vm.set_search_text(text)
+            self.vm.set_status_filter("Ativo")
+            self.vm.set_order_label("CNPJ (A→Z)")
+
+    def test_accent_insensitive_search(self):
+        self.vm.set_search_text("ÁVILA")
+        self.assertEqual([r.id for r in self.vm.get_rows()], ["99"])
+
+    def test_filtered_sort_matches_full_sort(self):
+        self.vm.set_order_label("CNPJ (A→Z)")
+        self.vm.set_search_text("contato1")
+        self.assertEqual(
+            [r.id for r in self.vm.get_rows()],
+            ["1"] + [str(i) for i in range(10, 20)],
+        )
+
+    def test_upsert_updates_in_place(self):
+        self.vm.upsert_cliente(_cliente(3, "Drogaria Nova"))
+        self.vm.set_search_text("drogaria nova")
+        self.assertEqual([r.razao_social for r in self.vm.get_rows()], ["Drogaria Nova"])
+        self.assertEqual(len(self.vm._clientes_raw), 51)
+
+    def test_edit_patches_index_without_rebuild(self):
+        index = self.vm._index
+        self.vm.set_search_text("farmacia")  # monta os postings
+        version = index.version
+        with (
+            patch.object(ClientesViewModel, "_reindex", side_effect=AssertionError("reindexou")),
+            patch.object(ClientesSearchIndex, "clear", side_effect=AssertionError("limpou o índice")),
+        ):
+            self.vm.upsert_cliente(_cliente(3, "Farmácia Editada"))
+            self.vm.remove_clientes([4])
+        self.assertIs(self.vm._index, index)
+        self.assertIsNotNone(index._postings)
+        self.assertEqual(index.version, version + 2)  # um passo por edição, sem recomeçar
+        self.vm.set_search_text("editada")
+        self.assertEqual([r.id for r in self.vm.get_rows()], ["3"])
+
+    def test_upsert_appends_new_cliente(self):
+        self.vm.upsert_cliente(_cliente(500, "Farmácia Zeta", obs="[Pendente]"))
+        self.vm.set_search_text("zeta")
+        self.assertEqual([r.id for r in self.vm.get_rows()], ["500"])
+        self.assertIn("Pendente", self.vm.get_status_choices())
+
+    def test_remove_clientes(self):
+        self.assertEqual(self.vm.remove_clientes([99, "1"]), 2)
+        self.assertNotIn("Ativo", self.vm.get_status_choices())
+        self.vm.set_search_text("")
+        self.assertEqual(len(self.vm.get_rows()), 49)
+
+    def test_trash_marker_is_not_a_status_choice(self):
+        vm = ClientesViewModel()
+        vm._trash_mode = True
+        vm.load_from_iterable([_cliente(1), _cliente(2, obs="[Ativo] x")])
+        self.assertEqual([r.status for r in vm.get_rows()], ["[LIXEIRA]", "Ativo"])
+        self.assertEqual(vm.get_status_choices(), ["Ativo"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Testes da busca server-side normalizada de clientes (coluna search_norm)."""
+
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from postgrest.exceptions import APIError
+
+from src.core.models import Cliente
+from src.core.search import search as search_mod
+from src.core.search.search import search_clientes, search_clientes_lixeira
+
+_USER = SimpleNamespace(org_id="org-1")
+
+
+def _query_builder() -> tuple[MagicMock, MagicMock]:
+    supabase = MagicMock()
+    qb = supabase.table.return_value.select.return_value
+    qb.not_.is_.return_value = qb
+    for name in ("is_", "eq", "ilike", "or_", "order", "range"):
+        getattr(qb, name).return_value = qb
+    return supabase, qb
+
+
+class _SearchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.supabase, self.qb = _query_builder()
+        self.exec = MagicMock(return_value=SimpleNamespace(data=[{"id": 7, "razao_social": "Açúcar Ltda"}]))
+        self._patchers = [
+            patch.object(search_mod, "supabase", self.supabase),
+            patch.object(search_mod, "exec_postgrest", self.exec),
+            patch.object(search_mod, "is_supabase_online", return_value=True),
+            patch.object(search_mod, "get_current_user", return_value=_USER),
+            patch.object(search_mod, "_server_norm_available", None),
+        ]
+        for p in self._patchers:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self._patchers):
+            p.stop()
+
+
+class TestServerSideNormalizedSearch(_SearchTestCase):
+    def test_term_is_normalized_and_matched_on_search_norm(self):
+        result = search_clientes("  AÇÚCAR-ltda ", limit=50, offset=100)
+        self.qb.ilike.assert_called_once_with("search_norm", "%acucarltda%")
+        self.qb.or_.assert_not_called()
+        self.qb.range.assert_called_once_with(100, 149)
+        self.assertEqual([c.id for c in result], [7])
+
+    def test_single_request_even_without_results(self):
+        self.exec.return_value = SimpleNamespace(data=[])
+        self.assertEqual(search_clientes("inexistente", limit=200), [])
+        self.assertEqual(self.exec.call_count, 1)
+
+    def test_server_rows_are_not_refiltered_locally(self):
+        # O servidor já aplicou a regra; match via id/obs não é descartado no cliente
+        self.exec.return_value = SimpleNamespace(data=[{"id": 12345, "razao_social": "Outra"}])
+        self.assertEqual(len(search_clientes("2345", limit=200)), 1)
+
+    def test_punctuation_only_term_does_not_filter(self):
+        search_clientes(" -./ ", limit=200)
+        self.qb.ilike.assert_not_called()
+
+    def test_trash_uses_same_filter(self):
+        search_clientes_lixeira("São João", limit=200)
+        self.qb.not_.is_.assert_called_with("deleted_at", "null")
+        self.qb.ilike.assert_called_once_with("search_norm", "%saojoao%")
+
+    def test_online_errors_propagate_without_full_table_fallback(self):
+        self.exec.side_effect = RuntimeError("timeout")
+        with patch("src.core.db_manager.db_manager.list_clientes_by_org") as local:
+            with self.assertRaises(RuntimeError):
+                search_clientes("abc", limit=200)
+        local.assert_not_called()
+        self.assertEqual(self.exec.call_count, 1)
+
+
+class TestMissingMigration(_SearchTestCase):
+    def test_falls_back_to_legacy_ilike_once(self):
+        drift = APIError({"code": "42703", "message": "column clients.search_norm does not exist"})
+        self.exec.side_effect = [drift, SimpleNamespace(data=[]), SimpleNamespace(data=[])]
+
+        search_clientes("farmacia", limit=200)
+        self.qb.or_.assert_called_once()
+        self.assertIn("razao_social.ilike.%farmacia%", self.qb.or_.call_args[0][0])
+        self.assertIs(search_mod._server_norm_available, False)
+
+        # próximas buscas já vão direto ao caminho legado (1 requisição)
+        search_clientes("farmacia", limit=200)
+        self.assertEqual(self.exec.call_count, 3)
+        self.assertEqual(self.qb.ilike.call_count, 1)
+
+
+class TestOfflineFallback(unittest.TestCase):
+    def test_offline_filters_locally_accent_insensitive(self):
+        clientes = [
+            Cliente(id=1, numero="", nome="", razao_social="Farmácia São João", cnpj="", cnpj_norm="",
+                    ultima_alteracao="", obs="", ultima_por=""),
+            Cliente(id=2, numero="", nome="", razao_social="Drogaria Sul", cnpj="", cnpj_norm="",
+                    ultima_alteracao="", obs="", ultima_por=""),
+        ]  # fmt: skip
+        with (
+            patch.object(search_mod, "is_supabase_online", return_value=False),
+            patch("src.core.db_manager.db_manager.list_clientes_by_org", return_value=clientes),
+        ):
+            result = search_clientes("sao joao", org_id="org-1")
+        self.assertEqual([c.id for c in result], [1])
+
+    def test_local_blob_matches_server_column_order(self):
+        from src.core.db_manager.replica import _search_blob
+
+        row = {"id": 7, "razao_social": "Açúcar Ltda", "cnpj": "11.222", "nome": "Ana", "numero": "9", "obs": "x"}
+        cliente = search_mod._row_to_cliente(row)
+        # concat_ws(' ', id, razao_social, cnpj, nome, numero, obs) da migration 20260410
+        self.assertEqual(search_mod._cliente_search_blob(cliente), "7acucarltda11222ana9x")
+        self.assertEqual(_search_blob(row), search_mod._cliente_search_blob(cliente))
+
+
+if __name__ == "__main__":
+    unittest.main()
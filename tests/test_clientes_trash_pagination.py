@@ -155,6 +155,7 @@ class TestSearchClientesLixeira:
         qb.not_.is_.return_value = qb
         qb.eq.return_value = qb
         qb.or_.return_value = qb
+        qb.ilike.return_value = qb
         qb.order.return_value = qb
         qb.range.return_value = qb
 
@@ -168,6 +169,7 @@ class TestSearchClientesLixeira:
             patch(_PATCH_EXEC, mock_exec),
             patch(_PATCH_IS_ONLINE, return_value=True),
             patch(_PATCH_GET_USER, return_value=_fake_user()),
+            patch("src.core.search.search._server_norm_available", None),
         ):
             search_clientes_lixeira(term, order_by, limit=limit, offset=offset)
 
@@ -191,9 +193,9 @@ class TestSearchClientesLixeira:
         assert id_calls, f"Tiebreaker por id não encontrado: {order_calls}"
 
     def test_ilike_applied_with_term(self):
-        """Quando term não é vazio, or_ com ilike é aplicado."""
-        qb = self._call_with_mock(term="farmácia")
-        qb.or_.assert_called()
+        """Quando term não é vazio, ilike na coluna normalizada é aplicado."""
+        qb = self._call_with_mock(term="Farmácia")
+        qb.ilike.assert_called_once_with("search_norm", "%farmacia%")
 
     def test_no_range_when_limit_none(self):
         """Sem limit, range NÃO é chamado."""
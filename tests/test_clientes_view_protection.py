@@ -3613,11 +3613,11 @@ class TestOpenClientEditorAST:
         # Flag deve ser resetada no bloco except
         assert "self._opening_editor = False" in src
 
-    def test_on_saved_callback_calls_load_async(self) -> None:
-        """O callback on_saved deve acionar load_async para recarregar a lista."""
+    def test_on_saved_callback_refreshes_saved_client(self) -> None:
+        """O callback on_saved deve atualizar só a linha salva via _refresh_saved_client."""
         fn = _method_node("_open_client_editor")
         src = _source_of(fn)
-        assert "load_async" in src, "on_saved callback deve chamar load_async"
+        assert "_refresh_saved_client" in src, "on_saved callback deve chamar _refresh_saved_client"
 
     def test_on_closed_callback_clears_dialog_and_flag(self) -> None:
         """O callback on_closed deve limpar _editor_dialog e _opening_editor."""
@@ -3710,15 +3710,26 @@ class TestOpenClientEditorGuardBehavior:
             _open_client_editor(fake)
         assert fake._editor_dialog is None
 
-    def test_on_save_callback_triggers_load_async(self) -> None:
-        """Invocar on_save (closure passada ao dialog) deve chamar load_async."""
+    def test_on_save_callback_refreshes_saved_client(self) -> None:
+        """Invocar on_save (closure passada ao dialog) atualiza só o cliente salvo."""
         fake = _make_editor_fake(client_id=10)
         stub_cls = MagicMock(return_value=MagicMock())
         with _patch_editor_dialog(stub_cls):
             _open_client_editor(fake)
         on_save = stub_cls.call_args.kwargs["on_save"]
         on_save({"data": "qualquer"})
-        fake.load_async.assert_called()
+        fake._refresh_saved_client.assert_called_once_with(10)
+        fake.load_async.assert_not_called()
+
+    def test_on_save_for_new_client_uses_saved_id(self) -> None:
+        """Cliente novo: o id vem do editor em ``_cliente_id``."""
+        fake = _make_editor_fake(client_id=None)
+        stub_cls = MagicMock(return_value=MagicMock())
+        with _patch_editor_dialog(stub_cls):
+            _open_client_editor(fake, new_client=True)
+        on_save = stub_cls.call_args.kwargs["on_save"]
+        on_save({"_cliente_id": 55})
+        fake._refresh_saved_client.assert_called_once_with(55)
 
     def test_on_close_callback_clears_dialog_and_resets_flag(self) -> None:
         """Invocar on_close (closure passada ao dialog) deve zerar _editor_dialog e _opening_editor."""
@@ -3735,73 +3746,33 @@ class TestOpenClientEditorGuardBehavior:
         assert fake._opening_editor is False
 
 
-# ── SEÇÃO 25B: _deselect_and_reload — microextração (comum a delete/restore) ─
-
-_VIEW_DESELECT_PATH = Path(_VIEW_FILE)
-
-
-class TestDeselectAndReloadAST:
-    """_deselect_and_reload deve existir e conter a lógica extraída dos closures."""
-
-    def _method_src(self) -> str:
-        src = _VIEW_DESELECT_PATH.read_text(encoding="utf-8")
-        start = src.find("def _deselect_and_reload(")
-        assert start >= 0, "_deselect_and_reload não encontrado em view.py"
-        end = src.find("\n    def ", start + 1)
-        return src[start:end] if end > 0 else src[start:]
-
-    def test_method_exists(self) -> None:
-        """_deselect_and_reload deve existir em view.py."""
-        self._method_src()  # levanta AssertionError se não encontrado
-
-    def test_clears_selected_client_id(self) -> None:
-        """_deselect_and_reload deve zerar _selected_client_id."""
-        src = self._method_src()
-        assert (
-            "self._selected_client_id = None" in src
-        ), "_deselect_and_reload deve atribuir None a _selected_client_id."
+# ── SEÇÃO 25B: _remove_and_render — comum a delete/restore ─────────────────
 
-    def test_calls_carregar(self) -> None:
-        """_deselect_and_reload deve chamar self.carregar()."""
-        src = self._method_src()
-        assert "self.carregar()" in src, "_deselect_and_reload deve chamar carregar() para recarregar a lista."
 
+class TestRemoveAndRenderBehavior:
+    """_remove_and_render tira o cliente do ViewModel sem recarregar a lista."""
 
-class TestDeselectAndReloadBehavior:
-    """_deselect_and_reload deve limpar seleção e chamar carregar()."""
+    def _fn(self):
+        return extract_functions_from_source(
+            _VIEW_FILE,
+            "_remove_and_render",
+            class_name="ClientesV2Frame",
+            extra_namespace={"log": logging.getLogger("test.remove"), "Any": Any},
+        )["_remove_and_render"]
 
     def test_clears_selection(self) -> None:
         fake = MagicMock()
-        fake._selected_client_id = 42
-        # Extrair e executar o método diretamente
-        fn = _method_node("_deselect_and_reload")
-        src = _source_of(fn)
-        exec(compile(f"def _run(self): {src.split(':', 1)[1]}", "<test>", "exec"), {"self": fake})
-        # Rota mais simples: chamar o método extraído por reflexão via exec do source
-        # A forma mais confiável em testes de comportamento headless é usar extract_functions_from_source
-        _fns = extract_functions_from_source(
-            _VIEW_FILE,
-            "_deselect_and_reload",
-            class_name="ClientesV2Frame",
-            extra_namespace={"log": logging.getLogger("test.deselect"), "Any": Any},
-        )
-        _fn = _fns["_deselect_and_reload"]
-        fake2 = MagicMock()
-        fake2._selected_client_id = 77
-        _fn(fake2)
-        assert fake2._selected_client_id is None
-
-    def test_calls_carregar_once(self) -> None:
-        _fns = extract_functions_from_source(
-            _VIEW_FILE,
-            "_deselect_and_reload",
-            class_name="ClientesV2Frame",
-            extra_namespace={"log": logging.getLogger("test.deselect"), "Any": Any},
-        )
-        _fn = _fns["_deselect_and_reload"]
+        fake._selected_client_id = 77
+        self._fn()(fake, 77)
+        assert fake._selected_client_id is None
+
+    def test_patches_vm_without_reload(self) -> None:
         fake = MagicMock()
-        _fn(fake)
-        fake.carregar.assert_called_once()
+        self._fn()(fake, 77)
+        fake._vm.remove_clientes.assert_called_once_with([77])
+        fake._render_rows.assert_called_once_with(keep_position=True)
+        fake.carregar.assert_not_called()
+        fake.load_async.assert_not_called()
 
 
 # ── SEÇÃO 31: one_line + first_line_preview — proteção unitária ───────────────
@@ -3873,14 +3844,11 @@ class TestOnDeleteClientAST:
         src = _source_of(fn)
         assert '"break"' in src or "'break'" in src, "_on_delete_client deve retornar 'break' quando event é fornecido"
 
-    def test_delegates_on_success_to_deselect_and_reload(self) -> None:
-        """_on_delete_client deve passar _deselect_and_reload como on_success."""
+    def test_delegates_on_success_to_remove_and_render(self) -> None:
+        """_on_delete_client deve tirar o cliente da lista via _remove_and_render (sem recarregar)."""
         fn = _method_node("_on_delete_client")
         src = _source_of(fn)
-        assert "_deselect_and_reload" in src, (
-            "_on_delete_client deve referenciar _deselect_and_reload. "
-            "O closure _on_success foi extraído para um método de classe."
-        )
+        assert "_remove_and_render" in src, "_on_delete_client deve referenciar _remove_and_render."
 
     def test_clears_stale_editor_dialog_in_source(self) -> None:
         """_on_delete_client deve limpar referência obsoleta ao editor dialog."""
@@ -3938,13 +3906,13 @@ class TestOnDeleteClientSuccessCallback:
         _mock_show_info.reset_mock()
         _mock_show_error_del.reset_mock()
 
-    def test_success_calls_deselect_and_reload(self) -> None:
-        """Após soft delete bem-sucedido, _deselect_and_reload deve ser chamado uma vez."""
+    def test_success_calls_remove_and_render(self) -> None:
+        """Após soft delete bem-sucedido, _remove_and_render deve ser chamado uma vez."""
         fake = _make_delete_fake(client_id=42, trash_mode=False)
         svc = _make_service_mock()
         with _patch_service(svc):
             _on_delete_client(fake)
-        fake._deselect_and_reload.assert_called_once()
+        fake._remove_and_render.assert_called_once_with(42)
 
 
 class TestOnDeleteClientStaleDialog:
@@ -4007,13 +3975,13 @@ class TestOnDeleteClientHardDeleteSuccess:
         _mock_show_info.reset_mock()
         _mock_show_error_del.reset_mock()
 
-    def test_hard_delete_success_calls_deselect_and_reload(self) -> None:
-        """Após hard delete bem-sucedido, _deselect_and_reload deve ser chamado uma vez."""
+    def test_hard_delete_success_calls_remove_and_render(self) -> None:
+        """Após hard delete bem-sucedido, _remove_and_render deve ser chamado uma vez."""
         fake = _make_delete_fake(client_id=77, trash_mode=True)
         svc = _make_service_mock(hard_delete_result=(True, []))
         with _patch_service(svc):
             _on_delete_client(fake)
-        fake._deselect_and_reload.assert_called_once()
+        fake._remove_and_render.assert_called_once_with(77)
 
 
 # ── SEÇÃO 27: _on_restore_client — cobertura complementar (FASE 7B.24) ──────
@@ -4038,14 +4006,11 @@ class TestOnRestoreClientAST:
             "self._trash_mode" in src
         ), "_on_restore_client deve checar _trash_mode — restaurar só faz sentido na lixeira"
 
-    def test_delegates_on_success_to_deselect_and_reload(self) -> None:
-        """_on_restore_client deve passar _deselect_and_reload como on_success."""
+    def test_delegates_on_success_to_remove_and_render(self) -> None:
+        """_on_restore_client deve tirar o cliente da lixeira via _remove_and_render (sem recarregar)."""
         fn = _method_node("_on_restore_client")
         src = _source_of(fn)
-        assert "_deselect_and_reload" in src, (
-            "_on_restore_client deve referenciar _deselect_and_reload. "
-            "O closure _on_success foi extraído para um método de classe."
-        )
+        assert "_remove_and_render" in src, "_on_restore_client deve referenciar _remove_and_render."
 
     def test_delegates_to_execute_restore_with_client_id(self) -> None:
         """_on_restore_client deve passar client_id para execute_restore."""
@@ -4063,18 +4028,18 @@ class TestOnRestoreClientSuccessCallback:
         _mock_show_info_restore.reset_mock()
         _mock_show_error_restore.reset_mock()
 
-    def test_success_calls_deselect_and_reload(self) -> None:
-        """Após restauração bem-sucedida, _deselect_and_reload deve ser chamado uma vez."""
+    def test_success_calls_remove_and_render(self) -> None:
+        """Após restauração bem-sucedida, _remove_and_render deve ser chamado uma vez."""
         fake = _make_restore_fake(client_id=42, trash_mode=True)
         svc = _make_restore_service_mock()
 
         with _patch_service(svc):
             _on_restore_client(fake)
 
-        fake._deselect_and_reload.assert_called_once()
+        fake._remove_and_render.assert_called_once_with(42)
 
-    def test_cancelled_does_not_call_deselect_and_reload(self) -> None:
-        """Se usuário cancelar, _deselect_and_reload não deve ser chamado."""
+    def test_cancelled_does_not_call_remove_and_render(self) -> None:
+        """Se usuário cancelar, _remove_and_render não deve ser chamado."""
         fake = _make_restore_fake(client_id=42, trash_mode=True)
         svc = _make_restore_service_mock()
         _mock_ask_yes_no_restore.return_value = False
@@ -4082,10 +4047,10 @@ class TestOnRestoreClientSuccessCallback:
         with _patch_service(svc):
             _on_restore_client(fake)
 
-        fake._deselect_and_reload.assert_not_called()
+        fake._remove_and_render.assert_not_called()
 
-    def test_service_error_does_not_call_deselect_and_reload(self) -> None:
-        """Se o serviço lançar excessão, _deselect_and_reload não deve ser chamado."""
+    def test_service_error_does_not_call_remove_and_render(self) -> None:
+        """Se o serviço lançar excessão, _remove_and_render não deve ser chamado."""
         fake = _make_restore_fake(client_id=99, trash_mode=True)
         svc = _make_restore_service_mock()
         svc.restaurar_clientes_da_lixeira.side_effect = RuntimeError("DB offline")
@@ -4093,7 +4058,7 @@ class TestOnRestoreClientSuccessCallback:
         with _patch_service(svc):
             _on_restore_client(fake)
 
-        fake._deselect_and_reload.assert_not_called()
+        fake._remove_and_render.assert_not_called()
 
 
 # ── SEÇÃO 28: _on_enviar_documentos — cobertura (FASE 7B.25) ─────────────────
@@ -4170,11 +4135,11 @@ class TestEnviarDocumentosAST:
         src = _source_of(fn)
         assert "trigger_dialog_upload" in src, "_on_enviar_documentos deve usar trigger_dialog_upload de actions.py"
 
-    def test_on_saved_calls_load_async(self) -> None:
-        """_on_enviar_documentos deve chamar load_async() no callback on_saved."""
+    def test_on_saved_refreshes_saved_client(self) -> None:
+        """_on_enviar_documentos deve chamar _refresh_saved_client() no callback on_saved."""
         fn = _method_node("_on_enviar_documentos")
         src = _source_of(fn)
-        assert "load_async" in src, "on_saved em _on_enviar_documentos deve chamar load_async() para recarregar a lista"
+        assert "_refresh_saved_client" in src, "on_saved em _on_enviar_documentos deve atualizar a linha do cliente"
 
     def test_exception_is_caught_by_try_except(self) -> None:
         """_on_enviar_documentos deve ter try/except para silenciar falhas de criação do dialog."""
@@ -4226,16 +4191,15 @@ class TestEnviarDocumentosBehavior:
         delay = mock_dialog_inst.after.call_args[0][0]
         assert delay == 200, "O delay do after() deve ser 200ms"
 
-    def test_on_saved_callback_calls_load_async(self) -> None:
-        """O callback on_saved passado ao dialog deve chamar load_async() da view."""
+    def test_on_saved_callback_refreshes_saved_client(self) -> None:
+        """O callback on_saved passado ao dialog deve atualizar a linha do cliente na view."""
         fake = _make_enviar_fake(client_id=42)
         with _patch_client_editor_dialog() as (mock_dialog_class, _):
             _on_enviar_documentos_fn(fake)
         _, kwargs = mock_dialog_class.call_args
         on_save_cb = kwargs["on_save"]
-        fake.load_async.reset_mock()
         on_save_cb({"id": 42, "nome": "Teste"})
-        fake.load_async.assert_called_once()
+        fake._refresh_saved_client.assert_called_once_with(42)
 
     def test_exception_in_dialog_creation_does_not_propagate(self) -> None:
         """Exceção na criação do dialog deve ser silenciada pelo try/except."""
@@ -4259,7 +4223,7 @@ class TestOnSavedSentinelSource:
       3. on_saved em _open_client_editor tem log "salvo com sucesso" no ramo padrão.
       4. on_saved em _on_enviar_documentos tem ramo `_source == "upload"`.
       5. on_saved em _on_enviar_documentos tem log "Documentos" no ramo upload.
-      6. Ambos os on_saved chamam load_async().
+      6. Ambos os on_saved atualizam a linha via _refresh_saved_client().
     """
 
     def _view_source(self) -> str:
@@ -4324,10 +4288,10 @@ class TestOnSavedSentinelSource:
         snippet = body[idx : idx + 400]
         assert "Documentos" in snippet, "_on_enviar_documentos.on_saved não loga 'Documentos' no ramo upload."
 
-    # ── Ambos chamam load_async ──────────────────────────────────────────────
+    # ── Ambos atualizam a linha salva ────────────────────────────────────────
 
-    def test_open_editor_on_saved_calls_load_async_in_all_paths(self) -> None:
-        """on_saved em _open_client_editor deve chamar load_async() em qualquer ramo."""
+    def test_open_editor_on_saved_refreshes_in_all_paths(self) -> None:
+        """on_saved em _open_client_editor deve chamar _refresh_saved_client() em qualquer ramo."""
         body = self._body_open_editor()
         on_saved_start = body.find("def on_saved(")
         assert on_saved_start >= 0
@@ -4335,56 +4299,53 @@ class TestOnSavedSentinelSource:
         next_def = body.find("\n            def ", on_saved_start + 1)
         closure = body[on_saved_start:next_def] if next_def > 0 else body[on_saved_start : on_saved_start + 600]
         assert (
-            "load_async" in closure
-        ), "_open_client_editor.on_saved não chama load_async(). Refresh da lista quebrado."
+            "_refresh_saved_client" in closure
+        ), "_open_client_editor.on_saved não chama _refresh_saved_client(). Refresh da lista quebrado."
 
-    def test_enviar_docs_on_saved_calls_load_async_in_all_paths(self) -> None:
-        """on_saved em _on_enviar_documentos deve chamar load_async() em qualquer ramo."""
+    def test_enviar_docs_on_saved_refreshes_in_all_paths(self) -> None:
+        """on_saved em _on_enviar_documentos deve chamar _refresh_saved_client() em qualquer ramo."""
         body = self._body_enviar_documentos()
         on_saved_start = body.find("def on_saved(")
         assert on_saved_start >= 0
         next_def = body.find("\n            def ", on_saved_start + 1)
         closure = body[on_saved_start:next_def] if next_def > 0 else body[on_saved_start : on_saved_start + 600]
         assert (
-            "load_async" in closure
-        ), "_on_enviar_documentos.on_saved não chama load_async(). Refresh da lista quebrado."
+            "_refresh_saved_client" in closure
+        ), "_on_enviar_documentos.on_saved não chama _refresh_saved_client(). Refresh da lista quebrado."
 
 
 class TestOnSavedSentinelBehavior:
     """Testes comportamentais do sentinel `_source: upload` em on_saved."""
 
-    def test_on_saved_with_upload_source_calls_load_async(self) -> None:
-        """on_save({"_source": "upload"}) deve chamar load_async()."""
+    def test_on_saved_with_upload_source_refreshes_saved_client(self) -> None:
+        """on_save({"_source": "upload"}) deve atualizar a linha do cliente."""
         fake = _make_enviar_fake(client_id=99)
         with _patch_client_editor_dialog() as (mock_dialog_class, _):
             _on_enviar_documentos_fn(fake)
         _, kwargs = mock_dialog_class.call_args
         on_save_cb = kwargs["on_save"]
-        fake.load_async.reset_mock()
         on_save_cb({"_source": "upload"})
-        fake.load_async.assert_called_once()
+        fake._refresh_saved_client.assert_called_once_with(fake._selected_client_id)
 
-    def test_on_saved_without_source_calls_load_async(self) -> None:
-        """on_save({}) (save real) deve chamar load_async() mesmo sem _source."""
+    def test_on_saved_without_source_refreshes_saved_client(self) -> None:
+        """on_save({}) (save real) deve atualizar a linha do cliente mesmo sem _source."""
         fake = _make_enviar_fake(client_id=99)
         with _patch_client_editor_dialog() as (mock_dialog_class, _):
             _on_enviar_documentos_fn(fake)
         _, kwargs = mock_dialog_class.call_args
         on_save_cb = kwargs["on_save"]
-        fake.load_async.reset_mock()
         on_save_cb({})
-        fake.load_async.assert_called_once()
+        fake._refresh_saved_client.assert_called_once_with(fake._selected_client_id)
 
-    def test_on_saved_with_save_data_calls_load_async(self) -> None:
-        """on_save({"id": 42, ...}) (save real com dados) deve chamar load_async()."""
+    def test_on_saved_with_save_data_refreshes_saved_client(self) -> None:
+        """on_save({"id": 42, ...}) (save real com dados) deve atualizar a linha do cliente."""
         fake = _make_enviar_fake(client_id=42)
         with _patch_client_editor_dialog() as (mock_dialog_class, _):
             _on_enviar_documentos_fn(fake)
         _, kwargs = mock_dialog_class.call_args
         on_save_cb = kwargs["on_save"]
-        fake.load_async.reset_mock()
         on_save_cb({"id": 42, "nome": "Empresa XYZ", "cnpj": "00.000.000/0001-00"})
-        fake.load_async.assert_called_once()
+        fake._refresh_saved_client.assert_called_once_with(fake._selected_client_id)
 
 
 # ── SEÇÃO 29: _on_export — cobertura complementar (FASE 7B.26) ────────────────
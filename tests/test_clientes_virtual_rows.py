@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Testes da janela virtualizada da Treeview de Clientes (sem Tk)."""
+
+from __future__ import annotations
+
+import unittest
+from dataclasses import dataclass
+
+from src.modules.clientes.ui.virtual_rows import RowValuesCache, VirtualRowWindow
+
+
+@dataclass
+class _Row:
+    id: str
+    name: str
+
+
+class _FakeTree:
+    """Treeview em memória: registra as operações para medir o diff."""
+
+    def __init__(self) -> None:
+        self.items: list[str] = []
+        self.values: dict[str, tuple] = {}
+        self.ops = {"insert": 0, "delete": 0, "move": 0, "item": 0}
+        self.idle: list = []
+        self.yscrollcommand = None
+        self.seen: list[str] = []
+
+    def get_children(self, _parent=""):
+        return tuple(self.items)
+
+    def insert(self, _parent, index, iid, values):
+        assert iid not in self.values, f"iid duplicado: {iid}"
+        self.items.insert(index, iid)
+        self.values[iid] = values
+        self.ops["insert"] += 1
+        return iid
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.items.remove(iid)
+            del self.values[iid]
+        self.ops["delete"] += len(iids)
+
+    def move(self, iid, _parent, index):
+        self.items.remove(iid)
+        self.items.insert(index, iid)
+        self.ops["move"] += 1
+
+    def item(self, iid, values):
+        self.values[iid] = values
+        self.ops["item"] += 1
+
+    def configure(self, **kw):
+        self.yscrollcommand = kw.get("yscrollcommand", self.yscrollcommand)
+
+    def yview_moveto(self, _fraction):
+        pass
+
+    def after_idle(self, fn):
+        self.idle.append(fn)
+
+    def see(self, iid):
+        self.seen.append(iid)
+
+    def reset_ops(self):
+        self.ops = dict.fromkeys(self.ops, 0)
+
+
+class _FakeScrollbar:
+    def __init__(self) -> None:
+        self.command = None
+        self.last = None
+
+    def configure(self, command):
+        self.command = command
+
+    def set(self, lo, hi):
+        self.last = (lo, hi)
+
+
+def _rows(n: int, prefix: str = "Cliente") -> list[_Row]:
+    return [_Row(str(i), f"{prefix} {i}") for i in range(n)]
+
+
+def _window(tree: _FakeTree, **kw) -> VirtualRowWindow[_Row]:
+    return VirtualRowWindow(tree, lambda r: (r.id, r.name), lambda r: r.id, buffer_rows=20, visible_rows=10, **kw)
+
+
+class TestWindowing(unittest.TestCase):
+    def test_only_visible_plus_buffer_is_materialized(self):
+        tree = _FakeTree()
+        win = _window(tree)
+        win.set_rows(_rows(10_000))
+        self.assertEqual(win.window, (0, 30))
+        self.assertEqual(tree.items, [str(i) for i in range(30)])
+        self.assertEqual(len(win.row_map), 10_000)
+
+    def test_small_list_is_fully_materialized(self):
+        tree = _FakeTree()
+        win = _window(tree)
+        win.set_rows(_rows(12))
+        self.assertEqual(tree.items, [str(i) for i in range(12)])
+
+    def test_scrollbar_reflects_full_list(self):
+        tree, bar = _FakeTree(), _FakeScrollbar()
+        win = _window(tree)
+        win.attach_scrollbar(bar)
+        win.set_rows(_rows(1000))
+        bar.command("moveto", "0.5")
+        start, end = win.window
+        self.assertTrue(start <= 500 < end)
+        self.assertEqual(tree.items, [str(i) for i in range(start, end)])
+        self.assertAlmostEqual(bar.last[0], 0.5)
+
+    def test_scroll_shifts_window_by_diff(self):
+        tree = _FakeTree()
+        win = _window(tree)
+        win.set_rows(_rows(1000))
+        win.scroll_to(400)
+        tree.reset_ops()
+        win.scroll_to(440)  # sai da janela: recentraliza
+        start, end = win.window
+        self.assertEqual(tree.items, [str(i) for i in range(start, end)])
+        # só as linhas que entraram/saíram foram tocadas
+        self.assertEqual(tree.ops["insert"], tree.ops["delete"])
+        self.assertLess(tree.ops["insert"], end - start)
+        self.assertEqual(tree.ops["item"], 0)
+
+    def test_native_scroll_near_edge_recenters_on_idle(self):
+        tree, bar = _FakeTree(), _FakeScrollbar()
+        win = _window(tree)
+        win.attach_scrollbar(bar)
+        win.set_rows(_rows(1000))
+        # vista local chegou perto do fim da janela de 30 linhas
+        tree.yscrollcommand("0.6", "0.9333")
+        self.assertEqual(len(tree.idle), 1)
+        tree.idle.pop()()
+        start, end = win.window
+        self.assertGreater(end, 30)
+        self.assertTrue(start <= 18 < end)
+        self.assertEqual(start % 2, 0)  # zebra estável
+
+    def test_window_start_is_even(self):
+        tree = _FakeTree()
+        win = _window(tree)
+        win.set_rows(_rows(1000))
+        for top in (101, 333, 777):
+            win.scroll_to(top)
+            self.assertEqual(win.window[0] % 2, 0)
+
+    def test_see_materializes_far_row(self):
+        tree = _FakeTree()
+        win = _window(tree)
+        win.set_rows(_rows(1000))
+        self.assertTrue(win.see("900"))
+        self.assertIn("900", tree.items)
+        self.assertFalse(win.see("nope"))
+
+
+class TestDiff(unittest.TestCase):
+    def setUp(self):
+        self.tree = _FakeTree()
+        self.changes = []
+        self.win = _window(self.tree, on_window_changed=lambda: self.changes.append(1))
+        self.rows = _rows(25)
+        self.win.set_rows(self.rows)
+        self.tree.reset_ops()
+        self.changes.clear()
+
+    def test_same_rows_touch_nothing(self):
+        self.win.set_rows(list(self.rows))
+        self.assertEqual(self.tree.ops, {"insert": 0, "delete": 0, "move": 0, "item": 0})
+        self.assertEqual(self.changes, [])
+
+    def test_filter_deletes_only_missing_rows(self):
+        self.win.set_rows([r for r in self.rows if int(r.id) % 2 == 0])
+        self.assertEqual(self.tree.ops["delete"], 12)
+        self.assertEqual(self.tree.ops["insert"] + self.tree.ops["move"] + self.tree.ops["item"], 0)
+        self.assertEqual(self.tree.items, [str(i) for i in range(0, 25, 2)])
+
+    def test_reorder_moves_without_reinserting(self):
+        self.win.set_rows(list(reversed(self.rows)))
+        self.assertEqual(self.tree.items, [str(i) for i in reversed(range(25))])
+        self.assertEqual(self.tree.ops["insert"], 0)
+        self.assertEqual(self.tree.ops["delete"], 0)
+        self.assertEqual(self.tree.ops["item"], 0)
+
+    def test_new_row_version_updates_values_in_place(self):
+        changed = list(self.rows)
+        changed[3] = _Row("3", "Renomeado")
+        self.win.set_rows(changed)
+        self.assertEqual(self.tree.ops, {"insert": 0, "delete": 0, "move": 0, "item": 1})
+        self.assertEqual(self.tree.values["3"], ("3", "Renomeado"))
+        self.assertEqual(self.changes, [1])
+
+    def test_duplicate_keys_get_unique_iids(self):
+        self.win.set_rows([_Row("1", "a"), _Row("1", "b")])
+        self.assertEqual(self.tree.items, ["1", "1#1"])
+        self.assertEqual(self.win.row_map["1#1"].name, "b")
+
+
+class TestRowValuesCache(unittest.TestCase):
+    def test_formats_once_per_row_version(self):
+        calls = []
+        cache = RowValuesCache(lambda r: calls.append(r) or (r.name,))
+        row = _Row("1", "x")
+        cache.get(row)
+        cache.get(row)
+        cache.get(_Row("1", "x"))  # nova versão (outro objeto)
+        self.assertEqual(len(calls), 2)
+
+    def test_retain_drops_rows_no_longer_listed(self):
+        cache = RowValuesCache(lambda r: (r.name,))
+        rows = _rows(10)
+        for r in rows:
+            cache.get(r)
+        cache.retain(rows[:2])
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Testes da réplica local de clientes (src/core/db_manager/replica.py)."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.core.db_manager import replica as replica_mod
+from src.core.db_manager.replica import ClientsReplica
+from src.core.search import search as search_mod
+from src.core.search.search import search_clientes, search_clientes_lixeira
+
+ORG = "org-1"
+
+
+def _row(cid, razao, updated="2026-03-01T10:00:00+00:00", deleted=None, **extra):
+    return {
+        "id": cid,
+        "razao_social": razao,
+        "nome": extra.pop("nome", None),
+        "cnpj": extra.pop("cnpj", None),
+        "org_id": ORG,
+        "ultima_alteracao": updated,
+        "deleted_at": deleted,
+        **extra,
+    }
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeClients:
+    """Tabela clients remota em memória (funções usadas pela réplica)."""
+
+    def __init__(self, rows):
+        self.rows = {r["id"]: dict(r) for r in rows}
+        self.calls: list[str] = []
+        self.fail = False
+
+    def fetch(self, org_id, *, since, after_id, limit):
+        self._call("full" if since is None else f"delta:{since}")
+        rows = sorted(self.rows.values(), key=lambda r: r["id"])
+        if since is not None:
+            rows = [r for r in rows if r["ultima_alteracao"] >= since]
+        if after_id is not None:
+            rows = [r for r in rows if r["id"] > after_id]
+        return [dict(r) for r in rows[:limit]]
+
+    def count(self, org_id):
+        self._call("count")
+        return len(self.rows)
+
+    def _call(self, name):
+        if self.fail:
+            raise RuntimeError("offline")
+        self.calls.append(name)
+
+
+class _ReplicaTestCase(unittest.TestCase):
+    def setUp(self):
+        self.remote = _FakeClients(
+            [
+                _row(1, "Ágata Comércio", cnpj="11.222.333/0001-81"),
+                _row(2, "beta farma"),
+                _row(3, "Casa Gama", deleted="2026-02-01T00:00:00+00:00"),
+                _row(4, None, nome="Sem razão"),
+                _row(5, "Delta", obs="cliente antigo"),
+            ]
+        )
+        for target, fn in (
+            ("_fetch_rows", self.remote.fetch),
+            ("_count_rows", self.remote.count),
+            ("is_supabase_online", lambda: True),
+        ):
+            p = patch.object(replica_mod, target, fn)
+            p.start()
+            self.addCleanup(p.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "clients_org-1.sqlite3"
+        self.clock = _Clock()
+        self.replica = self._open()
+        self.replica.sync()
+
+    def _open(self) -> ClientsReplica:
+        replica = ClientsReplica(ORG, self.path, sync_interval_s=60, clock=self.clock)
+        self.addCleanup(replica.close)
+        return replica
+
+    def _ids(self, term="", col=None, desc=False, *, trash=False, limit=None, offset=0):
+        rows = self.replica.search(term, col, desc, trash=trash, limit=limit, offset=offset)
+        return [r["id"] for r in rows]
+
+
+class TestLocalQueries(_ReplicaTestCase):
+    def test_search_matches_normalized_blob(self):
+        self.assertEqual(self._ids("agata"), [1])
+        self.assertEqual(self._ids("11222333"), [1])  # CNPJ sem pontuação
+        self.assertEqual(self._ids("GAMA"), [])  # está na lixeira
+        self.assertEqual(self._ids("gama", trash=True), [3])
+        self.assertEqual(self._ids("antigo"), [5])  # obs faz parte do texto
+        self.assertEqual(self._ids("ta"), [1, 2, 5])  # termo curto: LIKE
+
+    def test_order_nulls_and_pagination_follow_the_server(self):
+        self.assertEqual(self._ids(col="razao_social"), [1, 2, 5, 4])  # NULLS LAST
+        self.assertEqual(self._ids(col="razao_social", desc=True), [4, 5, 2, 1])  # NULLS FIRST
+        self.assertEqual(self._ids(col="razao_social", limit=2, offset=2), [5, 4])
+        self.assertEqual(self._ids(), [1, 2, 4, 5])
+
+    def test_unsupported_order_is_left_to_the_server(self):
+        self.assertIsNone(self.replica.search("", "status_anvisa", False, trash=False, limit=10))
+
+    def test_copy_survives_restart(self):
+        self.replica.close()
+        reopened = self._open()
+        self.assertTrue(reopened.ready())
+        self.assertEqual(reopened.row_count(), 5)
+
+
+class TestDeltaSync(_ReplicaTestCase):
+    def test_delta_applies_edits_and_soft_deletes(self):
+        self.remote.rows[2] = _row(2, "Beta Farma Renomeada", updated="2026-03-05T08:00:00+00:00")
+        self.remote.rows[5] = _row(5, "Delta", updated="2026-03-05T08:00:00+00:00", deleted="2026-03-05T08:00:00+00:00")
+        self.remote.rows[6] = _row(6, "Épsilon", updated="2026-03-05T08:00:00+00:00")
+
+        self.assertEqual(self.replica.sync(), "delta")
+
+        # margem de 5 min antes do maior ultima_alteracao visto
+        self.assertEqual(self.remote.calls[-2:], ["delta:2026-03-01T09:55:00+00:00", "count"])
+        self.assertEqual(self._ids("renomeada"), [2])
+        self.assertEqual(self._ids("epsilon"), [6])
+        self.assertEqual(self._ids(trash=True), [3, 5])
+
+    def test_remote_purge_triggers_full_reload(self):
+        del self.remote.rows[2]
+        self.assertEqual(self.replica.sync(), "full")
+        self.assertNotIn(2, self._ids())
+
+    def test_app_write_is_synced_before_next_read(self):
+        self.remote.rows[2] = _row(2, "Beta Editada", updated="2026-03-05T08:00:00+00:00")
+        self.replica.invalidate()
+
+        self.assertEqual(self._ids("editada"), [2])
+
+    def test_discard_removes_purged_rows_locally(self):
+        del self.remote.rows[3]
+        self.replica.discard([3])
+        self.remote.fail = True  # offline: vale a remoção local
+
+        self.assertEqual(self._ids(trash=True), [])
+
+    def test_sync_failure_keeps_serving_local_copy(self):
+        self.remote.fail = True
+        with self.assertRaises(RuntimeError):
+            self.replica.sync()
+        self.assertEqual(self._ids("beta"), [2])
+        self.assertEqual(self.replica.stats().sync_failures, 1)
+
+
+class TestSearchIntegration(_ReplicaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.supabase = MagicMock()
+        for p in (
+            patch.object(replica_mod, "_shared", self.replica),
+            patch.object(search_mod, "supabase", self.supabase),
+            patch.object(search_mod, "is_supabase_online", return_value=False),
+            patch.object(search_mod, "get_current_user", return_value=SimpleNamespace(org_id=ORG)),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_search_is_served_locally_even_offline(self):
+        result = search_clientes("beta", limit=50)
+        trash = search_clientes_lixeira("", limit=50)
+
+        self.assertEqual([c.id for c in result], [2])
+        self.assertEqual([c.id for c in trash], [3])
+        self.assertIsNone(result.next_cursor)
+        self.supabase.table.assert_not_called()
+
+    def test_other_org_and_cursor_pages_go_to_the_server(self):
+        with patch.object(search_mod, "_fetch_clients_page", return_value=[]) as remote:
+            with patch.object(search_mod, "is_supabase_online", return_value=True):
+                search_clientes("", org_id="org-2", limit=10)
+                search_clientes("", limit=10, cursor="abc")
+        self.assertEqual(remote.call_count, 2)
+
+
+class TestAppWritesReachReplica(unittest.TestCase):
+    """Gravações fora do db_manager também avisam a réplica."""
+
+    def setUp(self):
+        self.supabase = MagicMock()
+        self.notified: list[list[int]] = []
+        self._notify = lambda removed_ids=(): self.notified.append(list(removed_ids))
+
+    def test_clientes_service_trash_restore_and_delete(self):
+        from src.modules.clientes.core import service
+
+        with (
+            patch.object(service, "supabase", self.supabase),
+            patch.object(service, "exec_postgrest"),
+            patch.object(service, "notify_clients_changed", self._notify),
+            patch.object(service, "_current_user_label", return_value="ana@x"),
+            patch.object(service, "_resolve_current_org_id", return_value=ORG),
+            patch.object(service, "_remove_cliente_storage"),
+            patch.object(service, "SupabaseStorageAdapter"),
+            patch.object(service, "using_storage_backend", MagicMock()),
+        ):
+            service.mover_cliente_para_lixeira(1)
+            service.restaurar_clientes_da_lixeira([2])
+            service.touch_ultima_alteracao(3)
+            service.excluir_clientes_definitivamente([4, 5])
+            service.excluir_cliente_simples(6)
+
+        self.assertEqual(self.notified, [[], [], [], [4, 5], [6]])
+
+    def test_lixeira_restore_bumps_ultima_alteracao_and_purge_discards(self):
+        from src.core.services import lixeira_service
+
+        with (
+            patch.object(lixeira_service, "_get_supabase_and_org", return_value=(self.supabase, ORG)),
+            patch.object(lixeira_service, "exec_postgrest"),
+            patch.object(lixeira_service, "notify_clients_changed", self._notify),
+            patch.object(lixeira_service, "_remove_storage_prefix", return_value=0),
+        ):
+            self.assertEqual(lixeira_service.restore_clients([7]), (1, []))
+            self.assertEqual(lixeira_service.hard_delete_clients([8]), (1, []))
+
+        payload = self.supabase.table.return_value.update.call_args.args[0]
+        self.assertIsNone(payload["deleted_at"])
+        self.assertTrue(payload["ultima_alteracao"])
+        self.assertEqual(self.notified, [[], [8]])
+
+    def test_logout_closes_replica(self):
+        from src.infra import supabase_auth
+
+        with (
+            patch.object(replica_mod, "stop_clients_replica") as stop,
+            patch.object(supabase_auth.prefs_utils, "clear_auth_session"),
+        ):
+            supabase_auth.logout(MagicMock())
+        stop.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""Testes do carregamento paralelo do snapshot do dashboard do Hub (sem rede)."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.modules.hub.dashboard import service as dashboard_service
+from src.modules.hub.dashboard.models import DashboardSnapshot
+from src.modules.hub.viewmodels.dashboard_vm import DashboardViewModel
+
+TODAY = date(2026, 3, 10)
+ORG = "org-1"
+
+_PENDING_TASKS = [
+    {"due_date": "2026-03-09", "client_id": None, "title": "Atrasada", "priority": "high"},
+    {"due_date": "2026-03-10", "client_id": None, "title": "Hoje", "priority": "normal"},
+    {"due_date": "2026-03-20", "client_id": None, "title": "Depois", "priority": "low"},
+]
+
+
+def _fake_list_tasks(org_id, *, status=None, **_kw):
+    return list(_PENDING_TASKS) if status == "pending" else []
+
+
+class _BackendPatches:
+    """Substitui os repositórios usados pelas seções por funções locais."""
+
+    def __init__(self, **overrides):
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+        defaults = {
+            "count_clients": lambda: 42,
+            "count_pending_obligations": lambda org_id: 7,
+            "list_tasks_for_org": _fake_list_tasks,
+            "cashflow_totals": lambda dfrom, dto, *, org_id=None: {"in": 1500.0, "out": 0.0},
+            "list_obligations_for_org": lambda org_id, **_kw: [],
+        }
+        defaults.update(overrides)
+        self._fns = defaults
+        self._patchers = [
+            patch("src.core.services.clientes_service.count_clients", self._track("count_clients")),
+            patch(
+                "src.features.regulations.repository.count_pending_obligations",
+                self._track("count_pending_obligations"),
+            ),
+            patch("src.features.tasks.repository.list_tasks_for_org", self._track("list_tasks_for_org")),
+            patch("src.features.cashflow.repository.totals", self._track("cashflow_totals")),
+            patch(
+                "src.features.regulations.repository.list_obligations_for_org",
+                self._track("list_obligations_for_org"),
+            ),
+            # cache de obrigações novo a cada bloco (carrega das funções acima)
+            patch("src.features.regulations.cache._shared", None),
+            patch.object(dashboard_service, "_load_recent_activity", lambda org_id, today: []),
+            # caminho em Python; o RPC é coberto em TestSnapshotRpc
+            patch.object(dashboard_service, "DASHBOARD_USE_RPC", False),
+        ]
+
+    def _track(self, name):
+        def _call(*args, **kwargs):
+            with self._lock:
+                self.calls.append(f"{name}:{kwargs.get('status', '')}" if name == "list_tasks_for_org" else name)
+            return self._fns[name](*args, **kwargs)
+
+        return _call
+
+    def __enter__(self):
+        for p in self._patchers:
+            p.start()
+        return self
+
+    def __exit__(self, *exc):
+        for p in reversed(self._patchers):
+            p.stop()
+
+
+class TestParallelSnapshot(unittest.TestCase):
+    def test_fills_all_sections(self):
+        with _BackendPatches():
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+        self.assertEqual(snap.active_clients, 42)
+        self.assertEqual(snap.pending_obligations, 7)
+        self.assertEqual(snap.tasks_today, 2)
+        self.assertEqual(snap.cash_in_month, 1500.0)
+        self.assertEqual([t["title"] for t in snap.pending_tasks], ["Atrasada", "Hoje", "Depois"])
+        self.assertEqual(snap.risk_radar["SNGPC"]["status"], "green")
+
+    def test_obligation_sections_share_one_query(self):
+        obligations = [
+            {"id": "1", "kind": "SIFAP", "status": "pending", "due_date": "2026-03-30", "client_id": 1},
+            {"id": "2", "kind": "SNGPC", "status": "pending", "due_date": "2026-03-11", "client_id": 2},
+            {"id": "3", "kind": "SNGPC", "status": "done", "due_date": "2026-03-10", "client_id": 3},
+            {"id": "4", "kind": "FARMACIA_POPULAR", "status": "overdue", "due_date": "2026-03-10", "client_id": 4},
+        ]
+        with (
+            _BackendPatches(list_obligations_for_org=lambda org_id, **_kw: list(obligations)) as backend,
+            patch.object(dashboard_service, "_fetch_client_names", lambda ids: {}),
+            patch("src.modules.hub.dashboard.data_access.fetch_client_names_impl", lambda ids: {}),
+        ):
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+
+        self.assertEqual(backend.calls.count("list_obligations_for_org"), 1)
+        self.assertEqual([d["client_id"] for d in snap.upcoming_deadlines], ["4", "2", "1"])
+        self.assertEqual(
+            snap.hot_items,
+            ["Falta 1 dia para 1 envio(s) SNGPC", "1 obrigação(ões) Farmácia Popular vencida(s) ou para hoje!"],
+        )
+        self.assertEqual(snap.risk_radar["SIFAP"]["pending"], 1)
+        self.assertEqual([c["client_id"] for c in snap.clients_of_the_day], [4])
+
+    def test_pending_tasks_queried_once(self):
+        with _BackendPatches() as backend:
+            dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+        self.assertEqual(backend.calls.count("list_tasks_for_org:pending"), 1)
+
+    def test_sections_run_concurrently(self):
+        def _slow(value):
+            def _fn(*_a, **_kw):
+                time.sleep(0.2)
+                return value
+
+            return _fn
+
+        with _BackendPatches(count_clients=_slow(1), count_pending_obligations=_slow(2)):
+            t0 = time.perf_counter()
+            dashboard_service.get_dashboard_snapshot(ORG, TODAY, max_workers=4)
+            elapsed = time.perf_counter() - t0
+        self.assertLess(elapsed, 0.35)
+
+    def test_timing_breakdown_has_every_section(self):
+        with _BackendPatches():
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+        names = {t.name for t in snap.section_timings}
+        self.assertEqual(names, {name for name, _fn in dashboard_service._SECTIONS})
+        self.assertTrue(all(t.status == "ok" and t.elapsed_ms >= 0 for t in snap.section_timings))
+
+    def test_failed_section_keeps_defaults_and_reports_error(self):
+        def _boom():
+            raise RuntimeError("sem conexão")
+
+        with _BackendPatches(count_clients=_boom):
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+        self.assertEqual(snap.active_clients, 0)
+        self.assertEqual(snap.pending_obligations, 7)
+        timing = next(t for t in snap.section_timings if t.name == "active_clients")
+        self.assertEqual(timing.status, "error")
+        self.assertIn("sem conexão", timing.error)
+
+    def test_slow_section_times_out_without_blocking_others(self):
+        release = threading.Event()
+
+        def _hang():
+            release.wait(5)
+            return 99
+
+        try:
+            with _BackendPatches(count_clients=_hang):
+                t0 = time.perf_counter()
+                snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY, section_timeout=0.2)
+                elapsed = time.perf_counter() - t0
+        finally:
+            release.set()
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(snap.active_clients, 0)
+        self.assertEqual(snap.pending_obligations, 7)
+        timing = next(t for t in snap.section_timings if t.name == "active_clients")
+        self.assertEqual(timing.status, "timeout")
+
+    def test_partial_snapshots_published_before_completion(self):
+        partials: list[DashboardSnapshot] = []
+        with _BackendPatches():
+            final = dashboard_service.get_dashboard_snapshot(ORG, TODAY, on_partial=partials.append)
+        self.assertTrue(partials)
+        self.assertLess(len(partials[0].section_timings), len(final.section_timings))
+        # cópias: o snapshot final não é o mesmo objeto publicado
+        self.assertTrue(all(p is not final for p in partials))
+
+    def test_minimal_mode_only_loads_pending_tasks(self):
+        with _BackendPatches() as backend:
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY, minimal=True)
+        self.assertEqual(backend.calls, ["list_tasks_for_org:pending"])
+        self.assertEqual(len(snap.pending_tasks), 3)
+        self.assertEqual([t.name for t in snap.section_timings], ["pending_tasks"])
+
+
+_RPC_PAYLOAD = {
+    "active_clients": 40,
+    "pending_obligations": 6,
+    "tasks_today": 2,
+    "cash_in_month": "1500.50",
+    "upcoming_deadlines": [
+        {"due_date": "2026-03-08", "client_id": 5, "client_name": "Farmácia A", "kind": "SNGPC", "title": "SNGPC"},
+        {"due_date": "2026-03-12", "client_id": 9, "client_name": None, "kind": "SIFAP", "title": None},
+    ],
+    "hot_items": [
+        {"kind": "SNGPC", "count": 2, "min_days": -2},
+        {"kind": "FARMACIA_POPULAR", "count": 1, "min_days": 1},
+    ],
+    "risk_radar": {"SNGPC": {"pending": 0, "overdue": 2}, "SIFAP": {"pending": 1, "overdue": 0}},
+    "clients_of_the_day": [{"client_id": 5, "client_name": "Farmácia A", "obligation_kinds": ["SNGPC"]}],
+}
+
+
+class TestSnapshotRpc(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(dashboard_service, "_rpc_missing", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _rpc(self, fn):
+        return patch("src.modules.hub.dashboard.data_access.fetch_dashboard_snapshot_rpc", fn)
+
+    def test_rpc_replaces_aggregation_queries(self):
+        with _BackendPatches() as backend, self._rpc(lambda org_id, today, limit=5: dict(_RPC_PAYLOAD)):
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY, use_rpc=True)
+
+        self.assertEqual(backend.calls, ["list_tasks_for_org:pending"])
+        self.assertEqual((snap.active_clients, snap.pending_obligations, snap.tasks_today), (40, 6, 2))
+        self.assertEqual(snap.cash_in_month, 1500.5)
+        self.assertEqual(len(snap.pending_tasks), 3)
+        self.assertEqual([d["client_name"] for d in snap.upcoming_deadlines], ["Farmácia A", "Cliente #9"])
+        self.assertEqual(snap.upcoming_deadlines[0]["due_date"], "08/03/2026")
+        self.assertEqual(snap.upcoming_deadlines[1]["title"], "SIFAP")
+        self.assertEqual(
+            snap.hot_items,
+            ["2 envio(s) SNGPC vencido(s) ou para hoje!", "Falta 1 dia para 1 obrigação(ões) Farmácia Popular"],
+        )
+        self.assertEqual(snap.risk_radar["SNGPC"]["status"], "red")
+        self.assertEqual(snap.risk_radar["SIFAP"]["status"], "yellow")
+        self.assertEqual(snap.clients_of_the_day[0]["client_name"], "Farmácia A")
+        self.assertEqual(
+            {t.name for t in snap.section_timings}, {name for name, _fn in dashboard_service._RPC_SECTIONS}
+        )
+
+    def test_rpc_matches_python_builders(self):
+        obligations = [
+            {"kind": "SNGPC", "status": "pending", "due_date": "2026-03-08", "client_id": 5},
+            {"kind": "SNGPC", "status": "overdue", "due_date": "2026-03-11", "client_id": 5},
+            {"kind": "FARMACIA_POPULAR", "status": "pending", "due_date": "2026-03-11", "client_id": 9},
+            {"kind": "SIFAP", "status": "pending", "due_date": "2026-03-20", "client_id": 9},
+        ]
+        rpc = dashboard_service._snapshot_fields_from_rpc(
+            {
+                "hot_items": [
+                    {"kind": "FARMACIA_POPULAR", "count": 1, "min_days": 1},
+                    {"kind": "SNGPC", "count": 2, "min_days": -2},
+                ],
+                "risk_radar": {"SNGPC": {"pending": 0, "overdue": 2}, "SIFAP": {"pending": 1, "overdue": 0}},
+            },
+            TODAY,
+        )
+        self.assertEqual(rpc["hot_items"], dashboard_service._build_hot_items(obligations, TODAY))
+        self.assertEqual(rpc["risk_radar"], dashboard_service._build_risk_radar(obligations, TODAY))
+
+    def test_rpc_error_falls_back_to_python_sections(self):
+        def _boom(org_id, today, limit=5):
+            raise RuntimeError("timeout")
+
+        with _BackendPatches() as backend, self._rpc(_boom):
+            snap = dashboard_service.get_dashboard_snapshot(ORG, TODAY, use_rpc=True)
+
+        self.assertEqual(backend.calls.count("list_tasks_for_org:pending"), 1)
+        self.assertEqual((snap.tasks_today, len(snap.pending_tasks)), (2, 3))
+        self.assertEqual(snap.active_clients, 42)
+        self.assertEqual(snap.cash_in_month, 1500.0)
+        self.assertEqual(snap.risk_radar["SNGPC"]["status"], "green")
+        rpc = next(t for t in snap.section_timings if t.name == "snapshot_rpc")
+        self.assertEqual(rpc.status, "error")
+        self.assertFalse(dashboard_service._rpc_missing)
+
+    def test_missing_function_is_remembered(self):
+        class _NotFoundError(Exception):
+            code = "PGRST202"
+
+        calls = []
+
+        def _missing(org_id, today, limit=5):
+            calls.append(org_id)
+            raise _NotFoundError("Could not find the function public.dashboard_snapshot")
+
+        with _BackendPatches(), self._rpc(_missing), patch.object(dashboard_service, "DASHBOARD_USE_RPC", True):
+            first = dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+            second = dashboard_service.get_dashboard_snapshot(ORG, TODAY)
+
+        self.assertEqual(calls, [ORG])
+        self.assertEqual((first.active_clients, second.active_clients), (42, 42))
+        self.assertNotIn("snapshot_rpc", {t.name for t in second.section_timings})
+
+
+class TestViewModelPartials(unittest.TestCase):
+    def test_partial_states_are_loading(self):
+        def _service(org_id, today=None, *, on_partial=None):
+            on_partial(DashboardSnapshot(active_clients=3))
+            return DashboardSnapshot(active_clients=3, pending_obligations=1)
+
+        states = []
+        vm = DashboardViewModel(service=_service)
+        final = vm.load(ORG, on_partial=states.append)
+        self.assertEqual(len(states), 1)
+        self.assertTrue(states[0].is_loading)
+        self.assertEqual(states[0].card_clientes.value, 3)
+        self.assertFalse(final.is_loading)
+        self.assertEqual(final.card_pendencias.value, 1)
+
+    def test_service_without_partial_support_still_works(self):
+        vm = DashboardViewModel(service=lambda org_id, today=None: DashboardSnapshot(tasks_today=2))
+        self.assertEqual(vm.load(ORG).card_tarefas.value, 2)
+
+    def test_controller_posts_partials_to_view_on_main_thread(self):
+        from src.modules.hub.hub_screen_controller import HubScreenController
+
+        def _service(org_id, today=None, *, on_partial=None):
+            on_partial(DashboardSnapshot(active_clients=3))
+            return DashboardSnapshot(active_clients=3, pending_obligations=1)
+
+        posted = []
+        runner = MagicMock()
+        runner.post.side_effect = posted.append
+        view = MagicMock()
+        controller = HubScreenController(
+            state=SimpleNamespace(org_id=ORG, is_dashboard_loaded=False),
+            dashboard_vm=DashboardViewModel(service=_service),
+            notes_vm=MagicMock(),
+            quick_actions_vm=MagicMock(),
+            async_runner=runner,
+            lifecycle=MagicMock(),
+            view=view,
+            quick_actions_controller=MagicMock(),
+        )
+
+        final = controller.load_dashboard_data()
+
+        self.assertFalse(final.is_loading)
+        self.assertEqual(len(posted), 1)
+        view.update_dashboard.assert_not_called()  # só no main thread, via after()
+        posted[0]()
+        partial_state = view.update_dashboard.call_args[0][0]
+        self.assertTrue(partial_state.is_loading)
+        self.assertEqual(partial_state.card_clientes.value, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
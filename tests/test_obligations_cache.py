@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Testes do cache incremental de obrigações (src/features/regulations/cache.py)."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from src.features.regulations import repository
+from src.features.regulations import service as reg_service
+from src.features.regulations.cache import ObligationsCache
+
+ORG = "org-1"
+
+
+def _row(oid, due, status="pending", updated="2026-03-01T10:00:00+00:00", **extra):
+    return {"id": oid, "org_id": ORG, "client_id": 1, "due_date": due, "status": status, "updated_at": updated, **extra}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeRepo:
+    """Tabela reg_obligations em memória (funções usadas pelo cache)."""
+
+    def __init__(self, rows):
+        self.rows = {r["id"]: dict(r) for r in rows}
+        self.calls: list[str] = []
+        self.fail = False
+
+    def list_all(self, org_id, **_kw):
+        self._call("full")
+        return sorted(self.rows.values(), key=lambda r: r["due_date"] or "")
+
+    def updated_since(self, org_id, since):
+        self._call(f"delta:{since}")
+        return [r for r in self.rows.values() if r["updated_at"] >= since]
+
+    def count(self, org_id):
+        self._call("count")
+        return len(self.rows)
+
+    def _call(self, name):
+        if self.fail:
+            raise RuntimeError("offline")
+        self.calls.append(name)
+
+
+class _CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.repo = _FakeRepo(
+            [
+                _row("a", "2026-03-12"),
+                _row("b", "2026-03-05", status="overdue"),
+                _row("c", "2026-03-10", status="done"),
+                _row("d", None),
+                _row("e", "2026-03-10", updated="2026-03-02T09:00:00+00:00"),
+            ]
+        )
+        for target, fn in (
+            ("list_obligations_for_org", self.repo.list_all),
+            ("list_obligations_updated_since", self.repo.updated_since),
+            ("count_obligations", self.repo.count),
+        ):
+            p = patch.object(repository, target, fn)
+            p.start()
+            self.addCleanup(p.stop)
+        self.clock = _Clock()
+        self.cache = ObligationsCache(sync_interval_s=30, clock=self.clock)
+
+
+class TestIndex(_CacheTestCase):
+    def test_scan_is_due_ordered_and_filtered(self):
+        ids = [r["id"] for r in self.cache.scan(ORG)]
+        self.assertEqual(ids, ["b", "c", "e", "a"])  # "d" sem vencimento fica de fora
+
+        open_rows = self.cache.scan(ORG, statuses=("pending", "overdue"))
+        self.assertEqual([r["id"] for r in open_rows], ["b", "e", "a"])
+
+        self.assertEqual([r["id"] for r in self.cache.scan(ORG, start="2026-03-10", end=date(2026, 3, 10))], ["c", "e"])
+        self.assertEqual([r["id"] for r in self.cache.scan(ORG, end="2026-03-09")], ["b"])
+        self.assertEqual(len(self.cache.scan(ORG, statuses=("pending",), limit=1)), 1)
+        self.assertEqual(len(self.cache.rows(ORG)), 5)
+
+    def test_reads_within_interval_hit_memory(self):
+        self.cache.rows(ORG)
+        self.cache.scan(ORG)
+        self.clock.now += 10
+        self.cache.scan(ORG, end="2026-03-10")
+
+        self.assertEqual(self.repo.calls, ["full"])
+        stats = self.cache.stats()
+        self.assertEqual((stats.full_loads, stats.hits, stats.rows), (1, 2, 5))
+
+
+class TestDeltaSync(_CacheTestCase):
+    def test_delta_applies_changes_and_keeps_index_sorted(self):
+        self.cache.rows(ORG)
+        self.repo.rows["a"] = _row("a", "2026-03-01", updated="2026-03-05T08:00:00+00:00")
+        self.repo.rows["f"] = _row("f", "2026-03-11", updated="2026-03-05T08:00:00+00:00")
+
+        self.clock.now += 31
+        ids = [r["id"] for r in self.cache.scan(ORG)]
+
+        self.assertEqual(ids, ["a", "b", "c", "e", "f"])
+        self.assertEqual(self.repo.calls[0], "full")
+        # margem de 5 min antes do maior updated_at visto
+        self.assertEqual(self.repo.calls[1:], ["delta:2026-03-02T08:55:00+00:00", "count"])
+        self.assertEqual(self.cache.stats().delta_syncs, 1)
+
+    def test_remote_delete_triggers_full_reload(self):
+        self.cache.rows(ORG)
+        del self.repo.rows["b"]
+
+        self.clock.now += 31
+        self.assertNotIn("b", {r["id"] for r in self.cache.rows(ORG)})
+        self.assertEqual(self.repo.calls[-1], "full")
+
+    def test_change_older_than_watermark_is_caught_by_periodic_full_reload(self):
+        cache = ObligationsCache(sync_interval_s=30, full_reload_s=300, clock=self.clock)
+        cache.rows(ORG)
+        # máquina com relógio atrasado: updated_at bem antes da margem do delta
+        self.repo.rows["a"] = _row("a", "2026-03-12", status="done", updated="2026-02-01T00:00:00+00:00")
+
+        self.clock.now += 31
+        self.assertEqual({r["id"]: r["status"] for r in cache.rows(ORG)}["a"], "pending")
+        self.assertEqual(self.repo.calls[-1], "count")  # contagem bate: o delta não vê a alteração
+
+        self.clock.now += 300
+        self.assertEqual({r["id"]: r["status"] for r in cache.rows(ORG)}["a"], "done")
+        self.assertEqual(self.repo.calls[-1], "full")
+        self.assertEqual((cache.stats().full_loads, cache.stats().delta_syncs), (2, 1))
+
+    def test_invalidate_and_discard_force_sync(self):
+        self.cache.rows(ORG)
+        del self.repo.rows["a"]
+        self.cache.discard(ORG, "a")
+
+        self.assertNotIn("a", {r["id"] for r in self.cache.scan(ORG)})
+        self.assertEqual(self.repo.calls[-1], "count")  # delta + contagem, sem recarga
+
+        self.cache.invalidate(ORG)
+        self.cache.rows(ORG)
+        self.assertEqual(self.repo.calls[-1], "count")
+
+    def test_sync_failure_serves_last_copy(self):
+        self.cache.rows(ORG)
+        self.repo.fail = True
+        self.clock.now += 31
+
+        self.assertEqual(len(self.cache.rows(ORG)), 5)
+
+        self.repo.fail = False
+        self.cache.rows(ORG)
+        self.assertEqual(self.repo.calls[-1], "count")
+
+    def test_first_load_failure_raises(self):
+        self.repo.fail = True
+        with self.assertRaises(RuntimeError):
+            self.cache.rows(ORG)
+
+
+class TestServiceIntegration(unittest.TestCase):
+    def test_client_obligations_are_filtered_on_the_server(self):
+        seen = {}
+
+        def _fake(org_id, **kwargs):
+            seen.update(kwargs)
+            return [_row("a", "2026-03-12")]
+
+        with patch.object(repository, "list_obligations_for_org", _fake):
+            rows = reg_service.list_obligations_for_client(ORG, 7)
+
+        self.assertEqual(seen["client_id"], 7)
+        self.assertEqual([r["id"] for r in rows], ["a"])
+
+    def test_delete_discards_from_shared_cache(self):
+        cache = ObligationsCache()
+
+        class _Client:
+            def table(self, _name):
+                return self
+
+            def delete(self):
+                return self
+
+            def eq(self, *_a):
+                return self
+
+            def execute(self):
+                return None
+
+        with (
+            patch.object(reg_service, "_get_client", lambda: _Client()),
+            patch.object(reg_service, "get_obligations_cache", lambda: cache),
+            patch.object(cache, "discard") as discard,
+        ):
+            reg_service.delete_obligation(ORG, "a")
+
+        discard.assert_called_once_with(ORG, "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
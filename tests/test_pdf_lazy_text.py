@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Testes da extração de texto sob demanda e tamanhos de página do preview de PDF."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from src.modules.pdf_preview.page_cache import PageCache
+from src.modules.pdf_preview.raster_service import PdfRasterService, sample_page_indices
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(pages: int = 6, *, text_pages: set[int] | None = None, rotate: dict[int, int] | None = None) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=300 + i, height=500)
+        if text_pages is None or i in text_pages:
+            page.insert_text((20, 40), f"pagina {i}")
+        if rotate and i in rotate:
+            page.set_rotation(rotate[i])
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _service(data: bytes) -> PdfRasterService:
+    return PdfRasterService(pdf_bytes=data, cache=PageCache(16))
+
+
+class TestPageSizesFromTree(unittest.TestCase):
+    def test_sizes_match_loaded_pages_including_rotation(self):
+        data = _make_pdf(4, rotate={2: 90, 3: 180})
+        svc = _service(data)
+        try:
+            expected = [(int(p.rect.width), int(p.rect.height)) for p in svc._doc]
+            self.assertEqual(svc.get_page_sizes(), expected)
+            self.assertEqual(svc.get_page_sizes()[2], (500, 302))
+        finally:
+            svc.close()
+
+    def test_sizes_do_not_load_pages(self):
+        svc = _service(_make_pdf(3))
+        try:
+            with patch.object(svc._doc, "load_page", side_effect=AssertionError("load_page chamado")):
+                sizes = svc.get_page_sizes()
+            self.assertEqual(len(sizes), 3)
+        finally:
+            svc.close()
+
+
+class TestLazyText(unittest.TestCase):
+    def test_controller_open_does_not_extract_text(self):
+        from src.modules.pdf_preview.controller import PdfPreviewController
+
+        with patch.object(PdfRasterService, "get_page_text", side_effect=AssertionError("texto extraído")):
+            ctrl = PdfPreviewController(pdf_bytes=_make_pdf(3), page_cache=PageCache(16))
+        try:
+            self.assertFalse(ctrl.text_loaded)
+        finally:
+            ctrl.close()
+
+    def test_text_buffer_extracted_on_first_access(self):
+        from src.modules.pdf_preview.controller import PdfPreviewController
+
+        ctrl = PdfPreviewController(pdf_bytes=_make_pdf(3), page_cache=PageCache(16))
+        try:
+            buf = ctrl.text_buffer
+            self.assertTrue(ctrl.text_loaded)
+            self.assertEqual(len(buf), 3)
+            self.assertIn("pagina 1", buf[1])
+        finally:
+            ctrl.close()
+
+    def test_page_text_is_memoized(self):
+        svc = _service(_make_pdf(2))
+        try:
+            first = svc.get_page_text(1)
+            with patch.object(svc._doc, "load_page", side_effect=AssertionError("extraiu de novo")):
+                self.assertEqual(svc.get_page_text(1), first)
+        finally:
+            svc.close()
+
+    def test_sample_detects_text_layer(self):
+        svc = _service(_make_pdf(40, text_pages={39}))
+        try:
+            self.assertTrue(svc.sample_has_text())
+        finally:
+            svc.close()
+
+    def test_sample_reports_empty_for_scans_without_ocr(self):
+        svc = _service(_make_pdf(40, text_pages=set()))
+        try:
+            self.assertFalse(svc.sample_has_text())
+            # só a amostra foi lida, não o documento inteiro
+            self.assertLessEqual(len(svc._text_cache), 5)
+        finally:
+            svc.close()
+
+
+class TestSamplePageIndices(unittest.TestCase):
+    def test_small_document_uses_all_pages(self):
+        self.assertEqual(sample_page_indices(3), [0, 1, 2])
+
+    def test_large_document_spreads_including_first_and_last(self):
+        idx = sample_page_indices(500)
+        self.assertEqual(len(idx), 5)
+        self.assertEqual((idx[0], idx[-1]), (0, 499))
+
+    def test_empty(self):
+        self.assertEqual(sample_page_indices(0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
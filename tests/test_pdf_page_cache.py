@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Testes para src/modules/pdf_preview/page_cache.py e o cache do PdfRasterService."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+import unittest.mock
+
+import pytest
+
+from src.modules.pdf_preview.page_cache import PageCache, estimate_nbytes
+
+fitz = pytest.importorskip("fitz")
+
+MB = 1024 * 1024
+
+
+class _FakePhoto:
+    """Imita tk.PhotoImage: width()/height() e atributo tk."""
+
+    tk = object()
+
+    def __init__(self, w: int, h: int) -> None:
+        self._w, self._h = w, h
+
+    def width(self) -> int:
+        return self._w
+
+    def height(self) -> int:
+        return self._h
+
+
+class TestByteAccounting(unittest.TestCase):
+    def test_evicts_oldest_when_over_budget(self):
+        cache = PageCache(1)
+        cache.put("a", "A", nbytes=400 * 1024)
+        cache.put("b", "B", nbytes=400 * 1024)
+        cache.put("c", "C", nbytes=400 * 1024)
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.bytes_used, 800 * 1024)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_get_refreshes_lru_order(self):
+        cache = PageCache(1)
+        cache.put("a", "A", nbytes=400 * 1024)
+        cache.put("b", "B", nbytes=400 * 1024)
+        cache.get("a")
+        cache.put("c", "C", nbytes=400 * 1024)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+
+    def test_single_oversized_entry_is_kept(self):
+        cache = PageCache(1)
+        cache.put("small", 1, nbytes=10)
+        cache.put("huge", 2, nbytes=3 * MB)
+        self.assertEqual(list(cache), ["huge"])
+
+    def test_replacing_key_adjusts_bytes(self):
+        cache = PageCache(1)
+        cache.put("a", 1, nbytes=100)
+        cache.put("a", 2, nbytes=300)
+        self.assertEqual(cache.bytes_used, 300)
+        self.assertEqual(cache.get("a"), 2)
+
+    def test_hit_miss_counters(self):
+        cache = PageCache(1)
+        cache.put("a", 1, nbytes=1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("x")
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (2, 1))
+        self.assertAlmostEqual(stats.hit_ratio, 2 / 3)
+
+    def test_discard_where_only_removes_matching(self):
+        cache = PageCache(1)
+        cache.put(("img", 1, 0, 1.0), "x", nbytes=10)
+        cache.put(("img", 2, 0, 1.0), "y", nbytes=10)
+        removed = cache.discard_where(lambda k: k[1] == 1)
+        self.assertEqual(removed, 1)
+        self.assertEqual(cache.bytes_used, 10)
+
+    def test_shrinking_budget_evicts_immediately(self):
+        cache = PageCache(4)
+        for i in range(4):
+            cache.put(i, i, nbytes=MB)
+        cache.set_budget_mb(2)
+        self.assertEqual(len(cache), 2)
+
+
+class TestEstimateNbytes(unittest.TestCase):
+    def test_photoimage_like_counts_four_bytes_per_pixel(self):
+        self.assertEqual(estimate_nbytes(_FakePhoto(10, 20)), 800)
+
+    def test_pixmap_uses_channels(self):
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 30, 10), False)
+        self.assertEqual(estimate_nbytes(pix), 30 * 10 * 3)
+
+
+class TestDeferredRelease(unittest.TestCase):
+    def test_photoimage_evicted_off_main_thread_is_deferred(self):
+        cache = PageCache(1)
+        cache.put("photo", _FakePhoto(1, 1), nbytes=MB)
+
+        t = threading.Thread(target=lambda: cache.put("pix", "bitmap", nbytes=MB))
+        t.start()
+        t.join()
+
+        self.assertNotIn("photo", cache)
+        self.assertEqual(len(cache._deferred), 1)
+        cache.release_deferred()
+        self.assertEqual(cache._deferred, [])
+
+
+def _make_pdf_bytes(pages: int = 2) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=200, height=300)
+        page.insert_text((20, 40), f"pagina {i}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestRasterServiceCache(unittest.TestCase):
+    def setUp(self):
+        from src.modules.pdf_preview.raster_service import PdfRasterService
+
+        self.cache = PageCache(64)
+        self.svc = PdfRasterService(pdf_bytes=_make_pdf_bytes(), cache=self.cache)
+
+    def tearDown(self):
+        self.svc.close()
+
+    def test_pixmaps_are_accounted_in_bytes(self):
+        res = self.svc.get_page_pixmap(0, 1.0)
+        self.assertIsNotNone(res)
+        self.assertEqual(self.cache.bytes_used, res.width * res.height * res.pixmap.n)
+
+    def test_second_call_is_a_hit(self):
+        first = self.svc.get_page_pixmap(0, 1.0)
+        second = self.svc.get_page_pixmap(0, 1.0)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats().hits, 1)
+
+    def test_nearby_zoom_is_downscaled_not_rerasterized(self):
+        big = self.svc.get_page_pixmap(0, 2.0)
+        with unittest.mock.patch.object(self.svc._doc, "load_page", side_effect=AssertionError("rasterizou")):
+            small = self.svc.get_page_pixmap(0, 1.6)
+        self.assertIsNotNone(small)
+        self.assertEqual(small.width, round(big.width * 0.8))
+
+    def test_far_zoom_rasterizes_again(self):
+        self.svc.get_page_pixmap(0, 3.0)
+        res = self.svc.get_page_pixmap(0, 1.0)
+        self.assertEqual((res.width, res.height), (200, 300))
+
+    def test_close_releases_only_own_entries(self):
+        self.cache.put("other-viewer", "x", nbytes=10)
+        self.svc.get_page_pixmap(0, 1.0)
+        self.svc.close()
+        self.assertEqual(list(self.cache), ["other-viewer"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Testes para src/modules/pdf_preview/render_worker.py (PdfRenderWorker)."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import unittest
+
+from src.modules.pdf_preview.controllers.pdf_render_controller import PdfRenderController
+from src.modules.pdf_preview.render_worker import PdfRenderWorker
+
+
+class _FakeTkOwner:
+    """Substitui o widget Tk: after() enfileira, pump() executa na thread do teste."""
+
+    def __init__(self) -> None:
+        self.calls: "queue.Queue" = queue.Queue()
+
+    def after(self, _ms, fn):
+        self.calls.put(fn)
+        return "after#fake"
+
+    def pump(self, timeout: float = 2.0, expected: int = 1) -> int:
+        ran = 0
+        deadline = time.monotonic() + timeout
+        while ran < expected and time.monotonic() < deadline:
+            try:
+                fn = self.calls.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            fn()
+            ran += 1
+        return ran
+
+
+class TestRequestAndDelivery(unittest.TestCase):
+    def test_results_delivered_via_after(self):
+        owner = _FakeTkOwner()
+        worker = PdfRenderWorker(owner, lambda idx, zoom: f"p{idx}@{zoom}", max_workers=2)
+        got = []
+        try:
+            submitted = worker.request([0, 1, 2], 1.5, lambda i, z, p: got.append((i, z, p)))
+            self.assertEqual(submitted, [0, 1, 2])
+            owner.pump(expected=3)
+        finally:
+            worker.shutdown()
+        self.assertEqual(sorted(got), [(0, 1.5, "p0@1.5"), (1, 1.5, "p1@1.5"), (2, 1.5, "p2@1.5")])
+
+    def test_inflight_pages_not_resubmitted(self):
+        gate = threading.Event()
+        owner = _FakeTkOwner()
+
+        def _render(idx, zoom):
+            gate.wait(2)
+            return idx
+
+        worker = PdfRenderWorker(owner, _render, max_workers=1)
+        try:
+            first = worker.request([0, 1], 1.0, lambda *a: None)
+            second = worker.request([0, 1, 2], 1.0, lambda *a: None)
+            self.assertEqual(first, [0, 1])
+            self.assertEqual(second, [2])
+        finally:
+            gate.set()
+            worker.shutdown()
+
+    def test_render_error_delivers_none(self):
+        owner = _FakeTkOwner()
+
+        def _boom(idx, zoom):
+            raise RuntimeError("falha fitz")
+
+        worker = PdfRenderWorker(owner, _boom, max_workers=1)
+        got = []
+        try:
+            worker.request([4], 1.0, lambda i, z, p: got.append((i, p)))
+            owner.pump()
+        finally:
+            worker.shutdown()
+        self.assertEqual(got, [(4, None)])
+
+
+class TestCancellation(unittest.TestCase):
+    def test_zoom_change_drops_stale_results(self):
+        gate = threading.Event()
+        started = threading.Event()
+        owner = _FakeTkOwner()
+
+        def _render(idx, zoom):
+            started.set()
+            gate.wait(2)
+            return zoom
+
+        worker = PdfRenderWorker(owner, _render, max_workers=1)
+        got = []
+        try:
+            worker.request([0], 1.0, lambda i, z, p: got.append((i, z)))
+            self.assertTrue(started.wait(2))
+            # zoom muda enquanto a página 0 @1.0 ainda renderiza
+            worker.request([0], 2.0, lambda i, z, p: got.append((i, z)))
+            gate.set()
+            owner.pump(expected=2)
+        finally:
+            worker.shutdown()
+        self.assertEqual(got, [(0, 2.0)])
+
+    def test_pages_scrolled_away_are_not_rendered(self):
+        gate = threading.Event()
+        rendered = []
+        owner = _FakeTkOwner()
+
+        def _render(idx, zoom):
+            gate.wait(2)
+            rendered.append(idx)
+            return idx
+
+        worker = PdfRenderWorker(owner, _render, max_workers=1)
+        try:
+            worker.request([0, 1, 2, 3], 1.0, lambda *a: None)
+            # usuário rolou para o fim antes de 1..3 começarem
+            worker.request([0, 40], 1.0, lambda *a: None)
+            gate.set()
+            owner.pump(expected=2)
+        finally:
+            worker.shutdown()
+        self.assertEqual(sorted(rendered), [0, 40])
+
+    def test_cancel_invalidates_pending(self):
+        gate = threading.Event()
+        owner = _FakeTkOwner()
+        worker = PdfRenderWorker(owner, lambda idx, zoom: gate.wait(2) and idx, max_workers=1)
+        got = []
+        try:
+            worker.request([0, 1], 1.0, lambda i, z, p: got.append(i))
+            worker.cancel()
+            self.assertEqual(worker.pending_pages(), [])
+            gate.set()
+            owner.pump(timeout=0.3, expected=2)
+        finally:
+            worker.shutdown()
+        self.assertEqual(got, [])
+
+    def test_tile_keys_are_accepted(self):
+        from src.modules.pdf_preview.controllers.pdf_render_controller import TileSpec
+
+        owner = _FakeTkOwner()
+        worker = PdfRenderWorker(owner, lambda key, zoom: (key.col, key.row), max_workers=1)
+        tile = TileSpec(page_index=0, col=1, row=0, x0=512, y0=0, x1=1024, y1=512)
+        got = []
+        try:
+            self.assertEqual(worker.request([tile, tile], 3.0, lambda k, z, p: got.append((k, p))), [tile])
+            owner.pump()
+        finally:
+            worker.shutdown()
+        self.assertEqual(got, [(tile, (1, 0))])
+
+    def test_request_after_shutdown_is_noop(self):
+        worker = PdfRenderWorker(_FakeTkOwner(), lambda idx, zoom: idx)
+        worker.shutdown()
+        self.assertEqual(worker.request([0], 1.0, lambda *a: None), [])
+
+
+class TestRunTask(unittest.TestCase):
+    def test_task_result_delivered_via_after(self):
+        owner = _FakeTkOwner()
+        worker = PdfRenderWorker(owner, lambda idx, zoom: idx)
+        got = []
+        try:
+            self.assertTrue(worker.run_task(lambda: ["texto"], got.append))
+            owner.pump()
+        finally:
+            worker.shutdown()
+        self.assertEqual(got, [["texto"]])
+
+    def test_task_after_shutdown_is_rejected(self):
+        worker = PdfRenderWorker(_FakeTkOwner(), lambda idx, zoom: idx)
+        worker.shutdown()
+        self.assertFalse(worker.run_task(lambda: 1, lambda _r: None))
+
+
+class TestLookahead(unittest.TestCase):
+    def setUp(self):
+        self.ctrl = PdfRenderController()
+
+    def test_visible_first_then_alternating_neighbours(self):
+        self.assertEqual(self.ctrl.expand_with_lookahead([3, 4], 10, 2), [3, 4, 5, 2, 6, 1])
+
+    def test_clamped_to_document_bounds(self):
+        self.assertEqual(self.ctrl.expand_with_lookahead([0], 2, 3), [0, 1])
+
+    def test_zero_lookahead_keeps_visible_only(self):
+        self.assertEqual(self.ctrl.expand_with_lookahead([5, 6], 10, 0), [5, 6])
+
+    def test_empty_visible(self):
+        self.assertEqual(self.ctrl.expand_with_lookahead([], 10, 2), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
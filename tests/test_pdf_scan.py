@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Testes da varredura de PDFs com cache de texto (src/utils/file_utils/pdf_scan.py)."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.utils.file_utils import bytes_utils, pdf_scan
+from src.utils.file_utils.pdf_scan import PdfTextCache, rank_pdfs, scan_pdfs
+
+fitz = pytest.importorskip("fitz")
+
+CARTAO = (
+    "Comprovante de Inscricao e de Situacao Cadastral\nCNPJ 12.345.678/0001-95\nNOME EMPRESARIAL: FARMACIA TESTE LTDA"
+)
+
+
+def _write_pdf(path: Path, pages: list[str]) -> Path:
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        if text:
+            page.insert_text((40, 60), text)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class _DictStore:
+    def __init__(self):
+        self.data: dict = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, payload):
+        self.data[key] = payload
+
+
+@pytest.fixture
+def cache():
+    return PdfTextCache(_DictStore())
+
+
+@pytest.fixture(autouse=True)
+def _thread_pool(monkeypatch):
+    monkeypatch.setattr(pdf_scan, "_make_executor", lambda n: ThreadPoolExecutor(max_workers=n))
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    seen: dict[str, list[str]] = {"first": [], "full": []}
+    first, full = pdf_scan.extract_first_page, pdf_scan.extract_full_text
+
+    def _first(path):
+        seen["first"].append(Path(path).name)
+        return first(path)
+
+    def _full(path):
+        seen["full"].append(Path(path).name)
+        return full(path)
+
+    monkeypatch.setattr(pdf_scan, "extract_first_page", _first)
+    monkeypatch.setattr(pdf_scan, "extract_full_text", _full)
+    return seen
+
+
+def _match(text: str) -> bool:
+    return bytes_utils._looks_like_cartao_cnpj(text)
+
+
+def test_rank_puts_filename_match_first(tmp_path: Path):
+    paths = [tmp_path / "alvara.pdf", tmp_path / "scan001.pdf", tmp_path / "cartao cnpj.pdf"]
+
+    ranked = rank_pdfs(paths, "cartao_cnpj")
+
+    assert [p.name for p in ranked] == ["cartao cnpj.pdf", "scan001.pdf", "alvara.pdf"]
+
+
+def test_stops_at_first_page_match(tmp_path: Path, cache, calls):
+    other = _write_pdf(tmp_path / "nota.pdf", ["Nota fiscal 123", "pagina 2"])
+    cartao = _write_pdf(tmp_path / "cnpj.pdf", [CARTAO])
+
+    found = scan_pdfs([other, cartao], _match, kind="cartao_cnpj", max_workers=1, cache=cache)
+
+    assert found is not None and found[0] == cartao
+    assert "FARMACIA TESTE" in found[1]
+    assert calls["first"] == ["cnpj.pdf"]
+    assert calls["full"] == []
+
+
+def test_cached_text_skips_extraction(tmp_path: Path, cache, calls):
+    _write_pdf(tmp_path / "a.pdf", ["Nota fiscal"])
+    cartao = _write_pdf(tmp_path / "doc.pdf", [CARTAO])
+    pdfs = sorted(tmp_path.glob("*.pdf"))
+
+    assert scan_pdfs(pdfs, _match, kind="cartao_cnpj", cache=cache)[0] == cartao
+    extracted = len(calls["first"])
+
+    assert scan_pdfs(pdfs, _match, kind="cartao_cnpj", cache=cache)[0] == cartao
+    assert len(calls["first"]) == extracted
+
+
+def test_reads_remaining_pages_only_after_first_pages(tmp_path: Path, cache, calls):
+    single = _write_pdf(tmp_path / "a.pdf", ["Nota fiscal"])
+    multi = _write_pdf(tmp_path / "b.pdf", ["Capa do processo", CARTAO])
+
+    found = scan_pdfs([single, multi], _match, kind="cartao_cnpj", max_workers=2, cache=cache)
+
+    assert found is not None and found[0] == multi
+    assert sorted(calls["first"]) == ["a.pdf", "b.pdf"]
+    assert calls["full"] == ["b.pdf"]
+
+
+def test_no_match_caches_negative_results(tmp_path: Path, cache, calls):
+    pdfs = [_write_pdf(tmp_path / "a.pdf", ["Nota fiscal"]), _write_pdf(tmp_path / "b.pdf", ["Recibo"])]
+
+    assert scan_pdfs(pdfs, _match, kind="cartao_cnpj", cache=cache) is None
+    assert scan_pdfs(pdfs, _match, kind="cartao_cnpj", cache=cache) is None
+    assert len(calls["first"]) == 2
+
+
+def test_find_cartao_cnpj_returns_path_and_text(tmp_path: Path, cache, monkeypatch):
+    monkeypatch.setattr(pdf_scan, "get_pdf_text_cache", lambda: cache)
+    _write_pdf(tmp_path / "x.pdf", ["Outro documento"])
+    sub = tmp_path / "docs"
+    sub.mkdir()
+    cartao = _write_pdf(sub / "y.pdf", [CARTAO])
+
+    path, text = bytes_utils.find_cartao_cnpj(tmp_path)
+
+    assert path == cartao
+    assert "12.345.678/0001-95" in text
+    assert bytes_utils.find_cartao_cnpj_pdf(tmp_path) == cartao
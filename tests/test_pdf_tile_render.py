@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Testes do modo de renderização em tiles (zoom alto) do preview de PDF."""
+
+from __future__ import annotations
+
+import unittest
+
+import pytest
+
+from src.modules.pdf_preview.controllers.pdf_render_controller import PdfRenderController, TileSpec
+from src.modules.pdf_preview.page_cache import PageCache
+from src.modules.pdf_preview.render_service import PdfRenderService
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(*, rotate: int = 0) -> bytes:
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=500)
+    page.draw_rect(fitz.Rect(10, 10, 120, 60), color=(1, 0, 0), fill=(1, 0, 0))
+    page.insert_text((40, 300), "tile " * 8)
+    if rotate:
+        page.set_rotation(rotate)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestTileLayout(unittest.TestCase):
+    def setUp(self):
+        self.ctrl = PdfRenderController(tile_size=256, tile_min_zoom=2.0)
+
+    def test_threshold(self):
+        self.assertFalse(self.ctrl.use_tiles(1.99))
+        self.assertTrue(self.ctrl.use_tiles(2.0))
+
+    def test_edge_tiles_are_clipped_to_page(self):
+        tile = self.ctrl.tile_at(0, (300, 500), 2.0, 2, 3)
+        self.assertEqual((tile.x0, tile.y0, tile.x1, tile.y1), (512, 768, 600, 1000))
+        self.assertEqual((tile.width, tile.height), (88, 232))
+
+    def test_visible_tiles_scale_with_viewport_not_page(self):
+        sizes = [(600, 800)] * 3
+        layout = self.ctrl.calculate_page_layout(sizes, 4.0)
+        # viewport 800x600 no meio da segunda página
+        top = layout.page_tops[1]
+        tiles = self.ctrl.find_visible_tiles(layout.page_tops, sizes, 4.0, (0, top + 1000, 800, top + 1600))
+        self.assertTrue(tiles)
+        self.assertTrue(all(t.page_index == 1 for t in tiles))
+        self.assertLessEqual(len(tiles), 4 * 4)
+        total = (600 * 4 // 256 + 1) * (800 * 4 // 256 + 1)
+        self.assertLess(len(tiles), total)
+
+    def test_viewport_between_pages_spans_both(self):
+        sizes = [(300, 500)] * 2
+        layout = self.ctrl.calculate_page_layout(sizes, 2.0)
+        boundary = layout.page_tops[1]
+        tiles = self.ctrl.find_visible_tiles(layout.page_tops, sizes, 2.0, (0, boundary - 100, 400, boundary + 100))
+        self.assertEqual({t.page_index for t in tiles}, {0, 1})
+
+    def test_margin_adds_neighbour_ring(self):
+        sizes = [(1000, 1000)]
+        tops = [16]
+        base = self.ctrl.find_visible_tiles(tops, sizes, 3.0, (600, 600, 900, 900))
+        wider = self.ctrl.find_visible_tiles(tops, sizes, 3.0, (600, 600, 900, 900), margin=256)
+        self.assertGreater(len(wider), len(base))
+        self.assertTrue(set(base) <= set(wider))
+
+
+class TestTileRaster(unittest.TestCase):
+    def _assert_tile_matches_full_page(self, data: bytes) -> None:
+        from src.modules.pdf_preview.raster_service import PdfRasterService
+
+        svc = PdfRasterService(pdf_bytes=data, cache=PageCache(64))
+        try:
+            zoom = 2.0
+            full = svc.get_page_pixmap(0, zoom).pixmap
+            rect = (256, 0, 512, 256)
+            tile = svc.get_tile_pixmap(0, zoom, rect)
+            self.assertEqual((tile.width, tile.height), (256, 256))
+            for x in range(0, 256, 17):
+                for y in range(0, 256, 17):
+                    self.assertEqual(tile.pixmap.pixel(x, y), full.pixel(256 + x, y))
+        finally:
+            svc.close()
+
+    def test_tile_equals_crop_of_full_page(self):
+        self._assert_tile_matches_full_page(_make_pdf())
+
+    def test_tile_equals_crop_on_rotated_page(self):
+        self._assert_tile_matches_full_page(_make_pdf(rotate=90))
+
+    def test_empty_rect_returns_none(self):
+        from src.modules.pdf_preview.raster_service import PdfRasterService
+
+        svc = PdfRasterService(pdf_bytes=_make_pdf(), cache=PageCache(16))
+        try:
+            self.assertIsNone(svc.get_tile_pixmap(0, 2.0, (10, 10, 10, 50)))
+        finally:
+            svc.close()
+
+    def test_tiles_do_not_populate_pixmap_cache(self):
+        from src.modules.pdf_preview.raster_service import PdfRasterService
+
+        cache = PageCache(16)
+        svc = PdfRasterService(pdf_bytes=_make_pdf(), cache=cache)
+        try:
+            svc.get_tile_pixmap(0, 4.0, (0, 0, 512, 512))
+            self.assertEqual(len(cache), 0)
+        finally:
+            svc.close()
+
+
+class TestTileCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PageCache(16)
+        self.service = PdfRenderService(cache=self.cache)
+        self.tile = TileSpec(page_index=0, col=1, row=2, x0=512, y0=1024, x1=1024, y1=1536)
+
+    def test_tiles_cached_independently_per_zoom_and_position(self):
+        self.service.store_tile(self.tile, 3.0, "img-a")
+        other = TileSpec(page_index=0, col=2, row=2, x0=1024, y0=1024, x1=1200, y1=1536)
+        self.assertEqual(self.service.get_cached_tile(self.tile, 3.0), "img-a")
+        self.assertIsNone(self.service.get_cached_tile(other, 3.0))
+        self.assertIsNone(self.service.get_cached_tile(self.tile, 4.0))
+        self.assertIsNone(self.service.get_cached_photoimage(0, 3.0))
+
+    def test_clear_cache_drops_tiles_of_this_service_only(self):
+        neighbour = PdfRenderService(cache=self.cache)
+        self.service.store_tile(self.tile, 3.0, "mine")
+        neighbour.store_tile(self.tile, 3.0, "theirs")
+        self.service.clear_cache()
+        self.assertIsNone(self.service.get_cached_tile(self.tile, 3.0))
+        self.assertEqual(neighbour.get_cached_tile(self.tile, 3.0), "theirs")
+
+    def test_prepare_tile_image_uses_clip(self):
+        from src.modules.pdf_preview.controller import PdfPreviewController
+
+        ctrl = PdfPreviewController(pdf_bytes=_make_pdf(), page_cache=self.cache)
+        try:
+            payload = self.service.prepare_tile_image(tile=self.tile, zoom=4.0, pdf_controller=ctrl)
+            self.assertIsNotNone(payload)
+            size = payload.size if hasattr(payload, "size") else (payload.width, payload.height)
+            self.assertEqual(tuple(size), (512, 512))
+        finally:
+            ctrl.close()
+
+    def test_prepare_tile_without_controller(self):
+        self.assertIsNone(self.service.prepare_tile_image(tile=self.tile, zoom=4.0, pdf_controller=None))
+
+
+class _FakePhoto:
+    def __init__(self, w: int, h: int) -> None:
+        self._w, self._h = w, h
+
+    def width(self) -> int:
+        return self._w
+
+    def height(self) -> int:
+        return self._h
+
+    def zoom(self, factor: int) -> "_FakePhoto":
+        return _FakePhoto(self._w * factor, self._h * factor)
+
+    def subsample(self, factor: int) -> "_FakePhoto":
+        return _FakePhoto(self._w // factor, self._h // factor)
+
+
+class TestPlaceholder(unittest.TestCase):
+    def setUp(self):
+        self.service = PdfRenderService(cache=PageCache(16))
+        self.service.store_photoimage(0, 1.0, _FakePhoto(300, 500))
+        self.blank = _FakePhoto(0, 0)
+        self.service._blank_page_image = lambda **_kw: self.blank  # type: ignore[method-assign]
+
+    def _placeholder(self, zoom: float):
+        return self.service.make_placeholder(page_index=0, zoom=zoom, page_sizes=[(300, 500)])
+
+    def test_whole_ratio_reuses_cached_render(self):
+        self.assertEqual(self._placeholder(2.0).width(), 600)
+        self.assertEqual(self._placeholder(0.5).width(), 150)
+        self.assertEqual(self._placeholder(3.1).width(), 900)  # dentro de 5% de 3x
+
+    def test_fractional_ratio_uses_blank_page(self):
+        self.assertIs(self._placeholder(2.5), self.blank)
+        self.assertIs(self._placeholder(0.4), self.blank)
+
+
+if __name__ == "__main__":
+    unittest.main()
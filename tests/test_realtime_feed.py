@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Testes do estado de conexão do feed Realtime (src/infra/supabase/realtime_feed.py)."""
+
+from __future__ import annotations
+
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from realtime import RealtimeSubscribeStates
+
+from src.infra.supabase import realtime_feed
+from src.infra.supabase.realtime_feed import RowChangeFeed
+
+
+class _FakeChannel:
+    def __init__(self, state=RealtimeSubscribeStates.SUBSCRIBED):
+        self.subscribe_state = state
+        self.joined = True
+        self.system_callbacks = []
+
+    def on_postgres_changes(self, *args, **kwargs):
+        return self
+
+    def on_system(self, callback):
+        self.system_callbacks.append(callback)
+        return self
+
+    async def subscribe(self, callback):
+        callback(self.subscribe_state, None)
+
+    @property
+    def is_joined(self):
+        return self.joined
+
+
+class _FakeClient:
+    channel_obj = _FakeChannel()
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def channel(self, name):
+        return self.channel_obj
+
+    async def close(self):
+        pass
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not predicate():
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestRowChangeFeedState(unittest.TestCase):
+    def _start(self, channel):
+        _FakeClient.channel_obj = channel
+        feed = RowChangeFeed("https://x", "anon", None, table="zip_export_jobs", row_filter="id=eq.1")
+        with patch("realtime.AsyncRealtimeClient", _FakeClient), patch.object(realtime_feed, "_STATE_CHECK_S", 0.01):
+            started = feed.start(timeout_s=2)
+        self.addCleanup(feed.close)
+        return feed, started
+
+    def test_failed_subscription_is_not_connected(self):
+        for state in (
+            RealtimeSubscribeStates.CHANNEL_ERROR,
+            RealtimeSubscribeStates.TIMED_OUT,
+            RealtimeSubscribeStates.CLOSED,
+        ):
+            feed, started = self._start(_FakeChannel(state))
+            self.assertFalse(started, state)
+            self.assertFalse(feed.connected)
+
+    def test_system_error_after_subscribe_clears_connected(self):
+        channel = _FakeChannel()
+        feed, started = self._start(channel)
+        self.assertTrue(started)
+        channel.system_callbacks[0](SimpleNamespace(status="ok"))
+        self.assertTrue(feed.connected)
+        channel.system_callbacks[0](SimpleNamespace(status="error", message="table not in publication"))
+        self.assertFalse(feed.connected)
+
+    def test_channel_leaving_joined_state_clears_connected(self):
+        channel = _FakeChannel()
+        feed, started = self._start(channel)
+        self.assertTrue(started)
+        channel.joined = False
+        self.assertTrue(_wait_until(lambda: not feed.connected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Testes do download resumível por Range (src/infra/supabase/resumable_download.py)."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from pathlib import Path
+
+import pytest
+from requests import exceptions as req_exc
+
+from src.infra.supabase import resumable_download as rd
+from src.infra.supabase.resumable_download import DownloadHTTPError, DownloadIntegrityError, ResumableDownload
+from src.infra.supabase.storage_client import DownloadCancelledError
+
+PAYLOAD = bytes(range(256)) * 40  # 10240 bytes
+ETAG = '"' + hashlib.md5(PAYLOAD).hexdigest() + '"'  # noqa: S324
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    monkeypatch.setattr(rd, "_sleep", lambda _s: None)
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None, fail_after=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+        self._fail_after = fail_after
+
+    def iter_content(self, chunk_size=8192):
+        sent = 0
+        for i in range(0, len(self._body), 1024):
+            if self._fail_after is not None and sent >= self._fail_after:
+                raise req_exc.ChunkedEncodingError("conexão interrompida")
+            chunk = self._body[i : i + 1024]
+            sent += len(chunk)
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        pass
+
+
+class RangeServer:
+    """Sessão falsa que atende GET completo e ``Range: bytes=a-b``."""
+
+    def __init__(self, payload=PAYLOAD, etag=ETAG, ranges=True, fail_after=None):
+        self.payload = payload
+        self.etag = etag
+        self.ranges = ranges
+        self.fail_after = list(fail_after or [])
+        self.calls: list[dict] = []
+        self.ignore_range = False
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, params=None, stream=True, timeout=None):
+        headers = dict(headers or {})
+        with self._lock:
+            self.calls.append(headers)
+            fail = self.fail_after.pop(0) if self.fail_after else None
+        base = {"ETag": self.etag}
+        if self.ranges:
+            base["Accept-Ranges"] = "bytes"
+        rng = headers.get("Range")
+        if rng and not self.ignore_range and headers.get("If-Range", self.etag) == self.etag:
+            start, end = rng.split("=", 1)[1].split("-")
+            start, end = int(start), int(end or len(self.payload) - 1)
+            body = self.payload[start : end + 1]
+            return FakeResponse(
+                206,
+                body,
+                {**base, "Content-Range": f"bytes {start}-{end}/{len(self.payload)}", "Content-Length": str(len(body))},
+                fail,
+            )
+        return FakeResponse(200, self.payload, {**base, "Content-Length": str(len(self.payload))}, fail)
+
+
+def _download(server, dest, **kwargs):
+    kwargs.setdefault("resume_key", "zip-job:1")
+    return ResumableDownload(server, "https://cdn.example.com/a.zip", dest, **kwargs).run()
+
+
+def test_resumes_after_network_drop_with_range(tmp_path: Path):
+    server = RangeServer(fail_after=[4096])
+    dest = tmp_path / "a.zip"
+
+    assert _download(server, dest, verify_etag_md5=True) == dest
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.calls[1]["Range"] == "bytes=4096-10239"
+    assert server.calls[1]["If-Range"] == ETAG
+    assert not (tmp_path / "a.zip.part").exists()
+    assert not (tmp_path / "a.zip.part.json").exists()
+
+
+def test_partial_kept_and_resumed_in_a_new_call(tmp_path: Path):
+    dest = tmp_path / "a.zip"
+    first = RangeServer(fail_after=[2048, 0])
+    with pytest.raises(req_exc.ChunkedEncodingError):
+        _download(first, dest, max_attempts=2)
+    assert (tmp_path / "a.zip.part").exists()
+    assert (tmp_path / "a.zip.part.json").exists()
+
+    second = RangeServer()
+    _download(second, dest)
+
+    assert dest.read_bytes() == PAYLOAD
+    assert second.calls == [{"Range": "bytes=2048-10239", "If-Range": ETAG}]
+
+
+def test_other_resume_key_starts_over(tmp_path: Path):
+    dest = tmp_path / "a.zip"
+    with pytest.raises(req_exc.ChunkedEncodingError):
+        _download(RangeServer(fail_after=[2048]), dest, max_attempts=1)
+
+    server = RangeServer()
+    _download(server, dest, resume_key="zip-job:2")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert "Range" not in server.calls[0]
+
+
+def test_parallel_segments(tmp_path: Path):
+    server = RangeServer()
+    dest = tmp_path / "a.zip"
+
+    _download(server, dest, segments=4, parallel_min_bytes=1)
+
+    assert dest.read_bytes() == PAYLOAD
+    ranges = sorted(c["Range"] for c in server.calls if "Range" in c)
+    assert ranges == ["bytes=0-2559", "bytes=2560-5119", "bytes=5120-7679", "bytes=7680-10239"]
+
+
+def test_restarts_when_server_ignores_range(tmp_path: Path):
+    server = RangeServer(fail_after=[4096])
+    server.ignore_range = True
+    dest = tmp_path / "a.zip"
+
+    _download(server, dest)
+
+    assert dest.read_bytes() == PAYLOAD
+    assert "Range" not in server.calls[-1]
+
+
+def test_etag_md5_mismatch_discards_partial(tmp_path: Path):
+    server = RangeServer(etag='"' + "0" * 32 + '"')
+    dest = tmp_path / "a.zip"
+
+    with pytest.raises(DownloadIntegrityError):
+        _download(server, dest, verify_etag_md5=True)
+
+    assert not dest.exists()
+    assert not (tmp_path / "a.zip.part").exists()
+
+
+def test_sha256_checked(tmp_path: Path):
+    dest = tmp_path / "a.zip"
+    with pytest.raises(DownloadIntegrityError):
+        _download(RangeServer(), dest, expected_sha256="ab" * 32)
+
+    _download(RangeServer(), dest, expected_sha256=hashlib.sha256(PAYLOAD).hexdigest())
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_cancel_removes_partial_and_metadata(tmp_path: Path):
+    cancel = threading.Event()
+    dest = tmp_path / "a.zip"
+
+    def _progress(written, _total):
+        if written >= 4096:
+            cancel.set()
+
+    with pytest.raises(DownloadCancelledError):
+        _download(RangeServer(), dest, cancel_event=cancel, progress_cb=_progress)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_without_range_support_failure_removes_partial(tmp_path: Path):
+    server = RangeServer(ranges=False, fail_after=[4096])
+    dest = tmp_path / "a.zip"
+
+    with pytest.raises(req_exc.ChunkedEncodingError):
+        _download(server, dest)
+
+    assert len(server.calls) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_http_error_status_is_exposed(tmp_path: Path):
+    class _NotFound(RangeServer):
+        def get(self, url, **kwargs):
+            return FakeResponse(404)
+
+    with pytest.raises(DownloadHTTPError) as info:
+        _download(_NotFound(), tmp_path / "a.zip")
+
+    assert info.value.status == 404
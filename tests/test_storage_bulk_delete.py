@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Testes da exclusão recursiva em lote do Storage."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.adapters.storage import bulk_delete
+from src.adapters.storage.bulk_delete import collect_storage_keys, delete_prefix
+
+
+def _tree_lister(tree: dict[str, list[tuple[str, bool]]], fail: set[str] = frozenset()):
+    """list_fn fake: ``tree[prefix]`` = [(nome, é_pasta)]."""
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def _list(prefix: str):
+        with lock:
+            calls.append(prefix)
+        if prefix in fail:
+            raise ConnectionError("timeout")
+        return [{"name": name, "metadata": None if folder else {"size": 1}} for name, folder in tree.get(prefix, [])]
+
+    return _list, calls
+
+
+TREE = {
+    "org/1": [("SIFAP", True), ("GERAL", True), ("a.pdf", False)],
+    "org/1/SIFAP": [("b.pdf", False), ("2024", True)],
+    "org/1/SIFAP/2024": [("c.pdf", False)],
+    "org/1/GERAL": [("d.pdf", False)],
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_sleep():
+    with patch.object(bulk_delete, "retry_call", side_effect=lambda fn, *a, **k: fn(*a)):
+        yield
+
+
+def test_collect_walks_every_level():
+    list_fn, calls = _tree_lister(TREE)
+    keys, errors = collect_storage_keys(list_fn, "/org/1/", max_workers=3)
+    assert sorted(keys) == ["org/1/GERAL/d.pdf", "org/1/SIFAP/2024/c.pdf", "org/1/SIFAP/b.pdf", "org/1/a.pdf"]
+    assert errors == []
+    assert sorted(calls) == sorted(TREE)
+
+
+def test_list_failure_is_reported_and_siblings_still_collected():
+    list_fn, _ = _tree_lister(TREE, fail={"org/1/SIFAP"})
+    keys, errors = collect_storage_keys(list_fn, "org/1", max_workers=2)
+    assert sorted(keys) == ["org/1/GERAL/d.pdf", "org/1/a.pdf"]
+    assert len(errors) == 1 and errors[0].startswith("org/1/SIFAP:")
+
+
+def test_keys_removed_in_chunks():
+    files = [(f"f{i:03d}.pdf", False) for i in range(25)]
+    list_fn, _ = _tree_lister({"p": files})
+    remove_fn = MagicMock()
+    report = delete_prefix(list_fn, remove_fn, "p", chunk_size=10, max_workers=3)
+    assert report.ok
+    assert (report.found, report.deleted) == (25, 25)
+    sizes = sorted(len(c.args[0]) for c in remove_fn.call_args_list)
+    assert sizes == [5, 10, 10]
+
+
+def test_failed_chunk_lists_exact_remaining_keys():
+    files = [(f"f{i}.pdf", False) for i in range(6)]
+    list_fn, _ = _tree_lister({"p": files})
+
+    def remove_fn(chunk):
+        if "p/f3.pdf" in chunk:
+            raise RuntimeError("HTTP 500")
+
+    report = delete_prefix(list_fn, remove_fn, "p", chunk_size=2, max_workers=1)
+    assert not report.ok
+    assert report.deleted == 4
+    assert report.remaining == ["p/f2.pdf", "p/f3.pdf"]
+    assert "HTTP 500" in report.failed_chunks[0].error
+    assert report.error_messages()[0].startswith("2 arquivo(s) não removidos")
+
+
+def test_keys_missing_from_remove_response_are_remaining():
+    files = [(f"f{i}.pdf", False) for i in range(4)]
+    list_fn, _ = _tree_lister({"p": files})
+
+    def remove_fn(chunk):
+        # storage devolve só os objetos apagados (p/f2.pdf bloqueado por RLS)
+        return [{"name": key} for key in chunk if key != "p/f2.pdf"]
+
+    report = delete_prefix(list_fn, remove_fn, "p", chunk_size=2, max_workers=2)
+    assert not report.ok
+    assert report.deleted == 3
+    assert report.remaining == ["p/f2.pdf"]
+    assert report.failed_chunks[0].error == "não confirmadas pelo storage"
+
+
+def test_empty_prefix_makes_no_remove_call():
+    list_fn, _ = _tree_lister({})
+    remove_fn = MagicMock()
+    report = delete_prefix(list_fn, remove_fn, "vazio")
+    assert report.ok and report.found == 0
+    remove_fn.assert_not_called()
+
+
+def test_delete_storage_folder_reports_remaining():
+    from src.modules.uploads import service
+
+    report = bulk_delete.BulkDeleteReport(prefix="org/1/SIFAP", found=3, deleted=1)
+    report.failed_chunks.append(bulk_delete.ChunkFailure(("org/1/SIFAP/x.pdf", "org/1/SIFAP/y.pdf"), "HTTP 500"))
+    adapter = MagicMock()
+    adapter.delete_prefix.return_value = report
+    with patch.object(service, "SupabaseStorageAdapter", return_value=adapter):
+        result = service.delete_storage_folder("org/1/SIFAP", bucket="rc-docs")
+    assert result["ok"] is False
+    assert result["deleted"] == 1
+    assert result["remaining"] == ["org/1/SIFAP/x.pdf", "org/1/SIFAP/y.pdf"]
+    assert "2 arquivo(s)" in result["message"]
+
+
+def test_remove_cliente_storage_raises_with_remaining_keys():
+    from src.modules.clientes.core import service
+    from src.modules.clientes.core.service import ClienteStorageRemovalError
+
+    report = bulk_delete.BulkDeleteReport(prefix="org/7", found=1)
+    report.failed_chunks.append(bulk_delete.ChunkFailure(("org/7/a.pdf",), "HTTP 403"))
+    adapter = MagicMock()
+    adapter.delete_prefix.return_value = report
+    with patch.object(service, "SupabaseStorageAdapter", return_value=adapter):
+        with pytest.raises(ClienteStorageRemovalError, match="org/7/a.pdf"):
+            service._remove_cliente_storage("rc-docs", "org", 7)
+    adapter.delete_prefix.assert_called_once_with("org/7")
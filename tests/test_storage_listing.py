@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Testes da listagem paginada e do percurso recursivo do Storage."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.adapters.storage.listing import iter_pages, walk_prefix
+from src.adapters.storage.supabase_storage import SupabaseStorageAdapter
+
+
+class _FakeBucket:
+    """Simula ``client.storage.from_(bucket).list`` com limit/offset."""
+
+    def __init__(self, tree: dict[str, list[dict]]):
+        self.tree = tree
+        self.calls: list[tuple[str, int, int]] = []
+
+    def list(self, path: str, options: dict):
+        limit, offset = options["limit"], options["offset"]
+        self.calls.append((path, limit, offset))
+        return self.tree.get(path.rstrip("/"), [])[offset : offset + limit]
+
+
+def _client(bucket: _FakeBucket) -> MagicMock:
+    client = MagicMock()
+    client.storage.from_.return_value = bucket
+    return client
+
+
+def _files(n: int, prefix: str = "f") -> list[dict]:
+    return [{"name": f"{prefix}{i:04d}.pdf", "metadata": {"size": i}} for i in range(n)]
+
+
+def test_iter_pages_stops_on_short_page():
+    calls = []
+
+    def fetch(limit, offset):
+        calls.append((limit, offset))
+        return list(range(offset, min(offset + limit, 25)))
+
+    pages = list(iter_pages(fetch, page_size=10))
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert calls == [(10, 0), (10, 10), (10, 20)]
+
+
+def test_iter_pages_exact_multiple_needs_one_empty_request():
+    pages = list(iter_pages(lambda limit, offset: [1] * limit if offset < 20 else [], page_size=10))
+    assert [len(p) for p in pages] == [10, 10]
+
+
+def test_list_files_is_no_longer_truncated_at_1000():
+    bucket = _FakeBucket({"org/1": _files(2300)})
+    adapter = SupabaseStorageAdapter(client=_client(bucket), bucket="rc-docs")
+    entries = adapter.list_files("org/1")
+    assert len(entries) == 2300
+    assert entries[-1]["full_path"] == "org/1/f2299.pdf"
+    assert [offset for _p, _l, offset in bucket.calls] == [0, 1000, 2000]
+
+
+def test_iter_file_pages_yields_as_pages_arrive():
+    bucket = _FakeBucket({"p": _files(5)})
+    adapter = SupabaseStorageAdapter(client=_client(bucket), bucket="rc-docs")
+    pages = adapter.iter_file_pages("p", page_size=2)
+    assert [e["name"] for e in next(pages)] == ["f0000.pdf", "f0001.pdf"]
+    assert len(bucket.calls) == 1  # a segunda página só é pedida quando consumida
+    assert sum(len(p) for p in pages) == 3
+
+
+def _tree_list_fn(tree, *, delay=0.0, fail=()):
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def list_fn(prefix):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            time.sleep(delay)
+            if prefix in fail:
+                raise ConnectionError("boom")
+            return tree.get(prefix, [])
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    return list_fn, state
+
+
+def _folder(name):
+    return {"name": name, "metadata": None}
+
+
+def test_walk_prefix_yields_all_files_with_bounded_concurrency():
+    tree = {"root": [_folder(f"d{i}") for i in range(8)]}
+    for i in range(8):
+        tree[f"root/d{i}"] = _files(3)
+    list_fn, state = _tree_list_fn(tree, delay=0.02)
+    paths = sorted(e["full_path"] for e in walk_prefix(list_fn, "root", max_workers=3))
+    assert len(paths) == 24
+    assert paths[0] == "root/d0/f0000.pdf"
+    assert 1 < state["peak"] <= 3
+
+
+def test_walk_prefix_on_error_continues():
+    tree = {"root": [_folder("ok"), _folder("bad")], "root/ok": _files(2)}
+    list_fn, _ = _tree_list_fn(tree, fail={"root/bad"})
+    errors = []
+    paths = [e["full_path"] for e in walk_prefix(list_fn, "root", on_error=lambda p, e: errors.append(p))]
+    assert sorted(paths) == ["root/ok/f0000.pdf", "root/ok/f0001.pdf"]
+    assert errors == ["root/bad"]
+
+
+def test_walk_prefix_without_on_error_raises():
+    list_fn, _ = _tree_list_fn({"root": [_folder("bad")]}, fail={"root/bad"})
+    with pytest.raises(ConnectionError):
+        list(walk_prefix(list_fn, "root"))
+
+
+def test_browser_pages_carry_size_bytes():
+    from src.modules.uploads import storage_browser_service as svc
+
+    fake = _FakeBucket({"org/1": [_folder("SIFAP"), {"name": "a.pdf", "metadata": {"size": 42}}]})
+    with patch.object(svc, "SupabaseStorageAdapter", lambda bucket: SupabaseStorageAdapter(_client(fake), bucket)):
+        pages = list(svc.iter_storage_object_pages("rc-docs", "org/1"))
+    assert pages == [
+        [
+            {"name": "SIFAP", "is_folder": True, "full_path": "org/1/SIFAP", "size_bytes": 0},
+            {"name": "a.pdf", "is_folder": False, "full_path": "org/1/a.pdf", "size_bytes": 42},
+        ]
+    ]
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Testes do upload em streaming/TUS do adapter Supabase Storage (servidor falso)."""
+
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import src.adapters.storage.supabase_storage as mod
+from src.adapters.storage.resumable_upload import ResumableUploadRegistry, tus_upload
+
+_ENDPOINT = "https://proj.supabase.co/storage/v1/upload/resumable"
+
+
+class _FakeTusSession:
+    """Servidor TUS em memória; ``fail_patch_at`` simula queda de conexão no N-ésimo PATCH."""
+
+    def __init__(self, *, fail_patch_at: int | None = None, create_status: int = 201) -> None:
+        self.uploads: dict[str, bytearray] = {}
+        self.lengths: dict[str, int] = {}
+        self.patches: list[int] = []  # tamanho de cada bloco recebido
+        self.calls: list[str] = []
+        self.fail_patch_at = fail_patch_at
+        self.create_status = create_status
+
+    def request(self, method, url, headers=None, content=None):
+        self.calls.append(method)
+        headers = headers or {}
+        if method == "POST":
+            if self.create_status != 201:
+                return SimpleNamespace(status_code=self.create_status, headers={}, text="The resource already exists")
+            upload_url = f"{url}/{len(self.uploads) + 1}"
+            self.uploads[upload_url] = bytearray()
+            self.lengths[upload_url] = int(headers["Upload-Length"])
+            return SimpleNamespace(status_code=201, headers={"Location": upload_url}, text="")
+        if url not in self.uploads:
+            return SimpleNamespace(status_code=404, headers={}, text="not found")
+        if method == "HEAD":
+            return SimpleNamespace(status_code=200, headers={"Upload-Offset": str(len(self.uploads[url]))}, text="")
+        if method == "PATCH":
+            if self.fail_patch_at is not None and len(self.patches) + 1 == self.fail_patch_at:
+                self.fail_patch_at = None
+                raise ConnectionError("connection reset")
+            buf = self.uploads[url]
+            if int(headers["Upload-Offset"]) != len(buf):
+                return SimpleNamespace(status_code=409, headers={}, text="offset mismatch")
+            buf.extend(content)
+            self.patches.append(len(content))
+            return SimpleNamespace(status_code=204, headers={"Upload-Offset": str(len(buf))}, text="")
+        raise AssertionError(method)
+
+
+class _TmpFileCase(unittest.TestCase):
+    def _file(self, size: int) -> str:
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as f:
+            f.write(os.urandom(size))
+        self.addCleanup(os.unlink, path)
+        return path
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+
+class TestTusUpload(_TmpFileCase):
+    def test_sends_file_in_bounded_chunks(self):
+        path = self._file(2500)
+        session = _FakeTusSession()
+        tus_upload(session, _ENDPOINT, {}, "b", "k.pdf", path, "application/pdf", chunk_size=1000,
+                   registry=ResumableUploadRegistry())  # fmt: skip
+        self.assertEqual(session.patches, [1000, 1000, 500])
+        self.assertEqual(bytes(next(iter(session.uploads.values()))), self._read(path))
+
+    def test_interrupted_upload_resumes_from_last_acknowledged_chunk(self):
+        path = self._file(3000)
+        session = _FakeTusSession(fail_patch_at=3)
+        registry = ResumableUploadRegistry()
+        with self.assertRaises(ConnectionError):
+            tus_upload(
+                session, _ENDPOINT, {}, "b", "k.pdf", path, "application/pdf", chunk_size=1000, registry=registry
+            )
+        self.assertEqual(len(registry), 1)
+
+        tus_upload(session, _ENDPOINT, {}, "b", "k.pdf", path, "application/pdf", chunk_size=1000, registry=registry)
+        self.assertEqual(session.calls.count("POST"), 1)  # não recriou o upload
+        self.assertEqual(sum(session.patches), 3000)  # nenhum byte reenviado
+        self.assertEqual(bytes(next(iter(session.uploads.values()))), self._read(path))
+        self.assertEqual(len(registry), 0)
+
+    def test_expired_upload_restarts_from_zero(self):
+        path = self._file(1500)
+        session = _FakeTusSession(fail_patch_at=2)
+        registry = ResumableUploadRegistry()
+        with self.assertRaises(ConnectionError):
+            tus_upload(
+                session, _ENDPOINT, {}, "b", "k.pdf", path, "application/pdf", chunk_size=1000, registry=registry
+            )
+        session.uploads.clear()  # servidor descartou o upload parcial
+
+        tus_upload(session, _ENDPOINT, {}, "b", "k.pdf", path, "application/pdf", chunk_size=1000, registry=registry)
+        self.assertEqual(session.calls.count("POST"), 2)
+        self.assertEqual(bytes(next(iter(session.uploads.values()))), self._read(path))
+
+    def test_existing_object_is_reported_as_duplicate(self):
+        path = self._file(10)
+        session = _FakeTusSession(create_status=409)
+        with self.assertRaises(Exception) as ctx:
+            tus_upload(
+                session, _ENDPOINT, {}, "b", "k.pdf", path, "application/pdf", registry=ResumableUploadRegistry()
+            )
+        self.assertTrue(mod._is_duplicate_exc(ctx.exception))
+        self.assertFalse(mod._is_transient_exc(ctx.exception))
+
+
+class TestAdapterUploadModes(_TmpFileCase):
+    def _client(self, session=None):
+        client = MagicMock()
+        client.storage.session = session
+        client.storage._base_url = "https://proj.supabase.co/storage/v1/"
+        client.storage._headers = {"authorization": "Bearer t"}
+        return client
+
+    def test_small_file_is_streamed_from_disk(self):
+        path = self._file(100)
+        client = self._client()
+        seen = {}
+
+        def fake_upload(key, body, file_options):
+            seen["body"] = body
+
+        client.storage.from_.return_value.upload.side_effect = fake_upload
+        mod._upload(client, "bucket", path, "a/b.pdf", None)
+        self.assertIsInstance(seen["body"], io.BufferedReader)
+        self.assertTrue(seen["body"].closed)
+
+    def test_large_file_uses_tus_and_retry_resumes(self):
+        path = self._file(5000)
+        session = _FakeTusSession(fail_patch_at=2)
+        client = self._client(session)
+        with (
+            patch.object(mod, "RESUMABLE_THRESHOLD_BYTES", 1000),
+            patch.object(mod, "_sleep"),
+            patch("src.adapters.storage.resumable_upload._registry", ResumableUploadRegistry()),
+        ):
+            # blocos de 1000 bytes em vez dos 6 MB exigidos pelo Supabase
+            real = mod.tus_upload
+            with patch.object(mod, "tus_upload", side_effect=lambda *a, **k: real(*a, chunk_size=1000, **k)):
+                mod._upload(client, "bucket", path, "a/big.pdf", "application/pdf", upsert=False)
+        client.storage.from_.return_value.upload.assert_not_called()
+        self.assertEqual(session.calls.count("POST"), 1)
+        self.assertEqual(sum(session.patches), 5000)
+        self.assertEqual(max(session.patches), 1000)
+
+    def test_bytes_source_still_uploaded_directly(self):
+        client = self._client()
+        mod._upload(client, "bucket", b"abc", "a/b.pdf", None)
+        args = client.storage.from_.return_value.upload.call_args[0]
+        self.assertEqual(args[1], b"abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Testes do UploadDialogContext com progresso reportado por várias threads."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from src.modules.uploads.views.upload_dialog import UploadDialogContext
+
+
+class _FakeDialog:
+    def __init__(self) -> None:
+        self.updates: list[dict[str, Any]] = []
+
+    def _update_progress(self, **kwargs: Any) -> None:
+        self.updates.append(kwargs)
+
+
+def test_concurrent_advance_reaches_total():
+    """Conclusões simultâneas não se perdem: a barra chega a 100%."""
+    dialog = _FakeDialog()
+    ctx = UploadDialogContext(dialog, total=0)  # type: ignore[arg-type]
+    ctx.set_total(400)
+    start = threading.Barrier(8)
+
+    def _worker() -> None:
+        start.wait()
+        for _ in range(50):
+            ctx.advance(label="Enviando")
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert dialog.updates[-1]["fraction"] == 1.0
+    assert dialog.updates[-1]["detail"].startswith("400/400")
+    fractions = [u["fraction"] for u in dialog.updates[1:]]
+    assert fractions == sorted(fractions)
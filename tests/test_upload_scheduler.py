@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Testes do agendador de uploads paralelos (sem rede)."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.modules.uploads.exceptions import UploadCancelledError, UploadDuplicateError
+from src.modules.uploads.repository import upload_items_with_adapter
+from src.modules.uploads.upload_scheduler import UploadJob, UploadProgress, run_upload_jobs
+
+_MOD = "src.modules.uploads.repository"
+
+
+def _jobs(sizes: list[int]) -> list[UploadJob]:
+    return [
+        UploadJob(i, f"item{i}", f"/tmp/f{i}.pdf", f"k/{i}", size, "application/pdf") for i, size in enumerate(sizes)
+    ]
+
+
+class TestRunUploadJobs(unittest.TestCase):
+    def test_largest_files_start_first(self):
+        started: list[int] = []
+        run_upload_jobs(
+            _jobs([10, 300, 20, 300, 5]), lambda job: None, max_workers=1, on_start=lambda j: started.append(j.index)
+        )
+        self.assertEqual(started, [1, 3, 2, 0, 4])
+
+    def test_uploads_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        results = run_upload_jobs(_jobs([1, 1, 1]), lambda job: barrier.wait(), max_workers=3)
+        self.assertEqual(results, {0: None, 1: None, 2: None})
+
+    def test_host_budget_caps_concurrency(self):
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def upload(_job):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            threading.Event().wait(0.01)
+            with lock:
+                active["now"] -= 1
+
+        run_upload_jobs(_jobs([1] * 12), upload, max_workers=6, budget=threading.BoundedSemaphore(2))
+        self.assertLessEqual(active["max"], 2)
+
+    def test_failures_are_returned_per_job(self):
+        def upload(job):
+            if job.index == 1:
+                raise RuntimeError("500")
+
+        results = run_upload_jobs(_jobs([1, 2, 3]), upload, max_workers=2)
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], RuntimeError)
+
+    def test_cancel_event_skips_jobs_not_started(self):
+        cancel = threading.Event()
+        results = run_upload_jobs(_jobs([4, 3, 2, 1]), lambda job: cancel.set(), max_workers=1, cancel_event=cancel)
+        self.assertEqual(list(results), [0])
+
+    def test_on_start_exception_stops_batch_and_is_raised(self):
+        def on_start(job):
+            if job.index == 1:
+                raise KeyboardInterrupt  # qualquer BaseException volta ao chamador
+
+        uploaded: list[int] = []
+        with self.assertRaises(KeyboardInterrupt):
+            run_upload_jobs(_jobs([3, 2, 1]), lambda j: uploaded.append(j.index), max_workers=1, on_start=on_start)
+        self.assertEqual(uploaded, [0])
+
+    def test_progress_is_aggregated_by_bytes(self):
+        snapshots: list[UploadProgress] = []
+        run_upload_jobs(_jobs([300, 100]), lambda job: None, max_workers=1, on_progress=snapshots.append)
+        self.assertEqual([s.bytes_done for s in snapshots], [300, 400])
+        self.assertAlmostEqual(snapshots[0].fraction, 0.75)
+        self.assertEqual(snapshots[-1].fraction, 1.0)
+        self.assertEqual(snapshots[-1].eta_s, 0.0)
+
+
+class TestUploadProgress(unittest.TestCase):
+    def test_eta_from_throughput(self):
+        p = UploadProgress(files_done=1, files_total=4, bytes_done=100, bytes_total=400, elapsed_s=2.0)
+        self.assertEqual(p.bytes_per_second, 50.0)
+        self.assertEqual(p.eta_s, 6.0)
+
+    def test_eta_unknown_before_first_file(self):
+        p = UploadProgress(files_done=0, files_total=4, bytes_done=0, bytes_total=400, elapsed_s=2.0)
+        self.assertIsNone(p.eta_s)
+
+
+class TestRepositoryParallelUpload(unittest.TestCase):
+    def _builder(self, cnpj, rel, sub, **_kw):
+        return f"org/{cnpj}/{rel}"
+
+    def test_failures_keep_item_order_with_parallel_workers(self):
+        items = [SimpleNamespace(path=f"/tmp/{n}.pdf", relative_path=f"{n}.pdf") for n in "abcd"]
+
+        def fake_upload(_fn, local_path, remote_key, **_kw):
+            if local_path.endswith(("b.pdf", "d.pdf")):
+                raise RuntimeError("409 Duplicate")
+
+        with patch(f"{_MOD}.upload_with_retry", side_effect=fake_upload):
+            ok, failures = upload_items_with_adapter(
+                MagicMock(), items, "123", None, remote_path_builder=self._builder, max_workers=4
+            )
+        self.assertEqual(ok, 2)
+        self.assertEqual([item.relative_path for item, _ in failures], ["b.pdf", "d.pdf"])
+        self.assertTrue(all(isinstance(exc, UploadDuplicateError) for _, exc in failures))
+
+    def test_cancelled_items_reported_as_cancelled(self):
+        items = [SimpleNamespace(path=f"/tmp/{n}.pdf", relative_path=f"{n}.pdf") for n in "abc"]
+        cancel = threading.Event()
+        with patch(f"{_MOD}.upload_with_retry", side_effect=lambda *a, **k: cancel.set()):
+            ok, failures = upload_items_with_adapter(
+                MagicMock(), items, "123", None, remote_path_builder=self._builder, max_workers=1, cancel_event=cancel
+            )
+        self.assertEqual(ok, 1)
+        self.assertEqual(len(failures), 2)
+        self.assertTrue(all(isinstance(exc, UploadCancelledError) for _, exc in failures))
+
+    def test_stat_and_mime_resolved_once_before_upload(self):
+        items = [SimpleNamespace(path="/tmp/x.pdf", relative_path="x.pdf")]
+        seen = {}
+
+        def fake_upload(_fn, local_path, remote_key, **kw):
+            seen.update(kw)
+
+        with patch(f"{_MOD}.upload_with_retry", side_effect=fake_upload):
+            upload_items_with_adapter(MagicMock(), items, "123", None, remote_path_builder=self._builder)
+        self.assertEqual(seen["content_type"], "application/pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
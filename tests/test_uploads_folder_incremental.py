@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Testes do upload incremental de pastas (hash em cache + versões em lote)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.infra.cache_store import JsonCacheStore
+from src.modules.uploads import service
+from src.modules.uploads.hash_cache import FileHashCache
+
+_REPO = "src.modules.uploads.service.repository"
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class _TmpDirCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.store = JsonCacheStore(str(self.root / "hashes.json"), flush_delay=60)
+        self.addCleanup(self.store.close)
+
+    def _write(self, rel: str, data: bytes) -> Path:
+        path = self.root / "pasta" / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+
+class TestFileHashCache(_TmpDirCase):
+    def test_unchanged_file_is_not_rehashed(self):
+        path = self._write("a.pdf", b"conteudo")
+        hash_fn = MagicMock(side_effect=lambda p: _sha(Path(p).read_bytes()))
+        cache = FileHashCache(self.store, hash_fn)
+        self.assertEqual(cache(path), _sha(b"conteudo"))
+        self.assertEqual(cache(path), _sha(b"conteudo"))
+        self.assertEqual(hash_fn.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_modified_file_is_rehashed(self):
+        path = self._write("a.pdf", b"v1")
+        cache = FileHashCache(self.store, lambda p: _sha(Path(p).read_bytes()))
+        cache(path)
+        path.write_bytes(b"versao 2")
+        os.utime(path, ns=(1, 2_000_000_000))
+        self.assertEqual(cache(path), _sha(b"versao 2"))
+        self.assertEqual(cache.misses, 2)
+
+
+class TestIncrementalFolderUpload(_TmpDirCase):
+    def _run(self, *, incremental: bool, stored: dict[str, dict], listed: set[str] = frozenset()):
+        cache = FileHashCache(self.store, lambda p: _sha(Path(p).read_bytes()))
+        repo = MagicMock()
+        repo.current_user_id.return_value = "user-1"
+        repo.resolve_org_id.return_value = "org-1"
+        repo.fetch_document_versions_by_path.side_effect = lambda paths: {
+            p: row for p in paths for name, row in stored.items() if p.endswith("/" + name)
+        }
+        repo.list_storage_names.return_value = set(listed)
+        repo.insert_document_record.side_effect = lambda **kw: {"id": 500}
+        repo.insert_document_version_record.side_effect = lambda **kw: {"id": 900}
+        with patch(_REPO, repo), patch.object(service, "get_hash_cache", return_value=cache):
+            results = service.upload_folder_to_supabase(self.root / "pasta", 7, subdir="GERAL", incremental=incremental)
+        return repo, {Path(r["relative_path"]).name: r for r in results}
+
+    def test_uploads_only_new_and_changed_files(self):
+        self._write("a.pdf", b"igual")
+        self._write("b.pdf", b"mudou")
+        self._write("sub/c.pdf", b"novo")
+        stored = {
+            "a.pdf": {"id": 1, "document_id": 10, "sha256": _sha(b"igual")},
+            "b.pdf": {"id": 2, "document_id": 20, "sha256": _sha(b"antigo")},
+        }
+        repo, results = self._run(incremental=True, stored=stored)
+
+        self.assertEqual(
+            {k: r["status"] for k, r in results.items()}, {"a.pdf": "skipped", "b.pdf": "updated", "c.pdf": "uploaded"}
+        )
+        uploaded = sorted(Path(c.args[0]).name for c in repo.upload_local_file.call_args_list)
+        self.assertEqual(uploaded, ["b.pdf", "c.pdf"])
+        keys = sorted(c.args[1].rsplit("/", 1)[-1] for c in repo.upload_local_file.call_args_list)
+        self.assertEqual(keys, [f"b.{_sha(b'mudou')[:12]}.pdf", "c.pdf"])
+        repo.fetch_document_versions_by_path.assert_called_once()
+        # arquivo alterado vira nova versão do documento existente
+        self.assertEqual(repo.insert_document_record.call_count, 1)
+        version_docs = sorted(c.kwargs["document_id"] for c in repo.insert_document_version_record.call_args_list)
+        self.assertEqual(version_docs, [20, 500])
+        # só a subpasta do arquivo novo foi listada no storage, uma vez
+        repo.list_storage_names.assert_called_once()
+
+    def test_changed_file_does_not_overwrite_previous_version(self):
+        self._write("b.pdf", b"mudou")
+        stored = {
+            "b.pdf": {
+                "id": 2,
+                "document_id": 20,
+                "storage_path": "org-1/7/GERAL/b.pdf",
+                "sha256": _sha(b"antigo"),
+            }
+        }
+        repo, results = self._run(incremental=True, stored=stored)
+
+        (upload,) = repo.upload_local_file.call_args_list
+        new_key = upload.args[1]
+        self.assertNotEqual(new_key, stored["b.pdf"]["storage_path"])
+        self.assertTrue(new_key.endswith(f"/b.{_sha(b'mudou')[:12]}.pdf"))
+        version = repo.insert_document_version_record.call_args.kwargs
+        self.assertEqual((version["document_id"], version["storage_path"]), (20, new_key))
+        self.assertEqual(results["b.pdf"]["storage_path"], new_key)
+
+    def test_storage_listed_once_per_folder(self):
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            self._write(name, name.encode())
+        repo, results = self._run(incremental=False, stored={})
+        self.assertEqual(repo.list_storage_names.call_count, 1)
+        repo.fetch_document_versions_by_path.assert_not_called()
+        self.assertTrue(all(r["status"] == "uploaded" for r in results.values()))
+
+    def test_existing_object_without_version_still_blocks(self):
+        self._write("a.pdf", b"x")
+        with self.assertRaises(RuntimeError):
+            self._run(incremental=True, stored={}, listed={"a.pdf"})
+
+
+class TestFetchDocumentVersions(unittest.TestCase):
+    def test_batches_paths_in_chunks(self):
+        from src.modules.uploads import repository
+
+        qb = MagicMock()
+        qb.select.return_value = qb
+        qb.in_.return_value = qb
+        qb.order.return_value = qb
+        client = MagicMock()
+        client.table.return_value = qb
+        by_path = MagicMock(data=[{"id": 1, "storage_path": "p/0", "sha256": "x", "document_id": 1}])
+        by_document = MagicMock(
+            data=[
+                {"id": 1, "storage_path": "p/0", "sha256": "x", "document_id": 1},
+                {"id": 8, "storage_path": "p/0.yyy", "sha256": "y", "document_id": 1},
+            ]
+        )
+        with (
+            patch.object(repository, "supabase", client),
+            patch.object(repository, "exec_postgrest", side_effect=[by_path, by_document] * 3) as exec_mock,
+            patch.object(repository, "DOCUMENT_VERSION_PATHS_CHUNK", 2),
+        ):
+            found = repository.fetch_document_versions_by_path([f"p/{i}" for i in range(5)])
+        # por lote: caminhos + versões dos documentos encontrados
+        self.assertEqual(exec_mock.call_count, 6)
+        # vale a versão mais recente do documento, mesmo em outra chave
+        self.assertEqual((found["p/0"]["sha256"], found["p/0"]["storage_path"]), ("y", "p/0.yyy"))
+
+
+if __name__ == "__main__":
+    unittest.main()
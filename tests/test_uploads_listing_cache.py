@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Testes do cache de listagens do navegador de arquivos."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+from src.modules.uploads.listing_cache import StorageListingCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _items(*names: str) -> list[dict]:
+    return [{"name": n, "is_folder": False, "full_path": n} for n in names]
+
+
+class TestStorageListingCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.cache = StorageListingCache(ttl_s=30, clock=self.clock)
+
+    def test_get_or_load_hits_within_ttl_and_reloads_after(self) -> None:
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return _items("a.pdf")
+
+        self.cache.get_or_load("rc-docs", "org/1/", loader)
+        self.cache.get_or_load("rc-docs", "/org/1", loader)
+        self.assertEqual(len(calls), 1)
+        self.clock.now += 31
+        self.cache.get_or_load("rc-docs", "org/1", loader)
+        self.assertEqual(len(calls), 2)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 2))
+
+    def test_invalidate_drops_prefix_and_parent(self) -> None:
+        for prefix in ("org/1", "org/1/GERAL", "org/2"):
+            self.cache.put("rc-docs", prefix, _items("x"))
+        self.cache.invalidate("rc-docs", "org/1/GERAL/a.pdf")
+        self.assertIsNone(self.cache.get("rc-docs", "org/1/GERAL"))
+        self.assertIsNotNone(self.cache.get("rc-docs", "org/1"))
+        self.cache.invalidate("rc-docs", "org/1/GERAL")
+        self.assertIsNone(self.cache.get("rc-docs", "org/1"))
+        self.assertIsNotNone(self.cache.get("rc-docs", "org/2"))
+
+    def test_recursive_invalidation_covers_subtree(self) -> None:
+        for prefix in ("org/1", "org/1/A", "org/1/A/B", "org/10"):
+            self.cache.put("rc-docs", prefix, _items("x"))
+        self.cache.invalidate("rc-docs", "org/1", recursive=True)
+        self.assertIsNone(self.cache.get("rc-docs", "org/1/A"))
+        self.assertIsNone(self.cache.get("rc-docs", "org/1/A/B"))
+        self.assertIsNotNone(self.cache.get("rc-docs", "org/10"))
+
+    def test_load_started_before_invalidation_is_not_stored(self) -> None:
+        token = self.cache.token()
+        self.cache.invalidate("rc-docs", "org/1", recursive=True)
+        self.assertFalse(self.cache.put("rc-docs", "org/1/A", _items("velho"), token=token))
+        self.assertIsNone(self.cache.get("rc-docs", "org/1/A"))
+        self.assertTrue(self.cache.put("rc-docs", "org/1/A", _items("novo"), token=self.cache.token()))
+
+    def test_concurrent_loads_share_one_call(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return _items("a.pdf")
+
+        results = []
+        prefetch = threading.Thread(target=lambda: results.append(self.cache.get_or_load("b", "p", slow_loader)))
+        prefetch.start()
+        started.wait(2)
+        waiter = threading.Thread(target=lambda: results.append(self.cache.get_or_load("b", "p", slow_loader)))
+        waiter.start()
+        release.set()
+        prefetch.join(2)
+        waiter.join(2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r[0]["name"] for r in results], ["a.pdf", "a.pdf"])
+
+    def test_caller_after_invalidation_does_not_join_stale_prefetch(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def stale_loader():
+            started.set()
+            release.wait(2)
+            return _items("velho.pdf")
+
+        prefetch = threading.Thread(target=lambda: self.cache.get_or_load("b", "org/1/A", stale_loader))
+        prefetch.start()
+        started.wait(2)
+        self.cache.invalidate("b", "org/1", recursive=True)
+
+        fresh = self.cache.get_or_load("b", "org/1/A", lambda: _items("novo.pdf"))
+        release.set()
+        prefetch.join(2)
+
+        self.assertEqual(fresh[0]["name"], "novo.pdf")
+        self.assertEqual(self.cache.get("b", "org/1/A")[0]["name"], "novo.pdf")
+        self.assertEqual(self.cache._loading, {})
+
+    def test_loader_error_is_not_cached(self) -> None:
+        def failing():
+            raise ConnectionError("offline")
+
+        with self.assertRaises(ConnectionError):
+            self.cache.get_or_load("b", "p", failing)
+        self.assertEqual(self.cache.get_or_load("b", "p", lambda: _items("ok"))[0]["name"], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@ Todos os acessos ao Supabase e à Edge Function são mockados. Os testes validam
 from __future__ import annotations
 
 import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
@@ -100,6 +101,13 @@ class FakeHTTPResponse:
         pass
 
 
+@pytest.fixture(autouse=True)
+def _no_realtime():
+    """Sem Realtime nos testes: o acompanhamento cai no polling."""
+    with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=None):
+        yield
+
+
 @contextmanager
 def _patch_service():
     """Retorna patches para _get_supabase e _exec."""
@@ -357,6 +365,206 @@ class TestPollZipJob:
                 poll_zip_job("job-001", interval_s=0.01, timeout_s=0.05)
 
 
+class FakeFeed:
+    """Feed Realtime simulado: entrega as rows enfileiradas, depois None."""
+
+    def __init__(self, rows: list[dict], *, drop_after: int | None = None, on_get=None):
+        self._rows = list(rows)
+        self._drop_after = drop_after
+        self._on_get = on_get
+        self.timeouts: list[float] = []
+        self.connected = True
+        self.closed = False
+
+    def get(self, timeout: float):
+        self.timeouts.append(timeout)
+        if self._on_get is not None:
+            self._on_get()
+        if self._drop_after is not None and self._drop_after <= 0:
+            self.connected = False
+        if self._drop_after is not None:
+            self._drop_after -= 1
+        return self._rows.pop(0) if self._rows else None
+
+    def close(self):
+        self.closed = True
+
+
+class TestPollZipJobProgress:
+    def test_realtime_events_skip_polling(self):
+        """Com Realtime, o progresso chega por eventos: só duas leituras vão ao banco."""
+        feed = FakeFeed(
+            [
+                {"phase": "zipping", "total_files": 10, "processed_files": 3},
+                {"phase": "zipping", "total_files": 10, "processed_files": 7},
+                {"phase": "ready", "artifact_storage_path": "exports/test.zip"},
+            ]
+        )
+        seen: list[tuple[str, int]] = []
+
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.return_value = FakeResponse([_make_row(phase="scanning")])
+
+            with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=feed):
+                from src.modules.uploads.zip_job_service import poll_zip_job
+
+                job = poll_zip_job(
+                    "job-001",
+                    realtime=True,
+                    on_progress=lambda j: seen.append((j.phase.value, j.progress.processed_files)),
+                )
+
+        assert job.phase == ZipJobPhase.READY
+        assert job.artifact_storage_path == "exports/test.zip"
+        assert job.zip_name == "SIFAP.zip"
+        assert seen == [("scanning", 0), ("zipping", 3), ("zipping", 7), ("ready", 7)]
+        assert mock_exec.call_count == 2
+        assert feed.closed
+
+    def test_realtime_drop_falls_back_to_light_polling(self):
+        """Canal cai → polling só das colunas de status."""
+        feed = FakeFeed([], drop_after=0)
+
+        with _patch_service() as (mock_sb, mock_exec):
+            sb = MagicMock()
+            mock_sb.return_value = sb
+            mock_exec.side_effect = [
+                FakeResponse([_make_row(phase="scanning")]),
+                FakeResponse([{"phase": "scanning"}]),
+                FakeResponse([{"phase": "ready", "artifact_storage_path": "exports/test.zip"}]),
+            ]
+
+            with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=feed):
+                from src.modules.uploads.zip_job_service import poll_zip_job
+
+                job = poll_zip_job("job-001", realtime=True, interval_s=0.01)
+
+        assert job.phase == ZipJobPhase.READY
+        select_args = [c.args[0] for c in sb.table.return_value.select.call_args_list]
+        assert select_args[0] == "*"
+        assert "phase" in select_args[1] and "*" not in select_args[1]
+        assert feed.closed
+
+    def test_ready_before_subscription_is_not_missed(self):
+        """Job fica pronto entre a primeira leitura e a inscrição → releitura detecta."""
+        feed = FakeFeed([])
+
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.side_effect = [
+                FakeResponse([_make_row(phase="zipping")]),
+                FakeResponse([{"phase": "ready", "artifact_storage_path": "exports/test.zip"}]),
+            ]
+
+            with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=feed):
+                from src.modules.uploads.zip_job_service import poll_zip_job
+
+                job = poll_zip_job("job-001", realtime=True, timeout_s=60)
+
+        assert job.phase == ZipJobPhase.READY
+        assert feed.timeouts == []
+        assert feed.closed
+
+    def test_quiet_feed_polls_until_first_event(self):
+        """Canal inscrito mas sem eventos (tabela fora da publicação) → segue no polling adaptativo."""
+        feed = FakeFeed([])
+
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.side_effect = [
+                FakeResponse([_make_row(phase="scanning")]),
+                FakeResponse([{"phase": "scanning"}]),
+                FakeResponse([{"phase": "zipping"}]),
+                FakeResponse([{"phase": "ready", "artifact_storage_path": "exports/test.zip"}]),
+            ]
+
+            with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=feed):
+                from src.modules.uploads.zip_job_service import poll_zip_job
+
+                job = poll_zip_job("job-001", realtime=True, interval_s=0.01, max_interval_s=0.05, timeout_s=5)
+
+        assert job.phase == ZipJobPhase.READY
+        assert mock_exec.call_count == 4
+        assert max(feed.timeouts) <= 0.05
+
+    def test_silent_feed_backs_off_like_polling(self):
+        """Feed que nunca entrega eventos não faz mais leituras que o polling: a janela cresce."""
+
+        class SilentFeed(FakeFeed):
+            def get(self, timeout: float):
+                super().get(timeout)
+                time.sleep(timeout)
+
+        feed = SilentFeed([])
+        rows = [_make_row(phase="scanning")] * 6 + [{"phase": "ready", "artifact_storage_path": "exports/test.zip"}]
+
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.side_effect = [FakeResponse([r]) for r in rows]
+
+            with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=feed):
+                from src.modules.uploads.zip_job_service import poll_zip_job
+
+                job = poll_zip_job("job-001", realtime=True, interval_s=0.01, max_interval_s=0.05, timeout_s=5)
+
+        assert job.phase == ZipJobPhase.READY
+        assert len(feed.timeouts) == 5
+        assert all(b > a for a, b in zip(feed.timeouts[:3], feed.timeouts[1:4]))
+        assert feed.timeouts[-1] == pytest.approx(0.05, abs=0.01)
+
+    def test_cancel_event_interrupts_quiet_realtime_wait(self):
+        """Sem eventos, a espera no feed é em passos curtos e respeita cancel_event."""
+        cancel = threading.Event()
+        feed = FakeFeed([], on_get=lambda: len(feed.timeouts) == 3 and cancel.set())
+
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.return_value = FakeResponse([_make_row(phase="zipping")])
+
+            with patch("src.modules.uploads.zip_job_service._open_progress_feed", return_value=feed):
+                from src.modules.uploads.zip_job_service import ZipJobCancelledError, poll_zip_job
+
+                with pytest.raises(ZipJobCancelledError):
+                    poll_zip_job("job-001", realtime=True, timeout_s=60, cancel_event=cancel)
+
+        assert len(feed.timeouts) == 3
+        assert max(feed.timeouts) <= 0.5
+        assert mock_exec.call_count == 2  # leitura inicial + releitura pós-inscrição
+        assert feed.closed
+
+    def test_polling_backs_off_while_unchanged(self):
+        """Sem mudanças o intervalo cresce até max_interval_s; mudança volta ao mínimo."""
+        rows = [_make_row(phase="scanning")] * 5 + [_make_row(phase="zipping")] + [_make_row(phase="ready")]
+        waits: list[float] = []
+
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.side_effect = [FakeResponse([r]) for r in rows]
+
+            with patch("src.modules.uploads.zip_job_service.time.sleep", side_effect=waits.append):
+                from src.modules.uploads.zip_job_service import poll_zip_job
+
+                poll_zip_job("job-001", realtime=False, interval_s=1.0, max_interval_s=2.0)
+
+        assert waits[0] == 1.0
+        assert waits[1:5] == pytest.approx([1.6, 2.0, 2.0, 2.0])
+        assert waits[5] == 1.0
+
+    def test_update_uses_returned_row(self):
+        """PATCH com representation → sem releitura."""
+        with _patch_service() as (mock_sb, mock_exec):
+            mock_sb.return_value = MagicMock()
+            mock_exec.return_value = FakeResponse([_make_row(phase="scanning")])
+
+            from src.modules.uploads.zip_job_service import update_zip_job
+
+            job = update_zip_job("job-001", phase=ZipJobPhase.SCANNING)
+
+        assert job.phase == ZipJobPhase.SCANNING
+        assert mock_exec.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # Testes: get_artifact_url
 # ---------------------------------------------------------------------------